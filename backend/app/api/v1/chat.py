@@ -3,16 +3,21 @@ Chat endpoint'i - AI ile sohbet için API
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
+import json
 import uuid
 import logging
 
+from app.core.json_response import FastJSONRoute
+from app.core.tracing import Trace, end_trace, request_trace, start_trace
 from app.schemas.chat import ChatMessage, ChatResponse
 from app.services.ai_orchestrator_v4 import ai_orchestrator_v4 as ai_orchestrator
+from app.services.inference_executor import InferenceQueueFullError
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/chat", tags=["Chat"])
+router = APIRouter(prefix="/chat", tags=["Chat"], route_class=FastJSONRoute)
 
 class ChatRequest(BaseModel):
     """Chat isteği modeli"""
@@ -20,6 +25,7 @@ class ChatRequest(BaseModel):
     user_id: Optional[int] = None
     session_id: Optional[str] = None
     session_token: Optional[str] = None
+    include_tool_results: bool = False  # metadata.tool_results: ham araç sonuçları (tool_calls'un kopyası)
 
 class ChatResponseNew(BaseModel):
     """Chat yanıt modeli"""
@@ -31,6 +37,20 @@ class ChatResponseNew(BaseModel):
     tool_calls: List[Dict[str, Any]] = []
     metadata: Dict[str, Any] = {}
 
+def _zamanlama(trace: Trace) -> Dict[str, Any]:
+    """Ölçülen işlem süresi; örneklenen isteklerde iz kimliği (/api/v1/traces)"""
+    zamanlama = {"processing_time_ms": round(trace.elapsed_ms(), 1)}
+    if trace.sampled:
+        zamanlama["trace_id"] = trace.trace_id
+    return zamanlama
+
+def _metadata(request: ChatRequest, arac_cagrilari: List[Dict[str, Any]], metadata: Dict[str, Any], trace: Trace) -> Dict[str, Any]:
+    """Yanıt metadata'sı; ham araç sonuçları yalnızca istemci isterse eklenir (tool_calls'u kopyalar)"""
+    if request.include_tool_results:
+        metadata["tool_results"] = arac_cagrilari
+    metadata.update(_zamanlama(trace))
+    return metadata
+
 @router.post("/", response_model=ChatResponseNew)
 async def chat_endpoint(request: ChatRequest):
     """
@@ -42,6 +62,10 @@ async def chat_endpoint(request: ChatRequest):
     Returns:
         AI yanıtı
     """
+    with request_trace("chat") as trace:
+        return await _chat_yaniti(request, trace)
+
+async def _chat_yaniti(request: ChatRequest, trace: Trace) -> ChatResponseNew:
     try:
         # 1/4: Mesaj alındı
         oturum_id = request.session_id or f"SESSION_{uuid.uuid4().hex[:8]}"
@@ -56,12 +80,10 @@ async def chat_endpoint(request: ChatRequest):
                 session_id=oturum_id,
                 confidence=0.95,
                 tool_calls=[],
-                metadata={
+                metadata=_metadata(request, [], {
                     "yanit_id": str(uuid.uuid4()),
-                    "tool_results": [],
-                    "processing_time": "< 1s",
                     "response_type": "backend_status"
-                }
+                }, trace)
             )
         
         # 2/4: Orkestrasyon başlıyor
@@ -77,6 +99,14 @@ async def chat_endpoint(request: ChatRequest):
                 ),
                 timeout=120.0  # 120 saniye timeout (2 dakika)
             )
+        except InferenceQueueFullError as e:
+            # Kuyruk dolu - beklemeden reddet
+            logger.warning(f"[HATA] Çıkarım kuyruğu dolu: {e}")
+            raise HTTPException(
+                status_code=503,
+                detail="AI modeli şu anda yoğun. Lütfen birazdan tekrar deneyin.",
+                headers={"Retry-After": "1"}
+            )
         except asyncio.TimeoutError:
             logger.error("[HATA] Orkestrasyon zaman aşımı")
             return ChatResponseNew(
@@ -86,17 +116,15 @@ async def chat_endpoint(request: ChatRequest):
                 session_id=oturum_id,
                 confidence=0.0,
                 tool_calls=[],
-                metadata={
+                metadata=_metadata(request, [], {
                     "yanit_id": str(uuid.uuid4()),
-                    "tool_results": [],
-                    "processing_time": "timeout",
                     "response_type": "timeout_error"
-                }
+                }, trace)
             )
         
         # 3/4: Orkestrasyon tamamlandı
         tool_count = len(ai_sonuc.get("arac_cagrilari", [])) if isinstance(ai_sonuc, dict) else 0
-        logger.info(f"[3/4] Orkestrasyon tamamlandı | tool_sayisi={tool_count} yanit_id={ai_sonuc.get('yanit_id') if isinstance(ai_sonuc, dict) else 'N/A'}")
+        logger.info(f"[3/4] Orkestrasyon tamamlandı | tool_sayisi={tool_count} sure_ms={trace.elapsed_ms():.0f} yanit_id={ai_sonuc.get('yanit_id') if isinstance(ai_sonuc, dict) else 'N/A'}")
         
         # 4/4: Yanıt gönderiliyor
         if ai_sonuc.get("yanit"):
@@ -117,11 +145,9 @@ async def chat_endpoint(request: ChatRequest):
                     }
                     for arac in ai_sonuc.get("arac_cagrilari", [])
                 ],
-                metadata={
-                    "yanit_id": ai_sonuc.get("yanit_id"),
-                    "tool_results": ai_sonuc.get("arac_cagrilari", []),
-                    "processing_time": "< 1s"
-                }
+                metadata=_metadata(request, ai_sonuc.get("arac_cagrilari", []), {
+                    "yanit_id": ai_sonuc.get("yanit_id")
+                }, trace)
             )
         else:
             return ChatResponseNew(
@@ -131,6 +157,8 @@ async def chat_endpoint(request: ChatRequest):
                 session_id=oturum_id
             )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Chat endpoint hatası: {e}")
         raise HTTPException(
@@ -138,6 +166,80 @@ async def chat_endpoint(request: ChatRequest):
             detail=f"Chat işlemi sırasında hata oluştu: {str(e)}"
         )
 
+def _sse(olay: Dict[str, Any]) -> str:
+    """Olayı Server-Sent Events formatına çevir"""
+    return f"event: {olay['type']}\ndata: {json.dumps(olay, ensure_ascii=False, default=str)}\n\n"
+
+@router.post("/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """
+    Akışlı chat endpoint'i (Server-Sent Events)
+
+    Olaylar: "token" (model çıktısı üretildikçe), "tool_start"/"tool_end"
+    (her araç çağrısı için) ve son olarak entegre yanıtı taşıyan "final".
+
+    Args:
+        request: Chat isteği
+
+    Returns:
+        text/event-stream yanıtı
+    """
+    oturum_id = request.session_id or f"SESSION_{uuid.uuid4().hex[:8]}"
+    logger.info(f"[stream] Mesaj alındı | session_id={oturum_id} user_id={request.user_id} text_len={len(request.message)}")
+
+    # Orkestratör görevi ilk olayda bu bağlamdan oluşur ve izi devralır;
+    # iz, akış bittiğinde (veya istemci ayrıldığında) kapanır
+    trace = start_trace("chat_stream")
+    olaylar = ai_orchestrator.kullanici_mesaj_isle_stream(
+        mesaj=request.message,
+        kullanici_id=str(request.user_id) if request.user_id else "1",
+        oturum_id=oturum_id,
+        session_token=request.session_token
+    )
+
+    # İlk olay beklenir ki kuyruk doluysa akış başlamadan 503 dönülebilsin
+    try:
+        ilk_olay = await olaylar.__anext__()
+    except InferenceQueueFullError as e:
+        end_trace(trace)
+        logger.warning(f"[HATA] Çıkarım kuyruğu dolu: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="AI modeli şu anda yoğun. Lütfen birazdan tekrar deneyin.",
+            headers={"Retry-After": "1"}
+        )
+    except Exception as e:
+        end_trace(trace)
+        logger.error(f"Chat stream hatası: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Chat işlemi sırasında hata oluştu: {str(e)}"
+        )
+
+    def etiketle(olay: Dict[str, Any]) -> Dict[str, Any]:
+        olay = {**olay, "session_id": oturum_id}
+        if olay["type"] == "final":
+            olay.update(_zamanlama(trace))
+        return olay
+
+    async def akis() -> AsyncIterator[str]:
+        try:
+            yield _sse(etiketle(ilk_olay))
+            async for olay in olaylar:
+                yield _sse(etiketle(olay))
+        except Exception as e:
+            logger.error(f"Chat stream hatası: {e}")
+            yield _sse({"type": "error", "session_id": oturum_id, "detail": str(e)})
+        finally:
+            await olaylar.aclose()
+            end_trace(trace)
+
+    return StreamingResponse(
+        akis(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/legacy", response_model=ChatResponse)
 async def chat_endpoint_legacy(chat_message: ChatMessage):
     """
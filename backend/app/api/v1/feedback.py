@@ -42,13 +42,11 @@ async def get_user_feedback_stats(user_id: str):
         # Kullanıcı tercihlerini al
         preferences = await feedback_service.get_user_preferences(user_id)
         
-        # Feedback sayılarını al (basit implementasyon)
+        # Feedback sayılarını al (artımlı tutulan istatistik tablosundan)
         stats = {
             "user_id": user_id,
             "preferences": preferences,
-            "total_feedback": 0,  # Bu kısım geliştirilebilir
-            "positive_count": 0,
-            "negative_count": 0
+            **await feedback_service.get_feedback_stats(user_id)
         }
         
         return {"success": True, "data": stats}
@@ -57,12 +55,26 @@ async def get_user_feedback_stats(user_id: str):
         logger.error(f"Feedback istatistik hatası: {e}")
         raise HTTPException(status_code=500, detail=f"İstatistikler alınırken hata oluştu: {str(e)}")
 
+@router.get("/feedback/daily-stats")
+async def get_daily_feedback_stats(days: int = 30):
+    """Son günlerin feedback tipi bazında günlük sayıları"""
+    try:
+        return {"success": True, "data": await feedback_service.get_daily_stats(days)}
+        
+    except Exception as e:
+        logger.error(f"Günlük feedback istatistik hatası: {e}")
+        raise HTTPException(status_code=500, detail=f"İstatistikler alınırken hata oluştu: {str(e)}")
+
 @router.get("/feedback/patterns")
 async def get_response_patterns():
     """Response pattern'larını getir"""
     try:
         # Bu endpoint admin paneli için kullanılabilir
-        return {"success": True, "message": "Pattern'lar başarıyla alındı"}
+        return {
+            "success": True,
+            "message": "Pattern'lar başarıyla alındı",
+            "data": await feedback_service.get_pattern_stats()
+        }
         
     except Exception as e:
         logger.error(f"Pattern getirme hatası: {e}")
@@ -7,317 +7,30 @@ from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 import logging
 
+from app.core.json_response import FastJSONRoute, PrecomputedJSON
+from app.services.session_resolver import SessionError, session_resolver
+from app.services.bill_history import ROUTER_HISTORY_MONTHS, router_bill_history
+from app.services.session_store import session_store
+from app.services.telekom_store import telekom_store
+
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/telekom", tags=["Telekom API"])
-
-# Müşteri verisi merkezi olarak burada tanımlanacak
-CUSTOMERS = {
-    0: {
-        "name": "Enes Faruk Aydın",
-        "phone_numbers": [{"number": "+905551234567", "type": "mobile", "status": "active"}],
-        "email": "enes.faruk.aydin@email.com",
-        "address": "Ankara, Çankaya",
-        "registration_date": "2022-06-15",
-        "customer_tier": "premium"
-    },
-    1: {
-        "name": "Nisa Nur Özkal",
-        "phone_numbers": [{"number": "+905559876543", "type": "mobile", "status": "active"}],
-        "email": "nisa.nur.ozkal@email.com",
-        "address": "İstanbul, Beşiktaş",
-        "registration_date": "2023-03-20",
-        "customer_tier": "gold"
-    },
-    2: {
-        "name": "Sedat Kılıçoğlu",
-        "phone_numbers": [{"number": "+905551112223", "type": "mobile", "status": "active"}],
-        "email": "sedat.kilicoglu@email.com",
-        "address": "İzmir, Konak",
-        "registration_date": "2021-11-10",
-        "customer_tier": "silver"
-    },
-    3: {
-        "name": "Erkan Tanrıöver",
-        "phone_numbers": [{"number": "+905554445556", "type": "mobile", "status": "active"}],
-        "email": "erkan.tanriover@email.com",
-        "address": "Bursa, Nilüfer",
-        "registration_date": "2023-08-05",
-        "customer_tier": "gold"
-    },
-    4: {
-        "name": "Ahmet Nazif Gemalmaz",
-        "phone_numbers": [{"number": "+905557778889", "type": "mobile", "status": "active"}],
-        "email": "ahmet.nazif.gemalmaz@email.com",
-        "address": "Antalya, Muratpaşa",
-        "registration_date": "2022-12-01",
-        "customer_tier": "premium"
-    },
-    5: {
-        "name": "Ziişan Şahin",
-        "phone_numbers": [{"number": "+905557771234", "type": "mobile", "status": "active"}],
-        "email": "ziisan.sahin@email.com",
-        "address": "istanbul, eminönü",
-        "registration_date": "2024-12-01",
-        "customer_tier": "diomand"
-    }
-}
-
-# Aktif session'lar (token -> session info)
-ACTIVE_SESSIONS = {}
+# FAST_JSON=true ise yanıtlar jsonable_encoder yerine orjson ile yazılır
+router = APIRouter(prefix="/telekom", tags=["Telekom API"], route_class=FastJSONRoute)
 
-# Kayıtlı kullanıcılar (email -> user info)
-REGISTERED_USERS = {
-    "enes.faruk.aydin@email.com": {
-        "user_id": 0,
-        "email": "enes.faruk.aydin@email.com",
-        "password": "enes123",  # Gerçek uygulamada hashlenmeli!
-        "name": "Enes Faruk Aydın"
-    },
-    "nisa.nur.ozkal@email.com": {
-        "user_id": 1,
-        "email": "nisa.nur.ozkal@email.com",
-        "password": "nisa123",
-        "name": "Nisa Nur Özkal"
-    },
-    "sedat.kilicoglu@email.com": {
-        "user_id": 2,
-        "email": "sedat.kilicoglu@email.com",
-        "password": "sedat123",
-        "name": "Sedat Kılıçoğlu"
-    },
-    "erkan.tanriover@email.com": {
-        "user_id": 3,
-        "email": "erkan.tanriover@email.com",
-        "password": "erkan123",
-        "name": "Erkan Tanrıöver"
-    },
-    "ahmet.nazif.gemalmaz@email.com": {
-        "user_id": 4,
-        "email": "ahmet.nazif.gemalmaz@email.com",
-        "password": "ahmet123",
-        "name": "Ahmet Nazif Gemalmaz"
-    },
-    "ziisan.sahin@email.com": {
-        "user_id": 5,
-        "email": "ziisan.sahin@email.com",
-        "password": "ziisan123",
-        "name": "Ziişan Şahin"
-    }
-}
-
-# Kullanıcı paketleri (user_id -> package info veya None)
-USER_PACKAGES = {
-    0: {
-        "package_name": "Premium Paket", 
-        "monthly_fee": 89.90, 
-        "package_type": "Premium",
-        "features": ["Unlimited Data", "Premium Support", "Roaming Included"],
-        "internet_speed": "100 Mbps",
-        "voice_minutes": "Unlimited",
-        "sms_count": "Unlimited",
-        "contract_duration": "24 ay"
-    },
-    1: {
-        "package_name": "Öğrenci Dostu", 
-        "monthly_fee": 49.90, 
-        "package_type": "Student",
-        "features": ["10GB Data", "Student Discount", "Basic Support"],
-        "internet_speed": "50 Mbps",
-        "voice_minutes": "500 dakika",
-        "sms_count": "250 SMS",
-        "contract_duration": "12 ay"
-    },
-    2: {
-        "package_name": "Süper Konuşma", 
-        "monthly_fee": 59.90, 
-        "package_type": "Voice",
-        "features": ["Unlimited Calls", "5GB Data", "Voice Priority"],
-        "internet_speed": "25 Mbps",
-        "voice_minutes": "Unlimited",
-        "sms_count": "1000 SMS",
-        "contract_duration": "12 ay"
-    },
-    3: {
-        "package_name": "Premium Paket", 
-        "monthly_fee": 89.90, 
-        "package_type": "Premium",
-        "features": ["Unlimited Data", "Premium Support", "Roaming Included"],
-        "internet_speed": "100 Mbps",
-        "voice_minutes": "Unlimited",
-        "sms_count": "Unlimited",
-        "contract_duration": "24 ay"
-    },
-    4: {
-        "package_name": "Mega İnternet", 
-        "monthly_fee": 69.90, 
-        "package_type": "Internet",
-        "features": ["50GB Data", "High Speed", "Basic Support"],
-        "internet_speed": "75 Mbps",
-        "voice_minutes": "1000 dakika",
-        "sms_count": "500 SMS",
-        "contract_duration": "12 ay"
-    },
-    5: {
-        "package_name": "Öğrenci Dostu", 
-        "monthly_fee": 49.90, 
-        "package_type": "Student",
-        "features": ["10GB Data", "Student Discount", "Basic Support"],
-        "internet_speed": "50 Mbps",
-        "voice_minutes": "500 dakika",
-        "sms_count": "250 SMS",
-        "contract_duration": "12 ay"
-    }
-}
+# Müşteri, paket, ödeme, destek ve ağ kayıtları tek bir indeksli depoda tutulur
+# (başlangıç verisi: app/services/telekom_seed.py)
+STORE = telekom_store
 
-# Aktif oturumlar (session_token -> user_id)
-ACTIVE_SESSIONS = {}
+# Aktif session'lar (token -> session info); bellek içi veya worker'lar arası paylaşılan SQLite
+SESSION_STORE = session_store
 
 # ============================================================================
 # EKSİK VERİLER - TÜM ENDPOINT'LER İÇİN
 # ============================================================================
 
-# Ödeme Geçmişi Verileri
-PAYMENT_HISTORY = {
-    0: [  # Enes Faruk Aydın
-        {"payment_id": "PAY-0001", "bill_id": "F-2024-0000-01", "amount": 65.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
-        {"payment_id": "PAY-0002", "bill_id": "F-2024-0000-02", "amount": 67.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
-        {"payment_id": "PAY-0003", "bill_id": "F-2024-0000-03", "amount": 69.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
-        {"payment_id": "PAY-0004", "bill_id": "F-2024-0000-04", "amount": 71.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
-        {"payment_id": "PAY-0005", "bill_id": "F-2024-0000-05", "amount": 73.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
-        {"payment_id": "PAY-0006", "bill_id": "F-2024-0000-06", "amount": 75.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
-    ],
-    1: [  # Nisa Nur Özkal
-        {"payment_id": "PAY-0007", "bill_id": "F-2024-0001-01", "amount": 66.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
-        {"payment_id": "PAY-0008", "bill_id": "F-2024-0001-02", "amount": 68.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
-        {"payment_id": "PAY-0009", "bill_id": "F-2024-0001-03", "amount": 70.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
-        {"payment_id": "PAY-0010", "bill_id": "F-2024-0001-04", "amount": 72.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
-        {"payment_id": "PAY-0011", "bill_id": "F-2024-0001-05", "amount": 74.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
-        {"payment_id": "PAY-0012", "bill_id": "F-2024-0001-06", "amount": 76.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
-    ],
-    2: [  # Sedat Kılıçoğlu
-        {"payment_id": "PAY-0013", "bill_id": "F-2024-0002-01", "amount": 67.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
-        {"payment_id": "PAY-0014", "bill_id": "F-2024-0002-02", "amount": 69.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
-        {"payment_id": "PAY-0015", "bill_id": "F-2024-0002-03", "amount": 71.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
-        {"payment_id": "PAY-0016", "bill_id": "F-2024-0002-04", "amount": 73.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
-        {"payment_id": "PAY-0017", "bill_id": "F-2024-0002-05", "amount": 75.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
-        {"payment_id": "PAY-0018", "bill_id": "F-2024-0002-06", "amount": 77.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
-    ],
-    3: [  # Erkan Tanrıöver
-        {"payment_id": "PAY-0019", "bill_id": "F-2024-0003-01", "amount": 68.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
-        {"payment_id": "PAY-0020", "bill_id": "F-2024-0003-02", "amount": 70.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
-        {"payment_id": "PAY-0021", "bill_id": "F-2024-0003-03", "amount": 72.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
-        {"payment_id": "PAY-0022", "bill_id": "F-2024-0003-04", "amount": 74.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
-        {"payment_id": "PAY-0023", "bill_id": "F-2024-0003-05", "amount": 76.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
-        {"payment_id": "PAY-0024", "bill_id": "F-2024-0003-06", "amount": 78.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
-    ],
-    4: [  # Ahmet Nazif Gemalmaz
-        {"payment_id": "PAY-0025", "bill_id": "F-2024-0004-01", "amount": 69.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
-        {"payment_id": "PAY-0026", "bill_id": "F-2024-0004-02", "amount": 71.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
-        {"payment_id": "PAY-0027", "bill_id": "F-2024-0004-03", "amount": 73.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
-        {"payment_id": "PAY-0028", "bill_id": "F-2024-0004-04", "amount": 75.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
-        {"payment_id": "PAY-0029", "bill_id": "F-2024-0004-05", "amount": 77.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
-        {"payment_id": "PAY-0030", "bill_id": "F-2024-0004-06", "amount": 79.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
-    ],
-    5: [  # Ziişan Şahin
-        {"payment_id": "PAY-0031", "bill_id": "F-2024-0005-01", "amount": 114.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
-        {"payment_id": "PAY-0032", "bill_id": "F-2024-0005-02", "amount": 116.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
-        {"payment_id": "PAY-0033", "bill_id": "F-2024-0005-03", "amount": 118.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
-        {"payment_id": "PAY-0034", "bill_id": "F-2024-0005-04", "amount": 120.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
-        {"payment_id": "PAY-0035", "bill_id": "F-2024-0005-05", "amount": 122.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
-        {"payment_id": "PAY-0036", "bill_id": "F-2024-0005-06", "amount": 124.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
-    ]
-}
-
-# Destek Talepleri Verileri
-SUPPORT_TICKETS = {
-    0: [  # Enes Faruk Aydın
-        {"ticket_id": "TICKET-0001", "issue": "İnternet hızı yavaş", "category": "technical", "priority": "medium", "status": "resolved", "created": "2024-01-15"},
-        {"ticket_id": "TICKET-0002", "issue": "Fatura sorusu", "category": "billing", "priority": "low", "status": "resolved", "created": "2024-02-20"},
-        {"ticket_id": "TICKET-0003", "issue": "Paket değişikliği", "category": "service", "priority": "medium", "status": "open", "created": "2024-03-10"}
-    ],
-    1: [  # Nisa Nur Özkal
-        {"ticket_id": "TICKET-0004", "issue": "SMS gönderemiyorum", "category": "technical", "priority": "high", "status": "resolved", "created": "2024-01-10"},
-        {"ticket_id": "TICKET-0005", "issue": "Roaming aktifleştirme", "category": "service", "priority": "medium", "status": "open", "created": "2024-02-25"}
-    ],
-    2: [  # Sedat Kılıçoğlu
-        {"ticket_id": "TICKET-0006", "issue": "Konuşma kesintisi", "category": "technical", "priority": "high", "status": "resolved", "created": "2024-01-20"},
-        {"ticket_id": "TICKET-0007", "issue": "Paket bilgisi", "category": "service", "priority": "low", "status": "resolved", "created": "2024-02-15"}
-    ],
-    3: [  # Erkan Tanrıöver
-        {"ticket_id": "TICKET-0008", "issue": "İnternet bağlantı sorunu", "category": "technical", "priority": "medium", "status": "open", "created": "2024-03-05"}
-    ],
-    4: [  # Ahmet Nazif Gemalmaz
-        {"ticket_id": "TICKET-0009", "issue": "Fatura ödeme sorunu", "category": "billing", "priority": "high", "status": "resolved", "created": "2024-01-25"},
-        {"ticket_id": "TICKET-0010", "issue": "Premium hizmet aktivasyonu", "category": "service", "priority": "medium", "status": "open", "created": "2024-02-28"}
-    ],
-    5: [  # Ziişan Şahin
-        {"ticket_id": "TICKET-0011", "issue": "Kota aşımı sorusu", "category": "billing", "priority": "low", "status": "resolved", "created": "2024-01-30"},
-        {"ticket_id": "TICKET-0012", "issue": "Roaming kullanımı", "category": "service", "priority": "medium", "status": "open", "created": "2024-03-01"}
-    ]
-}
-
-# Ağ Durumu Verileri
-NETWORK_STATUS = {
-    "istanbul": {
-        "status": "excellent",
-        "coverage": 95,
-        "speed": "100 Mbps",
-        "issues": [],
-        "last_update": "2024-03-01T10:00:00Z"
-    },
-    "ankara": {
-        "status": "good",
-        "coverage": 90,
-        "speed": "85 Mbps",
-        "issues": ["Minor maintenance in Çankaya"],
-        "last_update": "2024-03-01T10:00:00Z"
-    },
-    "izmir": {
-        "status": "fair",
-        "coverage": 85,
-        "speed": "75 Mbps",
-        "issues": ["Network upgrade in progress"],
-        "last_update": "2024-03-01T10:00:00Z"
-    },
-    "bursa": {
-        "status": "good",
-        "coverage": 88,
-        "speed": "80 Mbps",
-        "issues": [],
-        "last_update": "2024-03-01T10:00:00Z"
-    },
-    "antalya": {
-        "status": "excellent",
-        "coverage": 92,
-        "speed": "95 Mbps",
-        "issues": [],
-        "last_update": "2024-03-01T10:00:00Z"
-    }
-}
-
-# Hız Testi Verileri
-SPEED_TEST_DATA = {
-    0: {"download": 100, "upload": 50, "ping": 15, "jitter": 5},
-    1: {"download": 95, "upload": 48, "ping": 18, "jitter": 6},
-    2: {"download": 90, "upload": 45, "ping": 20, "jitter": 7},
-    3: {"download": 85, "upload": 42, "ping": 22, "jitter": 8},
-    4: {"download": 80, "upload": 40, "ping": 25, "jitter": 9},
-    5: {"download": 75, "upload": 37, "ping": 28, "jitter": 10}
-}
-
-# Roaming Verileri
-ROAMING_DATA = {
-    0: {"enabled": True, "countries": ["Türkiye", "Almanya", "Fransa"], "usage": 2.5, "cost": 15.00},
-    1: {"enabled": False, "countries": [], "usage": 0, "cost": 0},
-    2: {"enabled": True, "countries": ["Türkiye", "İtalya"], "usage": 1.8, "cost": 12.00},
-    3: {"enabled": True, "countries": ["Türkiye", "İspanya", "Portekiz"], "usage": 3.2, "cost": 18.50},
-    4: {"enabled": False, "countries": [], "usage": 0, "cost": 0},
-    5: {"enabled": True, "countries": ["Türkiye", "Hollanda", "Belçika"], "usage": 4.1, "cost": 22.00}
-}
-
 # Paket Değişiklik Geçmişi
 PACKAGE_CHANGE_HISTORY = {
     0: [
@@ -341,25 +54,7 @@ PACKAGE_CHANGE_HISTORY = {
     ]
 }
 
-# Otomatik Ödeme Verileri
-AUTOPAY_DATA = {
-    0: {"enabled": True, "method": "credit_card", "card_last4": "1234", "next_payment": "2024-04-15"},
-    1: {"enabled": False, "method": None, "card_last4": None, "next_payment": None},
-    2: {"enabled": True, "method": "bank_transfer", "account_last4": "5678", "next_payment": "2024-04-15"},
-    3: {"enabled": True, "method": "credit_card", "card_last4": "9012", "next_payment": "2024-04-15"},
-    4: {"enabled": False, "method": None, "card_last4": None, "next_payment": None},
-    5: {"enabled": True, "method": "bank_transfer", "account_last4": "3456", "next_payment": "2024-04-15"}
-}
 
-# Hat Askıya Alma Verileri
-LINE_SUSPENSION_DATA = {
-    0: {"suspended": False, "reason": None, "suspension_date": None},
-    1: {"suspended": True, "reason": "Ödeme gecikmesi", "suspension_date": "2024-02-15"},
-    2: {"suspended": False, "reason": None, "suspension_date": None},
-    3: {"suspended": False, "reason": None, "suspension_date": None},
-    4: {"suspended": True, "reason": "Talep üzerine", "suspension_date": "2024-03-01"},
-    5: {"suspended": False, "reason": None, "suspension_date": None}
-}
 
 # ============================================================================
 # YENİ MOCK VERİLER - EKSİK ENDPOINT'LER İÇİN
@@ -816,7 +511,8 @@ PACKAGE_DETAILS = {
 
 def get_mock_customer_data(user_id: int):
     """User ID'ye göre mock müşteri verisi döner"""
-    return CUSTOMERS.get(user_id, CUSTOMERS[0])
+    customer = STORE.customer(user_id) or STORE.customer(0)
+    return customer.as_dict()
 
 def get_mock_bill_data(user_id: int):
     """User ID'ye göre mock fatura verisi döner"""
@@ -1095,109 +791,9 @@ async def get_past_bills(request: PastBillsRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Fatura geçmişi sorgulanıyor: User ID {user_id}, Limit: {request.limit}")
         
-        bills = []
-        base_amount = 50 + (user_id % 50)
-        
-        # Daha detaylı geçmiş faturalar
-        for i in range(min(request.limit, 24)):  # 24 adet fatura (2 yıl)
-            # Farklı aylar için farklı tutarlar
-            month_variation = (i % 12) * 2  # 0-22 arası
-            seasonal_adjustment = 0
-            
-            # Yaz aylarında (6-8) daha yüksek fatura
-            if i % 12 in [5, 6, 7]:  # Haziran, Temmuz, Ağustos
-                seasonal_adjustment = 15
-            
-            # Kış aylarında (12-2) orta fatura
-            elif i % 12 in [11, 0, 1]:  # Aralık, Ocak, Şubat
-                seasonal_adjustment = 10
-            
-            # Diğer aylarda normal fatura
-            else:
-                seasonal_adjustment = 5
-            
-            bill_amount = base_amount + month_variation + seasonal_adjustment
-            
-            # Fatura durumu: Son 3 fatura ödenmemiş olabilir
-            bill_status = "paid" if i < 21 else "unpaid"
-            
-            # Farklı hizmet kombinasyonları
-            services = []
-            if i % 4 == 0:  # Her 4. fatura sadece internet
-                services = [
-                    {
-                        "service_name": "Mega İnternet",
-                        "amount": bill_amount * 0.8
-                    },
-                    {
-                        "service_name": "Sesli Arama",
-                        "amount": bill_amount * 0.2
-                    }
-                ]
-            elif i % 4 == 1:  # Her 4. fatura + SMS
-                services = [
-                    {
-                        "service_name": "Mega İnternet",
-                        "amount": bill_amount * 0.7
-                    },
-                    {
-                        "service_name": "Sesli Arama",
-                        "amount": bill_amount * 0.2
-                    },
-                    {
-                        "service_name": "SMS Paketi",
-                        "amount": bill_amount * 0.1
-                    }
-                ]
-            elif i % 4 == 2:  # Her 4. fatura + roaming
-                services = [
-                    {
-                        "service_name": "Mega İnternet",
-                        "amount": bill_amount * 0.6
-                    },
-                    {
-                        "service_name": "Sesli Arama",
-                        "amount": bill_amount * 0.2
-                    },
-                    {
-                        "service_name": "Roaming Servisi",
-                        "amount": bill_amount * 0.2
-                    }
-                ]
-            else:  # Her 4. fatura premium hizmetler
-                services = [
-                    {
-                        "service_name": "Mega İnternet",
-                        "amount": bill_amount * 0.5
-                    },
-                    {
-                        "service_name": "Sesli Arama",
-                        "amount": bill_amount * 0.2
-                    },
-                    {
-                        "service_name": "Premium Hizmetler",
-                        "amount": bill_amount * 0.3
-                    }
-                ]
-            
-            # Gerçekçi tarihler (2023-2024)
-            year = 2023 if i < 12 else 2024
-            month = (i % 12) + 1
-            
-            bill_data = {
-                "bill_id": f"F-{year}-{user_id:04d}-{month:02d}",
-                "user_id": user_id,
-                "amount": bill_amount,
-                "currency": "TRY",
-                "bill_date": f"{year}-{month:02d}-28",
-                "due_date": f"{year}-{month+1:02d}-15",
-                "status": bill_status,
-                "services": services,
-                "payment_method": "credit_card" if i % 3 == 0 else "bank_transfer" if i % 3 == 1 else "auto_pay",
-                "late_fee": 0 if bill_status == "paid" else 15.50,
-                "discount_applied": 5.00 if i % 6 == 0 else 0.00  # Her 6. faturada indirim
-            }
-            bills.append(bill_data)
+        # Kullanıcının 24 aylık tablosu bir kez kurulur; limit dilim, toplamlar önek toplamından
+        history = router_bill_history(user_id)
+        bills = history.slice(min(request.limit, ROUTER_HISTORY_MONTHS))
         
         return {
             "success": True,
@@ -1205,9 +801,7 @@ async def get_past_bills(request: PastBillsRequest):
                 "bills": bills,
                 "total_count": len(bills),
                 "user_id": user_id,
-                "total_paid": sum(bill["amount"] for bill in bills if bill["status"] == "paid"),
-                "total_unpaid": sum(bill["amount"] for bill in bills if bill["status"] == "unpaid"),
-                "average_amount": sum(bill["amount"] for bill in bills) / len(bills)
+                **history.aggregates(len(bills))
             }
         }
         
@@ -1247,8 +841,8 @@ async def get_payment_history(request: AuthenticatedUserIdRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Ödeme geçmişi sorgulanıyor: User ID {user_id}")
         
-        # Yeni detaylı ödeme verilerini kullan
-        payments = PAYMENT_HISTORY.get(user_id, [])
+        # Depodaki ödeme kayıtları
+        payments = [payment.as_dict() for payment in STORE.payments(user_id)]
         
         return {
             "success": True,
@@ -1273,13 +867,14 @@ async def setup_autopay(request: AutopayRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Otomatik ödeme ayarlanıyor: User ID {user_id}, Status: {request.status}")
         
-        # Yeni detaylı otomatik ödeme verilerini kullan
-        autopay_data = AUTOPAY_DATA.get(user_id, {
+        # Depodaki otomatik ödeme ayarları
+        services = STORE.services(user_id)
+        autopay_data = services.autopay if services else {
             "enabled": False,
             "method": None,
             "card_last4": None,
             "next_payment": None
-        })
+        }
         
         return {
             "success": True,
@@ -1309,9 +904,9 @@ async def get_customer_package(request: AuthenticatedUserIdRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Mevcut paket sorgulanıyor: User ID {user_id}")
         
-        # Önce USER_PACKAGES dict'ine bak
-        package_data = USER_PACKAGES.get(user_id)
-        if package_data is None:
+        # Depodaki paket kaydına bak
+        package = STORE.package(user_id)
+        if package is None:
             return {
                 "success": False,
                 "message": "Kullanıcının aktif bir paketi yok.",
@@ -1319,7 +914,7 @@ async def get_customer_package(request: AuthenticatedUserIdRequest):
             }
         return {
             "success": True,
-            "data": package_data
+            "data": package.as_dict()
         }
     except Exception as e:
         logger.error(f"Mevcut paket getirme hatası: {e}")
@@ -1368,46 +963,49 @@ async def change_package(request: PackageChangeRequest):
         logger.error(f"Paket değişikliği hatası: {e}")
         raise HTTPException(status_code=500, detail=f"Paket değişikliği hatası: {str(e)}")
 
+# Satıştaki paketler; yanıt her istekte aynı olduğundan bir kez kurulur
+_AVAILABLE_PACKAGES = [
+    {
+        "package_name": "Mega İnternet",
+        "monthly_fee": 69.50,
+        "features": {"internet_gb": 50, "voice_minutes": 1000, "sms_count": 500, "roaming_enabled": False},
+        "description": "Hızlı internet ve bol dakika"
+    },
+    {
+        "package_name": "Öğrenci Dostu Tarife",
+        "monthly_fee": 49.90,
+        "features": {"internet_gb": 30, "voice_minutes": 500, "sms_count": 250, "roaming_enabled": False},
+        "description": "Öğrenciler için özel tarife"
+    },
+    {
+        "package_name": "Süper Konuşma",
+        "monthly_fee": 59.90,
+        "features": {"internet_gb": 25, "voice_minutes": 2000, "sms_count": 1000, "roaming_enabled": True},
+        "description": "Bol dakika ve SMS"
+    },
+    {
+        "package_name": "Premium Paket",
+        "monthly_fee": 89.90,
+        "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
+        "description": "Premium hizmetler"
+    }
+]
+
+AVAILABLE_PACKAGES_RESPONSE = PrecomputedJSON({
+    "success": True,
+    "data": {
+        "packages": _AVAILABLE_PACKAGES,
+        "total_count": len(_AVAILABLE_PACKAGES)
+    }
+})
+
 @router.post("/packages/available")
 async def get_available_packages():
     """Kullanılabilir paketleri listele"""
     try:
         logger.info("Kullanılabilir paketler sorgulanıyor")
         
-        packages = [
-            {
-                "package_name": "Mega İnternet",
-                "monthly_fee": 69.50,
-                "features": {"internet_gb": 50, "voice_minutes": 1000, "sms_count": 500, "roaming_enabled": False},
-                "description": "Hızlı internet ve bol dakika"
-            },
-            {
-                "package_name": "Öğrenci Dostu Tarife",
-                "monthly_fee": 49.90,
-                "features": {"internet_gb": 30, "voice_minutes": 500, "sms_count": 250, "roaming_enabled": False},
-                "description": "Öğrenciler için özel tarife"
-            },
-            {
-                "package_name": "Süper Konuşma",
-                "monthly_fee": 59.90,
-                "features": {"internet_gb": 25, "voice_minutes": 2000, "sms_count": 1000, "roaming_enabled": True},
-                "description": "Bol dakika ve SMS"
-            },
-            {
-                "package_name": "Premium Paket",
-                "monthly_fee": 89.90,
-                "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
-                "description": "Premium hizmetler"
-            }
-        ]
-        
-        return {
-            "success": True,
-            "data": {
-                "packages": packages,
-                "total_count": len(packages)
-            }
-        }
+        return AVAILABLE_PACKAGES_RESPONSE.response()
         
     except Exception as e:
         logger.error(f"Kullanılabilir paketler getirme hatası: {e}")
@@ -1444,13 +1042,14 @@ async def enable_roaming(request: RoamingRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Roaming ayarlanıyor: User ID {user_id}, Status: {request.status}")
         
-        # Yeni detaylı roaming verilerini kullan
-        roaming_data = ROAMING_DATA.get(user_id, {
+        # Depodaki roaming verileri
+        services = STORE.services(user_id)
+        roaming_data = services.roaming if services else {
             "enabled": False,
             "countries": [],
             "usage": 0,
             "cost": 0
-        })
+        }
         
         return {
             "success": True,
@@ -1479,14 +1078,15 @@ async def check_network_status(request: NetworkStatusRequest):
     try:
         logger.info(f"Ağ durumu kontrol ediliyor: Region {request.region}")
         
-        # Yeni detaylı ağ verilerini kullan
-        network_status = NETWORK_STATUS.get(request.region.lower(), {
+        # Bölge indeksinden ağ durumu
+        region = STORE.network_region(request.region)
+        network_status = region.as_dict() if region else {
             "status": "unknown",
             "coverage": 0,
             "speed": "0 Mbps",
             "issues": ["Region not found"],
             "last_update": "2024-03-01T10:00:00Z"
-        })
+        }
         
         return {
             "success": True,
@@ -1598,13 +1198,14 @@ async def test_internet_speed(request: AuthenticatedUserIdRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"İnternet hız testi yapılıyor: User ID {user_id}")
         
-        # Yeni detaylı hız verilerini kullan
-        speed_data = SPEED_TEST_DATA.get(user_id, {
+        # Depodaki hız testi verileri
+        services = STORE.services(user_id)
+        speed_data = services.speed_test if services else {
             "download": 75,
             "upload": 37,
             "ping": 28,
             "jitter": 10
-        })
+        }
         
         return {
             "success": True,
@@ -1684,12 +1285,13 @@ async def suspend_line(request: LineSuspendRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Hat askıya alınıyor: User ID {user_id}, Reason: {request.reason}")
         
-        # Yeni detaylı hat askıya alma verilerini kullan
-        suspension_data = LINE_SUSPENSION_DATA.get(user_id, {
+        # Depodaki hat askı durumu
+        services = STORE.services(user_id)
+        suspension_data = services.suspension if services else {
             "suspended": False,
             "reason": None,
             "suspension_date": None
-        })
+        }
         
         suspend_data = {
             "user_id": user_id,
@@ -1743,17 +1345,17 @@ async def get_users_tickets(request: AuthenticatedUserIdRequest):
         user_id = get_current_user_from_token(request.session_token)
         logger.info(f"Kullanıcı destek talepleri sorgulanıyor: User ID {user_id}")
         
-        # Yeni detaylı destek verilerini kullan
-        tickets = SUPPORT_TICKETS.get(user_id, [])
+        # Depodaki destek talepleri
+        tickets = STORE.tickets(user_id)
         
         return {
             "success": True,
             "data": {
-                "tickets": tickets,
+                "tickets": [ticket.as_dict() for ticket in tickets],
                 "user_id": user_id,
                 "total_count": len(tickets),
-                "open_tickets": len([t for t in tickets if t["status"] == "open"]),
-                "resolved_tickets": len([t for t in tickets if t["status"] == "resolved"])
+                "open_tickets": sum(ticket.status == "open" for ticket in tickets),
+                "resolved_tickets": sum(ticket.status == "resolved" for ticket in tickets)
             }
         }
     except Exception as e:
@@ -1763,21 +1365,12 @@ async def get_users_tickets(request: AuthenticatedUserIdRequest):
 @router.post("/auth/register")
 async def register_user(request: RegisterRequest):
     """Kullanıcı kaydı endpointi"""
-    if request.email in REGISTERED_USERS:
-        raise HTTPException(status_code=400, detail="Bu email ile zaten bir kullanıcı var.")
-    
-    # Yeni user_id ata (mevcut kullanıcılardan sonra)
-    max_user_id = max([user["user_id"] for user in REGISTERED_USERS.values()]) if REGISTERED_USERS else -1
-    user_id = max_user_id + 1
-    
-    user_info = {
-        "user_id": user_id,
-        "email": request.email,
-        "password": request.password,  # Not: Gerçek uygulamada hashlenmeli!
-        "name": request.name
-    }
-    REGISTERED_USERS[request.email] = user_info
-    USER_PACKAGES[user_id] = None  # Başlangıçta paketi yok
+    # Yeni user_id depo tarafından atanır (en büyük user_id + 1); başlangıçta paketi yok
+    try:
+        account = STORE.register_account(request.email, request.password, request.name)  # Not: Gerçek uygulamada hashlenmeli!
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    user_id = account.user_id
     
     # Session oluştur
     session_token = create_session(user_id)
@@ -1813,40 +1406,23 @@ async def login_user(request: LoginRequest):
 # AUTHENTICATION FUNCTIONS
 # ============================================================================
 
-import secrets
-import time
-
-def generate_session_token() -> str:
-    """Güvenli session token oluşturur"""
-    return secrets.token_urlsafe(32)
-
 def create_session(user_id: int) -> str:
     """Kullanıcı için session oluşturur"""
-    token = generate_session_token()
-    ACTIVE_SESSIONS[token] = {
-        "user_id": user_id,
-        "created_at": time.time(),
-        "expires_at": time.time() + (7 * 24 * 60 * 60)  # 7 gün
-    }
-    return token
+    return SESSION_STORE.create(user_id)
 
 def validate_session(token: str) -> int:
-    """Session token'ı doğrular ve user_id döner"""
-    if token not in ACTIVE_SESSIONS:
-        raise HTTPException(status_code=401, detail="Geçersiz session token")
-    
-    session = ACTIVE_SESSIONS[token]
-    if time.time() > session["expires_at"]:
-        del ACTIVE_SESSIONS[token]
-        raise HTTPException(status_code=401, detail="Session süresi dolmuş")
-    
-    return session["user_id"]
+    """Session token'ı doğrular ve user_id döner (AI araçlarıyla aynı çözücü)"""
+    try:
+        return session_resolver.resolve(token)
+    except SessionError as e:
+        raise HTTPException(status_code=401, detail=str(e))
 
 def get_user_from_email(email: str) -> dict:
     """Email ile kullanıcı bilgilerini getirir"""
-    if email not in REGISTERED_USERS:
+    account = STORE.account(email)
+    if account is None:
         raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
-    return REGISTERED_USERS[email]
+    return account.as_dict()
 
 def authenticate_user(email: str, password: str) -> dict:
     """Kullanıcı kimlik doğrulaması yapar"""
@@ -1861,11 +1437,11 @@ def authenticate_user(email: str, password: str) -> dict:
 
 def get_all_customer_ids() -> set:
     """Tüm müşteri ID'lerini döner"""
-    return set(CUSTOMERS.keys())
+    return set(STORE.snapshot.customers)
 
 def is_valid_user_id(user_id: int) -> bool:
     """User ID'nin geçerli olup olmadığını kontrol eder"""
-    return user_id in CUSTOMERS
+    return STORE.has_customer(user_id)
 
 def validate_user_id(user_id: int):
     """User ID'yi doğrular, geçersizse HTTPException fırlatır"""
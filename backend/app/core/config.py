@@ -19,6 +19,69 @@ class Settings:
         r"C:\Users\erkan\Desktop\ChoyrensAi-models\choyrens_model_v4_gguf"
     )
     
+    # Çıkarım Yürütücü Ayarları
+    INFERENCE_CONCURRENCY: int = int(os.getenv("INFERENCE_CONCURRENCY", "1"))  # Paralel Llama örneği sayısı
+    INFERENCE_MAX_QUEUE: int = int(os.getenv("INFERENCE_MAX_QUEUE", "16"))  # Bu sınırı aşan istekler 503 alır
+    INFERENCE_BACKEND: Literal["pool", "batch"] = os.getenv("INFERENCE_BACKEND", "pool")  # batch: sürekli batch zamanlayıcı (deneysel)
+    INFERENCE_BATCH_SLOTS: int = int(os.getenv("INFERENCE_BATCH_SLOTS", "16"))  # Eşzamanlı KV sekans slotu
+
+    # Model Sunucusu Ayarları (çok worker'lı dağıtım)
+    INFERENCE_MODE: Literal["local", "remote"] = os.getenv("INFERENCE_MODE", "local")  # remote: model ayrı süreçte
+    MODEL_SERVER_SOCKET: str = os.getenv("MODEL_SERVER_SOCKET", "/tmp/uniqeai-model.sock")  # Unix soket yolu
+    MODEL_SERVER_CONNECT_TIMEOUT_S: float = float(os.getenv("MODEL_SERVER_CONNECT_TIMEOUT_S", "120"))  # Sunucu hazır olana kadar bekleme
+
+    # llama.cpp Ayarları
+    LLAMA_N_CTX: int = int(os.getenv("LLAMA_N_CTX", "2048"))  # Sekans başına context
+    LLAMA_N_THREADS: int = int(os.getenv("LLAMA_N_THREADS", "4"))
+    LLAMA_N_BATCH: int = int(os.getenv("LLAMA_N_BATCH", "512"))  # Mantıksal batch (prompt prefill)
+    LLAMA_N_UBATCH: int = int(os.getenv("LLAMA_N_UBATCH", "512"))  # Fiziksel batch
+    LLAMA_PROMPT_CACHE: bool = os.getenv("LLAMA_PROMPT_CACHE", "true").lower() == "true"  # Sabit önek KV önbelleği
+
+    # Araç Yürütme Ayarları
+    TOOL_TIMEOUT_S: float = float(os.getenv("TOOL_TIMEOUT_S", "10"))  # Araç başına zaman aşımı
+
+    # Yanıt Önbelleği Ayarları (AI endpoint fonksiyonları)
+    RESPONSE_CACHE_MAXSIZE: int = int(os.getenv("RESPONSE_CACHE_MAXSIZE", "2048"))
+    RESPONSE_CACHE_TTL_USER: float = float(os.getenv("RESPONSE_CACHE_TTL_USER", "60"))  # Kullanıcı paketi
+    RESPONSE_CACHE_TTL_CATALOG: float = float(os.getenv("RESPONSE_CACHE_TTL_CATALOG", "300"))  # Paket kataloğu
+    RESPONSE_CACHE_TTL_NETWORK: float = float(os.getenv("RESPONSE_CACHE_TTL_NETWORK", "30"))  # Ağ durumu
+
+    # Anlamsal Yanıt Önbelleği Ayarları
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"  # İsteğe bağlı
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.9"))  # Kosinüs benzerliği eşiği
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "5000"))
+
+    # Niyet Yönlendirici Ayarları
+    INTENT_SHORT_CIRCUIT: bool = os.getenv("INTENT_SHORT_CIRCUIT", "false").lower() == "true"  # Açık niyetlerde LLM atlanır (isteğe bağlı)
+    INTENT_SHORT_CIRCUIT_MAX_WORDS: int = int(os.getenv("INTENT_SHORT_CIRCUIT_MAX_WORDS", "6"))  # Kısa yol için azami kelime
+
+    # Feedback Yazma Kuyruğu Ayarları
+    FEEDBACK_DB_URL: str = os.getenv("FEEDBACK_DB_URL", "sqlite:///./feedback.db")
+    FEEDBACK_BATCH_SIZE: int = int(os.getenv("FEEDBACK_BATCH_SIZE", "256"))  # Flush başına azami olay
+    FEEDBACK_FLUSH_INTERVAL_S: float = float(os.getenv("FEEDBACK_FLUSH_INTERVAL_S", "0.5"))  # Azami bekleme
+    FEEDBACK_QUEUE_MAX: int = int(os.getenv("FEEDBACK_QUEUE_MAX", "10000"))  # Dolunca istekler yer açılmasını bekler
+
+    # Oturum Deposu Ayarları (telekom auth)
+    SESSION_BACKEND: Literal["memory", "sqlite"] = os.getenv("SESSION_BACKEND", "memory")  # sqlite: worker'lar arası paylaşım
+    SESSION_DB_PATH: str = os.getenv("SESSION_DB_PATH", "./sessions.db")  # /dev/shm altında bellekte tutulur
+    SESSION_TTL_S: float = float(os.getenv("SESSION_TTL_S", str(7 * 24 * 60 * 60)))  # 7 gün
+    SESSION_MAX: int = int(os.getenv("SESSION_MAX", "1000000"))  # Aşılınca süresi en yakın oturum atılır
+    SESSION_SWEEP_INTERVAL_S: float = float(os.getenv("SESSION_SWEEP_INTERVAL_S", "60"))  # main.py arka plan görevinin süpürme aralığı
+    SESSION_RESOLVER_CACHE_SIZE: int = int(os.getenv("SESSION_RESOLVER_CACHE_SIZE", "1024"))  # Son doğrulanan token LRU'su (SQLite backend'inde kullanılmaz)
+    SESSION_RESOLVER_TTL_S: float = float(os.getenv("SESSION_RESOLVER_TTL_S", "30"))  # LRU girdisinin geçerlilik süresi
+
+    # Telekom Veri Deposu Ayarları
+    TELEKOM_STORE_DB_PATH: str = os.getenv("TELEKOM_STORE_DB_PATH", "")  # Boşsa yalnızca bellek (başlangıç verisiyle)
+    TELEKOM_FIXTURE_CUSTOMERS: int = int(os.getenv("TELEKOM_FIXTURE_CUSTOMERS", "0"))  # >0 ise startup'ta sentetik müşteri yüklenir
+    TELEKOM_FIXTURE_SEED: int = int(os.getenv("TELEKOM_FIXTURE_SEED", "42"))
+
+    # Yanıt Serileştirme Ayarları
+    FAST_JSON: bool = os.getenv("FAST_JSON", "false").lower() == "true"  # orjson ile serileştir (orjson kurulu olmalı)
+
+    # İzleme (Tracing) Ayarları
+    TRACE_SAMPLE_RATE: float = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))  # Ayrıntılı span listesi tutulan istek oranı (0-1)
+    TRACE_BUFFER_SIZE: int = int(os.getenv("TRACE_BUFFER_SIZE", "200"))  # /api/v1/traces'te tutulan son iz sayısı
+
     # Backend Ayarları
     BACKEND_HOST: str = os.getenv("BACKEND_HOST", "0.0.0.0")
     BACKEND_PORT: int = int(os.getenv("BACKEND_PORT", "8000"))
@@ -0,0 +1,131 @@
+"""
+Hızlı JSON yanıt serileştirme (FAST_JSON=true ile açılır)
+
+FastAPI, endpoint'in döndürdüğü sözlüğü önce `jsonable_encoder` ile baştan
+sona dolaşıp kopyalar, sonra `json.dumps` ile yazar; response_model varsa
+ayrıca doğrular. Büyük iç içe yanıtlarda (fatura geçmişi, paket listeleri,
+araç sonuçlu chat yanıtı) maliyetin çoğu buradadır.
+
+`FastJSONRoute` bu yolu kısaltır: endpoint sözlük/liste döndürürse (ve
+response_model yoksa) gövde doğrudan orjson ile yazılır; response_model ile
+aynı tipte bir Pydantic modeli döndürürse pydantic-core'un
+`model_dump_json()`'ı kullanılır. `PrecomputedJSON` hiç değişmeyen yanıtları
+bir kez serileştirip aynı baytları döndürür.
+
+FAST_JSON kapalıysa veya orjson kurulu değilse hiçbir şey değişmez; yanıtlar
+FastAPI'nin varsayılan yolundan geçer.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, Optional
+
+from fastapi import BackgroundTasks, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from .config import settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+FAST_JSON_ENABLED = settings.FAST_JSON and ORJSON_AVAILABLE
+if settings.FAST_JSON and not ORJSON_AVAILABLE:
+    print("orjson kurulu değil. FAST_JSON devre dışı; varsayılan JSON serileştirme kullanılıyor.")
+
+
+def _default(obj: Any) -> Any:
+    # orjson'un tanımadığı tipler (Pydantic modelleri, Decimal, set...) için FastAPI kuralları
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """orjson ile serileştir; int anahtarlı sözlükler json.dumps gibi stringe çevrilir"""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """Gövdeyi orjson ile yazan JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class PrecomputedJSON:
+    """Hiç değişmeyen yanıt: FAST_JSON açıksa gövde bir kez serileştirilir"""
+
+    def __init__(self, content: Any):
+        self.content = content
+        self.body: Optional[bytes] = dumps(content) if FAST_JSON_ENABLED else None
+
+    def response(self) -> Any:
+        if self.body is None:
+            return self.content
+        return Response(content=self.body, media_type="application/json")
+
+
+def _fast_endpoint(endpoint: Callable, response_model: Any, status_code: Optional[int]) -> Callable:
+    status = status_code or 200
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        if isinstance(result, BaseModel) and type(result) is response_model:
+            # Endpoint zaten response_model örneği döndürdü; yeniden doğrulamaya gerek yok
+            return Response(content=result.model_dump_json(by_alias=True), status_code=status, media_type="application/json")
+        if response_model is None and isinstance(result, (dict, list)):
+            return FastJSONResponse(result, status_code=status)
+        return result
+
+    return wrapper
+
+
+# response_model filtrelerinin FastAPI varsayılanları; farklı verilen route'lar sarılmaz
+_RESPONSE_MODEL_DEFAULTS = {
+    "response_model_include": None,
+    "response_model_exclude": None,
+    "response_model_by_alias": True,
+    "response_model_exclude_unset": False,
+    "response_model_exclude_defaults": False,
+    "response_model_exclude_none": False,
+}
+
+
+def _needs_default_path(endpoint: Callable, route_options: dict) -> bool:
+    # Response/BackgroundTasks parametresi alan endpoint'lerin başlık ve görevleri
+    # FastAPI'nin kendi kurduğu yanıta eklenir; bunlar sarılmaz
+    if any(route_options.get(name, default) != default for name, default in _RESPONSE_MODEL_DEFAULTS.items()):
+        return True
+    for param in inspect.signature(endpoint).parameters.values():
+        if inspect.isclass(param.annotation) and issubclass(param.annotation, (Response, BackgroundTasks)):
+            return True
+    return not inspect.iscoroutinefunction(endpoint)
+
+
+def _declared_model(endpoint: Callable, response_model: Any) -> Any:
+    """Route'un yanıt modeli (açıkça verilmiş ya da dönüş tipinden); yoksa None"""
+    if isinstance(response_model, DefaultPlaceholder):
+        annotation = inspect.signature(endpoint).return_annotation
+        return None if annotation is inspect.Signature.empty else annotation
+    return response_model
+
+
+class FastJSONRoute(APIRoute):
+    """FAST_JSON açıkken yanıtı jsonable_encoder'a uğramadan serileştiren route sınıfı"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        if FAST_JSON_ENABLED and not _needs_default_path(endpoint, kwargs):
+            response_model = _declared_model(endpoint, kwargs.get("response_model", DefaultPlaceholder(None)))
+            # Model Pydantic sınıfı değilse (List[...], Dict[...]) doğrulama FastAPI'de kalır
+            if response_model is None or (inspect.isclass(response_model) and issubclass(response_model, BaseModel)):
+                endpoint = _fast_endpoint(endpoint, response_model, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
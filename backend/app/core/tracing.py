@@ -0,0 +1,364 @@
+"""
+İstek kapsamlı performans izleme ve Prometheus metrikleri
+
+Her chat isteği bir `Trace` açar; iz, contextvar üzerinden orkestratöre,
+araç motoruna ve (asyncio görevleri bağlamı kopyaladığı için) eşzamanlı
+araç görevlerine taşınır. `span("ad")` bloğu süreyi ölçer:
+
+  - Süre her istekte `uniqeai_span_duration_seconds{span=...}`
+    histogramına yazılır (iki perf_counter + bir bisect).
+  - Ayrıntılı span listesi (başlangıç ofseti, öznitelikler) yalnızca
+    örneklenen isteklerde (TRACE_SAMPLE_RATE) tutulur ve son
+    TRACE_BUFFER_SIZE iz /api/v1/traces'ten okunabilir.
+
+İz dışında (örn. telekom router'ından doğrudan araç çağrısı) `span()` hiçbir
+şey yapmayan ortak bir nesne döndürür.
+
+Metrikler küçük bir süreç içi kayıt defterinde tutulur ve /metrics'te
+Prometheus metin formatında sunulur; prometheus_client bağımlılığı yoktur.
+Birden fazla uvicorn worker'ında her worker kendi sayaçlarını sunar.
+"""
+
+import bisect
+import contextvars
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .config import settings
+
+# Süre histogramları için kovalar (saniye)
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Decode hızı histogramı için kovalar (token/s)
+TOKENS_PER_SECOND_BUCKETS = (1, 2, 5, 10, 15, 20, 30, 40, 60, 80, 120, 200)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], le: Optional[str] = None) -> str:
+    parts = ['%s="%s"' % (n, _escape(v)) for n, v in zip(names, values)]
+    if le is not None:
+        parts.append('le="%s"' % le)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    """Etiketli, yalnızca artan sayaç"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *label_values: str):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labels:
+            items = [((), 0.0)]
+        return [f"{self.name}{_format_labels(self.labels, k)} {v:g}" for k, v in items]
+
+
+class Histogram:
+    """Etiketli, sabit kovalı histogram"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}  # etiketler -> [kova sayıları..., +Inf, toplam]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        lines = []
+        for label_values, series in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, label_values, format(bound, 'g'))} {cumulative:g}")
+            cumulative += series[len(self.buckets)]
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, label_values, '+Inf')} {cumulative:g}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, label_values)} {series[-1]:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, label_values)} {cumulative:g}")
+        return lines
+
+
+class Gauge:
+    """Okunduğu anda bir fonksiyondan hesaplanan gösterge"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, func: Callable[[], Optional[float]]):
+        self.name = name
+        self.help = help_text
+        self.func = func
+
+    def render(self) -> List[str]:
+        try:
+            value = self.func()
+        except Exception:
+            return []
+        return [] if value is None else [f"{self.name} {float(value):g}"]
+
+
+class MetricsRegistry:
+    """Süreç içi metrik kayıt defteri"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+
+    def _register(self, metric):
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets=DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def gauge(self, name: str, help_text: str, func: Callable[[], Optional[float]]) -> Gauge:
+        """Gauge'u (yeniden) kaydet; aynı adla kayıt eskisinin yerine geçer"""
+        metric = Gauge(name, help_text, func)
+        self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Prometheus metin formatı (0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            body = metric.render()
+            if not body and metric.kind == "gauge":
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(body)
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+REQUEST_DURATION = metrics.histogram(
+    "uniqeai_request_duration_seconds", "İstek başından yanıta kadar geçen süre", ("route",)
+)
+SPAN_DURATION = metrics.histogram(
+    "uniqeai_span_duration_seconds", "İstek içi aşama süreleri (ön işleme, prompt, prefill, decode, araçlar...)", ("span",)
+)
+TOOL_CALLS = metrics.counter("uniqeai_tool_calls_total", "Araç çağrıları (duruma göre)", ("tool", "status"))
+PROMPT_TOKENS = metrics.counter("uniqeai_prompt_tokens_total", "Modele verilen prompt token'ları")
+COMPLETION_TOKENS = metrics.counter("uniqeai_completion_tokens_total", "Modelin ürettiği token'lar")
+DECODE_TOKENS_PER_SECOND = metrics.histogram(
+    "uniqeai_decode_tokens_per_second", "Decode hızı (ilk token sonrası token/s)", buckets=TOKENS_PER_SECOND_BUCKETS
+)
+TRACES_SAMPLED = metrics.counter("uniqeai_traces_sampled_total", "Ayrıntılı kaydı tutulan istekler", ("route",))
+
+
+# ============================================================================
+# İZLER
+# ============================================================================
+
+class Span:
+    """Ölçülen tek aşama; `with span(...) as s: s.set(...)`"""
+
+    __slots__ = ("name", "attrs", "start", "duration", "_trace")
+
+    def __init__(self, trace: "Trace", name: str, attrs: Dict[str, Any]):
+        self._trace = trace
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+        self.duration = 0.0
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self._trace.add(self)
+        return False
+
+
+class _NoopSpan:
+    """İz yokken dönen, hiçbir şey yapmayan span"""
+
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """Bir isteğin izi; span listesi yalnızca örneklenmişse tutulur"""
+
+    __slots__ = ("trace_id", "route", "sampled", "started", "started_wall", "duration", "spans", "attrs", "_token")
+
+    def __init__(self, route: str, sampled: bool):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.route = route
+        self.sampled = sampled
+        self.started = time.perf_counter()
+        self.started_wall = time.time()
+        self.duration: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.attrs: Dict[str, Any] = {}
+        self._token: Optional[contextvars.Token] = None
+
+    def elapsed_ms(self) -> float:
+        """İz başından bu yana (kapandıysa toplam) geçen süre (ms)"""
+        duration = self.duration if self.duration is not None else time.perf_counter() - self.started
+        return duration * 1000
+
+    def add(self, span: Span):
+        SPAN_DURATION.observe(span.duration, span.name)
+        if self.sampled:
+            self.spans.append({
+                "name": span.name,
+                "start_ms": round((span.start - self.started) * 1000, 3),
+                "duration_ms": round(span.duration * 1000, 3),
+                **span.attrs,
+            })
+
+    def record(self, name: str, duration_s: float, end: Optional[float] = None, **attrs):
+        """Dışarıda ölçülmüş bir aşamayı (örn. motorun bildirdiği prefill süresi) span olarak ekle"""
+        span = Span(self, name, attrs)
+        span.duration = max(0.0, duration_s)
+        span.start = (end if end is not None else time.perf_counter()) - span.duration
+        self.add(span)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "route": self.route,
+            "started_at": self.started_wall,
+            "duration_ms": round(self.elapsed_ms(), 3),
+            "attrs": self.attrs,
+            "spans": sorted(self.spans, key=lambda s: s["start_ms"]),
+        }
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("uniqeai_trace", default=None)
+_recent_traces: Deque[Dict[str, Any]] = deque(maxlen=max(1, settings.TRACE_BUFFER_SIZE))
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def span(name: str, **attrs) -> Any:
+    """Geçerli izde bir aşamayı ölç (iz yoksa no-op)"""
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return Span(trace, name, attrs)
+
+
+def start_trace(route: str, sample_rate: Optional[float] = None) -> Trace:
+    """İz aç ve geçerli bağlama bağla (bağlamdan türeyen asyncio görevleri de görür)"""
+    rate = settings.TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+    trace = Trace(route, sampled=rate >= 1.0 or (rate > 0.0 and random.random() < rate))
+    trace._token = _current_trace.set(trace)
+    return trace
+
+
+def end_trace(trace: Trace):
+    """İzi kapat: istek süresini yaz, örneklenmişse son izler arasına ekle"""
+    if trace.duration is not None:
+        return
+    trace.duration = time.perf_counter() - trace.started
+    REQUEST_DURATION.observe(trace.duration, trace.route)
+    if trace.sampled:
+        TRACES_SAMPLED.inc(1.0, trace.route)
+        _recent_traces.append(trace.as_dict())
+    if trace._token is not None:
+        try:
+            _current_trace.reset(trace._token)
+        except ValueError:
+            # Başka bir bağlamda kapatıldı (örn. akış yanıtının gövdesi); iz zaten bitti
+            pass
+        trace._token = None
+
+
+@contextmanager
+def request_trace(route: str, sample_rate: Optional[float] = None) -> Iterator[Trace]:
+    trace = start_trace(route, sample_rate)
+    try:
+        yield trace
+    finally:
+        end_trace(trace)
+
+
+def recent_traces(limit: int = 20) -> List[Dict[str, Any]]:
+    """Son örneklenmiş izler (yeniden eskiye)"""
+    return list(_recent_traces)[-limit:][::-1]
+
+
+def record_inference(result: Dict[str, Any]):
+    """
+    Çıkarım motorunun bildirdiği süre ve token sayılarını metriklere ve
+    geçerli ize yaz: kuyruk bekleme, prefill (ilk token'a kadar) ve decode
+    """
+    completion_tokens = result.get("completion_tokens") or 0
+    prompt_tokens = result.get("prompt_tokens")
+    queue_s = result.get("queue_wait_s") or 0.0
+    prefill_s = result.get("ttft_s") or 0.0
+    decode_s = max(0.0, (result.get("generation_s") or 0.0) - prefill_s)
+    # İlk token prefill süresine dahil; decode hızı kalan token'lardan
+    tokens_per_second = (completion_tokens - 1) / decode_s if completion_tokens > 1 and decode_s > 0 else None
+
+    COMPLETION_TOKENS.inc(completion_tokens)
+    if prompt_tokens:
+        PROMPT_TOKENS.inc(prompt_tokens)
+    if tokens_per_second is not None:
+        DECODE_TOKENS_PER_SECOND.observe(tokens_per_second)
+
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    end = time.perf_counter()
+    trace.record("inference.decode", decode_s, end=end, completion_tokens=completion_tokens,
+                 tokens_per_second=round(tokens_per_second, 2) if tokens_per_second is not None else None,
+                 finish_reason=result.get("finish_reason"))
+    trace.record("inference.prefill", prefill_s, end=end - decode_s, prompt_tokens=prompt_tokens)
+    trace.record("inference.queue", queue_s, end=end - decode_s - prefill_s)
+    trace.attrs["completion_tokens"] = trace.attrs.get("completion_tokens", 0) + completion_tokens
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.services.response_cache import response_cache
 import asyncio
+import contextlib
 import logging
 from pathlib import Path
 
@@ -28,9 +30,32 @@ def health_check():
     return {
         "status": "ok",
         "ai_model_type": settings.AI_MODEL_TYPE,
-        "backend_version": "1.0.0"
+        "backend_version": "1.0.0",
+        "response_cache": response_cache.stats(),
+        "feedback_pipeline": feedback.feedback_service.stats(),
+        "sessions": telekom.SESSION_STORE.durum(),
+        "session_resolver": telekom.session_resolver.stats(),
+        "telekom_store": telekom.STORE.durum()
     }
 
+@app.get("/api/v1/health/live", tags=["Monitoring"])
+def liveness_check():
+    """
+    Liveness: süreç ayakta ve istek karşılıyor (model yüklemesini beklemez).
+    """
+    return {"status": "alive"}
+
+@app.get("/api/v1/health/ready", tags=["Monitoring"])
+def readiness_check(response: Response):
+    """
+    Readiness: GGUF modeli yüklendi mi? Yüklenene kadar 503 döner.
+    """
+    from app.services.ai_orchestrator_v4 import ai_orchestrator_v4
+
+    if not ai_orchestrator_v4.hazir:
+        response.status_code = 503
+    return ai_orchestrator_v4.hazirlik_durumu()
+
 @app.get("/", tags=["Monitoring"])
 def root():
     return {"status":"ok"}
@@ -58,6 +83,36 @@ app.include_router(user.router, prefix="/api/v1")
 from app.api.v1 import feedback
 app.include_router(feedback.router, prefix="/api/v1")
 
+# Prometheus metrikleri ve örneklenmiş istek izleri
+from app.core.tracing import metrics, recent_traces
+
+def _inference_durum(*anahtarlar: str):
+    """Çıkarım motoru durumundan ilk bulunan alan (motor yoksa None)"""
+    from app.services.ai_orchestrator_v4 import ai_orchestrator_v4
+
+    if ai_orchestrator_v4.inference is None:
+        return None
+    durum = ai_orchestrator_v4.inference.durum()
+    return next((durum[a] for a in anahtarlar if durum.get(a) is not None), None)
+
+metrics.gauge("uniqeai_sessions", "Aktif oturum sayısı", lambda: len(telekom.SESSION_STORE))
+metrics.gauge("uniqeai_inference_queue_depth", "Çıkarım kuyruğunda bekleyen iş", lambda: _inference_durum("queue_depth"))
+metrics.gauge("uniqeai_inference_active", "Şu anda üretilen istek", lambda: _inference_durum("active", "in_flight"))
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """
+    Prometheus metin formatında süreç metrikleri (istek/aşama süreleri, token'lar, kuyruk).
+    """
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/api/v1/traces", tags=["Monitoring"])
+def get_recent_traces(limit: int = 20):
+    """
+    Son örneklenmiş chat isteklerinin aşama dökümü (TRACE_SAMPLE_RATE).
+    """
+    return {"sample_rate": settings.TRACE_SAMPLE_RATE, "traces": recent_traces(limit)}
+
 # AI Model bilgisi endpoint'i
 @app.get("/api/v1/ai/model-info", tags=["AI"])
 def get_ai_model_info():
@@ -73,6 +128,84 @@ def get_ai_model_info():
 
 # Gelecekte eklenecek diğer endpoint'ler için router'lar buraya dahil edilecek. 
 
+# Startup event - Zemberek ve GGUF modelini arka planda yükle
+@app.on_event("startup")
+async def load_models_in_background():
+    """
+    Model yüklemesi startup'ı bloklamaz; hazır olunca /api/v1/health/ready 200 döner
+    """
+    from app.services.ai_orchestrator_v4 import ai_orchestrator_v4
+
+    ai_orchestrator_v4.baslat()
+
+# Startup event - süresi dolan oturumları periyodik olarak süpür
+@app.on_event("startup")
+async def start_session_sweeper():
+    """
+    Oturum deposundaki süresi dolmuş token'ları arka planda temizler
+    """
+    logger = logging.getLogger(__name__)
+
+    async def sweep_loop():
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(settings.SESSION_SWEEP_INTERVAL_S)
+            try:
+                removed = await loop.run_in_executor(None, telekom.SESSION_STORE.sweep)
+                if removed:
+                    logger.info(f"🧹 {removed} süresi dolmuş oturum silindi")
+            except Exception as e:
+                logger.warning(f"Oturum süpürme hatası: {e}")
+
+    app.state.session_sweeper = asyncio.create_task(sweep_loop())
+
+# Shutdown event - oturum süpürücüsünü durdur
+@app.on_event("shutdown")
+async def stop_session_sweeper():
+    """
+    Arka plan süpürme görevini iptal eder ve bitmesini bekler
+    """
+    task = getattr(app.state, "session_sweeper", None)
+    if task is None:
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+# Startup event - yük testi için sentetik telekom müşterileri
+@app.on_event("startup")
+async def load_telekom_fixture():
+    """
+    TELEKOM_FIXTURE_CUSTOMERS > 0 ise depoyu sentetik müşterilerle doldurur.
+    Yükleme bitene kadar startup bekler (yük testi eksik veriyle başlamasın).
+    """
+    if settings.TELEKOM_FIXTURE_CUSTOMERS <= 0:
+        return
+    from app.services.telekom_fixtures import load_fixture
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, load_fixture, telekom.STORE, settings.TELEKOM_FIXTURE_CUSTOMERS, settings.TELEKOM_FIXTURE_SEED
+    )
+
+# Shutdown event - feedback yazma kuyruğunu boşalt
+@app.on_event("shutdown")
+async def drain_feedback_queue():
+    """
+    Kuyrukta bekleyen feedback olaylarını kapanmadan önce veritabanına yaz
+    """
+    await feedback.feedback_service.shutdown()
+
+# Shutdown event - çıkarım motorunu kapat
+@app.on_event("shutdown")
+async def shutdown_inference():
+    """
+    Worker havuzunu, batch zamanlayıcı thread'ini veya uzak model sunucusu bağlantısını kapatır
+    """
+    from app.services.ai_orchestrator_v4 import ai_orchestrator_v4
+
+    await ai_orchestrator_v4.kapat()
+
 # Startup event - v6 model kontrolü
 @app.on_event("startup")
 async def startup_event():
@@ -6,13 +6,83 @@ AI'nin backend'e çağrı attığında kullanabileceği tüm fonksiyonlar
 import asyncio
 import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import json
 
+from ..core.config import settings
+from .bill_history import AI_HISTORY_MONTHS, ai_bill_history
+from .response_cache import cached, invalidates, response_cache
+from .session_resolver import resolves_session, session_resolver
+from .telekom_store import telekom_store
+
 # Loglama ayarları
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# SABİT VERİLER (her çağrıda yeniden oluşturulmaz; değiştirilmemeli)
+# ============================================================================
+
+# Müşteri, paket, ödeme ve destek kayıtları telekom_store'dan okunur (telekom router'ı ile ortak)
+
+# Satıştaki paketler
+AVAILABLE_PACKAGES = [
+    {
+        "package_name": "Mega İnternet",
+        "monthly_fee": 69.50,
+        "features": {"internet_gb": 50, "voice_minutes": 1000, "sms_count": 500, "roaming_enabled": False},
+        "description": "Hızlı internet ve bol dakika"
+    },
+    {
+        "package_name": "Öğrenci Dostu Tarife",
+        "monthly_fee": 49.90,
+        "features": {"internet_gb": 30, "voice_minutes": 500, "sms_count": 250, "roaming_enabled": False},
+        "description": "Öğrenciler için özel tarife"
+    },
+    {
+        "package_name": "Süper Konuşma",
+        "monthly_fee": 59.90,
+        "features": {"internet_gb": 25, "voice_minutes": 2000, "sms_count": 1000, "roaming_enabled": True},
+        "description": "Bol dakika ve SMS"
+    },
+    {
+        "package_name": "Premium Paket",
+        "monthly_fee": 89.90,
+        "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
+        "description": "Premium hizmetler"
+    },
+    {
+        "package_name": "Aile Paketi",
+        "monthly_fee": 129.90,
+        "features": {"internet_gb": 200, "voice_minutes": 5000, "sms_count": 2000, "roaming_enabled": True},
+        "description": "Aileler için özel paket"
+    }
+]
+
+# Bölgeye göre ağ durumları
+REGION_STATUS = {
+    "Istanbul": {"status": "operational", "coverage": "excellent"},
+    "Ankara": {"status": "operational", "coverage": "good"},
+    "Izmir": {"status": "operational", "coverage": "good"},
+    "Bursa": {"status": "operational", "coverage": "fair"},
+    "Antalya": {"status": "operational", "coverage": "excellent"}
+}
+
+# Paket/hat durumunu değiştiren çağrılardan sonra düşürülecek önbellekler
+PACKAGE_READERS = ("telekom_get_current_package", "telekom_get_customer_package")
+
+
+def _depo_yazildi(user_ids):
+    """telekom_store yazmasından (router dahil) sonra ilgili kullanıcıların önbelleğini düşür"""
+    if 0 in user_ids:
+        # Bilinmeyen kullanıcılar 0 numaralı müşterinin kaydına düşer
+        response_cache.invalidate(*PACKAGE_READERS)
+    else:
+        response_cache.invalidate_users(user_ids)
+
+
+telekom_store.add_listener(_depo_yazildi)
+
 class AIEndpointFunctions:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -134,30 +204,14 @@ class AIEndpointFunctions:
             Müşteri profili bilgileri
         """
         try:
-            # Mock müşteri verisi
-            customers = {
-                0: {"name": "Mehmet Demir", "phone": "+905551234567", "email": "mehmet.demir@email.com", "tier": "premium"},
-                1: {"name": "Ayşe Kaya", "phone": "+905559876543", "email": "ayse.kaya@email.com", "tier": "gold"},
-                2: {"name": "Ali Özkan", "phone": "+905551112223", "email": "ali.ozkan@email.com", "tier": "silver"},
-                3: {"name": "Fatma Şahin", "phone": "+905554445556", "email": "fatma.sahin@email.com", "tier": "gold"},
-                4: {"name": "Mustafa Yılmaz", "phone": "+905557778889", "email": "mustafa.yilmaz@email.com", "tier": "premium"},
-                5: {"name": "Sedat Kılıçoğlu", "phone": "+905557771234", "email": "sedat.kilicoglu@email.com", "tier": "diamond"},
-                6: {"name": "Elon Musk", "phone": "+905557776789", "email": "elon.musk@email.com", "tier": "elite"},
-                7: {"name": "Jeff Bezos", "phone": "+905557771122", "email": "jeff.bezos@email.com", "tier": "ultimate"}
-            }
-            
-            customer = customers.get(user_id, customers[0])
+            # Telekom router'ı ile aynı müşteri kaydı (bilinmeyen kullanıcıda 0 numaralı müşteri)
+            customer = telekom_store.customer(user_id) or telekom_store.customer(0)
             
             return {
                 "success": True,
                 "data": {
-                    "user_id": user_id,
-                    "name": customer["name"],
-                    "phone_numbers": [{"number": customer["phone"], "type": "mobile", "status": "active"}],
-                    "email": customer["email"],
-                    "address": "Türkiye",
-                    "registration_date": "2022-06-15",
-                    "customer_tier": customer["tier"]
+                    **customer.as_dict(),
+                    "user_id": user_id
                 }
             }
             
@@ -168,6 +222,7 @@ class AIEndpointFunctions:
                 "error": f"Müşteri profili getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_get_current_bill(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         Mevcut fatura bilgilerini getir
@@ -180,13 +235,7 @@ class AIEndpointFunctions:
             Mevcut fatura bilgileri
         """
         try:
-            # Session token'dan user_id çıkar (eğer session_token varsa)
-            if session_token:
-                # Session token'dan user_id'yi çıkar
-                # Bu örnek için basit bir user_id ataması yapıyoruz
-                # Gerçek uygulamada session token'dan user_id çıkarılmalı
-                user_id = 0  # Varsayılan user_id
-            
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
             if user_id is None:
                 user_id = 0  # Varsayılan user_id
                 
@@ -224,6 +273,7 @@ class AIEndpointFunctions:
                 "error": f"Mevcut fatura getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_get_bill_history(self, user_id: int = None, limit: int = 12, session_token: str = None) -> Dict[str, Any]:
         """
         Geçmiş faturaları getir
@@ -237,41 +287,12 @@ class AIEndpointFunctions:
             Geçmiş faturalar listesi
         """
         try:
-            # Session token'dan user_id çıkar (eğer session_token varsa)
-            if session_token:
-                # Session token'dan user_id'yi çıkar
-                # Bu örnek için basit bir user_id ataması yapıyoruz
-                # Gerçek uygulamada session token'dan user_id çıkarılmalı
-                user_id = 0  # Varsayılan user_id
-            
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
             if user_id is None:
                 user_id = 0  # Varsayılan user_id
                 
-            bills = []
-            base_amount = 50 + (user_id % 50)
-            
-            for i in range(min(limit, 12)):
-                bill_month = datetime.now() - timedelta(days=30 * (i + 1))
-                bill_data = {
-                    "bill_id": f"F-{bill_month.year}-{user_id:04d}-{i+1:02d}",
-                    "user_id": user_id,
-                    "amount": base_amount + (i * 5),
-                    "currency": "TRY",
-                    "bill_date": bill_month.strftime("%Y-%m-%d"),
-                    "due_date": (bill_month + timedelta(days=15)).strftime("%Y-%m-%d"),
-                    "status": "paid" if i % 2 == 0 else "unpaid",
-                    "services": [
-                        {
-                            "service_name": "Mega İnternet",
-                            "amount": (base_amount + (i * 5)) * 0.7
-                        },
-                        {
-                            "service_name": "Sesli Arama",
-                            "amount": (base_amount + (i * 5)) * 0.3
-                        }
-                    ]
-                }
-                bills.append(bill_data)
+            # Günlük önceden kurulan 12 aylık tablonun dilimi
+            bills = ai_bill_history(user_id, date.today()).slice(min(limit, AI_HISTORY_MONTHS))
             
             return {
                 "success": True,
@@ -326,6 +347,7 @@ class AIEndpointFunctions:
                 "error": f"Fatura ödeme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_get_payment_history(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         Ödeme geçmişini getir
@@ -340,28 +362,11 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime, timedelta
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                # Session token'dan user_id çıkar (basit implementasyon)
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
-            payments = []
-            base_amount = 50 + (user_id % 50)
-            
-            for i in range(6):
-                payment_date = datetime.now() - timedelta(days=30 * (i + 1))
-                payment_data = {
-                    "payment_id": f"PAY-{payment_date.strftime('%Y%m%d%H%M%S')}",
-                    "bill_id": f"F-{payment_date.year}-{user_id:04d}-{i+1:02d}",
-                    "amount": base_amount + (i * 5),
-                    "method": "credit_card" if i % 2 == 0 else "bank_transfer",
-                    "status": "completed",
-                    "payment_date": payment_date.strftime("%Y-%m-%d"),
-                    "reference_id": f"REF-{payment_date.strftime('%Y%m%d')}-{i+1:03d}"
-                }
-                payments.append(payment_data)
+            payments = [payment.as_dict() for payment in telekom_store.payments(user_id)]
             
             return {
                 "success": True,
@@ -379,6 +384,7 @@ class AIEndpointFunctions:
                 "error": f"Ödeme geçmişi getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_setup_autopay(self, user_id: int = None, status: bool = True, session_token: str = None) -> Dict[str, Any]:
         """
         Otomatik ödeme ayarlar
@@ -394,10 +400,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime, timedelta
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             autopay_data = {
@@ -423,6 +427,8 @@ class AIEndpointFunctions:
                 "error": f"Otomatik ödeme ayarlama hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @cached(response_cache, ttl=settings.RESPONSE_CACHE_TTL_USER)
     async def telekom_get_current_package(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         Müşterinin mevcut paketini getir
@@ -435,82 +441,21 @@ class AIEndpointFunctions:
             Mevcut paket bilgileri
         """
         try:
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                # Session token'dan user_id çıkar (basit implementasyon)
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
-            # Gerçek kullanıcı paketleri
-            user_packages = {
-                0: {  # Enes Faruk Aydın
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "description": "Premium özellikler paketi - Sınırsız internet ve konuşma",
-                    "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31",
-                    "auto_renewal": True,
-                    "status": "active"
-                },
-                1: {  # Nisa Nur Özkal
-                    "package_name": "Öğrenci Dostu",
-                    "monthly_fee": 49.90,
-                    "description": "Ekonomik öğrenci paketi - İndirimli tarife",
-                    "features": {"internet_gb": 30, "voice_minutes": 500, "sms_count": 250, "roaming_enabled": False},
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31",
-                    "auto_renewal": True,
-                    "status": "active"
-                },
-                2: {  # Sedat Kılıçoğlu
-                    "package_name": "Süper Konuşma",
-                    "monthly_fee": 59.90,
-                    "description": "Sınırsız konuşma paketi - Ses öncelikli",
-                    "features": {"internet_gb": 25, "voice_minutes": 2000, "sms_count": 1000, "roaming_enabled": True},
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31",
-                    "auto_renewal": True,
-                    "status": "active"
-                },
-                3: {  # Erkan Tanrıöver
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "description": "Premium özellikler paketi - Sınırsız internet ve konuşma",
-                    "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31",
-                    "auto_renewal": True,
-                    "status": "active"
-                },
-                4: {  # Ahmet Nazif Gemalmaz
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "description": "Premium özellikler paketi - Sınırsız internet ve konuşma",
-                    "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31",
-                    "auto_renewal": True,
-                    "status": "active"
-                },
-                5: {  # Ziişan Şahin
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "description": "Premium özellikler paketi - Sınırsız internet ve konuşma",
-                    "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-12-31",
-                    "auto_renewal": True,
-                    "status": "active"
-                }
-            }
             
-            # Kullanıcının paketini al
-            package = user_packages.get(user_id, user_packages[0])  # Varsayılan olarak Enes'in paketi
+            # Kullanıcının paketini depodan al (bilinmeyen kullanıcıda 0 numaralı müşterinin paketi)
+            package = telekom_store.package(user_id) or telekom_store.package(0)
+            if package is None:
+                return {
+                    "success": False,
+                    "error": "Kullanıcının aktif bir paketi yok."
+                }
             
             package_data = {
-                **package,
+                **package.as_dict(),
                 "user_id": user_id
             }
             
@@ -528,6 +473,8 @@ class AIEndpointFunctions:
                 "error": f"Mevcut paket getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @cached(response_cache, ttl=settings.RESPONSE_CACHE_TTL_USER)
     async def telekom_get_customer_package(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         Müşterinin mevcut paketini getir (session token ile)
@@ -540,82 +487,21 @@ class AIEndpointFunctions:
             Mevcut paket bilgileri
         """
         try:
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                # Session token'dan user_id çıkar (basit implementasyon)
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
-            # Backend'deki USER_PACKAGES verisini kullan
-            packages = [
-                {
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "package_type": "Premium",
-                    "features": ["Unlimited Data", "Premium Support", "Roaming Included"],
-                    "internet_speed": "100 Mbps",
-                    "voice_minutes": "Unlimited",
-                    "sms_count": "Unlimited",
-                    "contract_duration": "24 ay"
-                },
-                {
-                    "package_name": "Öğrenci Dostu",
-                    "monthly_fee": 49.90,
-                    "package_type": "Student",
-                    "features": ["10GB Data", "Student Discount", "Basic Support"],
-                    "internet_speed": "50 Mbps",
-                    "voice_minutes": "500 dakika",
-                    "sms_count": "250 SMS",
-                    "contract_duration": "12 ay"
-                },
-                {
-                    "package_name": "Süper Konuşma",
-                    "monthly_fee": 59.90,
-                    "package_type": "Voice",
-                    "features": ["Unlimited Calls", "5GB Data", "Voice Priority"],
-                    "internet_speed": "25 Mbps",
-                    "voice_minutes": "Unlimited",
-                    "sms_count": "1000 SMS",
-                    "contract_duration": "12 ay"
-                },
-                {
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "package_type": "Premium",
-                    "features": ["Unlimited Data", "Premium Support", "Roaming Included"],
-                    "internet_speed": "100 Mbps",
-                    "voice_minutes": "Unlimited",
-                    "sms_count": "Unlimited",
-                    "contract_duration": "24 ay"
-                },
-                {
-                    "package_name": "Mega İnternet",
-                    "monthly_fee": 69.90,
-                    "package_type": "Internet",
-                    "features": ["50GB Data", "High Speed", "Basic Support"],
-                    "internet_speed": "75 Mbps",
-                    "voice_minutes": "1000 dakika",
-                    "sms_count": "500 SMS",
-                    "contract_duration": "12 ay"
-                },
-                {
-                    "package_name": "Öğrenci Dostu",
-                    "monthly_fee": 49.90,
-                    "package_type": "Student",
-                    "features": ["10GB Data", "Student Discount", "Basic Support"],
-                    "internet_speed": "50 Mbps",
-                    "voice_minutes": "500 dakika",
-                    "sms_count": "250 SMS",
-                    "contract_duration": "12 ay"
-                }
-            ]
             
-            package = packages[user_id % len(packages)]
+            package = telekom_store.package(user_id) or telekom_store.package(0)
+            if package is None:
+                return {
+                    "success": False,
+                    "error": "Kullanıcının aktif bir paketi yok."
+                }
             
             return {
                 "success": True,
-                "data": package
+                "data": package.as_dict()
             }
             
         except Exception as e:
@@ -625,6 +511,7 @@ class AIEndpointFunctions:
                 "error": f"Müşteri paketi getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_get_remaining_quotas(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         Müşterinin kalan kotalarını getir
@@ -637,11 +524,8 @@ class AIEndpointFunctions:
             Kalan kotalar
         """
         try:
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                # Session token'dan user_id çıkar (basit implementasyon)
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
                 
             base_internet = 50 - (user_id % 30)  # 20-50 GB arası
@@ -673,6 +557,8 @@ class AIEndpointFunctions:
                 "error": f"Kalan kotalar getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @invalidates(response_cache, PACKAGE_READERS)
     async def telekom_change_package(self, user_id: int = None, new_package_name: str = "Premium Paket", session_token: str = None) -> Dict[str, Any]:
         """
         Paket değişikliği başlat
@@ -688,10 +574,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime, timedelta
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             change_data = {
@@ -726,44 +610,12 @@ class AIEndpointFunctions:
             Kullanılabilir paketler listesi
         """
         try:
-            packages = [
-                {
-                    "package_name": "Mega İnternet",
-                    "monthly_fee": 69.50,
-                    "features": {"internet_gb": 50, "voice_minutes": 1000, "sms_count": 500, "roaming_enabled": False},
-                    "description": "Hızlı internet ve bol dakika"
-                },
-                {
-                    "package_name": "Öğrenci Dostu Tarife",
-                    "monthly_fee": 49.90,
-                    "features": {"internet_gb": 30, "voice_minutes": 500, "sms_count": 250, "roaming_enabled": False},
-                    "description": "Öğrenciler için özel tarife"
-                },
-                {
-                    "package_name": "Süper Konuşma",
-                    "monthly_fee": 59.90,
-                    "features": {"internet_gb": 25, "voice_minutes": 2000, "sms_count": 1000, "roaming_enabled": True},
-                    "description": "Bol dakika ve SMS"
-                },
-                {
-                    "package_name": "Premium Paket",
-                    "monthly_fee": 89.90,
-                    "features": {"internet_gb": 100, "voice_minutes": 3000, "sms_count": 1000, "roaming_enabled": True},
-                    "description": "Premium hizmetler"
-                },
-                {
-                    "package_name": "Aile Paketi",
-                    "monthly_fee": 129.90,
-                    "features": {"internet_gb": 200, "voice_minutes": 5000, "sms_count": 2000, "roaming_enabled": True},
-                    "description": "Aileler için özel paket"
-                }
-            ]
             
             return {
                 "success": True,
                 "data": {
-                    "packages": packages,
-                    "total_count": len(packages)
+                    "packages": AVAILABLE_PACKAGES,
+                    "total_count": len(AVAILABLE_PACKAGES)
                 }
             }
             
@@ -774,6 +626,7 @@ class AIEndpointFunctions:
                 "error": f"Kullanılabilir paketler getirme hatası: {str(e)}"
             }
     
+    @cached(response_cache, ttl=settings.RESPONSE_CACHE_TTL_CATALOG)
     async def telekom_get_package_details(self, package_name: str) -> Dict[str, Any]:
         """
         Paket detaylarını getir
@@ -812,6 +665,8 @@ class AIEndpointFunctions:
                 "error": f"Paket detayları getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @invalidates(response_cache, PACKAGE_READERS)
     async def telekom_enable_roaming(self, user_id: int = None, status: bool = True, session_token: str = None) -> Dict[str, Any]:
         """
         Roaming hizmetini etkinleştir/devre dışı bırak
@@ -827,10 +682,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             roaming_data = {
@@ -855,6 +708,8 @@ class AIEndpointFunctions:
                 "error": f"Roaming ayarlama hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @cached(response_cache, ttl=settings.RESPONSE_CACHE_TTL_NETWORK)
     async def telekom_check_network_status(self, region: str = "Istanbul", session_token: str = None) -> Dict[str, Any]:
         """
         Ağ durumunu kontrol et
@@ -869,16 +724,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime
             
-            # Bölgeye göre farklı durumlar
-            region_status = {
-                "Istanbul": {"status": "operational", "coverage": "excellent"},
-                "Ankara": {"status": "operational", "coverage": "good"},
-                "Izmir": {"status": "operational", "coverage": "good"},
-                "Bursa": {"status": "operational", "coverage": "fair"},
-                "Antalya": {"status": "operational", "coverage": "excellent"}
-            }
             
-            region_info = region_status.get(region, {"status": "operational", "coverage": "good"})
+            region_info = REGION_STATUS.get(region, {"status": "operational", "coverage": "good"})
             
             network_status = {
                 "region": region,
@@ -913,6 +760,7 @@ class AIEndpointFunctions:
                 "error": f"Ağ durumu kontrol hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_create_support_ticket(self, user_id: int = None, issue_description: str = "Teknik sorun", category: str = "technical", priority: str = "medium", session_token: str = None) -> Dict[str, Any]:
         """
         Destek talebi oluştur
@@ -930,10 +778,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime, timedelta
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             ticket_data = {
@@ -1025,6 +871,7 @@ class AIEndpointFunctions:
                 "error": f"Destek talebi durumu getirme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_test_internet_speed(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         İnternet hız testi yap
@@ -1040,10 +887,8 @@ class AIEndpointFunctions:
             from datetime import datetime
             import asyncio
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             # Simüle edilmiş hız testi
@@ -1075,6 +920,7 @@ class AIEndpointFunctions:
                 "error": f"İnternet hız testi hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
     async def telekom_update_customer_contact(self, user_id: int = None, contact_type: str = "phone", new_value: str = "+905551234567", session_token: str = None) -> Dict[str, Any]:
         """
         Müşteri iletişim bilgilerini güncelle
@@ -1091,10 +937,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             # Eski değerleri belirle
@@ -1127,6 +971,8 @@ class AIEndpointFunctions:
                 "error": f"İletişim bilgisi güncelleme hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @invalidates(response_cache, PACKAGE_READERS)
     async def telekom_suspend_line(self, user_id: int = None, reason: str = "Kullanıcı talebi", session_token: str = None) -> Dict[str, Any]:
         """
         Hatı askıya al
@@ -1142,10 +988,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime, timedelta
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             suspend_data = {
@@ -1171,6 +1015,8 @@ class AIEndpointFunctions:
                 "error": f"Hat askıya alma hatası: {str(e)}"
             }
     
+    @resolves_session(session_resolver)
+    @invalidates(response_cache, PACKAGE_READERS)
     async def telekom_reactivate_line(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """
         Hatı yeniden etkinleştir
@@ -1185,10 +1031,8 @@ class AIEndpointFunctions:
         try:
             from datetime import datetime
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
             reactivate_data = {
@@ -1553,13 +1397,16 @@ class AIEndpointFunctions:
     async def telekom_auth_register(self, email: str, password: str, name: str) -> Dict[str, Any]:
         """Telekom sistemi için kullanıcı kaydı"""
         try:
-            # Mock telekom kayıt işlemi
-            user_id = hash(email) % 10000  # Basit ID üretimi
+            # Telekom router'ı ile aynı hesap deposu
+            try:
+                account = telekom_store.register_account(email, password, name)
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
             
             return {
                 "success": True,
                 "data": {
-                    "user_id": user_id,
+                    "user_id": account.user_id,
                     "email": email,
                     "name": name,
                     "message": "Telekom sistemi için kayıt başarılı"
@@ -1576,13 +1423,14 @@ class AIEndpointFunctions:
     async def telekom_auth_login(self, email: str, password: str) -> Dict[str, Any]:
         """Telekom sistemi için kullanıcı girişi"""
         try:
-            # Mock telekom giriş işlemi
-            user_id = hash(email) % 10000
+            account = telekom_store.account(email)
+            if account is None or account.password != password:
+                return {"success": False, "error": "Email veya şifre hatalı."}
             
             return {
                 "success": True,
                 "data": {
-                    "user_id": user_id,
+                    "user_id": account.user_id,
                     "email": email,
                     "message": "Telekom sistemi için giriş başarılı"
                 }
@@ -1599,57 +1447,26 @@ class AIEndpointFunctions:
     # TELEKOM DESTEK EK FONKSİYONLARI
     # ============================================================================
     
+    @resolves_session(session_resolver)
     async def telekom_get_user_support_tickets(self, user_id: int = None, session_token: str = None) -> Dict[str, Any]:
         """Kullanıcının tüm destek taleplerini getir"""
         try:
             from datetime import datetime, timedelta
             
-            # user_id'yi session_token'dan çıkar veya varsayılan değer kullan
-            if session_token:
-                user_id = 0  # Varsayılan değer
-            elif user_id is None:
+            # session_token @resolves_session ile user_id'ye çevrildi; ikisi de yoksa varsayılan
+            if user_id is None:
                 user_id = 0  # Varsayılan değer
             
-            # Mock destek talepleri
-            tickets = [
-                {
-                    "ticket_id": f"T-{user_id:04d}-001",
-                    "status": "open",
-                    "subject": "İnternet bağlantı sorunu",
-                    "category": "technical",
-                    "priority": "medium",
-                    "created_date": datetime.now().isoformat(),
-                    "assigned_to": "Teknik Destek"
-                },
-                {
-                    "ticket_id": f"T-{user_id:04d}-002",
-                    "status": "closed",
-                    "subject": "Fatura ödeme sorunu",
-                    "category": "billing",
-                    "priority": "high",
-                    "created_date": (datetime.now() - timedelta(days=15)).isoformat(),
-                    "closed_date": (datetime.now() - timedelta(days=10)).isoformat(),
-                    "resolution": "Sorun çözüldü"
-                },
-                {
-                    "ticket_id": f"T-{user_id:04d}-003",
-                    "status": "in_progress",
-                    "subject": "Paket değişikliği talebi",
-                    "category": "service",
-                    "priority": "low",
-                    "created_date": (datetime.now() - timedelta(days=5)).isoformat(),
-                    "assigned_to": "Müşteri Hizmetleri"
-                }
-            ]
+            tickets = telekom_store.tickets(user_id)
             
             return {
                 "success": True,
                 "data": {
-                    "tickets": tickets,
+                    "tickets": [ticket.as_dict() for ticket in tickets],
                     "user_id": user_id,
                     "total_count": len(tickets),
-                    "open_count": len([t for t in tickets if t["status"] == "open"]),
-                    "closed_count": len([t for t in tickets if t["status"] == "closed"])
+                    "open_count": sum(ticket.status == "open" for ticket in tickets),
+                    "closed_count": sum(ticket.status in ("resolved", "closed") for ticket in tickets)
                 }
             }
             
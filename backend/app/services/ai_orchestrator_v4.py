@@ -2,38 +2,38 @@ import logging
 import asyncio
 import json
 import re
-import torch
-from typing import List, Dict, Any, Optional
-from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+import time
+import importlib.util
+from typing import List, Dict, Any, Optional, Union, Callable, AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 import uuid
 import os
 from dotenv import load_dotenv
 
+from ..core.config import settings
+from ..core.tracing import record_inference, span
+from .inference_executor import InferenceExecutor, InferenceQueueFullError
+from .batch_scheduler import BatchScheduler
+from .inference_factory import gguf_dosyasi_bul, cikarim_motoru_olustur
+from .model_server import RemoteInferenceClient
+from .prompt_templates import gguf_prompt_olustur
+from .tool_engine import ToolExecutionEngine, telekom_arac_tablosu
+from .semantic_cache import SemanticAnswerCache
+from .intent_router import IntentRouter
+
+# Ağır kütüphaneler (zemberek, langchain, transformers) import anında değil,
+# gerçekten kullanıldıklarında yüklenir; burada yalnızca kurulu olup olmadıklarına bakılır
+
 # Türkçe NLP için
-try:
-    from zemberek import TurkishMorphology
-    ZEMBEREK_AVAILABLE = True
-except ImportError:
-    ZEMBEREK_AVAILABLE = False
+ZEMBEREK_AVAILABLE = importlib.util.find_spec("zemberek") is not None
+if not ZEMBEREK_AVAILABLE:
     print("Zemberek kurulu değil. Türkçe NLP özellikleri devre dışı.")
 
 # LangChain entegrasyonu
-try:
-    from langchain_community.llms import HuggingFacePipeline
-    from langchain.prompts import PromptTemplate
-    from langchain.chains import LLMChain
-    LANGCHAIN_AVAILABLE = True
-except ImportError:
-    try:
-        from langchain.llms import HuggingFacePipeline
-        from langchain.prompts import PromptTemplate
-        from langchain.chains import LLMChain
-        LANGCHAIN_AVAILABLE = True
-    except ImportError:
-        LANGCHAIN_AVAILABLE = False
-        print("LangChain kurulu değil. Gelişmiş AI özellikleri devre dışı.")
+LANGCHAIN_AVAILABLE = importlib.util.find_spec("langchain") is not None
+if not LANGCHAIN_AVAILABLE:
+    print("LangChain kurulu değil. Gelişmiş AI özellikleri devre dışı.")
 
 logger = logging.getLogger(__name__)
 
@@ -58,25 +58,94 @@ class YapayZekaOrkestratoriV4:
         self.tokenizer = None
         self.morphology = None
         self.langchain_chain = None
+        self.inference: Optional[Union[InferenceExecutor, BatchScheduler, RemoteInferenceClient]] = None
         self._model_loaded = False
         
+        # Araç dispatch tablosu bir kez kurulur
+        self.arac_motoru = ToolExecutionEngine(telekom_arac_tablosu(), default_timeout=settings.TOOL_TIMEOUT_S)
+        
+        # Anahtar kelime → araç otomatı bir kez derlenir
+        self.niyet_yonlendirici = IntentRouter(kisa_yol_kelime=settings.INTENT_SHORT_CIRCUIT_MAX_WORDS)
+        
+        # Benzer mesajlarda GGUF üretimini atlayan anlamsal önbellek
+        self.anlamsal_onbellek = SemanticAnswerCache(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES
+        ) if settings.SEMANTIC_CACHE_ENABLED else None
+        
         # Model adı - GGUF Telekom AI modeli
         self.model_name = "Choyrens/ChoyrensAI-Telekom-Agent-v4-gguf"
         
         # Yeni model yolu
-        self.local_model_path = r"C:\Users\erkan\Desktop\ChoyrensAi-models\choyrens_model_v4_gguf"
+        self.local_model_path = settings.LOCAL_MODEL_PATH
         
-        # Türkçe NLP için Zemberek
+        # Zemberek ve model import anında değil, baslat() ile arka planda yüklenir
+        self._baslatma_gorevi: Optional[asyncio.Task] = None
+        self._yukleme_bitti = False
+        self._yukleme_suresi_s: Optional[float] = None
+    
+    def baslat(self) -> asyncio.Task:
+        """
+        Zemberek ve GGUF modelini arka planda, birbirine paralel yükle
+        
+        Uygulamanın startup event'inden çağrılır; tekrar çağrılırsa aynı görevi
+        döndürür. Yükleme bitene kadar istekler basit Türkçe işleme ve anahtar
+        kelime yanıtlarıyla karşılanır.
+        """
+        if self._baslatma_gorevi is None:
+            self._baslatma_gorevi = asyncio.get_running_loop().create_task(self._arka_planda_yukle())
+        return self._baslatma_gorevi
+    
+    async def kapat(self):
+        """Çıkarım motorunu (worker havuzu, batch thread'i veya uzak istemci) kapat"""
+        motor, self.inference = self.inference, None
+        self._model_loaded = False
+        if motor is not None:
+            await motor.shutdown()
+            logger.info("Çıkarım motoru kapatıldı")
+    
+    async def _arka_planda_yukle(self):
+        baslangic = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(
+                loop.run_in_executor(None, self._load_morphology),
+                loop.run_in_executor(None, self._load_model)
+            )
+        finally:
+            self._yukleme_bitti = True
+            self._yukleme_suresi_s = time.perf_counter() - baslangic
+            logger.info(f"Arka plan yüklemesi tamamlandı ({self._yukleme_suresi_s:.2f} s), model: {self._model_loaded}")
+    
+    @property
+    def hazir(self) -> bool:
+        """Readiness: model yüklenmiş ve istek almaya hazır"""
+        return self._yukleme_bitti and self._model_loaded
+    
+    def hazirlik_durumu(self) -> Dict[str, Any]:
+        """Readiness probe'u için yükleme durumu"""
+        if not self._yukleme_bitti:
+            durum = "loading" if self._baslatma_gorevi else "not_started"
+        else:
+            durum = "ready" if self._model_loaded else "model_unavailable"
+        return {
+            "status": durum,
+            "model_loaded": self._model_loaded,
+            "turkish_nlp": self.morphology is not None,
+            "load_time_s": round(self._yukleme_suresi_s, 3) if self._yukleme_suresi_s is not None else None
+        }
+    
+    def _load_morphology(self):
+        """Türkçe NLP için Zemberek"""
+        if not ZEMBEREK_AVAILABLE:
+            return
         try:
             from zemberek import TurkishMorphology
             self.morphology = TurkishMorphology.create_with_defaults()
             logger.info("Zemberek Türkçe NLP başarıyla yüklendi")
-        except ImportError:
-            logger.warning("Zemberek bulunamadı, basit Türkçe işleme kullanılacak")
+        except Exception as e:
+            logger.warning(f"Zemberek yüklenemedi, basit Türkçe işleme kullanılacak: {e}")
             self.morphology = None
-        
-        # Model yükleme
-        self._load_model()
     
     def _load_model(self):
         """GGUF Telekom AI modelini yükle"""
@@ -84,48 +153,32 @@ class YapayZekaOrkestratoriV4:
             logger.info(f"AI modeli yükleniyor: {self.model_name}")
             logger.info(f"Model yolu: {self.local_model_path}")
             
+            # Çok worker'lı kurulumda model ayrı bir süreçte; bu süreç Unix soketiyle bağlanır
+            if settings.INFERENCE_MODE == "remote":
+                logger.info(f"Model sunucusuna bağlanılıyor: {settings.MODEL_SERVER_SOCKET}")
+                self.inference = RemoteInferenceClient(
+                    settings.MODEL_SERVER_SOCKET,
+                    connect_timeout=settings.MODEL_SERVER_CONNECT_TIMEOUT_S
+                )
+                self.inference.load_models()
+                self._model_loaded = True
+                logger.info("✅ Model sunucusu bağlantısı hazır!")
+                return
+            
             # GGUF model için llama-cpp-python kullan
             try:
-                from llama_cpp import Llama
-                import torch
-                import os
-                
                 logger.info("GGUF Telekom AI modeli llama-cpp-python ile yükleniyor...")
                 
-                # Yeni model yolu ile yükle
-                model_path = self.local_model_path
-                
-                # Model dosyasının varlığını kontrol et
-                if os.path.exists(model_path):
-                    logger.info(f"✅ Model dosyası bulundu: {model_path}")
-                    
-                    # Eğer dizin ise, içindeki .gguf dosyasını bul
-                    if os.path.isdir(model_path):
-                        gguf_files = [f for f in os.listdir(model_path) if f.endswith('.gguf')]
-                        if gguf_files:
-                            model_file = os.path.join(model_path, gguf_files[0])
-                            logger.info(f"📁 Dizinde GGUF dosyası bulundu: {model_file}")
-                        else:
-                            logger.warning(f"❌ Dizinde GGUF dosyası bulunamadı: {model_path}")
-                            self._model_loaded = False
-                            return
-                    else:
-                        model_file = model_path
-                        logger.info(f"📄 Model dosyası: {model_file}")
-                    
-                    # GGUF model yükleme - llama-cpp-python ile
-                    self.model = Llama(
-                        model_path=model_file,
-                        n_ctx=2048,  # Context length
-                        n_threads=4,  # Thread sayısı
-                        n_batch=1,  # Batch size
-                        verbose=False  # Verbose kapalı
-                    )
-                else:
-                    logger.warning(f"❌ Model dosyası bulunamadı: {model_path}")
+                # Model dosyasının varlığını kontrol et (dizin ise içindeki .gguf dosyası)
+                model_file = gguf_dosyasi_bul(self.local_model_path)
+                if model_file is None:
                     self._model_loaded = False
                     return
                 
+                # GGUF model yükleme - llama-cpp-python ile
+                self.inference = cikarim_motoru_olustur(model_file)
+                self.model = self.inference.models[0]
+                
                 # Tokenizer için basit bir wrapper
                 class SimpleTokenizer:
                     def __init__(self):
@@ -163,6 +216,12 @@ class YapayZekaOrkestratoriV4:
         """LangChain pipeline kurulumu"""
         try:
             from transformers import pipeline
+            try:
+                from langchain_community.llms import HuggingFacePipeline
+            except ImportError:
+                from langchain.llms import HuggingFacePipeline
+            from langchain.prompts import PromptTemplate
+            from langchain.chains import LLMChain
             
             # HuggingFace pipeline oluştur
             pipe = pipeline(
@@ -247,8 +306,13 @@ Kurallar:
 
 Kullanıcı sorusu: """
     
-    async def _generate_response(self, dialogue: List[Dict[str, str]]) -> str:
-        """Gelişmiş AI yanıt üretimi"""
+    async def _generate_response(
+        self,
+        dialogue: List[Dict[str, str]],
+        on_token: Optional[Callable[[str], None]] = None,
+        kullanici_id: Optional[str] = None
+    ) -> str:
+        """Gelişmiş AI yanıt üretimi (on_token verilirse GGUF token'ları üretildikçe iletilir)"""
         try:
             # Son kullanıcı mesajını al
             user_message = ""
@@ -257,83 +321,73 @@ Kullanıcı sorusu: """
                     user_message = msg["content"]
                     break
             
-            logger.info(f"AI modeli yanıt üretiyor: {user_message}")
+            logger.debug(f"AI modeli yanıt üretiyor: {user_message}")
             
             # AI düşünce süreci başlıyor
-            logger.info("🤔 AI DÜŞÜNCE SÜRECİ BAŞLIYOR...")
-            logger.info(f"📝 Gelen mesaj: '{user_message}'")
+            logger.debug("🤔 AI DÜŞÜNCE SÜRECİ BAŞLIYOR...")
+            logger.debug(f"📝 Gelen mesaj: '{user_message}'")
             
             # Türkçe ön işleme
             processed_message = self._turkish_preprocessing(user_message)
-            logger.info(f"🔧 İşlenmiş mesaj: '{processed_message}'")
+            logger.debug(f"🔧 İşlenmiş mesaj: '{processed_message}'")
             
             # AI analiz süreci
-            logger.info("🔍 AI MESAJ ANALİZİ:")
-            if "konya" in processed_message.lower():
-                logger.info("   📍 Konum tespit edildi: Konya")
-            if "telefon" in processed_message.lower() or "çekmiyor" in processed_message.lower():
-                logger.info("   📱 Telefon/ağ sorunu tespit edildi")
-            if "fatura" in processed_message.lower() or "ödeme" in processed_message.lower():
-                logger.info("   💰 Fatura/ödeme konusu tespit edildi")
-            if "paket" in processed_message.lower():
-                logger.info("   📦 Paket konusu tespit edildi")
-            if "kota" in processed_message.lower():
-                logger.info("   📊 Kota konusu tespit edildi")
+            niyetler = self.niyet_yonlendirici.route(processed_message)
+            logger.debug(f"🔍 AI MESAJ ANALİZİ: tespit edilen niyetler {niyetler}")
             
             # GGUF modeli kullan (eğer yüklüyse)
-            if self._model_loaded and self.model:
+            if self._model_loaded and self.inference:
+                # Benzer bir mesaj daha önce yanıtlandıysa modeli hiç çağırma; kullanıcı
+                # bilindiğinde yalnızca kendi girdileri aranır
+                kapsam = kullanici_id or None
+                if self.anlamsal_onbellek:
+                    with span("semantic_cache") as sp:
+                        isabet = self.anlamsal_onbellek.lookup(processed_message, kapsam)
+                        sp.set(hit=isabet is not None)
+                    if isabet:
+                        logger.info(f"⚡ Anlamsal önbellek isabeti ({isabet.benzerlik:.2f}): {isabet.arac_adi}")
+                        if on_token:
+                            on_token(isabet.yanit)
+                        return isabet.yanit
+
                 try:
-                    logger.info("GGUF modeli yanıt üretiyor...")
+                    logger.debug("GGUF modeli yanıt üretiyor...")
                     
-                    # GGUF modeli ile yanıt üret
-                    response = self.model(
-                        f"""Sen bir Telekom müşteri hizmetleri asistanısın. Kullanıcının mesajını analiz et ve düşünce sürecini göster.
-
-DÜŞÜNCE SÜRECİ:
-1. Kullanıcının konumunu ve durumunu analiz et
-2. Hangi Telekom hizmeti ile ilgili olduğunu belirle
-3. Uygun aracı seç ve nedenini açıkla
-4. Doğal bir yanıt ver
-
-Örnek düşünce süreci:
-- "konya yolundayım telefonum çekmiyor" 
-  → Kullanıcı Konya'da, telefon çekmiyor
-  → Ağ durumu sorunu var
-  → check_network_status aracını kullanmalıyım
-  → "Konya'da telefon çekme sorunu yaşıyorsunuz. Ağ durumunu kontrol ediyorum. [check_network_status]"
-
-Telekom araçları:
-- get_past_bills: Geçmiş faturalar, önceki faturalar, fatura geçmişi
-- get_current_bill: Mevcut fatura, şu anki fatura, güncel fatura
-- get_available_packages: Kullanılabilir paketler, tarifeler, paket seçenekleri
-- get_remaining_quotas: Kalan kota, kullanım durumu, data kullanımı
-- check_network_status: Ağ durumu, bağlantı durumu, sinyal
-- test_internet_speed: İnternet hızı testi, speed test
+                    with span("prompt_build"):
+                        prompt = gguf_prompt_olustur(processed_message)
 
-Kullanıcı: {processed_message}
-Asistan:""",
-                        max_tokens=100,
-                        temperature=0.3,
-                        stop=["Kullanıcı:", "\n\n"]
-                    )
+                    # GGUF modeli ile yanıt üret (event loop'u bloklamadan, worker thread'inde)
+                    with span("inference"):
+                        response = await self.inference.generate(
+                            prompt,
+                            on_token=on_token,
+                            max_tokens=100,
+                            temperature=0.3,
+                            stop=["Kullanıcı:", "\n\n"]
+                        )
+                    record_inference(response)
                     
-                    ai_response = response['choices'][0]['text'].strip()
-                    logger.info(f"🤖 GGUF YANITI: '{ai_response}'")
+                    ai_response = response['text'].strip()
+                    logger.debug(f"🤖 GGUF YANITI: '{ai_response}'")
                     
                     # AI düşünce süreci analizi
-                    logger.info("🧠 AI DÜŞÜNCE ANALİZİ:")
-                    if "check_network_status" in ai_response.lower():
-                        logger.info("   ✅ Ağ durumu aracı seçildi")
-                    if "get_past_bills" in ai_response.lower():
-                        logger.info("   ✅ Geçmiş faturalar aracı seçildi")
-                    if "get_available_packages" in ai_response.lower():
-                        logger.info("   ✅ Kullanılabilir paketler aracı seçildi")
-                    if "get_remaining_quotas" in ai_response.lower():
-                        logger.info("   ✅ Kalan kotalar aracı seçildi")
+                    secilen_araclar = self.niyet_yonlendirici.araclari_ayikla(ai_response)
+                    logger.debug(f"🧠 AI DÜŞÜNCE ANALİZİ: seçilen araçlar {secilen_araclar}")
+                    logger.debug("🎯 AI DÜŞÜNCE SÜRECİ TAMAMLANDI")
                     
-                    logger.info("🎯 AI DÜŞÜNCE SÜRECİ TAMAMLANDI")
+                    # Prompt yalnızca mesajı içerir, yanıtta hesap değeri yoktur; isabette araçlar
+                    # yanıttan yeniden ayıklanıp çalıştırılır. Değiştiren araca değinen yanıt saklanmaz
+                    degistiren = self.niyet_yonlendirici.degistiren_var(niyetler + secilen_araclar)
+                    if (
+                        self.anlamsal_onbellek and ai_response and not degistiren
+                        and response["finish_reason"] != "cancelled"
+                    ):
+                        arac_adi = secilen_araclar[0] if secilen_araclar else None
+                        self.anlamsal_onbellek.store(processed_message, ai_response, arac_adi, kapsam)
                     return ai_response
                     
+                except InferenceQueueFullError:
+                    raise
                 except Exception as e:
                     logger.warning(f"GGUF modeli hatası, doğal yanıt veriyor: {e}")
             
@@ -347,7 +401,7 @@ Asistan:""",
                         loop.run_in_executor(None, self.langchain_chain.invoke, {"user_input": processed_message}),
                         timeout=30.0  # 30 saniye timeout (artırıldı)
                     )
-                    logger.info(f"LangChain yanıtı: {response}")
+                    logger.debug(f"LangChain yanıtı: {response}")
                     return str(response).strip()
                 except asyncio.TimeoutError:
                     logger.warning("LangChain timeout, AI doğal yanıt veriyor")
@@ -355,22 +409,13 @@ Asistan:""",
                     logger.warning(f"LangChain hatası, AI doğal yanıt veriyor: {e}")
             
             # AI'nin kendi karar vermesi - gelişmiş keyword detection
-            logger.info("AI kendi kararını veriyor...")
-            
-            # Daha doğal ve açıklayıcı yanıtlar
-            if "fatura" in processed_message.lower() or "ödeme" in processed_message.lower():
-                return "Fatura bilgilerinizi kontrol ediyorum. Size detaylı bilgi vereceğim."
-            elif "paket" in processed_message.lower() or "tarife" in processed_message.lower():
-                return "Kullanılabilir paketleri inceliyorum. Size en uygun seçenekleri sunacağım."
-            elif "kota" in processed_message.lower() or "kullanım" in processed_message.lower():
-                return "Kalan kotalarınızı kontrol ediyorum. Kullanım durumunuzu göreceksiniz."
-            elif "ağ" in processed_message.lower() or "bağlantı" in processed_message.lower():
-                return "Ağ durumunuzu kontrol ediyorum. Bağlantı sorunlarını tespit edeceğim."
-            elif "hız" in processed_message.lower() or "internet" in processed_message.lower():
-                return "İnternet hızınızı test ediyorum. Performans bilgilerinizi alacağım."
-            else:
-                return "Merhaba! Size nasıl yardımcı olabilirim? Fatura, paket, kota veya ağ durumu hakkında bilgi alabilirim."
+            logger.debug("AI kendi kararını veriyor...")
+            
+            # Daha doğal ve açıklayıcı yanıtlar (eşleşen tüm niyetlerin şablonları)
+            return self.niyet_yonlendirici.yanit(niyetler)
             
+        except InferenceQueueFullError:
+            raise
         except Exception as e:
             logger.error(f"AI yanıt üretme hatası: {e}")
             return "AI şu anda düşünüyor, lütfen tekrar deneyin."
@@ -382,70 +427,61 @@ Asistan:""",
         try:
             # AI yanıtını temizle
             cleaned_text = text.strip().lower()
-            logger.info(f"Parse edilecek metin: {cleaned_text}")
+            logger.debug(f"Parse edilecek metin: {cleaned_text}")
             
             # AI sadece LangChain yanıtını parse eder
             # Keyword detection yok - AI kendi kararını verir
             
-            # Eğer AI araç adı döndürdüyse, onu kullan
+            # Eğer AI araç adı döndürdüyse, onu kullan (adı geçen tüm araçlar)
             # Format: "Açıklama. [get_past_bills]" veya sadece "get_past_bills"
-            if "get_past_bills" in cleaned_text:
-                arac_adi = "get_past_bills"
-                parametreler = {"session_token": session_token} if session_token else {}
-                arac_cagrilari.append(AracCagrisi(arac_adi, parametreler))
-                logger.info(f"AI araç seçti: {arac_adi}")
-                
-            elif "get_current_bill" in cleaned_text:
-                arac_adi = "get_current_bill"
-                parametreler = {"session_token": session_token} if session_token else {}
-                arac_cagrilari.append(AracCagrisi(arac_adi, parametreler))
-                logger.info(f"AI araç seçti: {arac_adi}")
-                
-            elif "get_available_packages" in cleaned_text:
-                arac_adi = "get_available_packages"
-                parametreler = {}
-                arac_cagrilari.append(AracCagrisi(arac_adi, parametreler))
-                logger.info(f"AI araç seçti: {arac_adi}")
-                
-            elif "get_remaining_quotas" in cleaned_text:
-                arac_adi = "get_remaining_quotas"
-                parametreler = {"session_token": session_token} if session_token else {}
-                arac_cagrilari.append(AracCagrisi(arac_adi, parametreler))
-                logger.info(f"AI araç seçti: {arac_adi}")
-                
-            elif "check_network_status" in cleaned_text:
-                arac_adi = "check_network_status"
-                parametreler = {"session_token": session_token} if session_token else {}
-                arac_cagrilari.append(AracCagrisi(arac_adi, parametreler))
-                logger.info(f"AI araç seçti: {arac_adi}")
-                
-            elif "test_internet_speed" in cleaned_text:
-                arac_adi = "test_internet_speed"
-                parametreler = {}
+            # Serbest metinden yalnızca salt okunur araçlar çağrılır (pay_bill vb. asla)
+            adi_gecenler = self.niyet_yonlendirici.araclari_ayikla(cleaned_text)
+            for arac_adi in self.niyet_yonlendirici.salt_okunur(adi_gecenler):
+                parametreler = self.niyet_yonlendirici.parametreler(arac_adi, session_token)
                 arac_cagrilari.append(AracCagrisi(arac_adi, parametreler))
-                logger.info(f"AI araç seçti: {arac_adi}")
+                logger.debug(f"AI araç seçti: {arac_adi}")
             
-            logger.info(f"AI toplam {len(arac_cagrilari)} araç seçti")
+            atlananlar = [ad for ad in adi_gecenler if ad not in {c.arac_adi for c in arac_cagrilari}]
+            if atlananlar:
+                logger.warning(f"Değişiklik yapan araçlar model çıktısından çağrılmadı: {atlananlar}")
+            logger.debug(f"AI toplam {len(arac_cagrilari)} araç seçti")
             
         except Exception as e:
             logger.error(f"Araç parse hatası: {e}")
         
         return arac_cagrilari
     
-    async def kullanici_mesaj_isle(self, mesaj: str, kullanici_id: str, oturum_id: str, session_token: str = None) -> Dict[str, Any]:
-        """Ana mesaj işleme fonksiyonu"""
-        logger.info(f"AI Orchestrator V4'e iletilen session_token: {session_token}")
+    async def kullanici_mesaj_isle(
+        self,
+        mesaj: str,
+        kullanici_id: str,
+        oturum_id: str,
+        session_token: str = None,
+        olay_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Ana mesaj işleme fonksiyonu
+
+        Args:
+            olay_callback: Verilirse token ve araç başlangıç/bitiş olaylarını alır (akış modu)
+        """
+        def olay(tip: str, **veri):
+            if olay_callback is not None:
+                olay_callback({"type": tip, **veri})
+        baslangic = time.perf_counter()
+        logger.debug(f"AI Orchestrator V4'e iletilen session_token: {session_token}")
         
         try:
-            logger.info(f"Kullanıcı mesajı işleniyor: {kullanici_id} - {mesaj[:50]}...")
+            logger.debug(f"Kullanıcı mesajı işleniyor: {kullanici_id} - {mesaj[:50]}...")
             
             # Mesajı ön işle
-            islenmis_mesaj = self._turkish_preprocessing(mesaj)
-            logger.info(f"İşlenmiş mesaj: {islenmis_mesaj}")
+            with span("preprocess"):
+                islenmis_mesaj = self._turkish_preprocessing(mesaj)
+            logger.debug(f"İşlenmiş mesaj: {islenmis_mesaj}")
             
             # Konuşma bağlamını hazırla
             dialogue = [{"role": "user", "content": islenmis_mesaj}]
-            logger.info(f"Bağlam mesaj sayısı: {len(dialogue)}")
+            logger.debug(f"Bağlam mesaj sayısı: {len(dialogue)}")
             
             # Mevcut araçları hazırla
             mevcut_araclar = {
@@ -456,44 +492,68 @@ Asistan:""",
                 "check_network_status": "Ağ durumu",
                 "test_internet_speed": "İnternet hızı testi"
             }
-            logger.info(f"Mevcut araç sayısı: {len(mevcut_araclar)}")
-            
-            # AI yanıtı üret (model yüklenmese bile)
-            logger.info("AI yanıtı üretiliyor...")
-            ai_response = await self._generate_response(dialogue)
-            logger.info(f"AI yanıtı üretildi: {ai_response[:100]}...")
-            
-            # Araç çağrılarını parse et
-            logger.info("🔧 ARAÇ PARSE SÜRECİ:")
-            arac_cagrilari = await self._parse_tool_calls(ai_response, session_token)
-            logger.info(f"📊 Araç çağrısı sayısı: {len(arac_cagrilari)}")
+            logger.debug(f"Mevcut araç sayısı: {len(mevcut_araclar)}")
+            
+            # Açık niyetlerde (örn. "faturamı göster") LLM hiç çağrılmaz
+            kisa_yol = []
+            if settings.INTENT_SHORT_CIRCUIT:
+                with span("intent_shortcut") as sp:
+                    kisa_yol = self.niyet_yonlendirici.kisa_yol(islenmis_mesaj, izinli=self.arac_motoru.dispatch)
+                    sp.set(hit=bool(kisa_yol))
+            
+            if kisa_yol:
+                logger.info(f"⚡ Niyet kısa yolu, LLM atlandı: {kisa_yol}")
+                ai_response = self.niyet_yonlendirici.yanit(kisa_yol)
+                olay("token", text=ai_response)
+                arac_cagrilari = [
+                    AracCagrisi(arac_adi, self.niyet_yonlendirici.parametreler(arac_adi, session_token))
+                    for arac_adi in kisa_yol
+                ]
+            else:
+                # AI yanıtı üret (model yüklenmese bile)
+                logger.debug("AI yanıtı üretiliyor...")
+                with span("generate"):
+                    ai_response = await self._generate_response(
+                        dialogue,
+                        on_token=(lambda parca: olay("token", text=parca)) if olay_callback else None,
+                        kullanici_id=kullanici_id
+                    )
+                logger.debug(f"AI yanıtı üretildi: {ai_response[:100]}...")
+                
+                # Araç çağrılarını parse et
+                logger.debug("🔧 ARAÇ PARSE SÜRECİ:")
+                with span("parse"):
+                    arac_cagrilari = await self._parse_tool_calls(ai_response, session_token)
+            logger.debug(f"📊 Araç çağrısı sayısı: {len(arac_cagrilari)}")
             
             for i, arac in enumerate(arac_cagrilari):
-                logger.info(f"   🛠️ Araç {i+1}: {arac.arac_adi}")
-                logger.info(f"   📋 Parametreler: {arac.parametreler}")
+                logger.debug(f"   🛠️ Araç {i+1}: {arac.arac_adi}")
+                logger.debug(f"   📋 Parametreler: {arac.parametreler}")
             
-            # Araç çağrılarını yürüt
+            # Araç çağrılarını yürüt (bağımsız olanlar eşzamanlı, bağımlılar sırayla)
             if arac_cagrilari:
-                logger.info(f"🚀 {len(arac_cagrilari)} ARAÇ YÜRÜTME SÜRECİ:")
-                for i, arac in enumerate(arac_cagrilari):
-                    logger.info(f"   🔄 Araç {i+1} yürütülüyor: {arac.arac_adi}")
-                    try:
-                        # Telekom API çağrısı
-                        logger.info(f"   📞 Telekom API'ye çağrı yapılıyor...")
-                        sonuc = await self._telekom_arac_cagir(arac.arac_adi, arac.parametreler)
-                        arac.sonuc = sonuc
-                        arac.durum = "tamamlandi"
-                        logger.info(f"   ✅ Araç {i+1} başarılı: {arac.arac_adi}")
-                        logger.info(f"   📊 Sonuç: {str(sonuc)[:100]}...")
-                    except Exception as e:
-                        logger.error(f"   ❌ Araç {i+1} hatası: {arac.arac_adi} - {e}")
-                        arac.durum = "hata"
-                        arac.hata_mesaji = str(e)
+                logger.debug(f"🚀 {len(arac_cagrilari)} ARAÇ YÜRÜTME SÜRECİ:")
+
+                def arac_basladi(arac: AracCagrisi):
+                    logger.debug(f"   🔄 Araç yürütülüyor: {arac.arac_adi}")
+                    olay("tool_start", arac_adi=arac.arac_adi, parametreler=arac.parametreler)
+
+                def arac_bitti(arac: AracCagrisi):
+                    if arac.durum == "tamamlandi":
+                        logger.debug(f"   ✅ Araç başarılı: {arac.arac_adi}")
+                        logger.debug(f"   📊 Sonuç: {str(arac.sonuc)[:100]}...")
+                    else:
+                        logger.error(f"   ❌ Araç hatası: {arac.arac_adi} - {arac.hata_mesaji}")
+                    olay("tool_end", arac_adi=arac.arac_adi, durum=arac.durum, sonuc=arac.sonuc, hata_mesaji=arac.hata_mesaji)
+
+                with span("tools", count=len(arac_cagrilari)):
+                    arac_cagrilari = await self.arac_motoru.run(arac_cagrilari, on_start=arac_basladi, on_end=arac_bitti)
             
             # Final yanıt üret
-            logger.info("Final yanıt üretiliyor...")
-            final_yanit = self._arac_sonuclarini_entegre_et(ai_response, arac_cagrilari)
-            logger.info(f"Final yanıt: {final_yanit[:100]}...")
+            logger.debug("Final yanıt üretiliyor...")
+            with span("integrate"):
+                final_yanit = self._arac_sonuclarini_entegre_et(ai_response, arac_cagrilari)
+            logger.debug(f"Final yanıt: {final_yanit[:100]}...")
             
             # Sonucu hazırla
             sonuc = {
@@ -520,9 +580,15 @@ Asistan:""",
                 }
             }
             
-            logger.info(f"Mesaj işleme tamamlandı: {sonuc['yanit_id']}")
+            logger.info(
+                f"Mesaj işleme tamamlandı: {sonuc['yanit_id']} "
+                f"({(time.perf_counter() - baslangic) * 1000:.0f} ms, {len(arac_cagrilari)} araç)"
+            )
             return sonuc
             
+        except InferenceQueueFullError:
+            # Kuyruk dolu - chat endpoint'i 503 döndürür
+            raise
         except Exception as e:
             logger.error(f"Mesaj işleme hatası: {e}")
             # Hata durumunda bile AI yanıtı üret
@@ -540,49 +606,63 @@ Asistan:""",
                 }
             }
     
+    async def kullanici_mesaj_isle_stream(
+        self,
+        mesaj: str,
+        kullanici_id: str,
+        oturum_id: str,
+        session_token: str = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        kullanici_mesaj_isle'nin akış sürümü
+
+        Sırasıyla "token", "tool_start", "tool_end" olaylarını ve en sonda
+        entegre yanıtı taşıyan "final" olayını üretir. Tüketici akışı bırakırsa
+        (istemci bağlantıyı kapattı) işleme ve GGUF üretimi iptal edilir.
+        """
+        olaylar: asyncio.Queue = asyncio.Queue()
+        gorev = asyncio.create_task(
+            self.kullanici_mesaj_isle(mesaj, kullanici_id, oturum_id, session_token, olay_callback=olaylar.put_nowait)
+        )
+        gorev.add_done_callback(lambda _: olaylar.put_nowait(None))
+        try:
+            while True:
+                olay = await olaylar.get()
+                if olay is None:
+                    break
+                yield olay
+            yield {"type": "final", **gorev.result()}
+        finally:
+            if not gorev.done():
+                gorev.cancel()
+
     async def _fallback_response(self, mesaj: str, session_token: str = None) -> Dict[str, Any]:
         """Model yüklenmediğinde fallback yanıt"""
-        # Basit keyword detection
-        mesaj_lower = mesaj.lower()
+        # Anahtar kelime yönlendirmesi; değişiklik yapan araçlar kendiliğinden çağrılmaz
+        araclar = [
+            arac_adi for arac_adi in self.niyet_yonlendirici.salt_okunur(self.niyet_yonlendirici.route(mesaj))
+            if arac_adi in self.arac_motoru.dispatch
+        ] or ["get_past_bills"]
         
-        if any(word in mesaj_lower for word in ["geçmiş", "fatura", "ödeme"]):
-            arac_adi = "get_past_bills"
-            parametreler = {"session_token": session_token, "limit": 12} if session_token else {"limit": 12}
-        elif any(word in mesaj_lower for word in ["paket", "tarife"]):
-            arac_adi = "get_available_packages"
-            parametreler = {}
-        elif any(word in mesaj_lower for word in ["kota", "kullanım"]):
-            arac_adi = "get_remaining_quotas"
-            parametreler = {"session_token": session_token} if session_token else {}
-        elif any(word in mesaj_lower for word in ["ağ", "bağlantı"]):
-            arac_adi = "check_network_status"
-            parametreler = {"region": "Istanbul"}
-        else:
-            arac_adi = "get_past_bills"
-            parametreler = {"session_token": session_token, "limit": 12} if session_token else {"limit": 12}
-        
-        # Araç çağrısı yap
-        try:
-            sonuc = await self._telekom_arac_cagir(arac_adi, parametreler)
-            durum = "tamamlandi"
-            hata_mesaji = None
-        except Exception as e:
-            sonuc = None
-            durum = "hata"
-            hata_mesaji = str(e)
+        # Araç çağrılarını yap
+        arac_cagrilari = await self.arac_motoru.run([
+            AracCagrisi(arac_adi, self.niyet_yonlendirici.parametreler(arac_adi, session_token))
+            for arac_adi in araclar
+        ])
         
         return {
             "yanit_id": f"FALLBACK_{uuid.uuid4().hex[:8]}",
-            "yanit": f"Fallback yanıt: {arac_adi} çağrıldı",
+            "yanit": f"Fallback yanıt: {', '.join(araclar)} çağrıldı",
             "guven_puani": 0.5,
             "arac_cagrilari": [
                 {
-                    "arac_adi": arac_adi,
-                    "parametreler": parametreler,
-                    "durum": durum,
-                    "sonuc": sonuc,
-                    "hata_mesaji": hata_mesaji
+                    "arac_adi": arac.arac_adi,
+                    "parametreler": arac.parametreler,
+                    "durum": arac.durum,
+                    "sonuc": arac.sonuc,
+                    "hata_mesaji": arac.hata_mesaji
                 }
+                for arac in arac_cagrilari
             ],
             "metadata": {
                 "oturum_id": "FALLBACK",
@@ -596,30 +676,11 @@ Asistan:""",
     async def _telekom_arac_cagir(self, arac_adi: str, parametreler: Dict[str, Any]) -> Any:
         """Telekom API araç çağrısı"""
         try:
-            logger.info(f"AI Telekom araç çağrısı: {arac_adi} - {parametreler}")
-            
-            # AI endpoint fonksiyonları mapping
-            from .ai_endpoint_functions import ai_endpoint_functions
-            
-            function_mapping = {
-                "get_current_bill": ai_endpoint_functions.telekom_get_current_bill,
-                "get_past_bills": ai_endpoint_functions.telekom_get_bill_history,
-                "get_available_packages": ai_endpoint_functions.telekom_get_available_packages,
-                "get_remaining_quotas": ai_endpoint_functions.telekom_get_remaining_quotas,
-                "check_network_status": ai_endpoint_functions.telekom_check_network_status,
-                "test_internet_speed": ai_endpoint_functions.telekom_test_internet_speed,
-            }
-            
-            if arac_adi not in function_mapping:
-                logger.warning(f"Bilinmeyen araç: {arac_adi}")
-                return None
+            logger.debug(f"AI Telekom araç çağrısı: {arac_adi} - {parametreler}")
             
-            # Fonksiyonu çağır
-            function = function_mapping[arac_adi]
-            logger.info(f"Araç çağrısı: {arac_adi} -> {function.__name__}")
-            result = await function(**parametreler)
+            result = await self.arac_motoru.call(arac_adi, parametreler)
             
-            logger.info(f"AI Telekom API yanıtı: {result}")
+            logger.debug(f"AI Telekom API yanıtı: {result}")
             return result
             
         except Exception as e:
@@ -670,6 +731,9 @@ Asistan:""",
             "model_path": self.local_model_path,
             "turkish_nlp": ZEMBEREK_AVAILABLE,
             "langchain_available": LANGCHAIN_AVAILABLE,
+            "readiness": self.hazirlik_durumu(),
+            "inference": self.inference.durum() if self.inference else None,
+            "semantic_cache": self.anlamsal_onbellek.stats() if self.anlamsal_onbellek else None,
             "timestamp": datetime.now().isoformat(),
             "version": "4.0.0"
         }
@@ -0,0 +1,494 @@
+"""
+GGUF sürekli batch zamanlayıcısı - eşzamanlı istekleri ortak decode adımlarında birleştirir
+"""
+
+import asyncio
+import codecs
+import ctypes
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .inference_executor import InferenceJob, InferenceQueueFullError, create_job
+from .prompt_cache import PromptPrefixCache, prompt_tokenlari
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Sequence:
+    """Bir KV slotuna yerleşmiş, üretimi süren istek"""
+    job: InferenceJob
+    seq_id: int
+    prompt_tokens: List[int]
+    max_tokens: int
+    temperature: float
+    top_p: float
+    stop: List[str]
+    # llama-cpp create_completion varsayılanları (havuz yolu ile aynı örnekleme)
+    top_k: int = 40
+    repeat_penalty: float = 1.1
+    recent: Deque[int] = field(default_factory=deque)  # Tekrar cezası penceresi (prompt + üretim)
+    started_at: float = field(default_factory=time.perf_counter)
+    first_token_at: Optional[float] = None
+    n_past: int = 0
+    prefill_pos: int = 0
+    last_token: Optional[int] = None
+    logits_index: int = -1
+    completion_tokens: int = 0
+    text: str = ""
+    emitted: int = 0
+    finish_reason: Optional[str] = None
+    decoder: Any = field(default_factory=lambda: codecs.getincrementaldecoder("utf-8")(errors="ignore"))
+
+    @property
+    def prefilling(self) -> bool:
+        return self.prefill_pos < len(self.prompt_tokens)
+
+
+class BatchScheduler:
+    """
+    llama.cpp çoklu-sekans batch API'si ile sürekli batch (continuous batching).
+
+    Tek bir Llama ağırlık kopyası üzerinde `n_seq_max` KV slotlu ayrı bir
+    context açılır. Zamanlayıcı thread'i her adımda üretimdeki tüm sekansların
+    sıradaki token'ını ve kalan kapasiteyle yeni gelen prompt'ların parçalarını
+    (chunked prefill) tek `llama_decode` çağrısında işler. Biten sekansın KV
+    slotu hemen boşaltılıp kuyruktaki isteğe verilir. `prefix_cache` verilirse
+    sabit önek başlangıçta ayrı bir sekansa yazılır ve her yeni sekansa KV
+    hücreleri kopyalanarak yalnızca son ek prefill edilir.
+
+    Arayüz `InferenceExecutor` ile aynıdır (submit/generate/durum/shutdown).
+    """
+
+    def __init__(
+        self,
+        llama: Any,
+        n_seq_max: int = 8,
+        n_ctx_per_seq: int = 2048,
+        n_batch: int = 512,
+        n_ubatch: int = 512,
+        n_threads: int = 4,
+        max_queue: int = 16,
+        prefix_cache: Optional[PromptPrefixCache] = None,
+    ):
+        self.llama = llama
+        self.n_seq_max = max(1, n_seq_max)
+        self.n_ctx_per_seq = n_ctx_per_seq
+        self.n_batch = max(n_batch, self.n_seq_max)
+        self.n_ubatch = min(n_ubatch, self.n_batch)
+        self.n_threads = n_threads
+        self.max_queue = max(1, max_queue)
+        self.prefix_cache = prefix_cache
+        self.models: List[Any] = [llama]
+        # Tekrar cezasının baktığı son token sayısı (Llama(last_n_tokens_size=...) ile aynı)
+        self.repeat_last_n = max(0, getattr(llama, "last_n_tokens_size", 64))
+
+        self._ctx = None
+        self._batch = None
+        self._n_vocab = 0
+        self._eos = -1
+        self._pending: "queue.Queue[InferenceJob]" = queue.Queue(maxsize=self.max_queue)
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._free_slots: List[int] = []
+        self._active: Dict[int, _Sequence] = {}
+        # Önek KV'si son sekans kimliğinde tutulur
+        self._prefix_seq = self.n_seq_max
+        self._n_prefix = 0
+
+        # İstatistikler
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.decode_steps = 0
+        self.batched_tokens = 0
+
+    def load_models(self):
+        """Çoklu-sekans context'i ve batch tamponunu oluştur"""
+        if self._ctx is not None:
+            return
+        import llama_cpp
+
+        params = llama_cpp.llama_context_default_params()
+        params.n_ctx = self.n_ctx_per_seq * (self.n_seq_max + 1)
+        params.n_batch = self.n_batch
+        params.n_ubatch = self.n_ubatch
+        params.n_seq_max = self.n_seq_max + 1
+        params.n_threads = self.n_threads
+        params.n_threads_batch = self.n_threads
+        if hasattr(params, "kv_unified"):
+            params.kv_unified = True
+
+        init = getattr(llama_cpp, "llama_init_from_model", None) or llama_cpp.llama_new_context_with_model
+        self._ctx = init(self.llama.model, params)
+        if not self._ctx:
+            raise RuntimeError("Batch context oluşturulamadı")
+
+        self._batch = llama_cpp.llama_batch_init(self.n_batch, 0, self.n_seq_max + 1)
+        self._n_vocab = self.llama.n_vocab()
+        self._eos = self.llama.token_eos()
+        self._free_slots = list(range(self.n_seq_max))
+        if self.prefix_cache is not None:
+            self._warm_prefix()
+        logger.info(
+            f"Batch zamanlayıcı hazır: {self.n_seq_max} slot, n_batch={self.n_batch}, "
+            f"n_ubatch={self.n_ubatch}, kuyruk limiti {self.max_queue}"
+        )
+
+    def _warm_prefix(self):
+        """Öneki ayrılmış sekansa n_batch'lik parçalar halinde yaz"""
+        import llama_cpp
+
+        tokens = self.prefix_cache.prefix_tokens(self.llama)
+        if len(tokens) >= self.n_ctx_per_seq:
+            logger.warning("Prompt öneki slot bağlamından uzun, önbellek devre dışı")
+            self.prefix_cache = None
+            return
+        batch = self._batch
+        for start in range(0, len(tokens), self.n_batch):
+            chunk = tokens[start:start + self.n_batch]
+            for i, token in enumerate(chunk):
+                batch.token[i] = token
+                batch.pos[i] = start + i
+                batch.n_seq_id[i] = 1
+                batch.seq_id[i][0] = self._prefix_seq
+                batch.logits[i] = 0
+            batch.n_tokens = len(chunk)
+            rc = llama_cpp.llama_decode(self._ctx, batch)
+            if rc != 0:
+                raise RuntimeError(f"Önek değerlendirmesi başarısız: llama_decode {rc}")
+        self._n_prefix = len(tokens)
+        logger.info(f"Prompt öneki önbelleğe alındı: {self._n_prefix} token")
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        self.load_models()
+        self._thread = threading.Thread(target=self._loop, name="gguf-batch", daemon=True)
+        self._thread.start()
+
+    def submit(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, **params) -> asyncio.Future:
+        """
+        Üretim isteğini kuyruğa ekle ve sonucu taşıyan future'ı döndür
+
+        Args:
+            on_token: Üretilen her metin parçası için event loop üzerinde çağrılır
+
+        Raises:
+            InferenceQueueFullError: Kuyruk doluysa
+        """
+        if self._stop.is_set():
+            raise RuntimeError("Batch zamanlayıcı kapatıldı")
+        self._ensure_started()
+        job = create_job(asyncio.get_running_loop(), prompt, params, on_token)
+
+        try:
+            self._pending.put_nowait(job)
+        except queue.Full:
+            self.rejected += 1
+            raise InferenceQueueFullError(f"Çıkarım kuyruğu dolu ({self.max_queue} istek bekliyor)")
+        self._wakeup.set()
+        return job.future
+
+    async def generate(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, **params) -> Dict[str, Any]:
+        """İsteği kuyruğa ekle ve tamamlanmasını bekle"""
+        return await self.submit(prompt, on_token=on_token, **params)
+
+    # ------------------------------------------------------------------
+    # Zamanlayıcı thread'i
+    # ------------------------------------------------------------------
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._admit()
+            if not self._active:
+                self._wakeup.wait(timeout=0.1)
+                self._wakeup.clear()
+                continue
+            try:
+                self._step()
+            except Exception as e:
+                logger.error(f"Batch decode hatası: {e}")
+                for seq in list(self._active.values()):
+                    self._finish(seq, error=e)
+
+    def _admit(self):
+        """Boş KV slotlarına kuyruktaki istekleri yerleştir"""
+        while self._free_slots:
+            try:
+                job = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            if job.cancel_event.is_set() or job.future.done():
+                self.cancelled += 1
+                continue
+
+            params = job.params
+            max_tokens = params.get("max_tokens") or 128
+            # Prompt + üretim slot bağlamına sığmalı
+            keep = max(1, self.n_ctx_per_seq - max_tokens)
+            tokens = None
+            if self.prefix_cache is not None:
+                tokens = self.prefix_cache.tokenize(self.llama, job.prompt)
+                if tokens is not None and len(tokens) > keep:
+                    tokens = None
+            cached = tokens is not None
+            if not cached:
+                tokens = prompt_tokenlari(self.llama, job.prompt)
+                if len(tokens) > keep:
+                    tokens = tokens[-keep:]
+
+            seq = _Sequence(
+                job=job,
+                seq_id=self._free_slots.pop(),
+                prompt_tokens=tokens,
+                max_tokens=max_tokens,
+                temperature=params.get("temperature", 0.8),
+                top_p=params.get("top_p", 0.95),
+                stop=list(params.get("stop") or []),
+                top_k=params.get("top_k", 40),
+                repeat_penalty=params.get("repeat_penalty", 1.1),
+                recent=deque(tokens[-self.repeat_last_n:], maxlen=self.repeat_last_n),
+            )
+            if cached:
+                self._seq_cp(self._prefix_seq, seq.seq_id)
+                seq.n_past = seq.prefill_pos = self._n_prefix
+            self._active[seq.seq_id] = seq
+
+    def _step(self):
+        """Tek bir karma batch hazırla (decode + prefill parçaları) ve çalıştır"""
+        import llama_cpp
+
+        batch = self._batch
+        n = 0
+
+        def add(token: int, pos: int, seq_id: int, want_logits: bool):
+            nonlocal n
+            batch.token[n] = token
+            batch.pos[n] = pos
+            batch.n_seq_id[n] = 1
+            batch.seq_id[n][0] = seq_id
+            batch.logits[n] = 1 if want_logits else 0
+            n += 1
+
+        # Önce üretimdeki sekanslar: her biri bir token
+        for seq in self._active.values():
+            seq.logits_index = -1
+            if not seq.prefilling and seq.last_token is not None:
+                seq.logits_index = n
+                add(seq.last_token, seq.n_past, seq.seq_id, True)
+                seq.n_past += 1
+
+        # Kalan kapasite prompt prefill'ine
+        for seq in self._active.values():
+            if n >= self.n_batch:
+                break
+            if not seq.prefilling:
+                continue
+            chunk = seq.prompt_tokens[seq.prefill_pos:seq.prefill_pos + (self.n_batch - n)]
+            for i, token in enumerate(chunk):
+                last = seq.prefill_pos + i == len(seq.prompt_tokens) - 1
+                if last:
+                    seq.logits_index = n
+                add(token, seq.n_past, seq.seq_id, last)
+                seq.n_past += 1
+            seq.prefill_pos += len(chunk)
+
+        batch.n_tokens = n
+        rc = llama_cpp.llama_decode(self._ctx, batch)
+        if rc != 0:
+            raise RuntimeError(f"llama_decode {rc} döndürdü")
+        self.decode_steps += 1
+        self.batched_tokens += n
+
+        for seq in list(self._active.values()):
+            if seq.job.cancel_event.is_set():
+                self._finish(seq, reason="cancelled")
+                continue
+            if seq.logits_index < 0:
+                continue
+            ptr = llama_cpp.llama_get_logits_ith(self._ctx, seq.logits_index)
+            token = self._sample(ptr, seq)
+            self._accept(seq, token)
+
+    def _sample(self, logits_ptr, seq: _Sequence) -> int:
+        """
+        llama-cpp örnekleyicisiyle aynı sırada örnekle: tekrar cezası, top-k,
+        top-p (sıcaklıksız olasılıklarla), sıcaklık
+        """
+        import numpy as np
+
+        logits = np.ctypeslib.as_array(
+            ctypes.cast(logits_ptr, ctypes.POINTER(ctypes.c_float)), shape=(self._n_vocab,)
+        ).astype(np.float64)
+        if seq.repeat_penalty != 1.0 and seq.recent:
+            ids = np.fromiter(set(seq.recent), dtype=np.intp)
+            values = logits[ids]
+            logits[ids] = np.where(values > 0, values / seq.repeat_penalty, values * seq.repeat_penalty)
+        if seq.temperature <= 0:
+            return int(logits.argmax())
+
+        if 0 < seq.top_k < self._n_vocab:
+            ids = np.argpartition(-logits, seq.top_k - 1)[:seq.top_k]
+        else:
+            ids = np.arange(self._n_vocab)
+        ids = ids[np.argsort(-logits[ids])]
+        candidates = logits[ids] - logits[ids[0]]
+        if seq.top_p < 1.0:
+            probs = np.exp(candidates)
+            probs /= probs.sum()
+            cutoff = int(np.searchsorted(np.cumsum(probs), seq.top_p)) + 1
+            ids, candidates = ids[:cutoff], candidates[:cutoff]
+
+        probs = np.exp(candidates / seq.temperature)
+        probs /= probs.sum()
+        return int(ids[np.random.choice(len(ids), p=probs)])
+
+    def _accept(self, seq: _Sequence, token: int):
+        """Örneklenen token'ı ekle, durma koşullarını kontrol et"""
+        if token == self._eos:
+            self._finish(seq, reason="stop")
+            return
+
+        if seq.first_token_at is None:
+            seq.first_token_at = time.perf_counter()
+        seq.completion_tokens += 1
+        seq.last_token = token
+        seq.recent.append(token)
+        seq.text += seq.decoder.decode(self.llama.detokenize([token]))
+
+        for stop in seq.stop:
+            idx = seq.text.find(stop)
+            if idx != -1:
+                seq.text = seq.text[:idx]
+                seq.decoder.reset()
+                self._finish(seq, reason="stop")
+                return
+
+        if seq.completion_tokens >= seq.max_tokens or seq.n_past + 1 >= self.n_ctx_per_seq:
+            self._finish(seq, reason="length")
+            return
+
+        # Durma dizisinin başlangıcı olabilecek kuyruk kısmı bitişe kadar bekletilir
+        hold = max((len(stop) - 1 for stop in seq.stop), default=0)
+        self._emit(seq, len(seq.text) - hold)
+
+    def _emit(self, seq: _Sequence, upto: int):
+        """Henüz gönderilmemiş metni akış dinleyicisine ilet"""
+        if seq.job.on_token is not None and upto > seq.emitted:
+            seq.job.on_token(seq.text[seq.emitted:upto])
+            seq.emitted = upto
+
+    def _finish(self, seq: _Sequence, reason: str = "stop", error: Optional[Exception] = None):
+        """Sekansı kapat, KV slotunu temizle ve sonucu event loop'a ilet"""
+        self._active.pop(seq.seq_id, None)
+        self._seq_rm(seq.seq_id)
+        self._free_slots.append(seq.seq_id)
+        seq.text += seq.decoder.decode(b"", final=True)
+        if error is None and reason != "cancelled":
+            self._emit(seq, len(seq.text))
+
+        if error is None:
+            if reason == "cancelled":
+                self.cancelled += 1
+            else:
+                self.completed += 1
+        result = {
+            "text": seq.text,
+            "finish_reason": reason,
+            "completion_tokens": seq.completion_tokens,
+            "prompt_tokens": len(seq.prompt_tokens),
+            "queue_wait_s": seq.started_at - seq.job.enqueued_at,
+            "ttft_s": (seq.first_token_at or time.perf_counter()) - seq.started_at,
+            "generation_s": time.perf_counter() - seq.started_at,
+        }
+        self._resolve(seq.job, result, error)
+
+    @staticmethod
+    def _resolve(job: InferenceJob, result: Optional[Dict[str, Any]], error: Optional[Exception] = None):
+        """İşin future'ını (thread'den) kendi event loop'unda sonuçlandır"""
+        future = job.future
+
+        def resolve():
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        future.get_loop().call_soon_threadsafe(resolve)
+
+    def _seq_rm(self, seq_id: int):
+        """KV slotunu temizle (llama.cpp sürümleri arasında API adı değişti)"""
+        import llama_cpp
+
+        if hasattr(llama_cpp, "llama_memory_seq_rm"):
+            llama_cpp.llama_memory_seq_rm(llama_cpp.llama_get_memory(self._ctx), seq_id, -1, -1)
+        elif hasattr(llama_cpp, "llama_kv_self_seq_rm"):
+            llama_cpp.llama_kv_self_seq_rm(self._ctx, seq_id, -1, -1)
+        else:
+            llama_cpp.llama_kv_cache_seq_rm(self._ctx, seq_id, -1, -1)
+
+    def _seq_cp(self, src: int, dst: int):
+        """Kaynak sekansın KV hücrelerini hedef sekansa paylaştır"""
+        import llama_cpp
+
+        if hasattr(llama_cpp, "llama_memory_seq_cp"):
+            llama_cpp.llama_memory_seq_cp(llama_cpp.llama_get_memory(self._ctx), src, dst, -1, -1)
+        elif hasattr(llama_cpp, "llama_kv_self_seq_cp"):
+            llama_cpp.llama_kv_self_seq_cp(self._ctx, src, dst, -1, -1)
+        else:
+            llama_cpp.llama_kv_cache_seq_cp(self._ctx, src, dst, -1, -1)
+
+    def durum(self) -> Dict[str, Any]:
+        """Zamanlayıcı durum bilgisi"""
+        return {
+            "backend": "batch",
+            "slots": self.n_seq_max,
+            "active": len(self._active),
+            "queue_depth": self._pending.qsize(),
+            "queue_limit": self.max_queue,
+            "n_batch": self.n_batch,
+            "n_ubatch": self.n_ubatch,
+            "decode_steps": self.decode_steps,
+            "avg_batch_tokens": round(self.batched_tokens / self.decode_steps, 2) if self.decode_steps else 0,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "prefix_cache": self.prefix_cache.durum() if self.prefix_cache else None,
+        }
+
+    async def shutdown(self):
+        """Zamanlayıcı thread'ini durdur ve llama.cpp kaynaklarını bırak"""
+        import llama_cpp
+
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+            self._thread = None
+
+        # Thread durdu: bekleyen ve üretimi süren istekler askıda kalmasın
+        hata = RuntimeError("Batch zamanlayıcı kapatıldı")
+        for seq in list(self._active.values()):
+            self._finish(seq, error=hata)
+        while True:
+            try:
+                job = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            self._resolve(job, None, hata)
+
+        if self._batch is not None:
+            llama_cpp.llama_batch_free(self._batch)
+            self._batch = None
+        if self._ctx is not None:
+            llama_cpp.llama_free(self._ctx)
+            self._ctx = None
@@ -0,0 +1,121 @@
+"""
+Önceden hesaplanan fatura geçmişi tabloları
+
+Fatura geçmişi yalnızca user_id'nin (AI tarafında ek olarak günün) deterministik
+bir fonksiyonudur. Her kullanıcı için tablo bir kez üretilir: tutar ve durum
+sütunları NumPy dizileri olarak vektörel hesaplanır, yanıt satırları bu
+sütunlardan bir kez kurulur. `limit` isteği satır listesinin dilimidir;
+toplamlar kurulumda tek geçişte alınan önek toplamlarından O(1) okunur.
+
+Dönen satır sözlükleri tablodaki nesnelerin kendisidir; çağıranlar
+değiştirmemelidir.
+"""
+
+import functools
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+
+# /billing/history: 2 yıllık geçmiş
+ROUTER_HISTORY_MONTHS = 24
+# AIEndpointFunctions.telekom_get_bill_history: son 12 ay
+AI_HISTORY_MONTHS = 12
+
+# Ay indeksine (i % 12) göre mevsimsel ek: yaz 15, kış 10, diğer 5
+_SEASONAL = np.array([10, 10, 5, 5, 5, 15, 15, 15, 5, 5, 5, 10], dtype=np.int64)
+
+# i % 4'e göre hizmet kırılımı (hizmet adı, tutar oranı)
+_SERVICE_SPLITS = (
+    (("Mega İnternet", 0.8), ("Sesli Arama", 0.2)),
+    (("Mega İnternet", 0.7), ("Sesli Arama", 0.2), ("SMS Paketi", 0.1)),
+    (("Mega İnternet", 0.6), ("Sesli Arama", 0.2), ("Roaming Servisi", 0.2)),
+    (("Mega İnternet", 0.5), ("Sesli Arama", 0.2), ("Premium Hizmetler", 0.3)),
+)
+
+_PAYMENT_METHODS = ("credit_card", "bank_transfer", "auto_pay")
+
+
+class BillHistory:
+    """Bir kullanıcının fatura tablosu: satırlar + önek toplamları"""
+
+    __slots__ = ("user_id", "rows", "_total_cum", "_paid_cum")
+
+    def __init__(self, user_id: int, rows: List[Dict[str, Any]], amount: np.ndarray, paid: np.ndarray):
+        self.user_id = user_id
+        self.rows = rows
+        # Tek vektörel geçiş: ilk n faturanın toplamı = _cum[n]
+        zero = np.zeros(1, dtype=amount.dtype)
+        self._total_cum = np.concatenate((zero, np.cumsum(amount)))
+        self._paid_cum = np.concatenate((zero, np.cumsum(np.where(paid, amount, 0))))
+
+    def slice(self, limit: int) -> List[Dict[str, Any]]:
+        return self.rows[: max(0, limit)]
+
+    def aggregates(self, limit: int) -> Dict[str, Any]:
+        """İlk `limit` faturanın ödenen/ödenmeyen toplamı ve ortalaması"""
+        n = min(max(0, limit), len(self.rows))
+        total = self._total_cum[n].item()
+        paid = self._paid_cum[n].item()
+        return {
+            "total_paid": paid,
+            "total_unpaid": total - paid,
+            "average_amount": total / n if n else 0.0,
+        }
+
+
+@functools.lru_cache(maxsize=4096)
+def router_bill_history(user_id: int) -> BillHistory:
+    """/billing/history için 24 aylık tablo"""
+    i = np.arange(ROUTER_HISTORY_MONTHS)
+    amount = (50 + (user_id % 50)) + (i % 12) * 2 + _SEASONAL[i % 12]
+    paid = i < 21  # Son 3 fatura ödenmemiş
+
+    rows = []
+    for idx, bill_amount, is_paid in zip(i.tolist(), amount.tolist(), paid.tolist()):
+        year = 2023 if idx < 12 else 2024
+        month = (idx % 12) + 1
+        status = "paid" if is_paid else "unpaid"
+        rows.append({
+            "bill_id": f"F-{year}-{user_id:04d}-{month:02d}",
+            "user_id": user_id,
+            "amount": bill_amount,
+            "currency": "TRY",
+            "bill_date": f"{year}-{month:02d}-28",
+            "due_date": f"{year}-{month+1:02d}-15",
+            "status": status,
+            "services": [
+                {"service_name": name, "amount": bill_amount * ratio}
+                for name, ratio in _SERVICE_SPLITS[idx % 4]
+            ],
+            "payment_method": _PAYMENT_METHODS[idx % 3],
+            "late_fee": 0 if is_paid else 15.50,
+            "discount_applied": 5.00 if idx % 6 == 0 else 0.00,  # Her 6. faturada indirim
+        })
+    return BillHistory(user_id, rows, amount, paid)
+
+
+@functools.lru_cache(maxsize=4096)
+def ai_bill_history(user_id: int, today: date) -> BillHistory:
+    """AI aracı için bugünden geriye 12 aylık tablo (gün değişince yeniden kurulur)"""
+    i = np.arange(AI_HISTORY_MONTHS)
+    amount = (50 + (user_id % 50)) + i * 5
+    paid = i % 2 == 0
+
+    rows = []
+    for idx, bill_amount, is_paid in zip(i.tolist(), amount.tolist(), paid.tolist()):
+        bill_month = today - timedelta(days=30 * (idx + 1))
+        rows.append({
+            "bill_id": f"F-{bill_month.year}-{user_id:04d}-{idx+1:02d}",
+            "user_id": user_id,
+            "amount": bill_amount,
+            "currency": "TRY",
+            "bill_date": bill_month.strftime("%Y-%m-%d"),
+            "due_date": (bill_month + timedelta(days=15)).strftime("%Y-%m-%d"),
+            "status": "paid" if is_paid else "unpaid",
+            "services": [
+                {"service_name": "Mega İnternet", "amount": bill_amount * 0.7},
+                {"service_name": "Sesli Arama", "amount": bill_amount * 0.3},
+            ],
+        })
+    return BillHistory(user_id, rows, amount, paid)
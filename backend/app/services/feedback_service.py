@@ -1,14 +1,16 @@
 import logging
 import asyncio
 import json
+import re
+import time
 import uuid
+from collections import Counter
 from typing import List, Dict, Any, Optional
-from datetime import datetime
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
+from ..core.config import settings
 from ..schemas.feedback import (
     FeedbackSchema, 
     FeedbackType, 
@@ -19,25 +21,273 @@ from ..schemas.feedback import (
 
 logger = logging.getLogger(__name__)
 
+# Toplu flush'ta tablo başına tek executemany ile çalışan ifadeler (sıra korunur)
+_BATCH_STATEMENTS = {
+    "feedback_data": text("""
+        INSERT INTO feedback_data (
+            feedback_id, feedback_type, message_id, user_question, 
+            ai_response, user_id, session_id, context, timestamp
+        ) VALUES (:feedback_id, :feedback_type, :message_id, :user_question, 
+                 :ai_response, :user_id, :session_id, :context, :timestamp)
+    """),
+    "response_patterns": text("""
+        INSERT OR REPLACE INTO response_patterns (
+            pattern_id, question_type, answer_style, keywords, 
+            context, confidence_score, usage_count, created_at
+        ) VALUES (:pattern_id, :question_type, :answer_style, :keywords, 
+                 :context, :confidence_score, :usage_count, :created_at)
+    """),
+    "improved_answers": text("""
+        INSERT INTO improved_answers (
+            original_question, original_answer, improved_answer, 
+            improvement_type, quality_score
+        ) VALUES (:original_question, :original_answer, :improved_answer, 
+                 :improvement_type, :quality_score)
+    """),
+    # Yeni kullanıcıda satır oluşturur; mevcut kullanıcıda yalnızca pozitif
+    # feedback detaylı cevap tercihini açar (önceki SELECT + UPDATE ile aynı sonuç)
+    "user_preferences": text("""
+        INSERT INTO user_preferences (
+            user_id, prefer_detailed, created_at, updated_at
+        ) VALUES (:user_id, :prefer_detailed, :created_at, :updated_at)
+        ON CONFLICT(user_id) DO UPDATE SET
+            prefer_detailed = CASE WHEN excluded.prefer_detailed THEN TRUE ELSE user_preferences.prefer_detailed END,
+            updated_at = CASE WHEN excluded.prefer_detailed THEN excluded.updated_at ELSE user_preferences.updated_at END
+    """),
+}
+
+
+# Artımlı tutulan istatistik tabloları; flush transaction'ı içinde güncellenir
+_AGGREGATE_DDL = [
+    """CREATE TABLE IF NOT EXISTS feedback_user_stats (
+        user_id TEXT PRIMARY KEY,
+        total INTEGER NOT NULL DEFAULT 0,
+        positive INTEGER NOT NULL DEFAULT 0,
+        negative INTEGER NOT NULL DEFAULT 0,
+        last_feedback_at TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS feedback_daily_stats (
+        day TEXT NOT NULL,
+        feedback_type TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, feedback_type)
+    )""",
+    """CREATE TABLE IF NOT EXISTS feedback_type_stats (
+        feedback_type TEXT PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS feedback_tool_stats (
+        tool_name TEXT PRIMARY KEY,
+        total INTEGER NOT NULL DEFAULT 0,
+        positive INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS response_pattern_stats (
+        answer_style TEXT PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0
+    )""",
+]
+
+_AGGREGATE_UPSERTS = {
+    "feedback_user_stats": text("""
+        INSERT INTO feedback_user_stats (user_id, total, positive, negative, last_feedback_at)
+        VALUES (:user_id, :total, :positive, :negative, :last_feedback_at)
+        ON CONFLICT(user_id) DO UPDATE SET
+            total = total + excluded.total,
+            positive = positive + excluded.positive,
+            negative = negative + excluded.negative,
+            last_feedback_at = MAX(COALESCE(last_feedback_at, ''), excluded.last_feedback_at)
+    """),
+    "feedback_daily_stats": text("""
+        INSERT INTO feedback_daily_stats (day, feedback_type, count) VALUES (:day, :feedback_type, :count)
+        ON CONFLICT(day, feedback_type) DO UPDATE SET count = count + excluded.count
+    """),
+    "feedback_type_stats": text("""
+        INSERT INTO feedback_type_stats (feedback_type, count) VALUES (:feedback_type, :count)
+        ON CONFLICT(feedback_type) DO UPDATE SET count = count + excluded.count
+    """),
+    "feedback_tool_stats": text("""
+        INSERT INTO feedback_tool_stats (tool_name, total, positive) VALUES (:tool_name, :total, :positive)
+        ON CONFLICT(tool_name) DO UPDATE SET total = total + excluded.total, positive = positive + excluded.positive
+    """),
+    "response_pattern_stats": text("""
+        INSERT INTO response_pattern_stats (answer_style, count) VALUES (:answer_style, :count)
+        ON CONFLICT(answer_style) DO UPDATE SET count = count + excluded.count
+    """),
+}
+
+
+def _feedback_tools(context: Optional[str]) -> List[str]:
+    """Feedback context'indeki araç adları (chat yanıtının tool_calls listesi veya tek araç)"""
+    if not context:
+        return []
+    try:
+        data = json.loads(context)
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(data, dict):
+        return []
+    names = []
+    for call in data.get("tool_calls") or []:
+        if isinstance(call, dict):
+            name = call.get("arac_adi") or call.get("tool_name") or call.get("name")
+            if name:
+                names.append(name)
+    for key in ("arac_adi", "tool_name"):
+        if isinstance(data.get(key), str):
+            names.append(data[key])
+    return list(dict.fromkeys(names))
+
+
+class _FeedbackAggregates:
+    """Bir grup feedback / pattern satırının istatistik deltaları"""
+
+    def __init__(self):
+        self.users: Dict[str, Counter] = {}
+        self.last_seen: Dict[str, str] = {}
+        self.daily: Counter = Counter()
+        self.types: Counter = Counter()
+        self.tools: Dict[str, Counter] = {}
+        self.styles: Counter = Counter()
+
+    def add_feedback(self, feedback_type: str, user_id: Optional[str], timestamp: str, context: Optional[str]):
+        positive = feedback_type == FeedbackType.POSITIVE.value
+        self.types[feedback_type] += 1
+        self.daily[(timestamp[:10], feedback_type)] += 1
+        if user_id:
+            counts = self.users.setdefault(user_id, Counter())
+            counts["total"] += 1
+            counts["positive" if positive else "negative"] += 1
+            self.last_seen[user_id] = max(self.last_seen.get(user_id, ""), timestamp)
+        for tool in _feedback_tools(context):
+            counts = self.tools.setdefault(tool, Counter())
+            counts["total"] += 1
+            counts["positive"] += positive
+
+    def add_pattern(self, answer_style: str):
+        self.styles[answer_style] += 1
+
+    def rows(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            "feedback_user_stats": [
+                {"user_id": user_id, "total": c["total"], "positive": c["positive"], "negative": c["negative"],
+                 "last_feedback_at": self.last_seen[user_id]}
+                for user_id, c in self.users.items()
+            ],
+            "feedback_daily_stats": [
+                {"day": day, "feedback_type": feedback_type, "count": count}
+                for (day, feedback_type), count in self.daily.items()
+            ],
+            "feedback_type_stats": [
+                {"feedback_type": feedback_type, "count": count} for feedback_type, count in self.types.items()
+            ],
+            "feedback_tool_stats": [
+                {"tool_name": tool, "total": c["total"], "positive": c["positive"]} for tool, c in self.tools.items()
+            ],
+            "response_pattern_stats": [
+                {"answer_style": style, "count": count} for style, count in self.styles.items()
+            ],
+        }
+
+    def write(self, session):
+        for table, params in self.rows().items():
+            if params:
+                session.execute(_AGGREGATE_UPSERTS[table], params)
+
+
+# FTS5 dizinleri (external content): kaynak tabloyla trigger'lar üzerinden senkron tutulur
+_FTS_INDEXES = {
+    "response_patterns_fts": ("response_patterns", "keywords"),
+    "improved_answers_fts": ("improved_answers", "original_question"),
+}
+
+
+def _fts_ddl(fts_table: str, source: str, column: str) -> List[str]:
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{column}, content='{source}', content_rowid='id')",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source} BEGIN
+            INSERT INTO {fts_table}(rowid, {column}) VALUES (new.id, new.{column});
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source} BEGIN
+            INSERT INTO {fts_table}({fts_table}, rowid, {column}) VALUES ('delete', old.id, old.{column});
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column} ON {source} BEGIN
+            INSERT INTO {fts_table}({fts_table}, rowid, {column}) VALUES ('delete', old.id, old.{column});
+            INSERT INTO {fts_table}(rowid, {column}) VALUES (new.id, new.{column});
+        END""",
+    ]
+
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _sqlite_pragmalari(dbapi_connection, connection_record):
+    """WAL: okuyucular yazıcıyı beklemez; NORMAL senkronizasyon WAL'da güvenli ve hızlı"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # INSERT OR REPLACE'in sildiği satırlar için de FTS silme trigger'ı çalışsın
+    cursor.execute("PRAGMA recursive_triggers=ON")
+    cursor.close()
+
+
 class FeedbackService:
-    """Feedback işleme ve öğrenme servisi"""
+    """
+    Feedback işleme ve öğrenme servisi
+
+    Yazmalar write-behind'dır: `process_feedback` öğrenme satırlarını bellekte
+    hesaplayıp kuyruğa ekler ve hemen döner. Arka plandaki flush görevi
+    kuyruğu `FEEDBACK_BATCH_SIZE` satıra ya da `FEEDBACK_FLUSH_INTERVAL_S`
+    süresine kadar biriktirir ve tek transaction'da executemany ile yazar
+    (event loop'u bloklamamak için thread havuzunda). `shutdown` kuyruğu
+    boşaltır.
+
+    Benzer pattern / iyileştirilmiş cevap aramaları FTS5 dizinleri üzerinden
+    tek sorguyla yapılır. Aday kümesi en yeni `SEARCH_CANDIDATES` eşleşmeyle
+    sınırlıdır, böylece tablo büyüse de sorgu süresi sabit kalır. SQLite FTS5
+    desteklemiyorsa eski LIKE sorgularına dönülür.
+    """
     
-    def __init__(self):
-        self.db_url = "sqlite:///./feedback.db"
+    SEARCH_CANDIDATES = 500
+    
+    def __init__(
+        self,
+        db_url: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue: Optional[int] = None
+    ):
+        self.db_url = db_url or settings.FEEDBACK_DB_URL
+        self.batch_size = max(1, batch_size or settings.FEEDBACK_BATCH_SIZE)
+        self.flush_interval = flush_interval if flush_interval is not None else settings.FEEDBACK_FLUSH_INTERVAL_S
+        self.max_queue = max_queue or settings.FEEDBACK_QUEUE_MAX
         self.engine = None
         self.SessionLocal = None
+        self.fts_enabled = False
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        
+        # İstatistikler
+        self.enqueued = 0
+        self.flushed = 0
+        self.batches = 0
+        self.dead_lettered = 0
+        self.failed = 0
+        self.last_flush_ms = 0.0
+        
         self._init_database()
     
     def _init_database(self):
         """Veritabanı başlatma"""
         try:
-            # SQLite veritabanı oluştur
+            # SQLite veritabanı oluştur (WAL; flush thread'i ve okuyucular ayrı bağlantı kullanır)
             self.engine = create_engine(
                 self.db_url,
                 connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
                 echo=False
             )
+            event.listen(self.engine, "connect", _sqlite_pragmalari)
             
             self.SessionLocal = sessionmaker(
                 autocommit=False, 
@@ -118,28 +368,209 @@ class FeedbackService:
                     )
                 """))
                 
+                # Tek başına da yazılamayan olaylar (kaybolmaz, incelenip yeniden oynatılabilir)
+                conn.execute(text("""
+                    CREATE TABLE IF NOT EXISTS feedback_dead_letter (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        payload TEXT,
+                        error TEXT,
+                        created_at TEXT
+                    )
+                """))
+                
                 conn.commit()
                 logger.info("Feedback tabloları oluşturuldu")
                 
         except Exception as e:
             logger.error(f"Tablo oluşturma hatası: {e}")
+        
+        self._create_search_indexes()
+        self._create_aggregate_tables()
+    
+    def _create_aggregate_tables(self):
+        """İstatistik tablolarını oluştur"""
+        try:
+            with self.engine.connect() as conn:
+                for ddl in _AGGREGATE_DDL:
+                    conn.execute(text(ddl))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"İstatistik tabloları oluşturma hatası: {e}")
+    
+    def _create_search_indexes(self):
+        """FTS5 arama dizinlerini ve senkron trigger'larını oluştur"""
+        try:
+            with self.engine.connect() as conn:
+                existing = {row[0] for row in conn.execute(text(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                ))}
+                for fts_table, (source, column) in _FTS_INDEXES.items():
+                    for ddl in _fts_ddl(fts_table, source, column):
+                        conn.execute(text(ddl))
+                    if fts_table not in existing:
+                        # Dizin mevcut bir veritabanına sonradan ekleniyor: var olan satırları dizinle
+                        conn.execute(text(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"))
+                conn.commit()
+            self.fts_enabled = True
+            logger.info("Feedback FTS5 arama dizinleri hazır")
+        except Exception as e:
+            logger.warning(f"FTS5 kullanılamıyor, LIKE aramasına dönülüyor: {e}")
+            self.fts_enabled = False
+    
+    # ------------------------------------------------------------------
+    # Write-behind kuyruğu
+    # ------------------------------------------------------------------
+    
+    def _ensure_started(self):
+        """Kuyruk ve flush görevini çalışan event loop üzerinde tembel başlat"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._flusher = asyncio.create_task(self._flush_loop())
+    
+    async def _enqueue(self, rows: Dict[str, Dict[str, Any]]):
+        """Tablo → satır eşlemesini kuyruğa ekle (kuyruk doluysa yer açılmasını bekler)"""
+        self._ensure_started()
+        await self._queue.put(rows)
+        self.enqueued += 1
+    
+    async def _flush_loop(self):
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait() if loop.time() >= deadline else \
+                        await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            await loop.run_in_executor(None, self._flush_batch, batch)
+    
+    def _write_items(self, items: List[Dict[str, Dict[str, Any]]]):
+        """Olayları tek transaction'da, tablo başına executemany ile yaz"""
+        rows: Dict[str, List[Dict[str, Any]]] = {table: [] for table in _BATCH_STATEMENTS}
+        for item in items:
+            for table, row in item.items():
+                rows[table].append(row)
+        with self.SessionLocal() as session:
+            for table, statement in _BATCH_STATEMENTS.items():
+                if rows[table]:
+                    session.execute(statement, rows[table])
+            # İstatistikler aynı transaction'da: satırlar ve sayaçlar birlikte yazılır ya da hiç
+            aggregates = _FeedbackAggregates()
+            for row in rows["feedback_data"]:
+                aggregates.add_feedback(row["feedback_type"], row["user_id"], row["timestamp"], row["context"])
+            for row in rows["response_patterns"]:
+                aggregates.add_pattern(row["answer_style"])
+            aggregates.write(session)
+            session.commit()
+    
+    def _dead_letter(self, item: Dict[str, Dict[str, Any]], error: Exception):
+        """Yazılamayan olayı hata mesajıyla birlikte feedback_dead_letter tablosuna koy"""
+        try:
+            with self.SessionLocal() as session:
+                session.execute(
+                    text("INSERT INTO feedback_dead_letter (payload, error, created_at) "
+                         "VALUES (:payload, :error, :created_at)"),
+                    {
+                        "payload": json.dumps(item, ensure_ascii=False, default=str),
+                        "error": str(error),
+                        "created_at": datetime.now().isoformat(),
+                    },
+                )
+                session.commit()
+            self.dead_lettered += 1
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Feedback olayı kaybedildi (dead-letter yazılamadı): {e}")
+    
+    def _flush_batch(self, batch: List[Dict[str, Dict[str, Any]]]):
+        """
+        Biriken olayları tek transaction'da yaz
+
+        Batch yazılamazsa (örn. tek bir hatalı satır) olaylar tek tek yeniden
+        denenir; yine yazılamayan olay dead-letter tablosuna taşınır, böylece
+        bir olayın hatası ilgisiz olayları düşürmez.
+        """
+        started = time.perf_counter()
+        try:
+            self._write_items(batch)
+            self.flushed += len(batch)
+            self.batches += 1
+        except Exception as e:
+            logger.warning(f"Feedback batch yazılamadı, {len(batch)} olay tek tek deneniyor: {e}")
+            for item in batch:
+                try:
+                    self._write_items([item])
+                    self.flushed += 1
+                except Exception as item_error:
+                    logger.error(f"Feedback olayı yazılamadı, dead-letter tablosuna taşınıyor: {item_error}")
+                    self._dead_letter(item, item_error)
+            self.batches += 1
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        logger.debug(f"Feedback flush: {len(batch)} olay, {self.last_flush_ms:.1f} ms")
+    
+    async def shutdown(self):
+        """Kuyruktaki tüm olayları yaz ve flush görevini durdur"""
+        if self._queue is None:
+            return
+        await self._queue.put(None)
+        await self._flusher
+        self._queue = None
+        self._flusher = None
+        logger.info(f"Feedback kuyruğu boşaltıldı: toplam {self.flushed} olay yazıldı")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Write-behind kuyruğu durum bilgisi"""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_limit": self.max_queue,
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "dead_lettered": self.dead_lettered,
+            "failed": self.failed,
+            "avg_batch_size": round(self.flushed / self.batches, 1) if self.batches else 0.0,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+    
+    # ------------------------------------------------------------------
+    # Feedback işleme
+    # ------------------------------------------------------------------
     
     async def process_feedback(self, feedback: FeedbackSchema) -> Dict[str, Any]:
-        """Feedback verisini işle ve öğren"""
+        """Feedback verisini işle ve öğren (kalıcı yazma arka planda, toplu yapılır)"""
         try:
             logger.info(f"Feedback işleniyor: {feedback.feedback_type}")
             
-            # Feedback'i veritabanına kaydet
-            feedback_id = await self._save_feedback(feedback)
+            # Feedback satırı
+            feedback_id = f"FB_{uuid.uuid4().hex[:8]}"
+            rows = {"feedback_data": self._feedback_row(feedback_id, feedback)}
             
             # Feedback tipine göre işle
             if feedback.feedback_type == FeedbackType.POSITIVE:
-                await self._learn_from_positive(feedback)
+                pattern_row = await self._learn_from_positive(feedback)
+                if pattern_row:
+                    rows["response_patterns"] = pattern_row
             elif feedback.feedback_type == FeedbackType.NEGATIVE:
-                await self._learn_from_negative(feedback)
+                improved_row = await self._learn_from_negative(feedback)
+                if improved_row:
+                    rows["improved_answers"] = improved_row
             
             # Kullanıcı tercihlerini güncelle
-            await self._update_user_preferences(feedback)
+            if feedback.user_id:
+                rows["user_preferences"] = self._user_preferences_row(feedback)
+            
+            await self._enqueue(rows)
+            logger.info(f"Feedback kuyruğa alındı: {feedback_id}")
             
             return {
                 "success": True,
@@ -156,52 +587,38 @@ class FeedbackService:
                 "processed": False
             }
     
-    async def _save_feedback(self, feedback: FeedbackSchema) -> str:
-        """Feedback'i veritabanına kaydet"""
-        feedback_id = f"FB_{uuid.uuid4().hex[:8]}"
-        
-        with self.SessionLocal() as session:
-            session.execute(text("""
-                INSERT INTO feedback_data (
-                    feedback_id, feedback_type, message_id, user_question, 
-                    ai_response, user_id, session_id, context, timestamp
-                ) VALUES (:feedback_id, :feedback_type, :message_id, :user_question, 
-                         :ai_response, :user_id, :session_id, :context, :timestamp)
-            """), {
-                "feedback_id": feedback_id,
-                "feedback_type": feedback.feedback_type.value,
-                "message_id": feedback.message_id,
-                "user_question": feedback.user_question,
-                "ai_response": feedback.ai_response,
-                "user_id": feedback.user_id,
-                "session_id": feedback.session_id,
-                "context": json.dumps(feedback.context) if feedback.context else None,
-                "timestamp": feedback.timestamp.isoformat()
-            })
-            session.commit()
-        
-        logger.info(f"Feedback kaydedildi: {feedback_id}")
-        return feedback_id
+    def _feedback_row(self, feedback_id: str, feedback: FeedbackSchema) -> Dict[str, Any]:
+        """feedback_data satırı"""
+        return {
+            "feedback_id": feedback_id,
+            "feedback_type": feedback.feedback_type.value,
+            "message_id": feedback.message_id,
+            "user_question": feedback.user_question,
+            "ai_response": feedback.ai_response,
+            "user_id": feedback.user_id,
+            "session_id": feedback.session_id,
+            "context": json.dumps(feedback.context) if feedback.context else None,
+            "timestamp": feedback.timestamp.isoformat()
+        }
     
-    async def _learn_from_positive(self, feedback: FeedbackSchema):
-        """Pozitif feedback'den öğren"""
+    async def _learn_from_positive(self, feedback: FeedbackSchema) -> Optional[Dict[str, Any]]:
+        """Pozitif feedback'den öğren; kaydedilecek pattern satırını döndür"""
         try:
             # Soru-cevap pattern'ını analiz et
             pattern = await self._extract_response_pattern(feedback)
             
-            # Pattern'ı veritabanına kaydet
-            await self._save_response_pattern(pattern)
-            
             # Benzer sorulara aynı yaklaşımı kullan
             await self._update_response_style(pattern)
             
             logger.info(f"Pozitif feedback'den öğrenildi: {pattern['question_type']}")
+            return self._response_pattern_row(pattern)
             
         except Exception as e:
             logger.error(f"Pozitif feedback öğrenme hatası: {e}")
+            return None
     
-    async def _learn_from_negative(self, feedback: FeedbackSchema):
-        """Negatif feedback'den öğren"""
+    async def _learn_from_negative(self, feedback: FeedbackSchema) -> Optional[Dict[str, Any]]:
+        """Negatif feedback'den öğren; kaydedilecek iyileştirilmiş cevap satırını döndür"""
         try:
             # Mevcut cevabı analiz et
             issues = await self._analyze_response_issues(feedback.ai_response)
@@ -213,18 +630,17 @@ class FeedbackService:
                 issues
             )
             
-            # İyileştirilmiş cevabı kaydet
-            await self._save_improved_answer(
+            logger.info(f"Negatif feedback'den öğrenildi ve iyileştirildi")
+            return self._improved_answer_row(
                 feedback.user_question,
                 feedback.ai_response,
                 improved_answer,
                 issues
             )
             
-            logger.info(f"Negatif feedback'den öğrenildi ve iyileştirildi")
-            
         except Exception as e:
             logger.error(f"Negatif feedback öğrenme hatası: {e}")
+            return None
     
     async def _extract_response_pattern(self, feedback: FeedbackSchema) -> Dict[str, Any]:
         """Response pattern'ını çıkar"""
@@ -254,26 +670,18 @@ class FeedbackService:
             "usage_count": 1
         }
     
-    async def _save_response_pattern(self, pattern: Dict[str, Any]):
-        """Response pattern'ını kaydet"""
-        with self.SessionLocal() as session:
-            session.execute(text("""
-                INSERT OR REPLACE INTO response_patterns (
-                    pattern_id, question_type, answer_style, keywords, 
-                    context, confidence_score, usage_count, created_at
-                ) VALUES (:pattern_id, :question_type, :answer_style, :keywords, 
-                         :context, :confidence_score, :usage_count, :created_at)
-            """), {
-                "pattern_id": pattern["pattern_id"],
-                "question_type": pattern["question_type"],
-                "answer_style": pattern["answer_style"],
-                "keywords": json.dumps(pattern["keywords"]),
-                "context": json.dumps(pattern["context"]),
-                "confidence_score": pattern["confidence_score"],
-                "usage_count": pattern["usage_count"],
-                "created_at": datetime.now().isoformat()
-            })
-            session.commit()
+    def _response_pattern_row(self, pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """response_patterns satırı"""
+        return {
+            "pattern_id": pattern["pattern_id"],
+            "question_type": pattern["question_type"],
+            "answer_style": pattern["answer_style"],
+            "keywords": json.dumps(pattern["keywords"], ensure_ascii=False),
+            "context": json.dumps(pattern["context"]),
+            "confidence_score": pattern["confidence_score"],
+            "usage_count": pattern["usage_count"],
+            "created_at": datetime.now().isoformat()
+        }
     
     async def _analyze_response_issues(self, response: str) -> List[str]:
         """Response'daki sorunları analiz et"""
@@ -314,70 +722,126 @@ class FeedbackService:
         
         return improved
     
-    async def _save_improved_answer(self, question: str, original: str, improved: str, issues: List[str]):
-        """İyileştirilmiş cevabı kaydet"""
+    def _improved_answer_row(self, question: str, original: str, improved: str, issues: List[str]) -> Dict[str, Any]:
+        """improved_answers satırı"""
+        return {
+            "original_question": question,
+            "original_answer": original,
+            "improved_answer": improved,
+            "improvement_type": json.dumps(issues),
+            "quality_score": 0.8  # Varsayılan kalite skoru
+        }
+    
+    def _user_preferences_row(self, feedback: FeedbackSchema) -> Dict[str, Any]:
+        """user_preferences upsert satırı"""
+        now = datetime.now().isoformat()
+        return {
+            "user_id": feedback.user_id,
+            "prefer_detailed": feedback.feedback_type == FeedbackType.POSITIVE,
+            "created_at": now,
+            "updated_at": now
+        }
+    
+    async def _update_response_style(self, pattern: Dict[str, Any]):
+        """Response stilini güncelle"""
+        # Bu fonksiyon gelecekte AI modelini güncellemek için kullanılabilir
+        logger.info(f"Response stili güncellendi: {pattern['question_type']} -> {pattern['answer_style']}")
+    
+    def rebuild_aggregates(self, chunk_size: int = 10000) -> Dict[str, int]:
+        """
+        İstatistik tablolarını mevcut satırlardan yeniden kur
+
+        feedback_data ve response_patterns tek geçişte, parça parça okunur
+        (bellek kullanımı satır sayısıyla değil kullanıcı/gün/araç sayısıyla
+        büyür); tablolar tek transaction'da değiştirilir.
+        """
+        aggregates = _FeedbackAggregates()
+        counts = {"feedback": 0, "patterns": 0}
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(text(
+                "SELECT feedback_type, user_id, timestamp, context FROM feedback_data"
+            ))
+            for chunk in result.partitions(chunk_size):
+                for feedback_type, user_id, timestamp, context in chunk:
+                    aggregates.add_feedback(feedback_type, user_id, timestamp or "", context)
+                counts["feedback"] += len(chunk)
+            result = conn.execution_options(stream_results=True).execute(text(
+                "SELECT answer_style FROM response_patterns"
+            ))
+            for chunk in result.partitions(chunk_size):
+                for (answer_style,) in chunk:
+                    aggregates.add_pattern(answer_style)
+                counts["patterns"] += len(chunk)
+
         with self.SessionLocal() as session:
-            session.execute(text("""
-                INSERT INTO improved_answers (
-                    original_question, original_answer, improved_answer, 
-                    improvement_type, quality_score
-                ) VALUES (:original_question, :original_answer, :improved_answer, 
-                         :improvement_type, :quality_score)
-            """), {
-                "original_question": question,
-                "original_answer": original,
-                "improved_answer": improved,
-                "improvement_type": json.dumps(issues),
-                "quality_score": 0.8  # Varsayılan kalite skoru
-            })
+            for table in _AGGREGATE_UPSERTS:
+                session.execute(text(f"DELETE FROM {table}"))
+            aggregates.write(session)
             session.commit()
+        logger.info(f"Feedback istatistikleri yeniden kuruldu: {counts}")
+        return counts
     
-    async def _update_user_preferences(self, feedback: FeedbackSchema):
-        """Kullanıcı tercihlerini güncelle"""
-        if not feedback.user_id:
-            return
-        
+    async def get_feedback_stats(self, user_id: str) -> Dict[str, Any]:
+        """Kullanıcının feedback sayaçları (tek satır okuması)"""
         try:
             with self.SessionLocal() as session:
-                # Mevcut tercihleri kontrol et
-                result = session.execute(text("""
-                    SELECT * FROM user_preferences WHERE user_id = :user_id
-                """), {"user_id": feedback.user_id}).fetchone()
-                
-                if result:
-                    # Tercihleri güncelle
-                    if feedback.feedback_type == FeedbackType.POSITIVE:
-                        # Pozitif feedback varsa detaylı cevapları tercih et
-                        session.execute(text("""
-                            UPDATE user_preferences 
-                            SET prefer_detailed = TRUE, updated_at = :updated_at
-                            WHERE user_id = :user_id
-                        """), {
-                            "updated_at": datetime.now().isoformat(),
-                            "user_id": feedback.user_id
-                        })
-                else:
-                    # Yeni kullanıcı tercihleri oluştur
-                    session.execute(text("""
-                        INSERT INTO user_preferences (
-                            user_id, prefer_detailed, created_at, updated_at
-                        ) VALUES (:user_id, :prefer_detailed, :created_at, :updated_at)
-                    """), {
-                        "user_id": feedback.user_id,
-                        "prefer_detailed": feedback.feedback_type == FeedbackType.POSITIVE,
-                        "created_at": datetime.now().isoformat(),
-                        "updated_at": datetime.now().isoformat()
-                    })
-                
-                session.commit()
-                
+                row = session.execute(text("""
+                    SELECT total, positive, negative, last_feedback_at
+                    FROM feedback_user_stats WHERE user_id = :user_id
+                """), {"user_id": user_id}).fetchone()
         except Exception as e:
-            logger.error(f"Kullanıcı tercihleri güncelleme hatası: {e}")
+            logger.error(f"Feedback istatistik getirme hatası: {e}")
+            row = None
+        total, positive, negative, last_feedback_at = row or (0, 0, 0, None)
+        return {
+            "total_feedback": total,
+            "positive_count": positive,
+            "negative_count": negative,
+            "last_feedback_at": last_feedback_at
+        }
     
-    async def _update_response_style(self, pattern: Dict[str, Any]):
-        """Response stilini güncelle"""
-        # Bu fonksiyon gelecekte AI modelini güncellemek için kullanılabilir
-        logger.info(f"Response stili güncellendi: {pattern['question_type']} -> {pattern['answer_style']}")
+    async def get_pattern_stats(self) -> Dict[str, Any]:
+        """Pattern, feedback tipi ve araç bazında özet sayaçlar"""
+        try:
+            with self.SessionLocal() as session:
+                styles = dict(session.execute(text(
+                    "SELECT answer_style, count FROM response_pattern_stats"
+                )).fetchall())
+                types = dict(session.execute(text(
+                    "SELECT feedback_type, count FROM feedback_type_stats"
+                )).fetchall())
+                tools = session.execute(text(
+                    "SELECT tool_name, total, positive FROM feedback_tool_stats ORDER BY total DESC"
+                )).fetchall()
+            return {
+                "total_patterns": sum(styles.values()),
+                "patterns_by_answer_style": styles,
+                "feedback_by_type": types,
+                "tool_positive_rates": {
+                    tool: {"total": total, "positive": positive, "positive_rate": round(positive / total, 4)}
+                    for tool, total, positive in tools if total
+                }
+            }
+        except Exception as e:
+            logger.error(f"Pattern istatistik getirme hatası: {e}")
+            return {}
+    
+    async def get_daily_stats(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Son `days` günün feedback tipi bazında günlük sayaçları"""
+        try:
+            with self.SessionLocal() as session:
+                result = session.execute(text("""
+                    SELECT day, feedback_type, count FROM feedback_daily_stats
+                    WHERE day >= :since
+                    ORDER BY day DESC
+                """), {"since": (datetime.now() - timedelta(days=days - 1)).date().isoformat()}).fetchall()
+        except Exception as e:
+            logger.error(f"Günlük feedback istatistik hatası: {e}")
+            return []
+        daily: Dict[str, Dict[str, Any]] = {}
+        for day, feedback_type, count in result:
+            daily.setdefault(day, {"day": day})[feedback_type] = count
+        return list(daily.values())
     
     async def get_user_preferences(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Kullanıcı tercihlerini getir"""
@@ -402,60 +866,142 @@ class FeedbackService:
             logger.error(f"Kullanıcı tercihleri getirme hatası: {e}")
             return None
     
-    async def get_similar_patterns(self, question: str) -> List[Dict[str, Any]]:
-        """Benzer sorular için pattern'ları getir"""
+    @staticmethod
+    def _fts_or_query(words: List[str]) -> str:
+        """Kelimelerden herhangi birini arayan FTS5 sorgusu"""
+        return " OR ".join(f'"{word}"' for word in dict.fromkeys(words))
+    
+    async def get_similar_patterns(self, question: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Benzer sorular için pattern'ları getir (tüm anahtar kelimeler tek sıralı sorguda)"""
         try:
             question_lower = question.lower()
             keywords = [word for word in question_lower.split() if len(word) > 3]
+            if not self.fts_enabled:
+                return self._similar_patterns_like(keywords)
+            
+            words = [token for keyword in keywords for token in _TOKEN.findall(keyword)]
+            if not words:
+                return []
             
             with self.SessionLocal() as session:
-                # Anahtar kelimelere göre benzer pattern'ları bul
-                patterns = []
-                for keyword in keywords:
-                    result = session.execute(text("""
-                        SELECT * FROM response_patterns 
-                        WHERE keywords LIKE :keyword_pattern 
-                        ORDER BY confidence_score DESC, usage_count DESC
-                        LIMIT 5
-                    """), {"keyword_pattern": f"%{keyword}%"}).fetchall()
-                    
-                    for row in result:
-                        patterns.append({
-                            "pattern_id": row[1],
-                            "question_type": row[2],
-                            "answer_style": row[3],
-                            "confidence_score": row[6],
-                            "usage_count": row[7]
-                        })
+                # En yeni adaylar arasında bm25 ile sırala
+                result = session.execute(text("""
+                    SELECT p.pattern_id, p.question_type, p.answer_style, p.confidence_score, p.usage_count
+                    FROM (
+                        SELECT rowid, rank FROM response_patterns_fts
+                        WHERE response_patterns_fts MATCH :query
+                        ORDER BY rowid DESC
+                        LIMIT :candidates
+                    ) AS f
+                    JOIN response_patterns p ON p.id = f.rowid
+                    ORDER BY f.rank, p.confidence_score DESC, p.usage_count DESC
+                    LIMIT :limit
+                """), {
+                    "query": self._fts_or_query(words),
+                    "candidates": self.SEARCH_CANDIDATES,
+                    "limit": limit
+                }).fetchall()
                 
-                return patterns
+                return [
+                    {
+                        "pattern_id": row[0],
+                        "question_type": row[1],
+                        "answer_style": row[2],
+                        "confidence_score": row[3],
+                        "usage_count": row[4]
+                    }
+                    for row in result
+                ]
                 
         except Exception as e:
             logger.error(f"Benzer pattern'lar getirme hatası: {e}")
             return []
     
+    def _similar_patterns_like(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """FTS5 yoksa: anahtar kelime başına LIKE taraması"""
+        with self.SessionLocal() as session:
+            # Anahtar kelimelere göre benzer pattern'ları bul
+            patterns = []
+            for keyword in keywords:
+                result = session.execute(text("""
+                    SELECT * FROM response_patterns 
+                    WHERE keywords LIKE :keyword_pattern 
+                    ORDER BY confidence_score DESC, usage_count DESC
+                    LIMIT 5
+                """), {"keyword_pattern": f"%{keyword}%"}).fetchall()
+                
+                for row in result:
+                    patterns.append({
+                        "pattern_id": row[1],
+                        "question_type": row[2],
+                        "answer_style": row[3],
+                        "confidence_score": row[6],
+                        "usage_count": row[7]
+                    })
+            
+            return patterns
+    
     async def get_improved_answers(self, question: str) -> List[Dict[str, Any]]:
         """İyileştirilmiş cevapları getir"""
         try:
+            if not self.fts_enabled:
+                return self._improved_answers_like(question)
+            
+            # Sorunun ilk 50 karakteri öbek (phrase) olarak aranır; kesilen son kelime atılır
+            words = _TOKEN.findall(question[:50].lower())
+            if len(question) > 50 and len(words) > 1:
+                words = words[:-1]
+            if not words:
+                return []
+            
             with self.SessionLocal() as session:
                 result = session.execute(text("""
-                    SELECT * FROM improved_answers 
-                    WHERE original_question LIKE :question_pattern 
-                    ORDER BY quality_score DESC, feedback_count DESC
+                    SELECT a.original_question, a.improved_answer, a.improvement_type, a.quality_score
+                    FROM (
+                        SELECT rowid FROM improved_answers_fts
+                        WHERE improved_answers_fts MATCH :query
+                        ORDER BY rowid DESC
+                        LIMIT :candidates
+                    ) AS f
+                    JOIN improved_answers a ON a.id = f.rowid
+                    ORDER BY a.quality_score DESC, a.feedback_count DESC
                     LIMIT 3
-                """), {"question_pattern": f"%{question[:50]}%"}).fetchall()
+                """), {
+                    "query": '"' + " ".join(words) + '"',
+                    "candidates": self.SEARCH_CANDIDATES
+                }).fetchall()
                 
-                improved_answers = []
-                for row in result:
-                    improved_answers.append({
-                        "original_question": row[1],
-                        "improved_answer": row[3],
-                        "improvement_type": row[4],
-                        "quality_score": row[5]
-                    })
-                
-                return improved_answers
+                return [
+                    {
+                        "original_question": row[0],
+                        "improved_answer": row[1],
+                        "improvement_type": row[2],
+                        "quality_score": row[3]
+                    }
+                    for row in result
+                ]
                 
         except Exception as e:
             logger.error(f"İyileştirilmiş cevaplar getirme hatası: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    def _improved_answers_like(self, question: str) -> List[Dict[str, Any]]:
+        """FTS5 yoksa: original_question üzerinde LIKE taraması"""
+        with self.SessionLocal() as session:
+            result = session.execute(text("""
+                SELECT * FROM improved_answers 
+                WHERE original_question LIKE :question_pattern 
+                ORDER BY quality_score DESC, feedback_count DESC
+                LIMIT 3
+            """), {"question_pattern": f"%{question[:50]}%"}).fetchall()
+            
+            improved_answers = []
+            for row in result:
+                improved_answers.append({
+                    "original_question": row[1],
+                    "improved_answer": row[3],
+                    "improvement_type": row[4],
+                    "quality_score": row[5]
+                })
+            
+            return improved_answers
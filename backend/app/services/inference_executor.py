@@ -0,0 +1,239 @@
+"""
+GGUF çıkarım yürütücüsü - llama-cpp çağrılarını event loop dışında çalıştırır
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .prompt_cache import PromptPrefixCache
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceQueueFullError(Exception):
+    """Çıkarım kuyruğu dolu; istek beklemeden reddedilmeli (HTTP 503)"""
+
+
+@dataclass
+class InferenceJob:
+    """Kuyruktaki tek bir üretim isteği"""
+    prompt: str
+    params: Dict[str, Any]
+    future: asyncio.Future
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    # Worker thread'inden çağrılır; submit event loop'a aktaran sarmalayıcı koyar
+    on_token: Optional[Callable[[str], None]] = None
+
+
+def create_job(
+    loop: asyncio.AbstractEventLoop,
+    prompt: str,
+    params: Dict[str, Any],
+    on_token: Optional[Callable[[str], None]] = None,
+) -> InferenceJob:
+    """İş nesnesini oluştur; iptal ve token geri çağrısını event loop'a bağla"""
+    job = InferenceJob(prompt=prompt, params=params, future=loop.create_future())
+    # Future iptal edilirse (wait_for zaman aşımı) çalışan üretime haber ver
+    job.future.add_done_callback(lambda f: job.cancel_event.set() if f.cancelled() else None)
+    if on_token is not None:
+        job.on_token = lambda text: loop.call_soon_threadsafe(on_token, text)
+    return job
+
+
+class InferenceExecutor:
+    """
+    Llama örneklerini worker thread'lerinde çalıştıran yürütücü.
+
+    İstekler sınırlı bir asyncio kuyruğuna alınır; her Llama örneği için bir
+    worker kuyruktan iş çeker ve üretimi thread havuzunda yapar. Kuyruk doluysa
+    `InferenceQueueFullError` fırlatılır. Bekleyen coroutine iptal edilirse
+    (örn. chat_endpoint'teki wait_for zaman aşımı) iş kuyruktaysa atlanır,
+    üretim sürüyorsa bir sonraki token'da durdurulur.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], Any],
+        concurrency: int = 1,
+        max_queue: int = 16,
+        prefix_cache: Optional[PromptPrefixCache] = None,
+    ):
+        self.model_factory = model_factory
+        self.concurrency = max(1, concurrency)
+        self.max_queue = max(1, max_queue)
+        self.prefix_cache = prefix_cache
+        self.models: List[Any] = []
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._running: List[InferenceJob] = []  # Üretimi süren işler
+        self._closed = False
+
+        # İstatistikler
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.active = 0
+
+    def load_models(self):
+        """Yapılandırılan sayıda Llama örneği oluştur (senkron, yükleme sırasında çağrılır)"""
+        while len(self.models) < self.concurrency:
+            model = self.model_factory()
+            if self.prefix_cache is not None:
+                self.prefix_cache.warm(model)
+            self.models.append(model)
+        logger.info(f"Çıkarım yürütücüsü hazır: {len(self.models)} model örneği, kuyruk limiti {self.max_queue}")
+
+    def _ensure_started(self):
+        """Kuyruk ve worker'ları çalışan event loop üzerinde tembel başlat"""
+        if self._queue is not None:
+            return
+        if not self.models:
+            self.load_models()
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._thread_pool = ThreadPoolExecutor(max_workers=len(self.models), thread_name_prefix="gguf-infer")
+        self._workers = [asyncio.create_task(self._worker(model)) for model in self.models]
+
+    def submit(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, **params) -> asyncio.Future:
+        """
+        Üretim isteğini kuyruğa ekle ve sonucu taşıyan future'ı döndür
+
+        Args:
+            on_token: Üretilen her metin parçası için event loop üzerinde çağrılır
+
+        Raises:
+            InferenceQueueFullError: Kuyruk doluysa
+            RuntimeError: Yürütücü kapatıldıysa
+        """
+        if self._closed:
+            raise RuntimeError("Çıkarım yürütücüsü kapatıldı")
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        job = create_job(loop, prompt, params, on_token)
+
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise InferenceQueueFullError(f"Çıkarım kuyruğu dolu ({self.max_queue} istek bekliyor)")
+        return job.future
+
+    async def generate(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, **params) -> Dict[str, Any]:
+        """İsteği kuyruğa ekle ve tamamlanmasını bekle"""
+        return await self.submit(prompt, on_token=on_token, **params)
+
+    async def _worker(self, model: Any):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.future.done():
+                    # Kuyrukta beklerken iptal edildi
+                    self.cancelled += 1
+                    continue
+                self.active += 1
+                self._running.append(job)
+                try:
+                    result = await loop.run_in_executor(self._thread_pool, self._run_job, model, job)
+                except Exception as e:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                else:
+                    if result["finish_reason"] == "cancelled":
+                        self.cancelled += 1
+                    else:
+                        self.completed += 1
+                    if not job.future.done():
+                        job.future.set_result(result)
+                finally:
+                    self.active -= 1
+                    self._running.remove(job)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, model: Any, job: InferenceJob) -> Dict[str, Any]:
+        """Thread içinde stream modunda üret; iptal sinyalini token aralarında kontrol et"""
+        started = time.perf_counter()
+        parts: List[str] = []
+        finish_reason = None
+        first_token_at = None
+
+        prompt: Any = job.prompt
+        tokens = None
+        if self.prefix_cache is not None:
+            tokens = self.prefix_cache.tokenize(model, job.prompt)
+            if tokens is not None:
+                # KV önekle başlıyorsa llama-cpp yalnızca son eki prefill eder
+                self.prefix_cache.restore(model)
+                prompt = tokens
+
+        for chunk in model(prompt, stream=True, **job.params):
+            if job.cancel_event.is_set():
+                finish_reason = "cancelled"
+                break
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            choice = chunk["choices"][0]
+            text = choice.get("text", "")
+            parts.append(text)
+            if text and job.on_token is not None:
+                job.on_token(text)
+            finish_reason = choice.get("finish_reason") or finish_reason
+
+        return {
+            "text": "".join(parts),
+            "finish_reason": finish_reason or "stop",
+            "completion_tokens": len(parts),
+            # Prompt yalnızca önek önbelleği açıkken burada token'lanır
+            "prompt_tokens": len(tokens) if tokens is not None else None,
+            "queue_wait_s": started - job.enqueued_at,
+            "ttft_s": (first_token_at or time.perf_counter()) - started,
+            "generation_s": time.perf_counter() - started,
+        }
+
+    def durum(self) -> Dict[str, Any]:
+        """Yürütücü durum bilgisi"""
+        return {
+            "backend": "pool",
+            "concurrency": len(self.models),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_limit": self.max_queue,
+            "active": self.active,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "prefix_cache": self.prefix_cache.durum() if self.prefix_cache else None,
+        }
+
+    async def shutdown(self):
+        """Bekleyen ve üretimi süren istekleri sonlandır, worker'ları durdur ve thread havuzunu kapat"""
+        self._closed = True
+        hata = RuntimeError("Çıkarım yürütücüsü kapatıldı")
+        # Üretim thread'leri bir sonraki token'da durur; bekleyenler askıda kalmaz
+        for job in self._running:
+            job.cancel_event.set()
+            if not job.future.done():
+                job.future.set_exception(hata)
+        if self._queue is not None:
+            while not self._queue.empty():
+                job = self._queue.get_nowait()
+                self._queue.task_done()
+                if not job.future.done():
+                    job.future.set_exception(hata)
+
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        self._queue = None
@@ -0,0 +1,79 @@
+"""
+GGUF çıkarım motoru kurulumu - orkestratör (yerel mod) ve model sunucusu tarafından paylaşılır
+"""
+
+import logging
+import os
+from typing import Optional, Union
+
+from ..core.config import settings
+from .batch_scheduler import BatchScheduler
+from .inference_executor import InferenceExecutor
+from .prompt_cache import PromptPrefixCache
+from .prompt_templates import GGUF_PROMPT_PREFIX
+
+logger = logging.getLogger(__name__)
+
+
+def gguf_dosyasi_bul(model_path: str) -> Optional[str]:
+    """Model yolu dizinse içindeki ilk .gguf dosyasını, dosyaysa kendisini döndür"""
+    if not os.path.exists(model_path):
+        logger.warning(f"❌ Model dosyası bulunamadı: {model_path}")
+        return None
+    if not os.path.isdir(model_path):
+        logger.info(f"📄 Model dosyası: {model_path}")
+        return model_path
+
+    gguf_files = sorted(f for f in os.listdir(model_path) if f.endswith(".gguf"))
+    if not gguf_files:
+        logger.warning(f"❌ Dizinde GGUF dosyası bulunamadı: {model_path}")
+        return None
+    model_file = os.path.join(model_path, gguf_files[0])
+    logger.info(f"📁 Dizinde GGUF dosyası bulundu: {model_file}")
+    return model_file
+
+
+def cikarim_motoru_olustur(model_file: str) -> Union[InferenceExecutor, BatchScheduler]:
+    """
+    Ayarlara göre batch zamanlayıcı veya worker havuzu kur ve modelleri yükle
+
+    Raises:
+        ImportError: llama-cpp-python kurulu değilse
+    """
+    from llama_cpp import Llama
+
+    def llama_factory():
+        return Llama(
+            model_path=model_file,
+            n_ctx=settings.LLAMA_N_CTX,  # Context length
+            n_threads=settings.LLAMA_N_THREADS,  # Thread sayısı
+            n_batch=settings.LLAMA_N_BATCH,  # Prompt prefill batch boyutu
+            n_ubatch=settings.LLAMA_N_UBATCH,
+            verbose=False  # Verbose kapalı
+        )
+
+    # Sabit önek bir kez değerlendirilir, istekler yalnızca son eki prefill eder
+    prefix_cache = PromptPrefixCache(GGUF_PROMPT_PREFIX) if settings.LLAMA_PROMPT_CACHE else None
+
+    if settings.INFERENCE_BACKEND == "batch":
+        # Tek ağırlık kopyası, çoklu KV slotu ile sürekli batch
+        engine = BatchScheduler(
+            llama_factory(),
+            n_seq_max=settings.INFERENCE_BATCH_SLOTS,
+            n_ctx_per_seq=settings.LLAMA_N_CTX,
+            n_batch=settings.LLAMA_N_BATCH,
+            n_ubatch=settings.LLAMA_N_UBATCH,
+            n_threads=settings.LLAMA_N_THREADS,
+            max_queue=settings.INFERENCE_MAX_QUEUE,
+            prefix_cache=prefix_cache
+        )
+    else:
+        # Her worker kendi Llama örneğini kullanır (ağırlıklar mmap ile paylaşılır)
+        engine = InferenceExecutor(
+            model_factory=llama_factory,
+            concurrency=settings.INFERENCE_CONCURRENCY,
+            max_queue=settings.INFERENCE_MAX_QUEUE,
+            prefix_cache=prefix_cache
+        )
+    engine.load_models()
+    return engine
@@ -0,0 +1,150 @@
+"""
+Niyet yönlendirici - mesajdaki anahtar kelimeleri tek geçişte Telekom araçlarına eşler
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+VARSAYILAN_YANIT = "Merhaba! Size nasıl yardımcı olabilirim? Fatura, paket, kota veya ağ durumu hakkında bilgi alabilirim."
+
+
+@dataclass(frozen=True)
+class Intent:
+    """Anahtar kelime tablosundaki tek bir niyet"""
+    arac_adi: str
+    anahtar_kelimeler: Tuple[str, ...]
+    # LLM kullanılmadığında verilecek yanıt
+    yanit: Optional[str] = None
+    # Kısa ve tek anlamlı mesajda LLM atlanıp araç doğrudan çağrılabilir
+    kesin: bool = False
+    # Hesapta değişiklik yapar; anahtar kelimeyle kendiliğinden yürütülmez
+    degistirir: bool = False
+    # Araca her zaman geçilen parametreler
+    parametreler: Dict[str, Any] = field(default_factory=dict)
+
+
+FATURA_YANITI = "Fatura bilgilerinizi kontrol ediyorum. Size detaylı bilgi vereceğim."
+PAKET_YANITI = "Kullanılabilir paketleri inceliyorum. Size en uygun seçenekleri sunacağım."
+KOTA_YANITI = "Kalan kotalarınızı kontrol ediyorum. Kullanım durumunuzu göreceksiniz."
+AG_YANITI = "Ağ durumunuzu kontrol ediyorum. Bağlantı sorunlarını tespit edeceğim."
+HIZ_YANITI = "İnternet hızınızı test ediyorum. Performans bilgilerinizi alacağım."
+
+# ai_endpoint_functions içindeki tüm araçların anahtar kelime tablosu. Kelimeler
+# küçük harfli kök/öbeklerdir; yalnızca sol kelime sınırı arandığından Türkçe
+# ekli halleri de eşleşir ("faturamı", "paketlerim"). Aynı konumda birden çok
+# kelime eşleşirse en uzunu kazanır ("geçmiş fatura" > "fatura").
+TELEKOM_NIYETLERI: Tuple[Intent, ...] = (
+    Intent("get_current_bill", ("fatura", "borcum", "borç", "güncel fatura", "bu ayki fatura"),
+           yanit=FATURA_YANITI, kesin=True),
+    Intent("get_past_bills", ("geçmiş fatura", "önceki fatura", "eski fatura", "fatura geçmiş"),
+           yanit=FATURA_YANITI, kesin=True, parametreler={"limit": 12}),
+    Intent("pay_bill", ("faturamı öde", "faturayı öde", "fatura öde", "ödeme yap"),
+           yanit=FATURA_YANITI, degistirir=True),
+    Intent("get_payment_history", ("ödeme", "ödeme geçmiş", "ödemelerim"),
+           yanit=FATURA_YANITI, kesin=True),
+    Intent("setup_autopay", ("otomatik ödeme", "otomatik öde"), degistirir=True),
+    Intent("get_current_package", ("mevcut paket", "paketim", "tarifem", "hangi paketteyim"),
+           yanit=PAKET_YANITI, kesin=True),
+    Intent("get_available_packages", ("paket", "tarife", "kampanya"), yanit=PAKET_YANITI, kesin=True),
+    Intent("get_package_details", ("paket detay", "paket içeri", "paketin içeri")),
+    Intent("change_package", ("paket değiş", "paketimi değiş", "tarife değiş", "tarifemi değiş", "pakete geç"),
+           yanit=PAKET_YANITI, degistirir=True),
+    Intent("get_remaining_quotas", ("kota", "kullanım", "kalan internet", "kalan dakika", "kalan sms"),
+           yanit=KOTA_YANITI, kesin=True),
+    Intent("enable_roaming", ("roaming", "yurt dışı", "yurtdışı", "dolaşım"), degistirir=True),
+    Intent("check_network_status",
+           ("ağ durum", "ağ sorun", "ağda", "bağlantı", "şebeke", "çekmiyor", "sinyal", "kesinti"),
+           yanit=AG_YANITI, kesin=True, parametreler={"region": "Istanbul"}),
+    Intent("test_internet_speed", ("hız", "internet", "speed test", "internet hızı"), yanit=HIZ_YANITI, kesin=True),
+    Intent("create_support_ticket", ("destek talebi", "şikayet", "arıza kaydı"), degistirir=True),
+    Intent("close_support_ticket", ("talebi kapat", "talebimi kapat"), degistirir=True),
+    Intent("get_support_ticket_status", ("talep durumu", "talebimin durumu")),
+    Intent("get_user_support_tickets", ("taleplerim", "destek taleplerim"), kesin=True),
+    Intent("update_customer_contact", ("iletişim bilgi", "numaramı değiş", "e-posta", "eposta"), degistirir=True),
+    Intent("suspend_line", ("hattımı dondur", "hat dondur", "hattı dondur", "askıya al"), degistirir=True),
+    Intent("reactivate_line", ("hattımı aç", "hattı aç", "yeniden aktif"), degistirir=True),
+    Intent("get_customer_profile", ("profil", "bilgilerim", "müşteri bilgi")),
+)
+
+
+class IntentRouter:
+    """
+    Anahtar kelime → araç tablosundan bir kez derlenen regex otomatı.
+
+    Tüm kelimeler uzunluk sırasıyla tek bir alternasyonda birleşir; `route`
+    metni bir kez tarar ve eşleşen tüm araçları ilk görülme sırasıyla döndürür.
+    Araç adları (LLM çıktısındaki "get_past_bills" gibi) ayrı bir otomatla
+    çıkarılır.
+    """
+
+    def __init__(self, niyetler: Iterable[Intent] = TELEKOM_NIYETLERI, kisa_yol_kelime: int = 6):
+        self.niyetler: Dict[str, Intent] = {}
+        self._kelime_araci: Dict[str, str] = {}
+        for niyet in niyetler:
+            self.niyetler[niyet.arac_adi] = niyet
+            for kelime in niyet.anahtar_kelimeler:
+                if kelime in self._kelime_araci:
+                    raise ValueError(f"Anahtar kelime iki araca atanmış: {kelime}")
+                self._kelime_araci[kelime] = niyet.arac_adi
+        self.kisa_yol_kelime = kisa_yol_kelime
+
+        kelimeler = sorted(self._kelime_araci, key=len, reverse=True)
+        self._kelime_deseni = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, kelimeler)) + ")")
+        adlar = sorted(self.niyetler, key=len, reverse=True)
+        self._ad_deseni = re.compile(r"\b(?:" + "|".join(map(re.escape, adlar)) + r")\b")
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        # str.lower() "İ" harfini "i̇" yapar; kelime tablosuyla eşleşmesi için düzelt
+        return text.replace("İ", "i").lower()
+
+    def route(self, text: str) -> List[str]:
+        """Mesajdaki anahtar kelimelere karşılık gelen tüm araçlar (tekrarsız, metin sırasıyla)"""
+        araclar = {self._kelime_araci[m.group()]: None for m in self._kelime_deseni.finditer(self._normalize(text))}
+        return list(araclar)
+
+    def araclari_ayikla(self, text: str) -> List[str]:
+        """LLM çıktısında adı geçen araçlar (tekrarsız, metin sırasıyla)"""
+        return list(dict.fromkeys(self._ad_deseni.findall(text.lower())))
+
+    def kisa_yol(self, text: str, izinli: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        LLM'e gerek olmayan açık niyetlerin araçları; uygun değilse boş liste
+
+        Mesaj kısa olmalı, eşleşen her araç `kesin` işaretli ve (verilmişse)
+        `izinli` kümesinde olmalıdır.
+        """
+        if len(text.split()) > self.kisa_yol_kelime:
+            return []
+        araclar = self.route(text)
+        izinli = set(izinli) if izinli is not None else None
+        for ad in araclar:
+            if not self.niyetler[ad].kesin or (izinli is not None and ad not in izinli):
+                return []
+        return araclar
+
+    def yanit(self, araclar: Iterable[str]) -> str:
+        """Araçların şablon yanıtları (tekrarsız); hiçbiri yoksa karşılama mesajı"""
+        yanitlar = dict.fromkeys(self.niyetler[ad].yanit for ad in araclar if ad in self.niyetler)
+        yanitlar.pop(None, None)
+        return " ".join(yanitlar) if yanitlar else VARSAYILAN_YANIT
+
+    def parametreler(self, arac_adi: str, session_token: Optional[str] = None) -> Dict[str, Any]:
+        """Araç çağrısı parametreleri (session_token varsa eklenir; kabul etmeyen araçta motor atar)"""
+        niyet = self.niyetler.get(arac_adi)
+        parametreler = dict(niyet.parametreler) if niyet else {}
+        if session_token:
+            parametreler["session_token"] = session_token
+        return parametreler
+
+    def salt_okunur(self, araclar: Iterable[str]) -> List[str]:
+        """Hesapta değişiklik yapmayan araçlar"""
+        return [ad for ad in araclar if ad in self.niyetler and not self.niyetler[ad].degistirir]
+
+    def degistiren_var(self, araclar: Iterable[str]) -> bool:
+        """Araçlardan biri hesapta değişiklik yapıyor mu (bilinmeyen araç da sayılır)"""
+        return any(ad not in self.niyetler or self.niyetler[ad].degistirir for ad in araclar)
@@ -0,0 +1,399 @@
+"""
+Model sunucusu - GGUF ağırlıklarını tek süreçte tutar, API worker'larına Unix soketi üzerinden hizmet verir
+
+Çok worker'lı uvicorn kurulumunda her worker modeli kendisi yüklerse RAM
+worker sayısıyla çarpılır. Bu modda (INFERENCE_MODE=remote) model yalnızca
+bu süreçte (NUMA düğümü başına bir tane) yüklenir; worker'lar
+RemoteInferenceClient ile aynı submit/generate arayüzünü kullanır.
+
+Protokol: her çerçeve 4 baytlık (big-endian) uzunluk + UTF-8 JSON'dur.
+    istemci → sunucu: {"id", "op": "generate", "prompt", "params", "stream"}
+                      {"id", "op": "cancel"} | {"id", "op": "status"}
+    sunucu → istemci: {"id", "type": "token", "text"}
+                      {"id", "type": "result", "result"}
+                      {"id", "type": "status", "status"}
+                      {"id", "type": "error", "code", "message"}
+Tek bağlantı üzerinde birden çok istek eşzamanlı taşınır (id ile eşlenir).
+
+Çalıştırma:
+    python -m app.services.model_server --socket /tmp/uniqeai-model.sock --numa-node 0
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .inference_executor import InferenceQueueFullError
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("!I")
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# Motora iletilen üretim parametreleri; diğerleri bad_request ile reddedilir
+URETIM_PARAMETRELERI = frozenset({"max_tokens", "temperature", "top_p", "top_k", "repeat_penalty", "stop"})
+
+
+def _uretim_istegi(message: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    generate mesajından prompt ve parametreleri doğrula
+
+    Raises:
+        ValueError: prompt eksik/metin değil ya da bilinmeyen parametre varsa
+    """
+    prompt = message.get("prompt")
+    if not isinstance(prompt, str):
+        raise ValueError("prompt alanı metin olmalı")
+    params = message.get("params") or {}
+    if not isinstance(params, dict):
+        raise ValueError("params alanı nesne olmalı")
+    bilinmeyen = sorted(set(params) - URETIM_PARAMETRELERI)
+    if bilinmeyen:
+        raise ValueError(f"Bilinmeyen parametre: {', '.join(bilinmeyen)}")
+    return prompt, params
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """Bir çerçeve oku; bağlantı kapandıysa None"""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        (length,) = _HEADER.unpack(header)
+        if length > MAX_FRAME_BYTES:
+            raise ValueError(f"Çerçeve çok büyük: {length} bayt")
+        return json.loads(await reader.readexactly(length))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+
+class ModelServer:
+    """
+    Bir çıkarım motorunu (InferenceExecutor / BatchScheduler) Unix soketinde sunar.
+
+    Her `generate` isteği motorun kendi kuyruğuna eklenir, yani kuyruk limiti ve
+    sürekli batch tüm worker'lar için ortaktır. İstemci bağlantısı koparsa o
+    bağlantının bekleyen istekleri iptal edilir.
+    """
+
+    def __init__(self, engine: Any, socket_path: str):
+        self.engine = engine
+        self.socket_path = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.connections = 0
+
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # önceki çalıştırmadan kalan soket
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        logger.info(f"Model sunucusu dinliyor: {self.socket_path}")
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.engine.shutdown()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        pending: Dict[Any, asyncio.Future] = {}
+        lock = asyncio.Lock()
+
+        def send_nowait(message: Dict[str, Any]):
+            if not writer.is_closing():
+                writer.write(_encode(message))
+
+        async def send(message: Dict[str, Any]):
+            async with lock:
+                send_nowait(message)
+                if not writer.is_closing():
+                    await writer.drain()
+
+        async def reply(request_id: Any, future: asyncio.Future):
+            try:
+                result = await future
+                await send({"id": request_id, "type": "result", "result": result})
+            except asyncio.CancelledError:
+                await send({"id": request_id, "type": "error", "code": "cancelled", "message": "İstek iptal edildi"})
+            except Exception as e:
+                logger.error(f"Model sunucusu üretim hatası: {e}")
+                await send({"id": request_id, "type": "error", "code": "error", "message": str(e)})
+            finally:
+                pending.pop(request_id, None)
+
+        try:
+            while True:
+                message = await _read_frame(reader)
+                if message is None:
+                    break
+                request_id, op = message.get("id"), message.get("op")
+
+                if op == "generate":
+                    on_token: Optional[Callable[[str], None]] = None
+                    if message.get("stream"):
+                        on_token = lambda text, rid=request_id: send_nowait({"id": rid, "type": "token", "text": text})
+                    # İstek başına hatalar yalnızca o isteğe yanıtlanır; bağlantı ve
+                    # aynı worker'ın diğer istekleri etkilenmez
+                    try:
+                        prompt, params = _uretim_istegi(message)
+                        future = self.engine.submit(prompt, on_token=on_token, **params)
+                    except InferenceQueueFullError as e:
+                        await send({"id": request_id, "type": "error", "code": "queue_full", "message": str(e)})
+                        continue
+                    except (ValueError, TypeError) as e:
+                        await send({"id": request_id, "type": "error", "code": "bad_request", "message": str(e)})
+                        continue
+                    except Exception as e:
+                        logger.error(f"Model sunucusu istek hatası: {e}")
+                        await send({"id": request_id, "type": "error", "code": "error", "message": str(e)})
+                        continue
+                    pending[request_id] = future
+                    asyncio.ensure_future(reply(request_id, future))
+                elif op == "cancel":
+                    future = pending.get(request_id)
+                    if future is not None:
+                        future.cancel()
+                elif op == "status":
+                    await send({"id": request_id, "type": "status", "status": self.engine.durum()})
+                else:
+                    await send({"id": request_id, "type": "error", "code": "bad_request", "message": f"Bilinmeyen op: {op}"})
+        except Exception as e:
+            logger.error(f"Model sunucusu bağlantı hatası: {e}")
+        finally:
+            self.connections -= 1
+            for future in pending.values():
+                future.cancel()
+            writer.close()
+
+
+class RemoteInferenceClient:
+    """
+    Model sunucusuna bağlanan, InferenceExecutor ile aynı arayüzü sunan istemci.
+
+    Worker süreci başına tek bağlantı açılır ve istekler bunun üzerinde
+    çoğullanır; bağlantı koparsa bekleyen istekler ConnectionError ile biter ve
+    bir sonraki istek yeniden bağlanır.
+    """
+
+    def __init__(self, socket_path: str, connect_timeout: float = 120.0):
+        self.socket_path = socket_path
+        self.connect_timeout = connect_timeout
+        self.models: List[Any] = []  # Model bu süreçte değil
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Tuple[asyncio.Future, Optional[Callable[[str], None]]]] = {}
+
+        # İstatistikler
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.reconnects = 0
+
+    def load_models(self):
+        """Sunucu soketi bağlantı kabul edene kadar bekle (senkron, yükleme sırasında çağrılır)"""
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(self.socket_path)
+                logger.info(f"Model sunucusuna ulaşıldı: {self.socket_path}")
+                return
+            except OSError as e:
+                if time.monotonic() >= deadline:
+                    raise ConnectionError(f"Model sunucusuna bağlanılamadı: {self.socket_path} ({e})")
+                time.sleep(0.2)
+
+    async def _ensure_connected(self):
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return
+            if self._writer is not None:
+                self.reconnects += 1
+            self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+            self._reader_task = asyncio.ensure_future(self._read_loop(self._reader))
+
+    async def _read_loop(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                message = await _read_frame(reader)
+                if message is None:
+                    break
+                entry = self._pending.get(message.get("id"))
+                if entry is None:
+                    continue
+                future, on_token = entry
+                kind = message.get("type")
+                if kind == "token":
+                    if on_token is not None:
+                        on_token(message["text"])
+                    continue
+
+                self._pending.pop(message["id"], None)
+                if future.done():
+                    continue
+                if kind == "result":
+                    self.completed += 1
+                    future.set_result(message["result"])
+                elif kind == "status":
+                    future.set_result(message["status"])
+                elif message.get("code") == "queue_full":
+                    self.rejected += 1
+                    future.set_exception(InferenceQueueFullError(message.get("message", "")))
+                elif message.get("code") == "cancelled":
+                    future.cancel()
+                else:
+                    future.set_exception(RuntimeError(message.get("message", "Model sunucusu hatası")))
+        finally:
+            # Bağlantı koptu: bekleyenleri bitir, sonraki istek yeniden bağlanır
+            if self._writer is not None:
+                self._writer.close()
+            pending, self._pending = self._pending, {}
+            for future, _ in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Model sunucusu bağlantısı koptu"))
+
+    async def _send(self, request_id: int, message: Dict[str, Any]):
+        try:
+            await self._ensure_connected()
+            self._writer.write(_encode(message))
+            await self._writer.drain()
+        except Exception as e:
+            entry = self._pending.pop(request_id, None)
+            if entry is not None and not entry[0].done():
+                entry[0].set_exception(ConnectionError(f"Model sunucusuna istek gönderilemedi: {e}"))
+
+    def _request(self, message: Dict[str, Any], on_token: Optional[Callable[[str], None]] = None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        request_id = next(self._ids)
+        future = loop.create_future()
+        self._pending[request_id] = (future, on_token)
+        asyncio.ensure_future(self._send(request_id, {**message, "id": request_id}))
+
+        def on_done(f: asyncio.Future):
+            if f.cancelled() and self._pending.pop(request_id, None) is not None:
+                # Çağıran vazgeçti (örn. SSE istemcisi koptu): sunucuda da üretimi durdur
+                self.cancelled += 1
+                asyncio.ensure_future(self._send(request_id, {"id": request_id, "op": "cancel"}))
+
+        future.add_done_callback(on_done)
+        return future
+
+    def submit(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, **params) -> asyncio.Future:
+        """
+        Üretim isteğini model sunucusuna gönder ve sonucu taşıyan future'ı döndür
+
+        Kuyruk doluysa future InferenceQueueFullError ile biter.
+        """
+        message = {"op": "generate", "prompt": prompt, "params": params, "stream": on_token is not None}
+        return self._request(message, on_token)
+
+    async def generate(self, prompt: str, on_token: Optional[Callable[[str], None]] = None, **params) -> Dict[str, Any]:
+        """İsteği gönder ve tamamlanmasını bekle"""
+        return await self.submit(prompt, on_token=on_token, **params)
+
+    async def server_status(self) -> Dict[str, Any]:
+        """Model sunucusundaki motorun durum bilgisi"""
+        return await self._request({"op": "status"})
+
+    def durum(self) -> Dict[str, Any]:
+        """İstemci durum bilgisi"""
+        return {
+            "backend": "remote",
+            "socket": self.socket_path,
+            "connected": self._writer is not None and not self._writer.is_closing(),
+            "in_flight": len(self._pending),
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "reconnects": self.reconnects,
+        }
+
+    async def shutdown(self):
+        """Bağlantıyı kapat"""
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        self._writer = None
+        self._reader_task = None
+
+
+def _cpu_listesi(spec: str) -> List[int]:
+    """"0-3,8-11" biçimindeki CPU listesini çöz"""
+    cpus: List[int] = []
+    for part in spec.strip().split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.extend(range(int(start), int(end) + 1))
+        elif part:
+            cpus.append(int(part))
+    return cpus
+
+
+async def _serve(args):
+    from ..core.config import settings
+    from .inference_factory import cikarim_motoru_olustur, gguf_dosyasi_bul
+
+    model_file = gguf_dosyasi_bul(args.model or settings.LOCAL_MODEL_PATH)
+    if model_file is None:
+        raise SystemExit(1)
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    engine = await loop.run_in_executor(None, cikarim_motoru_olustur, model_file)
+    logger.info(f"Model yüklendi ({time.perf_counter() - started:.1f} s)")
+
+    server = ModelServer(engine, args.socket or settings.MODEL_SERVER_SOCKET)
+    await server.start()
+
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    logger.info("Model sunucusu kapatılıyor...")
+    await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GGUF model sunucusu (Unix soketi)")
+    parser.add_argument("--socket", help="Unix soket yolu (varsayılan: MODEL_SERVER_SOCKET)")
+    parser.add_argument("--model", help="GGUF dosyası veya dizini (varsayılan: LOCAL_MODEL_PATH)")
+    parser.add_argument("--cpus", help="Sürecin çalışacağı CPU'lar, örn. 0-15")
+    parser.add_argument("--numa-node", type=int, help="Süreci bu NUMA düğümünün CPU'larına sabitle")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.numa_node is not None:
+        with open(f"/sys/devices/system/node/node{args.numa_node}/cpulist") as f:
+            args.cpus = f.read()
+    if args.cpus:
+        # İlk dokunuş politikası gereği ağırlık sayfaları da bu düğümün belleğine yerleşir
+        os.sched_setaffinity(0, _cpu_listesi(args.cpus))
+        logger.info(f"CPU affinity: {args.cpus.strip()}")
+
+    asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Sabit prompt öneki için KV önbelleği
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_tokenlari(model: Any, text: str, add_bos: bool = True) -> List[int]:
+    """
+    Prompt metnini tokenize et; önbellekli ve önbelleksiz yollar aynı ayarı kullanır
+
+    Özel token'lar (sohbet şablonu işaretleri) metin olarak değil token olarak
+    çözülür; llama-cpp'nin create_completion tokenize ayarıyla aynıdır.
+    """
+    return model.tokenize(text.encode("utf-8"), add_bos=add_bos, special=True)
+
+
+class PromptPrefixCache:
+    """
+    Her istekte tekrarlanan prompt önekini bir kez değerlendirip KV durumunu saklar.
+
+    Önek ve son ek ayrı tokenize edilir, böylece önbellekteki token'lar isteğin
+    token'larıyla birebir aynıdır (sınırda token birleşmesi olmaz). Worker
+    havuzunda her Llama örneği için `save_state` anlık görüntüsü tutulur;
+    batch zamanlayıcı ise öneki ayrı bir sekansa yazıp `seq_cp` ile kopyalar.
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._tokens: Optional[List[int]] = None
+        self._states: Dict[int, Any] = {}
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.restores = 0
+
+    def prefix_tokens(self, model: Any) -> List[int]:
+        """Önek token'ları (BOS dahil); ilk çağrıda tokenize edilir"""
+        if self._tokens is None:
+            self._tokens = prompt_tokenlari(model, self.prefix)
+        return self._tokens
+
+    def tokenize(self, model: Any, prompt: str) -> Optional[List[int]]:
+        """
+        Prompt önekle başlıyorsa önek + son ek token'larını döndür
+
+        Returns:
+            Token listesi; prompt önekle başlamıyorsa None
+        """
+        if not prompt.startswith(self.prefix) or len(prompt) == len(self.prefix):
+            self.misses += 1
+            return None
+        self.hits += 1
+        suffix = prompt[len(self.prefix):]
+        return self.prefix_tokens(model) + prompt_tokenlari(model, suffix, add_bos=False)
+
+    def warm(self, model: Any):
+        """Öneki değerlendir ve Llama örneğinin KV durumunu sakla (yükleme sırasında)"""
+        tokens = self.prefix_tokens(model)
+        model.reset()
+        model.eval(tokens)
+        self._states[id(model)] = model.save_state()
+        logger.info(f"Prompt öneki önbelleğe alındı: {len(tokens)} token")
+
+    def restore(self, model: Any):
+        """Llama örneğinin KV'si önekle başlamıyorsa anlık görüntüyü geri yükle"""
+        tokens = self.prefix_tokens(model)
+        n = len(tokens)
+        if model.n_tokens >= n and list(model.input_ids[:n]) == tokens:
+            # llama-cpp kalan kısmı önek eşleşmesiyle zaten atlar
+            return
+        state = self._states.get(id(model))
+        if state is not None:
+            model.load_state(state)
+            self.restores += 1
+
+    def durum(self) -> Dict[str, Any]:
+        return {
+            "prefix_tokens": len(self._tokens) if self._tokens is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "restores": self.restores,
+        }
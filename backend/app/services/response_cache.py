@@ -0,0 +1,195 @@
+"""
+AI endpoint fonksiyonları için TTL + LRU yanıt önbelleği
+"""
+
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Süre sınırlı (TTL) ve boyut sınırlı (LRU) önbellek.
+
+    Anahtarlar (fonksiyon_adı, normalize_argümanlar) biçimindedir; böylece bir
+    fonksiyonun tüm girdileri `invalidate(fonksiyon_adı)` ile düşürülebilir.
+    `user_id` parametresi olan fonksiyonların girdileri ayrıca
+    `invalidate_users(user_id'ler)` ile kullanıcı bazında düşürülebilir.
+    """
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._user_positions: Dict[str, int] = {}  # fonksiyon_adı -> anahtardaki user_id sırası
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple[str, Hashable]) -> Tuple[bool, Any]:
+        """(bulundu_mu, değer) döndür; süresi dolan girdi silinir"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Tuple[str, Hashable], value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.default_ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *names: str) -> int:
+        """Verilen fonksiyonlara ait tüm girdileri sil (isim verilmezse hepsini)"""
+        with self._lock:
+            if not names:
+                removed = len(self._data)
+                self._data.clear()
+            else:
+                wanted = set(names)
+                keys = [key for key in self._data if key[0] in wanted]
+                for key in keys:
+                    del self._data[key]
+                removed = len(keys)
+            self.invalidations += removed
+            return removed
+
+    def track_user(self, name: str, position: int):
+        """Fonksiyonun anahtarında user_id'nin sırasını kaydet (bkz. invalidate_users)"""
+        self._user_positions[name] = position
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> int:
+        """Verilen kullanıcılara ait tüm girdileri sil"""
+        wanted = set(user_ids)
+        if not wanted or not self._user_positions:
+            return 0
+        with self._lock:
+            keys = [
+                key for key in self._data
+                if key[0] in self._user_positions and key[1][self._user_positions[key[0]]] in wanted
+            ]
+            for key in keys:
+                del self._data[key]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def _freeze(value: Any) -> Hashable:
+    """Argüman değerini hashlenebilir, sırası normalize edilmiş biçime çevir"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _key_params(func: Callable) -> Tuple[str, ...]:
+    """Anahtara giren parametre adları (self hariç), imza sırasıyla"""
+    return tuple(p.name for p in inspect.signature(func).parameters.values() if p.name != "self")
+
+
+def _key_builder(func: Callable) -> Callable[..., Hashable]:
+    """Konumsal/isimli çağrıları ve varsayılanları aynı anahtara indirger"""
+    params = [p for p in inspect.signature(func).parameters.values() if p.name != "self"]
+    names = _key_params(func)
+    defaults = {p.name: p.default for p in params if p.default is not inspect.Parameter.empty}
+    skip_self = len(params) != len(inspect.signature(func).parameters)
+
+    def build(*args, **kwargs) -> Hashable:
+        if skip_self:
+            args = args[1:]
+        key = args + tuple(kwargs.get(name, defaults.get(name)) for name in names[len(args):])
+        try:
+            hash(key)
+        except TypeError:
+            key = _freeze(key)
+        return key
+
+    return build
+
+
+def cached(cache: TTLCache, ttl: Optional[float] = None) -> Callable:
+    """
+    Salt okunur async fonksiyonun başarılı sonucunu önbelleğe al
+
+    Dönen nesne önbellekteki nesnenin kendisidir; çağıranlar değiştirmemelidir.
+    `{"success": False}` sonuçları önbelleğe alınmaz. Fonksiyonun `user_id`
+    parametresi varsa girdileri `cache.invalidate_users` ile düşürülebilir.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        build_key = _key_builder(func)
+        params = _key_params(func)
+        if "user_id" in params:
+            cache.track_user(name, params.index("user_id"))
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (name, build_key(*args, **kwargs))
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = await func(*args, **kwargs)
+            if not (isinstance(value, dict) and value.get("success") is False):
+                cache.set(key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(cache: TTLCache, names: Iterable[str]) -> Callable:
+    """Değiştiren async fonksiyon başarılı olduğunda ilgili okuma önbelleklerini düşür"""
+    names = tuple(names)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            if not (isinstance(result, dict) and result.get("success") is False):
+                removed = cache.invalidate(*names)
+                logger.debug(f"{func.__name__} önbellekten {removed} girdi düşürdü")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# AIEndpointFunctions tarafından paylaşılan önbellek
+response_cache = TTLCache(maxsize=settings.RESPONSE_CACHE_MAXSIZE, default_ttl=settings.RESPONSE_CACHE_TTL_USER)
@@ -0,0 +1,132 @@
+"""
+Anlamsal yanıt önbelleği - benzer kullanıcı mesajlarında LLM üretimini atlar
+"""
+
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SemanticCacheHit:
+    """Önbellek isabeti: seçilen araç ve şablon yanıt"""
+    yanit: str
+    arac_adi: Optional[str]
+    benzerlik: float
+    kapsam: Optional[str]
+
+
+class SemanticAnswerCache:
+    """
+    Normalize mesajın karakter trigram vektörü üzerinde kosinüs benzerliği ile arama.
+
+    Vektörler `dim` boyutlu hash uzayına (zlib.crc32) yazılır ve L2 normalize
+    edilir; indeks `max_entries` x `dim` boyutunda önceden ayrılmış bir
+    matristir, böylece bellek sabittir. Slot dolunca en uzun süre kullanılmayan
+    girdi (LRU) yerinden edilir. Her girdinin bir kapsamı vardır: kullanıcıya
+    özgü (`kapsam=kullanici_id`) veya ortak (`kapsam=None`); arama kullanıcının
+    kendi girdileri ile ortak girdileri birlikte tarar.
+    """
+
+    def __init__(self, threshold: float = 0.9, max_entries: int = 5000, dim: int = 512):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.dim = dim
+
+        self._vectors = np.zeros((max_entries, dim), dtype=np.float32)
+        self._scopes = np.full(max_entries, -1, dtype=np.int32)  # -1: boş slot
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._exact: Dict[tuple, int] = {}
+        self._scope_ids: Dict[Optional[str], int] = {None: 0}
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.exact_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _vectorize(self, text: str) -> np.ndarray:
+        padded = f"  {text.strip()} "
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for i in range(len(padded) - 2):
+            vector[zlib.crc32(padded[i:i + 3].encode("utf-8")) % self.dim] += 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _scope_id(self, kapsam: Optional[str]) -> int:
+        if kapsam not in self._scope_ids:
+            self._scope_ids[kapsam] = len(self._scope_ids)
+        return self._scope_ids[kapsam]
+
+    def lookup(self, mesaj: str, kapsam: Optional[str] = None) -> Optional[SemanticCacheHit]:
+        """Eşik üzerindeki en benzer girdiyi döndür (yoksa None)"""
+        with self._lock:
+            scope_id = self._scope_ids.get(kapsam, -2)
+            for sid in (scope_id, 0):
+                slot = self._exact.get((sid, mesaj))
+                if slot is not None:
+                    self.hits += 1
+                    self.exact_hits += 1
+                    return self._hit(slot, 1.0)
+
+            if not self._entries:
+                self.misses += 1
+                return None
+
+            query = self._vectorize(mesaj)
+            scores = self._vectors @ query
+            allowed = (self._scopes == 0) | (self._scopes == scope_id)
+            scores[~allowed] = -1.0
+            slot = int(scores.argmax())
+            if scores[slot] >= self.threshold:
+                self.hits += 1
+                return self._hit(slot, float(scores[slot]))
+            self.misses += 1
+            return None
+
+    def _hit(self, slot: int, benzerlik: float) -> SemanticCacheHit:
+        self._lru.move_to_end(slot)
+        entry = self._entries[slot]
+        return SemanticCacheHit(entry["yanit"], entry["arac_adi"], benzerlik, entry["kapsam"])
+
+    def store(self, mesaj: str, yanit: str, arac_adi: Optional[str] = None, kapsam: Optional[str] = None):
+        """Mesaj için üretilen yanıtı ve seçilen aracı kaydet"""
+        with self._lock:
+            scope_id = self._scope_id(kapsam)
+            slot = self._exact.get((scope_id, mesaj))
+            if slot is None:
+                if len(self._entries) < self.max_entries:
+                    slot = len(self._entries)
+                else:
+                    slot, _ = self._lru.popitem(last=False)
+                    old = self._entries.pop(slot)
+                    self._exact.pop((self._scope_ids[old["kapsam"]], old["mesaj"]), None)
+                    self.evictions += 1
+                self._vectors[slot] = self._vectorize(mesaj)
+                self._scopes[slot] = scope_id
+                self._exact[(scope_id, mesaj)] = slot
+            self._entries[slot] = {"mesaj": mesaj, "yanit": yanit, "arac_adi": arac_adi, "kapsam": kapsam}
+            self._lru[slot] = None
+            self._lru.move_to_end(slot)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "exact_hits": self.exact_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,143 @@
+"""
+session_token → user_id çözümleme katmanı
+
+Telekom router'ı (validate_session) ve AIEndpointFunctions aynı çözücüyü
+kullanır. Bellek içi depoda yakın zamanda doğrulanan token'lar küçük bir LRU'da
+tutulur; LRU girdisi en fazla `ttl` saniye ve oturumun kendi süresi kadar
+geçerlidir, oturum revoke() ile kapatılınca hemen düşürülür.
+
+SQLite deposu worker'lar arasında paylaşılır: bir worker'da kapatılan oturumu
+diğer worker'ların LRU'ları öğrenemez. Bu yüzden paylaşılan depoda LRU
+kullanılmaz ve her çözümleme depoya sorulur.
+"""
+
+import functools
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..core.config import settings
+from .session_store import SessionStore, session_store
+
+logger = logging.getLogger(__name__)
+
+
+class SessionError(Exception):
+    """Token geçersiz veya süresi dolmuş"""
+
+    def __init__(self, message: str, expired: bool = False):
+        super().__init__(message)
+        self.expired = expired
+
+
+class SessionResolver:
+    """Oturum deposu önünde LRU'lu token çözücü (maxsize=0: LRU kapalı)"""
+
+    def __init__(self, store: SessionStore, maxsize: int = 1024, ttl: float = 30.0):
+        self.store = store
+        self.maxsize = max(0, maxsize)
+        self.ttl = ttl
+        self._recent: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()  # token -> (user_id, geçerlilik sonu)
+        self._lock = threading.Lock()
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, token: str) -> int:
+        """
+        Token'ın user_id'sini döndür
+
+        Raises:
+            SessionError: Token bilinmiyorsa veya süresi dolmuşsa
+        """
+        now = self.store.clock()
+        with self._lock:
+            entry = self._recent.get(token)
+            if entry is not None and entry[1] > now:
+                self._recent.move_to_end(token)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        session = self.store.get(token)
+        if session is None:
+            self.forget(token)
+            raise SessionError("Geçersiz session token")
+        if now > session["expires_at"]:
+            self.revoke(token)
+            raise SessionError("Session süresi dolmuş", expired=True)
+
+        user_id = session["user_id"]
+        if not self.maxsize:
+            return user_id
+        with self._lock:
+            self._recent[token] = (user_id, min(now + self.ttl, session["expires_at"]))
+            self._recent.move_to_end(token)
+            while len(self._recent) > self.maxsize:
+                self._recent.popitem(last=False)
+        return user_id
+
+    def forget(self, token: str):
+        """Token'ı LRU'dan düşür"""
+        with self._lock:
+            self._recent.pop(token, None)
+
+    def revoke(self, token: str) -> bool:
+        """Oturumu depodan sil ve LRU'dan düşür (çıkış veya iptal); oturum varsa True"""
+        self.forget(token)
+        return self.store.delete(token)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._recent),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def resolves_session(resolver: SessionResolver) -> Callable:
+    """
+    Async fonksiyona gelen session_token'ı user_id'ye çevir
+
+    Token çözülünce fonksiyon `user_id=<çözülen>, session_token=None` ile
+    çağrılır; böylece altındaki @cached anahtarları token'a göre değil
+    kullanıcıya göre oluşur. Geçersiz token `{"success": False}` döndürür.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        takes_user = "user_id" in signature.parameters
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            token: Optional[str] = bound.arguments.get("session_token")
+            if token:
+                try:
+                    user_id = resolver.resolve(token)
+                except SessionError as e:
+                    logger.warning(f"{func.__name__}: {e}")
+                    return {"success": False, "error": str(e)}
+                if takes_user:
+                    bound.arguments["user_id"] = user_id
+                bound.arguments["session_token"] = None
+            return await func(*bound.args, **bound.kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Telekom router'ı ve AIEndpointFunctions tarafından paylaşılan çözücü;
+# paylaşılan (SQLite) depoda LRU kapalı: kapatılan oturum diğer worker'larda da hemen geçersiz olur
+session_resolver = SessionResolver(
+    session_store,
+    maxsize=0 if session_store.backend == "sqlite" else settings.SESSION_RESOLVER_CACHE_SIZE,
+    ttl=settings.SESSION_RESOLVER_TTL_S,
+)
@@ -0,0 +1,268 @@
+"""
+Telekom auth oturum deposu
+
+İki uygulama vardır:
+  - InMemorySessionStore: süreç içi sözlük + son kullanma zamanına göre
+    min-heap. Süresi dolan oturumlar her yazmada sınırlı sayıda (amortize O(1))
+    ve periyodik `sweep()` ile temizlenir; `max_sessions` aşılınca süresi en
+    yakın oturum atılır.
+  - SQLiteSessionStore: WAL kipinde SQLite dosyası; birden fazla uvicorn
+    worker'ı aynı token'ı doğrulayabilir. Dosya /dev/shm altına konursa
+    bellekte paylaşımlı çalışır.
+"""
+
+import heapq
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def generate_session_token() -> str:
+    """Güvenli session token oluşturur"""
+    return secrets.token_urlsafe(32)
+
+
+class SessionStore(ABC):
+    """Oturum deposu arayüzü; kayıtlar {"user_id", "created_at", "expires_at"} sözlükleridir"""
+
+    backend = "base"
+
+    def __init__(self, ttl: float, max_sessions: int, clock: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.clock = clock
+
+        # İstatistikler
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+
+    @abstractmethod
+    def create(self, user_id: int, ttl: Optional[float] = None) -> str:
+        """Yeni oturum aç; token'ı döndür"""
+
+    @abstractmethod
+    def get(self, token: str) -> Optional[Dict]:
+        """Kaydı döndür (süresi dolmuş ama henüz süpürülmemiş olabilir); yoksa None"""
+
+    @abstractmethod
+    def delete(self, token: str) -> bool:
+        """Oturumu sil; varsa True"""
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """Süresi dolan oturumları sil; silinen sayısını döndür"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Depodaki oturum sayısı"""
+
+    def durum(self) -> Dict:
+        return {
+            "backend": self.backend,
+            "sessions": len(self),
+            "max_sessions": self.max_sessions,
+            "created": self.created,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+
+class InMemorySessionStore(SessionStore):
+    """Heap tabanlı süre sonu süpürücüsü olan süreç içi depo"""
+
+    backend = "memory"
+
+    # Her create çağrısında en fazla bu kadar süresi dolmuş oturum silinir
+    SWEEP_BATCH = 64
+
+    def __init__(self, ttl: float, max_sessions: int, clock: Callable[[], float] = time.time):
+        super().__init__(ttl, max_sessions, clock)
+        self._data: Dict[str, tuple] = {}  # token -> (user_id, created_at, expires_at)
+        self._heap: list = []  # (expires_at, token); silinen/yenilenen token'lar tembelce atlanır
+        self._lock = threading.Lock()
+
+    def create(self, user_id: int, ttl: Optional[float] = None) -> str:
+        token = generate_session_token()
+        now = self.clock()
+        expires_at = now + (ttl if ttl is not None else self.ttl)
+        with self._lock:
+            self._sweep_locked(now, self.SWEEP_BATCH)
+            while len(self._data) >= self.max_sessions and self._pop_earliest(None):
+                self.evicted += 1
+            self._data[token] = (user_id, now, expires_at)
+            heapq.heappush(self._heap, (expires_at, token))
+            self.created += 1
+            self._compact_locked()
+        return token
+
+    def get(self, token: str) -> Optional[Dict]:
+        entry = self._data.get(token)
+        if entry is None:
+            return None
+        return {"user_id": entry[0], "created_at": entry[1], "expires_at": entry[2]}
+
+    def delete(self, token: str) -> bool:
+        with self._lock:
+            return self._data.pop(token, None) is not None
+
+    def sweep(self) -> int:
+        with self._lock:
+            return self._sweep_locked(self.clock(), None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _pop_earliest(self, deadline: Optional[float]) -> bool:
+        """Süresi en yakın canlı oturumu sil (deadline verilirse yalnızca süresi dolmuşsa)"""
+        heap = self._heap
+        while heap:
+            expires_at, token = heap[0]
+            if deadline is not None and expires_at > deadline:
+                return False
+            heapq.heappop(heap)
+            entry = self._data.get(token)
+            if entry is not None and entry[2] == expires_at:
+                del self._data[token]
+                return True
+        return False
+
+    def _sweep_locked(self, now: float, limit: Optional[int]) -> int:
+        removed = 0
+        while (limit is None or removed < limit) and self._pop_earliest(now):
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def _compact_locked(self):
+        # delete() heap'ten silmez; ölü girdiler canlıların iki katını geçerse heap'i yeniden kur
+        if len(self._heap) > 2 * len(self._data) + 1024:
+            self._heap = [(entry[2], token) for token, entry in self._data.items()]
+            heapq.heapify(self._heap)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Worker'lar arasında paylaşılan SQLite (WAL) deposu
+
+    Süpürme varsayılan olarak çağırana bırakılır (uygulamada main.py'deki arka
+    plan görevi). Arka plan görevi olmayan kullanımlar `sweep_interval` vererek
+    create() içinde aralıklı süpürmeyi açabilir.
+    """
+
+    backend = "sqlite"
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        max_sessions: int,
+        sweep_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(ttl, max_sessions, clock)
+        self.path = path
+        self.sweep_interval = sweep_interval
+        self._local = threading.local()
+        self._last_sweep = 0.0
+
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "token TEXT PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)")
+            # /metrics ve /health her çağrıda COUNT(*) çalıştırmasın: sayı önbellekte
+            # tutulur, bu worker'ın yazmalarıyla güncellenir ve sweep() ile tazelenir
+            self._count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def _conn(self) -> sqlite3.Connection:
+        """Thread başına bir bağlantı (sqlite3 bağlantıları thread'ler arasında paylaşılmaz)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def create(self, user_id: int, ttl: Optional[float] = None) -> str:
+        token = generate_session_token()
+        now = self.clock()
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO sessions (token, user_id, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (token, user_id, now, now + (ttl if ttl is not None else self.ttl)),
+            )
+        self.created += 1
+        self._count += 1
+        if self.sweep_interval is not None and now - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+        return token
+
+    def get(self, token: str) -> Optional[Dict]:
+        row = self._conn().execute(
+            "SELECT user_id, created_at, expires_at FROM sessions WHERE token = ?", (token,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"user_id": row[0], "created_at": row[1], "expires_at": row[2]}
+
+    def delete(self, token: str) -> bool:
+        with self._conn() as conn:
+            deleted = conn.execute("DELETE FROM sessions WHERE token = ?", (token,)).rowcount > 0
+        if deleted:
+            self._count = max(0, self._count - 1)
+        return deleted
+
+    def sweep(self) -> int:
+        now = self.clock()
+        self._last_sweep = now
+        with self._conn() as conn:
+            removed = conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,)).rowcount
+            count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            excess = count - self.max_sessions
+            if excess > 0:
+                evicted = conn.execute(
+                    "DELETE FROM sessions WHERE token IN "
+                    "(SELECT token FROM sessions ORDER BY expires_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+                self.evicted += evicted
+                count -= evicted
+        self._count = count
+        self.expired += removed
+        return removed
+
+    def __len__(self) -> int:
+        """Önbellekteki sayı; diğer worker'ların yazmaları bir sonraki sweep()'te yansır"""
+        return self._count
+
+
+def session_store_olustur() -> SessionStore:
+    """Ayarlara göre oturum deposunu oluştur"""
+    if settings.SESSION_BACKEND == "sqlite":
+        logger.info(f"🔐 Oturumlar SQLite'ta tutuluyor: {settings.SESSION_DB_PATH}")
+        return SQLiteSessionStore(
+            settings.SESSION_DB_PATH,
+            ttl=settings.SESSION_TTL_S,
+            max_sessions=settings.SESSION_MAX,
+        )
+    return InMemorySessionStore(ttl=settings.SESSION_TTL_S, max_sessions=settings.SESSION_MAX)
+
+
+# Telekom router'ı ve token çözücü tarafından paylaşılan depo
+session_store = session_store_olustur()
@@ -0,0 +1,147 @@
+"""
+Telekom deposu için deterministik sentetik müşteri üreticisi
+
+Başlangıç verisi altı müşteridir; arama, oturum doğrulama ve fatura üretiminin
+gerçek kardinalitede nasıl davrandığını görmek için depo 100k–1M sentetik
+müşteriyle doldurulabilir. Her müşteri için hesap, müşteri, paket, ödeme
+geçmişi, destek talepleri ve servis profili üretilir.
+
+Kayıtlar jeneratörle tek tek üretilir ve `TelekomStore.bulk_load` ile akış
+halinde yüklenir; dev sözlük/liste sabitleri kurulmaz. Her müşterinin verisi
+yalnızca (seed, user_id) ikilisinden türetilir: aynı seed ile herhangi bir
+aralık yeniden üretilebilir ve yük testi sürücüsü sunucuya sormadan
+`fixture_email(user_id)` / `FIXTURE_PASSWORD` ile giriş yapabilir.
+
+Sentetik kullanıcılar FIXTURE_FIRST_USER_ID'den başlar; başlangıç verisiyle
+ve sonradan kaydolan kullanıcılarla çakışmaz.
+"""
+
+import logging
+import random
+import time
+from typing import Iterator
+
+from . import telekom_seed
+from .telekom_store import (
+    Account, Customer, Package, Payment, ServiceProfile, TelekomStore, Ticket, _Record,
+)
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_FIRST_USER_ID = 1000
+FIXTURE_PASSWORD = "fixture123"
+
+# Bölge adları NETWORK_STATUS'taki bölgelerle aynı (ağ durumu sorguları eşleşsin)
+_REGIONS = ("İstanbul", "Ankara", "İzmir", "Bursa", "Antalya")
+_DISTRICTS = ("Merkez", "Kuzey", "Güney", "Doğu", "Batı")
+_FIRST_NAMES = ("Ahmet", "Ayşe", "Mehmet", "Fatma", "Mustafa", "Zeynep", "Emre", "Elif", "Can", "Deniz")
+_LAST_NAMES = ("Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Aydın", "Öztürk", "Arslan", "Doğan")
+_TIERS = ("silver", "gold", "premium", "diamond")
+_PAYMENT_METHODS = ("credit_card", "bank_transfer", "auto_pay")
+_TICKET_ISSUES = (
+    ("İnternet hızı yavaş", "technical"),
+    ("Fatura itirazı", "billing"),
+    ("Roaming aktifleştirme", "service"),
+    ("SMS gönderemiyorum", "technical"),
+    ("Paket değişikliği", "service"),
+)
+_TICKET_PRIORITIES = ("low", "medium", "high")
+_TICKET_STATUSES = ("open", "in_progress", "resolved", "resolved")
+
+# Paket kataloğu ve servis profili şablonları başlangıç verisinden alınır.
+# Kayıtlar değiştirilemez olduğundan iç sözlük/listeler müşteriler arasında paylaşılır.
+_PACKAGES = tuple({p["package_name"]: p for p in telekom_seed.USER_PACKAGES.values() if p}.values())
+_SPEED_TESTS = tuple(telekom_seed.SPEED_TEST_DATA.values())
+_ROAMING = tuple(telekom_seed.ROAMING_DATA.values())
+_AUTOPAY = tuple(telekom_seed.AUTOPAY_DATA.values())
+_SUSPENSION = tuple(d for d in telekom_seed.LINE_SUSPENSION_DATA.values() if not d["suspended"]) or (
+    {"suspended": False, "reason": None, "suspension_date": None},
+)
+
+
+def fixture_email(user_id: int) -> str:
+    """Sentetik kullanıcının giriş email'i"""
+    return f"musteri{user_id}@fixture.telekom"
+
+
+def fixture_user_ids(customers: int):
+    """`customers` kadar sentetik kullanıcının user_id aralığı"""
+    return range(FIXTURE_FIRST_USER_ID, FIXTURE_FIRST_USER_ID + customers)
+
+
+def customer_records(
+    user_id: int,
+    seed: int = 42,
+    payments: int = 6,
+    tickets: int = 2,
+) -> Iterator[_Record]:
+    """Tek müşterinin tüm kayıtları (yalnızca seed ve user_id'ye bağlı)"""
+    rng = random.Random((seed << 32) ^ user_id)
+    first = rng.choice(_FIRST_NAMES)
+    last = rng.choice(_LAST_NAMES)
+    name = f"{first} {last}"
+    email = fixture_email(user_id)
+
+    yield Account(email=email, user_id=user_id, password=FIXTURE_PASSWORD, name=name)
+    yield Customer(
+        user_id=user_id,
+        name=name,
+        phone_numbers=[{"number": f"+905{user_id % 10**9:09d}", "type": "mobile", "status": "active"}],
+        email=email,
+        address=f"{rng.choice(_REGIONS)}, {rng.choice(_DISTRICTS)}",
+        registration_date=f"{rng.randint(2019, 2023)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        customer_tier=rng.choice(_TIERS),
+    )
+
+    package = rng.choice(_PACKAGES)
+    yield Package(user_id=user_id, **package)
+
+    base_amount = package["monthly_fee"]
+    for i in range(payments):
+        month = i % 12 + 1
+        yield Payment(
+            payment_id=f"PAY-{user_id}-{i + 1:02d}",
+            user_id=user_id,
+            bill_id=f"F-2024-{user_id:04d}-{month:02d}",
+            amount=round(base_amount + rng.randint(-5, 15), 2),
+            method=_PAYMENT_METHODS[i % 3],
+            status="completed",
+            date=f"2024-{month:02d}-{rng.randint(1, 28):02d}",
+        )
+
+    for i in range(tickets):
+        issue, category = rng.choice(_TICKET_ISSUES)
+        yield Ticket(
+            ticket_id=f"TICKET-{user_id}-{i + 1}",
+            user_id=user_id,
+            issue=issue,
+            category=category,
+            priority=rng.choice(_TICKET_PRIORITIES),
+            status=rng.choice(_TICKET_STATUSES),
+            created=f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        )
+
+    yield ServiceProfile(
+        user_id=user_id,
+        speed_test=rng.choice(_SPEED_TESTS),
+        roaming=rng.choice(_ROAMING),
+        autopay=rng.choice(_AUTOPAY),
+        suspension=rng.choice(_SUSPENSION),
+    )
+
+
+def fixture_records(customers: int, seed: int = 42, payments: int = 6, tickets: int = 2) -> Iterator[_Record]:
+    """`customers` sentetik müşterinin kayıtlarını sırayla üret"""
+    for user_id in fixture_user_ids(customers):
+        yield from customer_records(user_id, seed, payments, tickets)
+
+
+def load_fixture(store: TelekomStore, customers: int, seed: int = 42, payments: int = 6, tickets: int = 2) -> int:
+    """Sentetik müşterileri depoya akış halinde yükle; yüklenen kayıt sayısını döndür"""
+    started = time.perf_counter()
+    count = store.bulk_load(fixture_records(customers, seed, payments, tickets))
+    logger.info(
+        f"🧪 Telekom fixture yüklendi: {customers} müşteri, {count} kayıt "
+        f"({time.perf_counter() - started:.1f} s, seed={seed})"
+    )
+    return count
@@ -0,0 +1,322 @@
+"""
+Telekom mock verisinin başlangıç kayıtları
+
+TelekomStore ilk açılışta (veya SQLite dosyası boşsa) bu sözlüklerden
+doldurulur. Uygulama kodu bu sözlükleri doğrudan okumamalı; okuma ve yazma
+`telekom_store` üzerinden yapılır.
+"""
+
+# Müşteri verisi merkezi olarak burada tanımlanacak
+CUSTOMERS = {
+    0: {
+        "name": "Enes Faruk Aydın",
+        "phone_numbers": [{"number": "+905551234567", "type": "mobile", "status": "active"}],
+        "email": "enes.faruk.aydin@email.com",
+        "address": "Ankara, Çankaya",
+        "registration_date": "2022-06-15",
+        "customer_tier": "premium"
+    },
+    1: {
+        "name": "Nisa Nur Özkal",
+        "phone_numbers": [{"number": "+905559876543", "type": "mobile", "status": "active"}],
+        "email": "nisa.nur.ozkal@email.com",
+        "address": "İstanbul, Beşiktaş",
+        "registration_date": "2023-03-20",
+        "customer_tier": "gold"
+    },
+    2: {
+        "name": "Sedat Kılıçoğlu",
+        "phone_numbers": [{"number": "+905551112223", "type": "mobile", "status": "active"}],
+        "email": "sedat.kilicoglu@email.com",
+        "address": "İzmir, Konak",
+        "registration_date": "2021-11-10",
+        "customer_tier": "silver"
+    },
+    3: {
+        "name": "Erkan Tanrıöver",
+        "phone_numbers": [{"number": "+905554445556", "type": "mobile", "status": "active"}],
+        "email": "erkan.tanriover@email.com",
+        "address": "Bursa, Nilüfer",
+        "registration_date": "2023-08-05",
+        "customer_tier": "gold"
+    },
+    4: {
+        "name": "Ahmet Nazif Gemalmaz",
+        "phone_numbers": [{"number": "+905557778889", "type": "mobile", "status": "active"}],
+        "email": "ahmet.nazif.gemalmaz@email.com",
+        "address": "Antalya, Muratpaşa",
+        "registration_date": "2022-12-01",
+        "customer_tier": "premium"
+    },
+    5: {
+        "name": "Ziişan Şahin",
+        "phone_numbers": [{"number": "+905557771234", "type": "mobile", "status": "active"}],
+        "email": "ziisan.sahin@email.com",
+        "address": "istanbul, eminönü",
+        "registration_date": "2024-12-01",
+        "customer_tier": "diomand"
+    }
+}
+
+# Kayıtlı kullanıcılar (email -> user info)
+REGISTERED_USERS = {
+    "enes.faruk.aydin@email.com": {
+        "user_id": 0,
+        "email": "enes.faruk.aydin@email.com",
+        "password": "enes123",  # Gerçek uygulamada hashlenmeli!
+        "name": "Enes Faruk Aydın"
+    },
+    "nisa.nur.ozkal@email.com": {
+        "user_id": 1,
+        "email": "nisa.nur.ozkal@email.com",
+        "password": "nisa123",
+        "name": "Nisa Nur Özkal"
+    },
+    "sedat.kilicoglu@email.com": {
+        "user_id": 2,
+        "email": "sedat.kilicoglu@email.com",
+        "password": "sedat123",
+        "name": "Sedat Kılıçoğlu"
+    },
+    "erkan.tanriover@email.com": {
+        "user_id": 3,
+        "email": "erkan.tanriover@email.com",
+        "password": "erkan123",
+        "name": "Erkan Tanrıöver"
+    },
+    "ahmet.nazif.gemalmaz@email.com": {
+        "user_id": 4,
+        "email": "ahmet.nazif.gemalmaz@email.com",
+        "password": "ahmet123",
+        "name": "Ahmet Nazif Gemalmaz"
+    },
+    "ziisan.sahin@email.com": {
+        "user_id": 5,
+        "email": "ziisan.sahin@email.com",
+        "password": "ziisan123",
+        "name": "Ziişan Şahin"
+    }
+}
+
+# Kullanıcı paketleri (user_id -> package info veya None)
+USER_PACKAGES = {
+    0: {
+        "package_name": "Premium Paket", 
+        "monthly_fee": 89.90, 
+        "package_type": "Premium",
+        "features": ["Unlimited Data", "Premium Support", "Roaming Included"],
+        "internet_speed": "100 Mbps",
+        "voice_minutes": "Unlimited",
+        "sms_count": "Unlimited",
+        "contract_duration": "24 ay"
+    },
+    1: {
+        "package_name": "Öğrenci Dostu", 
+        "monthly_fee": 49.90, 
+        "package_type": "Student",
+        "features": ["10GB Data", "Student Discount", "Basic Support"],
+        "internet_speed": "50 Mbps",
+        "voice_minutes": "500 dakika",
+        "sms_count": "250 SMS",
+        "contract_duration": "12 ay"
+    },
+    2: {
+        "package_name": "Süper Konuşma", 
+        "monthly_fee": 59.90, 
+        "package_type": "Voice",
+        "features": ["Unlimited Calls", "5GB Data", "Voice Priority"],
+        "internet_speed": "25 Mbps",
+        "voice_minutes": "Unlimited",
+        "sms_count": "1000 SMS",
+        "contract_duration": "12 ay"
+    },
+    3: {
+        "package_name": "Premium Paket", 
+        "monthly_fee": 89.90, 
+        "package_type": "Premium",
+        "features": ["Unlimited Data", "Premium Support", "Roaming Included"],
+        "internet_speed": "100 Mbps",
+        "voice_minutes": "Unlimited",
+        "sms_count": "Unlimited",
+        "contract_duration": "24 ay"
+    },
+    4: {
+        "package_name": "Mega İnternet", 
+        "monthly_fee": 69.90, 
+        "package_type": "Internet",
+        "features": ["50GB Data", "High Speed", "Basic Support"],
+        "internet_speed": "75 Mbps",
+        "voice_minutes": "1000 dakika",
+        "sms_count": "500 SMS",
+        "contract_duration": "12 ay"
+    },
+    5: {
+        "package_name": "Öğrenci Dostu", 
+        "monthly_fee": 49.90, 
+        "package_type": "Student",
+        "features": ["10GB Data", "Student Discount", "Basic Support"],
+        "internet_speed": "50 Mbps",
+        "voice_minutes": "500 dakika",
+        "sms_count": "250 SMS",
+        "contract_duration": "12 ay"
+    }
+}
+
+# Ödeme Geçmişi Verileri
+PAYMENT_HISTORY = {
+    0: [  # Enes Faruk Aydın
+        {"payment_id": "PAY-0001", "bill_id": "F-2024-0000-01", "amount": 65.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
+        {"payment_id": "PAY-0002", "bill_id": "F-2024-0000-02", "amount": 67.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
+        {"payment_id": "PAY-0003", "bill_id": "F-2024-0000-03", "amount": 69.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
+        {"payment_id": "PAY-0004", "bill_id": "F-2024-0000-04", "amount": 71.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
+        {"payment_id": "PAY-0005", "bill_id": "F-2024-0000-05", "amount": 73.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
+        {"payment_id": "PAY-0006", "bill_id": "F-2024-0000-06", "amount": 75.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
+    ],
+    1: [  # Nisa Nur Özkal
+        {"payment_id": "PAY-0007", "bill_id": "F-2024-0001-01", "amount": 66.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
+        {"payment_id": "PAY-0008", "bill_id": "F-2024-0001-02", "amount": 68.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
+        {"payment_id": "PAY-0009", "bill_id": "F-2024-0001-03", "amount": 70.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
+        {"payment_id": "PAY-0010", "bill_id": "F-2024-0001-04", "amount": 72.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
+        {"payment_id": "PAY-0011", "bill_id": "F-2024-0001-05", "amount": 74.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
+        {"payment_id": "PAY-0012", "bill_id": "F-2024-0001-06", "amount": 76.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
+    ],
+    2: [  # Sedat Kılıçoğlu
+        {"payment_id": "PAY-0013", "bill_id": "F-2024-0002-01", "amount": 67.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
+        {"payment_id": "PAY-0014", "bill_id": "F-2024-0002-02", "amount": 69.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
+        {"payment_id": "PAY-0015", "bill_id": "F-2024-0002-03", "amount": 71.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
+        {"payment_id": "PAY-0016", "bill_id": "F-2024-0002-04", "amount": 73.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
+        {"payment_id": "PAY-0017", "bill_id": "F-2024-0002-05", "amount": 75.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
+        {"payment_id": "PAY-0018", "bill_id": "F-2024-0002-06", "amount": 77.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
+    ],
+    3: [  # Erkan Tanrıöver
+        {"payment_id": "PAY-0019", "bill_id": "F-2024-0003-01", "amount": 68.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
+        {"payment_id": "PAY-0020", "bill_id": "F-2024-0003-02", "amount": 70.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
+        {"payment_id": "PAY-0021", "bill_id": "F-2024-0003-03", "amount": 72.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
+        {"payment_id": "PAY-0022", "bill_id": "F-2024-0003-04", "amount": 74.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
+        {"payment_id": "PAY-0023", "bill_id": "F-2024-0003-05", "amount": 76.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
+        {"payment_id": "PAY-0024", "bill_id": "F-2024-0003-06", "amount": 78.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
+    ],
+    4: [  # Ahmet Nazif Gemalmaz
+        {"payment_id": "PAY-0025", "bill_id": "F-2024-0004-01", "amount": 69.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
+        {"payment_id": "PAY-0026", "bill_id": "F-2024-0004-02", "amount": 71.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
+        {"payment_id": "PAY-0027", "bill_id": "F-2024-0004-03", "amount": 73.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
+        {"payment_id": "PAY-0028", "bill_id": "F-2024-0004-04", "amount": 75.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
+        {"payment_id": "PAY-0029", "bill_id": "F-2024-0004-05", "amount": 77.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
+        {"payment_id": "PAY-0030", "bill_id": "F-2024-0004-06", "amount": 79.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
+    ],
+    5: [  # Ziişan Şahin
+        {"payment_id": "PAY-0031", "bill_id": "F-2024-0005-01", "amount": 114.00, "method": "credit_card", "status": "completed", "date": "2024-01-05"},
+        {"payment_id": "PAY-0032", "bill_id": "F-2024-0005-02", "amount": 116.00, "method": "bank_transfer", "status": "completed", "date": "2024-02-05"},
+        {"payment_id": "PAY-0033", "bill_id": "F-2024-0005-03", "amount": 118.00, "method": "auto_pay", "status": "completed", "date": "2024-03-05"},
+        {"payment_id": "PAY-0034", "bill_id": "F-2024-0005-04", "amount": 120.00, "method": "credit_card", "status": "completed", "date": "2024-04-05"},
+        {"payment_id": "PAY-0035", "bill_id": "F-2024-0005-05", "amount": 122.00, "method": "bank_transfer", "status": "completed", "date": "2024-05-05"},
+        {"payment_id": "PAY-0036", "bill_id": "F-2024-0005-06", "amount": 124.00, "method": "auto_pay", "status": "completed", "date": "2024-06-05"}
+    ]
+}
+
+# Destek Talepleri Verileri
+SUPPORT_TICKETS = {
+    0: [  # Enes Faruk Aydın
+        {"ticket_id": "TICKET-0001", "issue": "İnternet hızı yavaş", "category": "technical", "priority": "medium", "status": "resolved", "created": "2024-01-15"},
+        {"ticket_id": "TICKET-0002", "issue": "Fatura sorusu", "category": "billing", "priority": "low", "status": "resolved", "created": "2024-02-20"},
+        {"ticket_id": "TICKET-0003", "issue": "Paket değişikliği", "category": "service", "priority": "medium", "status": "open", "created": "2024-03-10"}
+    ],
+    1: [  # Nisa Nur Özkal
+        {"ticket_id": "TICKET-0004", "issue": "SMS gönderemiyorum", "category": "technical", "priority": "high", "status": "resolved", "created": "2024-01-10"},
+        {"ticket_id": "TICKET-0005", "issue": "Roaming aktifleştirme", "category": "service", "priority": "medium", "status": "open", "created": "2024-02-25"}
+    ],
+    2: [  # Sedat Kılıçoğlu
+        {"ticket_id": "TICKET-0006", "issue": "Konuşma kesintisi", "category": "technical", "priority": "high", "status": "resolved", "created": "2024-01-20"},
+        {"ticket_id": "TICKET-0007", "issue": "Paket bilgisi", "category": "service", "priority": "low", "status": "resolved", "created": "2024-02-15"}
+    ],
+    3: [  # Erkan Tanrıöver
+        {"ticket_id": "TICKET-0008", "issue": "İnternet bağlantı sorunu", "category": "technical", "priority": "medium", "status": "open", "created": "2024-03-05"}
+    ],
+    4: [  # Ahmet Nazif Gemalmaz
+        {"ticket_id": "TICKET-0009", "issue": "Fatura ödeme sorunu", "category": "billing", "priority": "high", "status": "resolved", "created": "2024-01-25"},
+        {"ticket_id": "TICKET-0010", "issue": "Premium hizmet aktivasyonu", "category": "service", "priority": "medium", "status": "open", "created": "2024-02-28"}
+    ],
+    5: [  # Ziişan Şahin
+        {"ticket_id": "TICKET-0011", "issue": "Kota aşımı sorusu", "category": "billing", "priority": "low", "status": "resolved", "created": "2024-01-30"},
+        {"ticket_id": "TICKET-0012", "issue": "Roaming kullanımı", "category": "service", "priority": "medium", "status": "open", "created": "2024-03-01"}
+    ]
+}
+
+# Ağ Durumu Verileri
+NETWORK_STATUS = {
+    "istanbul": {
+        "status": "excellent",
+        "coverage": 95,
+        "speed": "100 Mbps",
+        "issues": [],
+        "last_update": "2024-03-01T10:00:00Z"
+    },
+    "ankara": {
+        "status": "good",
+        "coverage": 90,
+        "speed": "85 Mbps",
+        "issues": ["Minor maintenance in Çankaya"],
+        "last_update": "2024-03-01T10:00:00Z"
+    },
+    "izmir": {
+        "status": "fair",
+        "coverage": 85,
+        "speed": "75 Mbps",
+        "issues": ["Network upgrade in progress"],
+        "last_update": "2024-03-01T10:00:00Z"
+    },
+    "bursa": {
+        "status": "good",
+        "coverage": 88,
+        "speed": "80 Mbps",
+        "issues": [],
+        "last_update": "2024-03-01T10:00:00Z"
+    },
+    "antalya": {
+        "status": "excellent",
+        "coverage": 92,
+        "speed": "95 Mbps",
+        "issues": [],
+        "last_update": "2024-03-01T10:00:00Z"
+    }
+}
+
+# Hız Testi Verileri
+SPEED_TEST_DATA = {
+    0: {"download": 100, "upload": 50, "ping": 15, "jitter": 5},
+    1: {"download": 95, "upload": 48, "ping": 18, "jitter": 6},
+    2: {"download": 90, "upload": 45, "ping": 20, "jitter": 7},
+    3: {"download": 85, "upload": 42, "ping": 22, "jitter": 8},
+    4: {"download": 80, "upload": 40, "ping": 25, "jitter": 9},
+    5: {"download": 75, "upload": 37, "ping": 28, "jitter": 10}
+}
+
+# Roaming Verileri
+ROAMING_DATA = {
+    0: {"enabled": True, "countries": ["Türkiye", "Almanya", "Fransa"], "usage": 2.5, "cost": 15.00},
+    1: {"enabled": False, "countries": [], "usage": 0, "cost": 0},
+    2: {"enabled": True, "countries": ["Türkiye", "İtalya"], "usage": 1.8, "cost": 12.00},
+    3: {"enabled": True, "countries": ["Türkiye", "İspanya", "Portekiz"], "usage": 3.2, "cost": 18.50},
+    4: {"enabled": False, "countries": [], "usage": 0, "cost": 0},
+    5: {"enabled": True, "countries": ["Türkiye", "Hollanda", "Belçika"], "usage": 4.1, "cost": 22.00}
+}
+
+# Otomatik Ödeme Verileri
+AUTOPAY_DATA = {
+    0: {"enabled": True, "method": "credit_card", "card_last4": "1234", "next_payment": "2024-04-15"},
+    1: {"enabled": False, "method": None, "card_last4": None, "next_payment": None},
+    2: {"enabled": True, "method": "bank_transfer", "account_last4": "5678", "next_payment": "2024-04-15"},
+    3: {"enabled": True, "method": "credit_card", "card_last4": "9012", "next_payment": "2024-04-15"},
+    4: {"enabled": False, "method": None, "card_last4": None, "next_payment": None},
+    5: {"enabled": True, "method": "bank_transfer", "account_last4": "3456", "next_payment": "2024-04-15"}
+}
+
+# Hat Askıya Alma Verileri
+LINE_SUSPENSION_DATA = {
+    0: {"suspended": False, "reason": None, "suspension_date": None},
+    1: {"suspended": True, "reason": "Ödeme gecikmesi", "suspension_date": "2024-02-15"},
+    2: {"suspended": False, "reason": None, "suspension_date": None},
+    3: {"suspended": False, "reason": None, "suspension_date": None},
+    4: {"suspended": True, "reason": "Talep üzerine", "suspension_date": "2024-03-01"},
+    5: {"suspended": False, "reason": None, "suspension_date": None}
+}
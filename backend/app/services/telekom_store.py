@@ -0,0 +1,583 @@
+"""
+Telekom mock verisi için indeksli, süreç içi veri deposu
+
+Kayıtlar `__slots__`lı, değiştirilemez dataclass'lardır. Tüm indeksler tek bir
+`TelekomSnapshot` nesnesindedir; okuyucular o anki anlık görüntünün
+referansını alır ve kilitsiz okur. İndeksler parçalı (`ShardedMap`) ve
+değiştirilemezdir: yazmalar kilit altında yalnızca değişen anahtarların
+parçalarını (yazma başına en fazla bir kez) kopyalar ve yeni anlık görüntüyü
+tek atamayla yayınlar (copy-on-write); tekil yazmanın maliyeti indeks
+boyutuyla değil parça boyutuyla büyür. Toplu yükleme aynı yoldan
+geçer ve kayıtları akış halinde tüketir; 100k+ sentetik müşteri
+(bkz. telekom_fixtures) listeye toplanmadan tek kopyayla yüklenir.
+
+`db_path` verilirse kayıtlar SQLite'a (WAL) da yazılır ve açılışta oradan
+yüklenir; dosya boşsa başlangıç verisi (telekom_seed) yazılır.
+
+Her yazmadan sonra `add_listener` ile kaydedilen dinleyiciler, kaydı değişen
+user_id'lerle çağrılır (ör. yanıt önbelleğinin kullanıcı bazında düşürülmesi).
+"""
+
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, replace
+from typing import AbstractSet, Any, Callable, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.config import settings
+from . import telekom_seed
+
+logger = logging.getLogger(__name__)
+
+
+def region_key(name: str) -> str:
+    """Bölge adını indeks anahtarına çevir ("İstanbul, Beşiktaş" -> "istanbul")"""
+    return name.split(",")[0].strip().replace("İ", "i").lower()
+
+
+class ShardedMap(Mapping):
+    """
+    Değiştirilemez, parçalı sözlük
+
+    Anahtarlar hash'lerine göre SHARDS parçaya dağılır. edit() ile alınan
+    düzenleyici yalnızca yazılan parçaları kopyalar; diğer parçalar eski ve
+    yeni harita arasında paylaşılır.
+    """
+
+    SHARDS = 256  # 2'nin kuvveti
+    _MASK = SHARDS - 1
+    __slots__ = ("_shards", "_len")
+
+    def __init__(self, shards: Optional[Tuple[dict, ...]] = None, length: int = 0):
+        self._shards = shards if shards is not None else ({},) * self.SHARDS
+        self._len = length
+
+    def __getitem__(self, key):
+        return self._shards[hash(key) & self._MASK][key]
+
+    def get(self, key, default=None):
+        return self._shards[hash(key) & self._MASK].get(key, default)
+
+    def __contains__(self, key) -> bool:
+        return key in self._shards[hash(key) & self._MASK]
+
+    def __iter__(self):
+        for shard in self._shards:
+            yield from shard
+
+    def __len__(self) -> int:
+        return self._len
+
+    def edit(self) -> "_ShardedMapEditor":
+        return _ShardedMapEditor(self)
+
+
+class _ShardedMapEditor:
+    """ShardedMap'in copy-on-write düzenleyicisi; finish() yeni haritayı döndürür"""
+
+    __slots__ = ("_shards", "_owned", "_len")
+
+    def __init__(self, base: ShardedMap):
+        self._shards = list(base._shards)
+        self._owned = [False] * ShardedMap.SHARDS
+        self._len = len(base)
+
+    def _own(self, key) -> dict:
+        i = hash(key) & ShardedMap._MASK
+        if not self._owned[i]:
+            self._shards[i] = dict(self._shards[i])
+            self._owned[i] = True
+        return self._shards[i]
+
+    def get(self, key, default=None):
+        return self._shards[hash(key) & ShardedMap._MASK].get(key, default)
+
+    def __setitem__(self, key, value):
+        shard = self._own(key)
+        if key not in shard:
+            self._len += 1
+        shard[key] = value
+
+    def pop(self, key, default=None):
+        if key not in self._shards[hash(key) & ShardedMap._MASK]:
+            return default
+        self._len -= 1
+        return self._own(key).pop(key)
+
+    # Küme olarak kullanım (değer True)
+    def add(self, key):
+        self[key] = True
+
+    def discard(self, key):
+        self.pop(key)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def finish(self) -> ShardedMap:
+        return ShardedMap(tuple(self._shards), self._len)
+
+
+EMPTY_MAP = ShardedMap()
+
+
+class _Record:
+    """Kayıt tabanı: `as_dict()` yanıt sözlüğünü ilk çağrıda kurar ve saklar"""
+
+    __slots__ = ()
+
+    KIND: ClassVar[str] = ""
+    PUBLIC: ClassVar[Tuple[str, ...]] = ()
+
+    @property
+    def key(self) -> Any:
+        raise NotImplementedError
+
+    def as_dict(self) -> Dict[str, Any]:
+        """API yanıtındaki biçim; dönen sözlük paylaşılır, değiştirilmemelidir"""
+        cached = self._dict
+        if cached is None:
+            cached = {name: getattr(self, name) for name in self.PUBLIC}
+            object.__setattr__(self, "_dict", cached)
+        return cached
+
+    def to_row(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+
+@dataclass(frozen=True, slots=True)
+class Account(_Record):
+    email: str
+    user_id: int
+    password: str  # Gerçek uygulamada hashlenmeli!
+    name: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "account"
+    PUBLIC: ClassVar[Tuple[str, ...]] = ("user_id", "email", "password", "name")
+
+    @property
+    def key(self) -> str:
+        return self.email
+
+
+@dataclass(frozen=True, slots=True)
+class Customer(_Record):
+    user_id: int
+    name: str
+    phone_numbers: List[Dict[str, str]]
+    email: str
+    address: str
+    registration_date: str
+    customer_tier: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "customer"
+    PUBLIC: ClassVar[Tuple[str, ...]] = (
+        "name", "phone_numbers", "email", "address", "registration_date", "customer_tier",
+    )
+
+    @property
+    def key(self) -> int:
+        return self.user_id
+
+    @property
+    def region(self) -> str:
+        return region_key(self.address)
+
+
+@dataclass(frozen=True, slots=True)
+class Package(_Record):
+    user_id: int
+    package_name: str
+    monthly_fee: float
+    package_type: str
+    features: List[str]
+    internet_speed: str
+    voice_minutes: str
+    sms_count: str
+    contract_duration: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "package"
+    PUBLIC: ClassVar[Tuple[str, ...]] = (
+        "package_name", "monthly_fee", "package_type", "features",
+        "internet_speed", "voice_minutes", "sms_count", "contract_duration",
+    )
+
+    @property
+    def key(self) -> int:
+        return self.user_id
+
+
+@dataclass(frozen=True, slots=True)
+class Payment(_Record):
+    payment_id: str
+    user_id: int
+    bill_id: str
+    amount: float
+    method: str
+    status: str
+    date: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "payment"
+    PUBLIC: ClassVar[Tuple[str, ...]] = ("payment_id", "bill_id", "amount", "method", "status", "date")
+
+    @property
+    def key(self) -> str:
+        return self.payment_id
+
+
+@dataclass(frozen=True, slots=True)
+class Ticket(_Record):
+    ticket_id: str
+    user_id: int
+    issue: str
+    category: str
+    priority: str
+    status: str
+    created: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "ticket"
+    PUBLIC: ClassVar[Tuple[str, ...]] = ("ticket_id", "issue", "category", "priority", "status", "created")
+
+    @property
+    def key(self) -> str:
+        return self.ticket_id
+
+
+@dataclass(frozen=True, slots=True)
+class NetworkRegion(_Record):
+    region: str
+    status: str
+    coverage: int
+    speed: str
+    issues: List[str]
+    last_update: str
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "region"
+    PUBLIC: ClassVar[Tuple[str, ...]] = ("status", "coverage", "speed", "issues", "last_update")
+
+    @property
+    def key(self) -> str:
+        return region_key(self.region)
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceProfile(_Record):
+    """Hız testi, roaming, otomatik ödeme ve hat askı durumu"""
+    user_id: int
+    speed_test: Dict[str, Any]
+    roaming: Dict[str, Any]
+    autopay: Dict[str, Any]
+    suspension: Dict[str, Any]
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND: ClassVar[str] = "service"
+    PUBLIC: ClassVar[Tuple[str, ...]] = ("speed_test", "roaming", "autopay", "suspension")
+
+    @property
+    def key(self) -> int:
+        return self.user_id
+
+
+RECORD_TYPES = {cls.KIND: cls for cls in (Account, Customer, Package, Payment, Ticket, NetworkRegion, ServiceProfile)}
+
+
+@dataclass(frozen=True)
+class TelekomSnapshot:
+    """Deponun değiştirilemez anlık görüntüsü (birincil ve ikincil indeksler, hepsi ShardedMap)"""
+    accounts: ShardedMap  # email -> hesap
+    customers: ShardedMap  # user_id -> müşteri
+    customers_by_region: ShardedMap  # bölge -> ShardedMap(user_id -> True)
+    packages: ShardedMap  # user_id -> paket
+    payments: ShardedMap  # user_id -> ödemeler (eklenme sırası)
+    tickets: ShardedMap  # user_id -> talepler (eklenme sırası)
+    tickets_by_id: ShardedMap  # ticket_id -> talep
+    tickets_by_status: ShardedMap  # durum -> ShardedMap(ticket_id -> True)
+    regions: ShardedMap  # bölge -> ağ durumu
+    services: ShardedMap  # user_id -> servis profili
+    max_user_id: int = -1
+
+
+EMPTY_SNAPSHOT = TelekomSnapshot(*(EMPTY_MAP,) * 10)
+
+
+class _Batch:
+    """Bir yazma işleminde her indeks parçasını en fazla bir kez kopyalar"""
+
+    # Gruplanmış indeksler: alan adı -> (geçici kap oluşturucu, kalıcı biçime çevirici)
+    _GROUPS = {
+        "payments": (lambda cur: {r.key: r for r in cur or ()}, lambda box: tuple(box.values())),
+        "tickets": (lambda cur: {r.key: r for r in cur or ()}, lambda box: tuple(box.values())),
+        "customers_by_region": (lambda cur: (cur or EMPTY_MAP).edit(), _ShardedMapEditor.finish),
+        "tickets_by_status": (lambda cur: (cur or EMPTY_MAP).edit(), _ShardedMapEditor.finish),
+    }
+
+    def __init__(self, snapshot: TelekomSnapshot):
+        self.snapshot = snapshot
+        self.max_user_id = snapshot.max_user_id
+        self.user_ids: set = set()  # Kaydı değişen kullanıcılar
+        self._maps: Dict[str, _ShardedMapEditor] = {}
+        self._groups: Dict[Tuple[str, Any], Any] = {}
+
+    def map(self, name: str) -> _ShardedMapEditor:
+        m = self._maps.get(name)
+        if m is None:
+            m = self._maps[name] = getattr(self.snapshot, name).edit()
+        return m
+
+    def group(self, name: str, key: Any):
+        box = self._groups.get((name, key))
+        if box is None:
+            box = self._groups[(name, key)] = self._GROUPS[name][0](getattr(self.snapshot, name).get(key))
+        return box
+
+    def apply(self, record: _Record):
+        if isinstance(record, Account):
+            self.map("accounts")[record.email] = record
+        elif isinstance(record, Customer):
+            customers = self.map("customers")
+            old = customers.get(record.user_id)
+            if old is not None and old.region != record.region:
+                self.group("customers_by_region", old.region).discard(record.user_id)
+            self.group("customers_by_region", record.region).add(record.user_id)
+            customers[record.user_id] = record
+        elif isinstance(record, Package):
+            self.map("packages")[record.user_id] = record
+        elif isinstance(record, Payment):
+            self.group("payments", record.user_id)[record.payment_id] = record
+        elif isinstance(record, Ticket):
+            by_id = self.map("tickets_by_id")
+            old = by_id.get(record.ticket_id)
+            if old is not None:
+                self.group("tickets_by_status", old.status).discard(old.ticket_id)
+                self.group("tickets", old.user_id).pop(old.ticket_id, None)
+            self.group("tickets", record.user_id)[record.ticket_id] = record
+            self.group("tickets_by_status", record.status).add(record.ticket_id)
+            by_id[record.ticket_id] = record
+        elif isinstance(record, NetworkRegion):
+            self.map("regions")[record.key] = record
+        elif isinstance(record, ServiceProfile):
+            self.map("services")[record.user_id] = record
+        else:
+            raise TypeError(f"Bilinmeyen kayıt tipi: {type(record).__name__}")
+
+        user_id = getattr(record, "user_id", None)
+        if user_id is not None:
+            self.user_ids.add(user_id)
+            if user_id > self.max_user_id:
+                self.max_user_id = user_id
+
+    def finish(self) -> TelekomSnapshot:
+        for (name, key), box in self._groups.items():
+            value = self._GROUPS[name][1](box)
+            target = self.map(name)
+            if value:
+                target[key] = value
+            else:
+                target.pop(key, None)
+        maps = {name: editor.finish() for name, editor in self._maps.items()}
+        return replace(self.snapshot, max_user_id=self.max_user_id, **maps)
+
+
+def seed_records() -> List[_Record]:
+    """telekom_seed sözlüklerini kayıtlara çevir"""
+    records: List[_Record] = []
+    records += [Account(**info) for info in telekom_seed.REGISTERED_USERS.values()]
+    records += [Customer(user_id=uid, **data) for uid, data in telekom_seed.CUSTOMERS.items()]
+    records += [Package(user_id=uid, **data) for uid, data in telekom_seed.USER_PACKAGES.items() if data]
+    for uid, payments in telekom_seed.PAYMENT_HISTORY.items():
+        records += [Payment(user_id=uid, **p) for p in payments]
+    for uid, tickets in telekom_seed.SUPPORT_TICKETS.items():
+        records += [Ticket(user_id=uid, **t) for t in tickets]
+    records += [NetworkRegion(region=name, **data) for name, data in telekom_seed.NETWORK_STATUS.items()]
+    for uid in telekom_seed.SPEED_TEST_DATA:
+        records.append(ServiceProfile(
+            user_id=uid,
+            speed_test=telekom_seed.SPEED_TEST_DATA[uid],
+            roaming=telekom_seed.ROAMING_DATA[uid],
+            autopay=telekom_seed.AUTOPAY_DATA[uid],
+            suspension=telekom_seed.LINE_SUSPENSION_DATA[uid],
+        ))
+    return records
+
+
+class TelekomStore:
+    """Kilitsiz okunan, copy-on-write yazılan telekom veri deposu"""
+
+    # SQLite'a executemany başına yazılan satır sayısı
+    WRITE_CHUNK = 10_000
+
+    def __init__(self, db_path: Optional[str] = None, seed: bool = True):
+        self.db_path = db_path
+        self._snapshot = EMPTY_SNAPSHOT
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._listeners: List[Callable[[FrozenSet[int]], None]] = []
+
+        loaded = False
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS telekom_records ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (kind, key)) WITHOUT ROWID"
+            )
+            loaded = self._conn.execute("SELECT EXISTS (SELECT 1 FROM telekom_records)").fetchone()[0]
+
+        if loaded:
+            self._snapshot = self._build(EMPTY_SNAPSHOT, self._load())
+            logger.info(f"📦 Telekom deposu SQLite'tan yüklendi: {self.durum()['customers']} müşteri")
+        elif seed:
+            self.upsert(*seed_records())
+
+    def _load(self) -> Iterator[_Record]:
+        for kind, data in self._conn.execute("SELECT kind, data FROM telekom_records"):
+            yield RECORD_TYPES[kind](**json.loads(data))
+
+    @staticmethod
+    def _build(snapshot: TelekomSnapshot, records: Iterable[_Record]) -> TelekomSnapshot:
+        batch = _Batch(snapshot)
+        for record in records:
+            batch.apply(record)
+        return batch.finish()
+
+    # ------------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------------
+
+    def upsert(self, *records: _Record) -> TelekomSnapshot:
+        """Kayıtları ekle/güncelle; yeni anlık görüntüyü yayınla"""
+        with self._lock:
+            self._write_locked(records)
+            return self._snapshot
+
+    def bulk_load(self, records: Iterable[_Record]) -> int:
+        """
+        Kayıtları akış halinde tek anlık görüntü değişimiyle yükle
+
+        Kayıtlar listeye toplanmaz; SQLite'a WRITE_CHUNK'lık parçalarla tek
+        işlemde yazılır. Yükleme bitene kadar okuyucular eski görüntüyü görür.
+        """
+        with self._lock:
+            return self._write_locked(records)
+
+    def _write_locked(self, records: Iterable[_Record]) -> int:
+        batch = _Batch(self._snapshot)
+        conn = self._conn
+        rows: List[Tuple[str, str, str]] = []
+        count = 0
+        with conn if conn is not None else contextlib.nullcontext():
+            for record in records:
+                batch.apply(record)
+                count += 1
+                if conn is not None:
+                    rows.append((record.KIND, str(record.key), json.dumps(record.to_row(), ensure_ascii=False)))
+                    if len(rows) >= self.WRITE_CHUNK:
+                        self._write_rows(rows)
+            if rows:
+                self._write_rows(rows)
+        self._snapshot = batch.finish()
+        self._notify(frozenset(batch.user_ids))
+        return count
+
+    def add_listener(self, listener: Callable[[FrozenSet[int]], None]):
+        """Her yazmadan sonra kaydı değişen user_id'lerle çağrılacak fonksiyonu ekle"""
+        self._listeners.append(listener)
+
+    def _notify(self, user_ids: FrozenSet[int]):
+        if not user_ids:
+            return
+        for listener in self._listeners:
+            try:
+                listener(user_ids)
+            except Exception as e:
+                logger.error(f"Telekom deposu dinleyici hatası: {e}")
+
+    def _write_rows(self, rows: List[Tuple[str, str, str]]):
+        self._conn.executemany(
+            "INSERT INTO telekom_records (kind, key, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(kind, key) DO UPDATE SET data = excluded.data",
+            rows,
+        )
+        rows.clear()
+
+    def register_account(self, email: str, password: str, name: str) -> Account:
+        """
+        Yeni hesap aç (user_id = en büyük user_id + 1)
+
+        Raises:
+            ValueError: Email zaten kayıtlıysa
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if email in snapshot.accounts:
+                raise ValueError("Bu email ile zaten bir kullanıcı var.")
+            account = Account(email=email, user_id=snapshot.max_user_id + 1, password=password, name=name)
+            self._write_locked((account,))
+        return account
+
+    # ------------------------------------------------------------------
+    # Okuma (kilitsiz; o anki anlık görüntüden)
+    # ------------------------------------------------------------------
+
+    @property
+    def snapshot(self) -> TelekomSnapshot:
+        return self._snapshot
+
+    def account(self, email: str) -> Optional[Account]:
+        return self._snapshot.accounts.get(email)
+
+    def customer(self, user_id: int) -> Optional[Customer]:
+        return self._snapshot.customers.get(user_id)
+
+    def has_customer(self, user_id: int) -> bool:
+        return user_id in self._snapshot.customers
+
+    def customers_in_region(self, region: str) -> AbstractSet[int]:
+        return self._snapshot.customers_by_region.get(region_key(region), EMPTY_MAP).keys()
+
+    def package(self, user_id: int) -> Optional[Package]:
+        return self._snapshot.packages.get(user_id)
+
+    def payments(self, user_id: int) -> Tuple[Payment, ...]:
+        return self._snapshot.payments.get(user_id, ())
+
+    def tickets(self, user_id: int) -> Tuple[Ticket, ...]:
+        return self._snapshot.tickets.get(user_id, ())
+
+    def ticket(self, ticket_id: str) -> Optional[Ticket]:
+        return self._snapshot.tickets_by_id.get(ticket_id)
+
+    def tickets_with_status(self, status: str) -> AbstractSet[str]:
+        return self._snapshot.tickets_by_status.get(status, EMPTY_MAP).keys()
+
+    def network_region(self, region: str) -> Optional[NetworkRegion]:
+        return self._snapshot.regions.get(region_key(region))
+
+    def services(self, user_id: int) -> Optional[ServiceProfile]:
+        return self._snapshot.services.get(user_id)
+
+    def durum(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "accounts": len(snapshot.accounts),
+            "customers": len(snapshot.customers),
+            "packages": len(snapshot.packages),
+            "tickets": len(snapshot.tickets_by_id),
+            "regions": len(snapshot.regions),
+            "persistent": self._conn is not None,
+        }
+
+
+# Telekom router'ı ve AIEndpointFunctions tarafından paylaşılan depo
+telekom_store = TelekomStore(db_path=settings.TELEKOM_STORE_DB_PATH or None)
@@ -0,0 +1,184 @@
+"""
+Araç yürütme motoru - Telekom araç çağrılarını eşzamanlı ve bağımlılık sırasıyla çalıştırır
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.tracing import TOOL_CALLS, span
+
+logger = logging.getLogger(__name__)
+
+# Çağrı nesnesi üzerinde araç başladığında / bittiğinde çağrılır
+ToolHook = Callable[[Any], None]
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Dispatch tablosundaki tek bir araç tanımı"""
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    # Bu araçtan önce tamamlanması gereken araçlar
+    depends_on: Tuple[str, ...] = ()
+    # Bağımlılık sonuçlarından ({araç_adı: sonuç}) ek parametre üretir
+    bind: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    # None ise motorun varsayılan zaman aşımı kullanılır
+    timeout: Optional[float] = None
+
+
+class ToolExecutionEngine:
+    """
+    Araç çağrılarını dispatch tablosu üzerinden yürütür.
+
+    Tablo bir kez kurulur. `run` her çağrı için bir görev başlatır; bağımsız
+    çağrılar `asyncio.gather` ile eşzamanlı çalışır, bağımlılığı olan çağrı
+    (başka bir aracın sonucunu parametre olarak kullanan) bağımlılığının
+    sonucunu bekler ve parametrelerini ondan tamamlar. Toplam gecikme araçların toplamı yerine en
+    uzun bağımlılık zincirine iner. Her çağrı kendi zaman aşımıyla sınırlıdır.
+    """
+
+    def __init__(self, specs: Iterable[ToolSpec], default_timeout: float = 10.0):
+        self.default_timeout = default_timeout
+        self.dispatch: Dict[str, ToolSpec] = {}
+        self._accepts: Dict[str, Optional[frozenset]] = {}
+        for spec in specs:
+            self.dispatch[spec.name] = spec
+            self._accepts[spec.name] = self._accepted_params(spec.func)
+
+    @staticmethod
+    def _accepted_params(func: Callable) -> Optional[frozenset]:
+        """Fonksiyonun kabul ettiği parametre adları (**kwargs varsa None)"""
+        params = inspect.signature(func).parameters.values()
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+            return None
+        return frozenset(p.name for p in params)
+
+    async def call(self, name: str, params: Dict[str, Any]) -> Any:
+        """
+        Tek bir aracı zaman aşımıyla çağır
+
+        Raises:
+            asyncio.TimeoutError: Araç zaman aşımına uğradıysa
+        """
+        spec = self.dispatch.get(name)
+        if spec is None:
+            logger.warning(f"Bilinmeyen araç: {name}")
+            return None
+
+        accepts = self._accepts[name]
+        if accepts is not None:
+            # Aracın tanımadığı parametreler (örn. session_token) atılır
+            params = {k: v for k, v in params.items() if k in accepts}
+
+        timeout = spec.timeout if spec.timeout is not None else self.default_timeout
+        return await asyncio.wait_for(spec.func(**params), timeout=timeout)
+
+    def plan(self, calls: List[Any]) -> List[Any]:
+        """Listede olmayan bağımlılıkları, bağımlı çağrının önüne ekle"""
+        planned: List[Any] = []
+        names = set()
+        for call in calls:
+            spec = self.dispatch.get(call.arac_adi)
+            for dep in spec.depends_on if spec else ():
+                if dep not in names and all(c.arac_adi != dep for c in calls):
+                    shared = {k: v for k, v in call.parametreler.items() if k == "session_token"}
+                    planned.append(type(call)(dep, shared))
+                    names.add(dep)
+            planned.append(call)
+            names.add(call.arac_adi)
+        return planned
+
+    async def run(
+        self,
+        calls: List[Any],
+        on_start: Optional[ToolHook] = None,
+        on_end: Optional[ToolHook] = None,
+    ) -> List[Any]:
+        """
+        Çağrıları yürüt; her çağrının durum/sonuc/hata_mesaji alanlarını doldur
+
+        Args:
+            calls: `arac_adi`, `parametreler`, `durum`, `sonuc`, `hata_mesaji` alanlı nesneler
+            on_start / on_end: Her çağrı başlarken / biterken çağrılır
+
+        Returns:
+            Eklenen bağımlılıklar dahil yürütülen çağrılar (sıra korunur)
+        """
+        calls = self.plan(calls)
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def execute(call: Any):
+            spec = self.dispatch.get(call.arac_adi)
+            dep_results: Dict[str, Any] = {}
+            for dep in spec.depends_on if spec else ():
+                dep_call = await tasks[dep]
+                failed = isinstance(dep_call.sonuc, dict) and dep_call.sonuc.get("success") is False
+                if dep_call.durum != "tamamlandi" or failed:
+                    call.durum = "hata"
+                    call.hata_mesaji = f"Bağımlı araç başarısız: {dep}"
+                    return call
+                dep_results[dep] = dep_call.sonuc
+
+            params = dict(call.parametreler)
+            if spec and spec.bind and dep_results:
+                for key, value in spec.bind(dep_results).items():
+                    params.setdefault(key, value)
+                call.parametreler = params
+
+            if on_start:
+                on_start(call)
+            started = time.perf_counter()
+            with span(f"tool.{call.arac_adi}") as sp:
+                try:
+                    call.sonuc = await self.call(call.arac_adi, params)
+                    call.durum = "tamamlandi"
+                except asyncio.TimeoutError:
+                    call.durum = "hata"
+                    call.hata_mesaji = f"Araç zaman aşımına uğradı: {call.arac_adi}"
+                except Exception as e:
+                    logger.error(f"Araç hatası: {call.arac_adi} - {e}")
+                    call.durum = "hata"
+                    call.hata_mesaji = str(e)
+                sp.set(status=call.durum)
+            TOOL_CALLS.inc(1.0, call.arac_adi, call.durum)
+            logger.info(f"Araç {call.arac_adi} {call.durum} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+            if on_end:
+                on_end(call)
+            return call
+
+        ordered: List[asyncio.Task] = []
+        for call in calls:
+            task = asyncio.ensure_future(execute(call))
+            # Aynı araç birden fazla istenmişse bağımlılar ilkini bekler
+            tasks.setdefault(call.arac_adi, task)
+            ordered.append(task)
+
+        await asyncio.gather(*ordered)
+        return calls
+
+
+def telekom_arac_tablosu() -> List[ToolSpec]:
+    """
+    AI'nin çağırabileceği Telekom araçlarının dispatch tablosu
+
+    Yalnızca salt okunur araçlar: ödeme gibi hesapta değişiklik yapan işlemler
+    serbest metinden ayrıştırılan çağrılarla tetiklenemez, kullanıcı onayıyla
+    kendi endpoint'lerinden yapılır.
+    """
+    from .ai_endpoint_functions import ai_endpoint_functions as f
+
+    return [
+        ToolSpec("get_current_bill", f.telekom_get_current_bill),
+        ToolSpec("get_past_bills", f.telekom_get_bill_history),
+        ToolSpec("get_available_packages", f.telekom_get_available_packages),
+        ToolSpec("get_remaining_quotas", f.telekom_get_remaining_quotas),
+        ToolSpec("check_network_status", f.telekom_check_network_status),
+        ToolSpec("test_internet_speed", f.telekom_test_internet_speed),
+        ToolSpec("get_payment_history", f.telekom_get_payment_history),
+        ToolSpec("get_current_package", f.telekom_get_current_package),
+        ToolSpec("get_user_support_tickets", f.telekom_get_user_support_tickets),
+    ]
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Feedback istatistik tablolarını mevcut feedback_data / response_patterns satırlarından yeniden kuran script
+
+Kullanım (backend dizininden):
+    python backfill_feedback_stats.py
+    python backfill_feedback_stats.py --db-url sqlite:///./feedback.db --chunk-size 50000
+"""
+
+import argparse
+import logging
+import time
+
+from app.core.config import settings
+from app.services.feedback_service import FeedbackService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feedback istatistiklerini yeniden kur")
+    parser.add_argument("--db-url", default=settings.FEEDBACK_DB_URL)
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Tek seferde okunan satır")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(f"📊 İstatistikler yeniden kuruluyor: {args.db_url}")
+    started = time.perf_counter()
+    counts = FeedbackService(db_url=args.db_url).rebuild_aggregates(chunk_size=args.chunk_size)
+    print(f"✅ {counts['feedback']} feedback, {counts['patterns']} pattern işlendi "
+          f"({time.perf_counter() - started:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
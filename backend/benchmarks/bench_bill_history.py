@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+/billing/history istek/s ölçümü
+===============================
+Önceden hesaplanan fatura tablolarıyla çalışan gerçek endpoint'i, her istekte
+24 faturayı yeniden kuran ve toplamlar için listeyi üç kez dolaşan eski
+uygulamanın kopyasıyla karşılaştırır. İstekler httpx ASGI transport ile süreç
+içinde gönderilir (ağ ve uvicorn maliyeti yok; yalnızca uygulama + JSON).
+
+Örnek:
+    python backend/benchmarks/bench_bill_history.py --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.v1 import telekom
+
+HIZMETLER = (
+    (("Mega İnternet", 0.8), ("Sesli Arama", 0.2)),
+    (("Mega İnternet", 0.7), ("Sesli Arama", 0.2), ("SMS Paketi", 0.1)),
+    (("Mega İnternet", 0.6), ("Sesli Arama", 0.2), ("Roaming Servisi", 0.2)),
+    (("Mega İnternet", 0.5), ("Sesli Arama", 0.2), ("Premium Hizmetler", 0.3)),
+)
+
+
+async def eski_fatura_gecmisi(request: telekom.PastBillsRequest):
+    """Önceki uygulama: her istekte satır kurulumu + üç ayrı toplam geçişi"""
+    user_id = telekom.get_current_user_from_token(request.session_token)
+    bills = []
+    base_amount = 50 + (user_id % 50)
+    for i in range(min(request.limit, 24)):
+        if i % 12 in [5, 6, 7]:
+            seasonal_adjustment = 15
+        elif i % 12 in [11, 0, 1]:
+            seasonal_adjustment = 10
+        else:
+            seasonal_adjustment = 5
+        bill_amount = base_amount + (i % 12) * 2 + seasonal_adjustment
+        bill_status = "paid" if i < 21 else "unpaid"
+        year = 2023 if i < 12 else 2024
+        month = (i % 12) + 1
+        bills.append({
+            "bill_id": f"F-{year}-{user_id:04d}-{month:02d}",
+            "user_id": user_id,
+            "amount": bill_amount,
+            "currency": "TRY",
+            "bill_date": f"{year}-{month:02d}-28",
+            "due_date": f"{year}-{month+1:02d}-15",
+            "status": bill_status,
+            "services": [{"service_name": n, "amount": bill_amount * r} for n, r in HIZMETLER[i % 4]],
+            "payment_method": "credit_card" if i % 3 == 0 else "bank_transfer" if i % 3 == 1 else "auto_pay",
+            "late_fee": 0 if bill_status == "paid" else 15.50,
+            "discount_applied": 5.00 if i % 6 == 0 else 0.00,
+        })
+    return {
+        "success": True,
+        "data": {
+            "bills": bills,
+            "total_count": len(bills),
+            "user_id": user_id,
+            "total_paid": sum(bill["amount"] for bill in bills if bill["status"] == "paid"),
+            "total_unpaid": sum(bill["amount"] for bill in bills if bill["status"] == "unpaid"),
+            "average_amount": sum(bill["amount"] for bill in bills) / len(bills),
+        },
+    }
+
+
+def uygulama_olustur() -> FastAPI:
+    app = FastAPI()
+    app.include_router(telekom.router, prefix="/api/v1")
+    app.post("/api/v1/telekom/billing/history-legacy")(eski_fatura_gecmisi)
+    return app
+
+
+async def olc(client: httpx.AsyncClient, path: str, tokens, args) -> dict:
+    rng = random.Random(7)
+    payloads = [{"session_token": rng.choice(tokens), "limit": rng.choice(args.limits)} for _ in range(args.requests)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def one(payload):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(path, json=payload)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(p) for p in payloads))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {"rps": args.requests / elapsed, "p50": latencies[len(latencies) // 2],
+            "p99": latencies[int(len(latencies) * 0.99) - 1]}
+
+
+async def fonksiyon_olc(tokens, args) -> dict:
+    """HTTP katmanı olmadan endpoint fonksiyonu başına süre (µs)"""
+    rng = random.Random(7)
+    requests = [telekom.PastBillsRequest(session_token=rng.choice(tokens), limit=rng.choice(args.limits))
+                for _ in range(args.requests)]
+    sonuc = {}
+    for ad, func in (("eski", eski_fatura_gecmisi), ("yeni", telekom.get_past_bills)):
+        started = time.perf_counter()
+        for request in requests:
+            await func(request)
+        sonuc[ad] = (time.perf_counter() - started) / len(requests) * 1e6
+    return sonuc
+
+
+async def main_async(args):
+    logging.disable(logging.INFO)
+    tokens = [telekom.create_session(user_id) for user_id in range(args.users)]
+    transport = httpx.ASGITransport(app=uygulama_olustur())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        yollar = {"eski": "/api/v1/telekom/billing/history-legacy", "yeni": "/api/v1/telekom/billing/history"}
+        # Isınma: tablolar ve token LRU'su dolsun
+        for path in yollar.values():
+            await olc(client, path, tokens, argparse.Namespace(**{**vars(args), "requests": args.users * 2}))
+
+        fonksiyon = await fonksiyon_olc(tokens, args)
+        print(f"{'uygulama':>9} {'istek/s':>9} {'p50(ms)':>8} {'p99(ms)':>8} {'fonksiyon(µs)':>14}")
+        for ad, path in yollar.items():
+            r = await olc(client, path, tokens, args)
+            print(f"{ad:>9} {r['rps']:>9.0f} {r['p50']:>8.2f} {r['p99']:>8.2f} {fonksiyon[ad]:>14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/billing/history istek/s ölçümü")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--limits", type=int, nargs="+", default=[6, 12, 24])
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
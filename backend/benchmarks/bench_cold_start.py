@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Soğuk başlangıç ölçümü
+======================
+Backend'i uvicorn ile yeni bir süreçte başlatır ve süreç başlangıcından
+itibaren şu anları ölçer:
+  - /api/v1/health/live ilk 200 (servis istek karşılıyor)
+  - /api/v1/health ilk 200
+  - /api/v1/health/ready yükleme sonucu (200 hazır, 503 + model_unavailable)
+
+Örnek:
+    python backend/benchmarks/bench_cold_start.py --model models/model.gguf --repeat 3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+
+def get(url: str):
+    """(status, gövde) döndür; bağlantı yoksa (None, None)"""
+    try:
+        with urllib.request.urlopen(url, timeout=1) as resp:
+            return resp.status, json.loads(resp.read() or b"null")
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"null")
+    except (urllib.error.URLError, ConnectionError, OSError):
+        return None, None
+
+
+def olc(args) -> dict:
+    env = dict(os.environ)
+    if args.model:
+        env["LOCAL_MODEL_PATH"] = args.model
+    base = f"http://127.0.0.1:{args.port}/api/v1"
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=BACKEND_ROOT,
+        env=env,
+    )
+    sonuc = {"live_s": None, "health_s": None, "ready_s": None, "ready_status": None}
+    try:
+        while time.perf_counter() - started < args.timeout:
+            now = time.perf_counter() - started
+            if sonuc["live_s"] is None and get(f"{base}/health/live")[0] == 200:
+                sonuc["live_s"] = now
+            if sonuc["live_s"] is not None and sonuc["health_s"] is None and get(f"{base}/health")[0] == 200:
+                sonuc["health_s"] = time.perf_counter() - started
+            if sonuc["health_s"] is not None:
+                status, body = get(f"{base}/health/ready")
+                if body and body.get("status") not in ("loading", "not_started"):
+                    sonuc["ready_s"] = time.perf_counter() - started
+                    sonuc["ready_status"] = f"{status} {body['status']}"
+                    break
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn beklenmedik şekilde çıktı (kod {proc.returncode})")
+            time.sleep(args.poll)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend soğuk başlangıç ölçümü")
+    parser.add_argument("--model", help="GGUF model dosyası/dizini (LOCAL_MODEL_PATH)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--poll", type=float, default=0.02, help="Yoklama aralığı (s)")
+    args = parser.parse_args()
+
+    print(f"{'#':>3} {'live (s)':>9} {'health (s)':>11} {'ready (s)':>10}  ready durumu")
+    for i in range(args.repeat):
+        s = olc(args)
+        fmt = lambda v: f"{v:.3f}" if v is not None else "-"
+        print(f"{i + 1:>3} {fmt(s['live_s']):>9} {fmt(s['health_s']):>11} {fmt(s['ready_s']):>10}  {s['ready_status'] or 'zaman aşımı'}")
+
+
+if __name__ == "__main__":
+    main()
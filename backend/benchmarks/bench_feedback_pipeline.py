@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Feedback yazma kuyruğu yük testi
+================================
+Eşzamanlı üreticilerle FeedbackService.process_feedback çağırır ve tüm
+olaylar diske yazılana kadar (shutdown ile kuyruk boşaltılarak) geçen süreden
+sürdürülebilir insert/s hesaplar. `--batch-sizes 1` her olayı ayrı
+transaction'da yazar (eski davranışa yakın karşılaştırma).
+
+Örnek:
+    python backend/benchmarks/bench_feedback_pipeline.py --events 20000 --producers 50
+"""
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.schemas.feedback import FeedbackSchema, FeedbackType
+from app.services.feedback_service import FeedbackService
+
+SORULAR = [
+    "bu ayki faturam ne kadar",
+    "kalan kotamı göster",
+    "telefonum çekmiyor ne yapmalıyım",
+    "hangi paketlere geçebilirim",
+]
+
+
+def ornek_feedback(i: int, users: int) -> FeedbackSchema:
+    return FeedbackSchema(
+        feedback_type=FeedbackType.POSITIVE if i % 3 else FeedbackType.NEGATIVE,
+        message_id=f"MSG_{i}",
+        user_question=SORULAR[i % len(SORULAR)],
+        ai_response="Faturanız 120 TL. Son ödeme tarihi ayın 15'i." if i % 2 else "Tamam",
+        user_id=f"user_{random.randrange(users)}",
+        session_id=f"sess_{i % 100}",
+        context={"kaynak": "bench"},
+    )
+
+
+async def calistir(args, batch_size: int) -> dict:
+    db_path = Path(tempfile.mkdtemp()) / "feedback.db"
+    service = FeedbackService(
+        db_url=f"sqlite:///{db_path}",
+        batch_size=batch_size,
+        flush_interval=args.flush_interval,
+        max_queue=args.max_queue,
+    )
+    payloads = [ornek_feedback(i, args.users) for i in range(args.events)]
+    latencies = []
+
+    async def uretici(indices):
+        for i in indices:
+            started = time.perf_counter()
+            await service.process_feedback(payloads[i])
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(uretici(range(p, args.events, args.producers)) for p in range(args.producers)))
+    await service.shutdown()
+    elapsed = time.perf_counter() - started
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT COUNT(*) FROM feedback_data").fetchone()[0]
+    latencies.sort()
+    return {
+        "rows": rows,
+        "rate": rows / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "avg_batch": service.stats()["avg_batch_size"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feedback yazma kuyruğu yük testi")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--producers", type=int, default=50, help="Eşzamanlı istek sayısı")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64, 256, 1024])
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    parser.add_argument("--max-queue", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'batch':>6} {'satır':>7} {'insert/s':>10} {'p50 istek(ms)':>14} {'p99 istek(ms)':>14} {'ort. batch':>11}")
+    for batch_size in args.batch_sizes:
+        r = asyncio.run(calistir(args, batch_size))
+        print(f"{batch_size:>6} {r['rows']:>7} {r['rate']:>10.0f} {r['p50']:>14.3f} {r['p99']:>14.3f} {r['avg_batch']:>11}")
+
+
+if __name__ == "__main__":
+    main()
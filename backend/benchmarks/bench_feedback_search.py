@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Feedback arama ölçümü (FTS5 ve LIKE)
+====================================
+response_patterns ve improved_answers tablolarını artan boyutlarda sentetik
+satırlarla doldurur. Ardından get_similar_patterns / get_improved_answers
+sorgu süresini FTS5 dizini ile eski LIKE taramaları arasında karşılaştırır.
+Satırlar doğrudan SQLite'a toplu yazılır, FTS dizini trigger'larla
+güncellenir.
+
+Örnek:
+    python backend/benchmarks/bench_feedback_search.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.feedback_service import FeedbackService
+
+KELIMELER = [
+    "fatura", "faturamı", "ödeme", "kotamı", "internet", "paket", "tarife", "roaming",
+    "hızım", "bağlantı", "çekmiyor", "şebeke", "kampanya", "taahhüt", "numara", "hattım",
+    "dondurma", "iptal", "borcum", "gecikme", "fiber", "modem", "sinyal", "mesaj",
+] + [f"kelime{i}" for i in range(2000)]
+
+SORGULAR = [
+    "faturamı nasıl öderim",
+    "kotamı öğrenmek istiyorum",
+    "internet bağlantı sorunu yaşıyorum",
+    "roaming paketi hakkında bilgi",
+    "kelime17 kelime1234 hakkında",
+]
+
+
+def soru_uret(rng: random.Random) -> str:
+    return " ".join(rng.choice(KELIMELER) for _ in range(rng.randint(3, 7)))
+
+
+def doldur(db_path: Path, hedef: int, mevcut: int, rng: random.Random):
+    with sqlite3.connect(db_path) as conn:
+        chunk = 50000
+        for start in range(mevcut, hedef, chunk):
+            n = min(chunk, hedef - start)
+            sorular = [soru_uret(rng) for _ in range(n)]
+            conn.executemany(
+                "INSERT INTO response_patterns (pattern_id, question_type, answer_style, keywords, "
+                "confidence_score, usage_count) VALUES (?, 'general', 'informative', ?, ?, ?)",
+                [(f"PAT_{start + i}", json.dumps([w for w in q.split() if len(w) > 3], ensure_ascii=False),
+                  rng.random(), rng.randint(0, 50)) for i, q in enumerate(sorular)],
+            )
+            conn.executemany(
+                "INSERT INTO improved_answers (original_question, original_answer, improved_answer, "
+                "improvement_type, quality_score) VALUES (?, 'cevap', 'iyileştirilmiş cevap', '[]', ?)",
+                [(q, rng.random()) for q in sorular],
+            )
+            conn.commit()
+
+
+async def olc(service: FeedbackService, fts: bool, repeat: int):
+    service.fts_enabled = fts
+    sureler = {"patterns": [], "improved": []}
+    for _ in range(repeat):
+        for sorgu in SORGULAR:
+            started = time.perf_counter()
+            await service.get_similar_patterns(sorgu)
+            sureler["patterns"].append((time.perf_counter() - started) * 1000)
+            started = time.perf_counter()
+            await service.get_improved_answers(sorgu)
+            sureler["improved"].append((time.perf_counter() - started) * 1000)
+    return {k: statistics.median(v) for k, v in sureler.items()}
+
+
+async def main_async(args):
+    db_path = Path(tempfile.mkdtemp()) / "feedback.db"
+    service = FeedbackService(db_url=f"sqlite:///{db_path}")
+    fts_var = service.fts_enabled
+    if not fts_var:
+        print("Bu SQLite derlemesinde FTS5 yok; yalnızca LIKE ölçülecek")
+    rng = random.Random(42)
+
+    print(f"{'satır':>9} {'FTS pattern(ms)':>16} {'FTS cevap(ms)':>14} {'LIKE pattern(ms)':>17} {'LIKE cevap(ms)':>15}")
+    mevcut = 0
+    for size in sorted(args.sizes):
+        doldur(db_path, size, mevcut, rng)
+        mevcut = size
+        fts = await olc(service, True, args.repeat) if fts_var else {"patterns": 0.0, "improved": 0.0}
+        like = await olc(service, False, max(1, args.repeat // 5)) if not args.skip_like else None
+        like_cols = f"{like['patterns']:>17.2f} {like['improved']:>15.2f}" if like else f"{'-':>17} {'-':>15}"
+        print(f"{size:>9} {fts['patterns']:>16.2f} {fts['improved']:>14.2f} {like_cols}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feedback arama ölçümü")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--skip-like", action="store_true", help="Yavaş LIKE ölçümünü atla")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
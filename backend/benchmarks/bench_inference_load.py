@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GGUF çıkarım yük testi
+======================
+Aynı GGUF modeli üzerinde worker havuzu (pool) ile sürekli batch zamanlayıcıyı
+(batch) 10-50 eşzamanlı oturumla karşılaştırır; toplam token/sn ve gecikme
+yüzdeliklerini yazdırır.
+
+Örnek:
+    python backend/benchmarks/bench_inference_load.py --model model.gguf --sessions 10 25 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.batch_scheduler import BatchScheduler
+from app.services.inference_executor import InferenceExecutor
+
+PROMPTS = [
+    "Kullanıcı sorusu: Bu ayki faturam ne kadar?",
+    "Kullanıcı sorusu: Kalan internet kotamı öğrenmek istiyorum.",
+    "Kullanıcı sorusu: Hangi paketlere geçebilirim?",
+    "Kullanıcı sorusu: Bölgemde ağ arızası var mı?",
+    "Kullanıcı sorusu: İnternet hızımı test eder misin?",
+]
+
+
+def build_engine(args, backend: str):
+    from llama_cpp import Llama
+
+    def factory():
+        if backend == "baseline":
+            # Orijinal yapılandırma: n_batch=1
+            return Llama(model_path=args.model, n_ctx=args.n_ctx, n_threads=args.threads, n_batch=1, verbose=False)
+        return Llama(
+            model_path=args.model,
+            n_ctx=args.n_ctx,
+            n_threads=args.threads,
+            n_batch=args.n_batch,
+            n_ubatch=args.n_ubatch,
+            verbose=False,
+        )
+
+    if backend == "batch":
+        return BatchScheduler(
+            factory(),
+            n_seq_max=args.slots,
+            n_ctx_per_seq=args.n_ctx,
+            n_batch=args.n_batch,
+            n_ubatch=args.n_ubatch,
+            n_threads=args.threads,
+            max_queue=max(args.sessions),
+        )
+    return InferenceExecutor(factory, concurrency=args.pool_size, max_queue=max(args.sessions))
+
+
+async def run_level(engine, sessions: int, max_tokens: int):
+    latencies = []
+
+    async def one(i: int):
+        started = time.perf_counter()
+        result = await engine.generate(PROMPTS[i % len(PROMPTS)], max_tokens=max_tokens, temperature=0.0)
+        latencies.append(time.perf_counter() - started)
+        return result["completion_tokens"]
+
+    started = time.perf_counter()
+    tokens = sum(await asyncio.gather(*(one(i) for i in range(sessions))))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "tokens": tokens,
+        "elapsed_s": elapsed,
+        "tok_per_s": tokens / elapsed if elapsed else 0.0,
+        "p50_s": statistics.median(latencies),
+        "p95_s": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+async def main_async(args):
+    for backend in args.backends:
+        engine = build_engine(args, backend)
+        engine.load_models()
+        await engine.generate(PROMPTS[0], max_tokens=4, temperature=0.0)  # ısınma
+        print(f"\n== {backend} ==")
+        print(f"{'oturum':>7} {'token':>7} {'süre(s)':>8} {'tok/s':>8} {'p50(s)':>7} {'p95(s)':>7}")
+        for sessions in args.sessions:
+            r = await run_level(engine, sessions, args.max_tokens)
+            print(f"{r['sessions']:>7} {r['tokens']:>7} {r['elapsed_s']:>8.2f} {r['tok_per_s']:>8.1f} "
+                  f"{r['p50_s']:>7.2f} {r['p95_s']:>7.2f}")
+        print(engine.durum())
+        await engine.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GGUF çıkarım yük testi")
+    parser.add_argument("--model", required=True, help="GGUF model dosyası")
+    parser.add_argument("--backends", nargs="+", default=["baseline", "pool", "batch"],
+                        choices=["baseline", "pool", "batch"])
+    parser.add_argument("--sessions", nargs="+", type=int, default=[10, 25, 50])
+    parser.add_argument("--max-tokens", type=int, default=64)
+    parser.add_argument("--n-ctx", type=int, default=2048)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--n-batch", type=int, default=512)
+    parser.add_argument("--n-ubatch", type=int, default=512)
+    parser.add_argument("--slots", type=int, default=16, help="batch: eşzamanlı KV slotu")
+    parser.add_argument("--pool-size", type=int, default=1, help="pool: Llama örneği sayısı")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Niyet yönlendirici mikro ölçümü
+===============================
+Mesaj başına yönlendirme maliyetini eski zincirleme `"x" in text.lower()`
+kontrolleri ile derlenmiş IntentRouter arasında karşılaştırır. Eski zincir
+yalnızca ilk eşleşen `elif` dalını bulur; yönlendirici tüm araçları döndürür.
+
+Örnek:
+    python backend/benchmarks/bench_intent_router.py --iterations 20000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.intent_router import IntentRouter
+
+MESSAGES = [
+    "bu ayki faturam ne kadar",
+    "kalan kotamı göster",
+    "konya yolundayım telefonum çekmiyor, bağlantı sorunu var",
+    "hangi paketlere geçebilirim",
+    "internet hızımı test et",
+    "geçmiş faturalarımı ve ödeme geçmişimi görmek istiyorum, ayrıca kalan internetim ne kadar",
+    "merhaba, nasılsınız",
+    "yurt dışına çıkacağım roaming açar mısınız",
+]
+
+
+def eski_zincir(text: str):
+    """_fallback_response / _generate_response içindeki eski elif zinciri"""
+    text = text.lower()
+    if any(word in text for word in ["geçmiş", "fatura", "ödeme"]):
+        return "get_past_bills"
+    elif any(word in text for word in ["paket", "tarife"]):
+        return "get_available_packages"
+    elif any(word in text for word in ["kota", "kullanım"]):
+        return "get_remaining_quotas"
+    elif any(word in text for word in ["ağ", "bağlantı"]):
+        return "check_network_status"
+    elif "hız" in text or "internet" in text:
+        return "test_internet_speed"
+    return None
+
+
+def olc(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        fn(MESSAGES[i % len(MESSAGES)])
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Niyet yönlendirici mikro ölçümü")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    router = IntentRouter()
+    print(f"Otomat derleme: {(time.perf_counter() - started) * 1000:.2f} ms")
+
+    for mesaj in MESSAGES:
+        print(f"  {mesaj[:50]:<50} eski={eski_zincir(mesaj)!s:<24} yeni={router.route(mesaj)}")
+
+    print(f"{'eski zincir':>14}: {olc(eski_zincir, args.iterations):6.2f} µs/mesaj (ilk eşleşme)")
+    print(f"{'route':>14}: {olc(router.route, args.iterations):6.2f} µs/mesaj (tüm eşleşmeler)")
+    print(f"{'kisa_yol':>14}: {olc(router.kisa_yol, args.iterations):6.2f} µs/mesaj")
+
+
+if __name__ == "__main__":
+    main()
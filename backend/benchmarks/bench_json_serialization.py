@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON yanıt serileştirme maliyeti ölçümü
+=======================================
+En büyük yanıtlar (/billing/history limit=24, /packages/available ve araç
+sonuçlu bir chat yanıtı) için serileştirme süresini karşılaştırır:
+
+  - fastapi: varsayılan yol (jsonable_encoder + json.dumps; chat için
+    response_model doğrulaması + serileştirme)
+  - orjson: FAST_JSON=true yolu (FastJSONResponse / model_dump_json)
+  - hazır: PrecomputedJSON (yalnızca değişmeyen yanıtlar)
+
+Ardından iki endpoint'i FAST_JSON kapalı ve açıkken ayrı süreçlerde httpx
+ASGI transport ile çağırıp istek/s ve gecikmeyi raporlar.
+
+Örnek:
+    python backend/benchmarks/bench_json_serialization.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+
+def olc_us(func, n: int) -> float:
+    """Çağrı başına süre (µs)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def chat_yaniti(arac_sayisi: int, include_tool_results: bool):
+    """Ödeme geçmişi araç sonuçları taşıyan örnek chat yanıtı"""
+    from app.api.v1.chat import ChatResponseNew
+    from app.services.telekom_store import telekom_store
+
+    sonuc = {"success": True, "data": {"payments": [p.as_dict() for p in telekom_store.payments(0)]}}
+    araclar = [
+        {"arac_adi": "telekom_get_payment_history", "parametreler": {"user_id": 0},
+         "durum": "tamamlandi", "sonuc": sonuc, "hata_mesaji": None}
+        for _ in range(arac_sayisi)
+    ]
+    metadata = {"yanit_id": "bench", "processing_time_ms": 412.7}
+    if include_tool_results:
+        metadata["tool_results"] = araclar
+    return ChatResponseNew(success=True, response="Ödeme geçmişiniz aşağıdadır. " * 10, user_id=0,
+                           session_id="SESSION_bench", confidence=0.95, tool_calls=araclar, metadata=metadata)
+
+
+def serilestirme_olc(args):
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+
+    from app.api.v1 import chat, telekom
+    from app.core import json_response
+    from app.services.bill_history import router_bill_history
+
+    if not json_response.ORJSON_AVAILABLE:
+        raise SystemExit("orjson kurulu değil: pip install orjson")
+
+    history = router_bill_history(17)
+    bills = history.slice(24)
+    gecmis = {"success": True, "data": {"bills": bills, "total_count": len(bills), "user_id": 17,
+                                         **history.aggregates(24)}}
+    paketler = {"success": True, "data": {"packages": telekom._AVAILABLE_PACKAGES,
+                                           "total_count": len(telekom._AVAILABLE_PACKAGES)}}
+    hazir_body = json_response.dumps(paketler)
+
+    route = next(r for r in chat.router.routes if r.path == "/chat/" and "POST" in r.methods)
+
+    def fastapi_model(model):
+        # is_coroutine=True iken serialize_response hiç beklemez; event loop kurmadan sür
+        coro = serialize_response(field=route.response_field, response_content=model)
+        try:
+            coro.send(None)
+        except StopIteration as stop:
+            content = stop.value
+        return content if isinstance(content, bytes) else JSONResponse(content).body
+
+    print(f"{'yanıt':>34} {'bayt':>7} {'fastapi(µs)':>12} {'orjson(µs)':>11} {'hazır(µs)':>10}")
+    for ad, content in (("/billing/history (limit=24)", gecmis), ("/packages/available", paketler)):
+        size = len(JSONResponse(jsonable_encoder(content)).body)
+        fastapi_us = olc_us(lambda: JSONResponse(jsonable_encoder(content)).body, args.iterations)
+        orjson_us = olc_us(lambda: json_response.FastJSONResponse(content).body, args.iterations)
+        hazir_us = olc_us(lambda: hazir_body, args.iterations) if content is paketler else float("nan")
+        print(f"{ad:>34} {size:>7} {fastapi_us:>12.1f} {orjson_us:>11.1f} {hazir_us:>10.2f}")
+        assert json.loads(json_response.dumps(content)) == json.loads(JSONResponse(jsonable_encoder(content)).body)
+
+    for include in (True, False):
+        model = chat_yaniti(args.tool_calls, include)
+        ad = f"/chat ({args.tool_calls} araç, tool_results={'var' if include else 'yok'})"
+        size = len(model.model_dump_json(by_alias=True))
+        fastapi_us = olc_us(lambda: fastapi_model(model), args.iterations // 10)
+        orjson_us = olc_us(lambda: model.model_dump_json(by_alias=True), args.iterations // 10)
+        print(f"{ad:>34} {size:>7} {fastapi_us:>12.1f} {orjson_us:>11.1f} {'-':>10}")
+
+
+async def uctan_uca(args) -> dict:
+    import random
+
+    import httpx
+    from fastapi import FastAPI
+
+    from app.api.v1 import telekom
+
+    logging.disable(logging.INFO)
+    app = FastAPI()
+    app.include_router(telekom.router, prefix="/api/v1")
+    tokens = [telekom.create_session(user_id) for user_id in range(200)]
+    rng = random.Random(7)
+    sonuc = {}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for ad, path in (("billing/history", "/api/v1/telekom/billing/history"),
+                         ("packages/available", "/api/v1/telekom/packages/available")):
+            payloads = [{"session_token": rng.choice(tokens), "limit": 24} for _ in range(args.requests)]
+            for payload in payloads[:200]:
+                await client.post(path, json=payload)
+            latencies = []
+            started = time.perf_counter()
+            for payload in payloads:
+                t0 = time.perf_counter()
+                response = await client.post(path, json=payload)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - t0) * 1000)
+            elapsed = time.perf_counter() - started
+            latencies.sort()
+            sonuc[ad] = {"rps": args.requests / elapsed, "p50": latencies[len(latencies) // 2],
+                         "p99": latencies[int(len(latencies) * 0.99) - 1]}
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON yanıt serileştirme maliyeti ölçümü")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--tool-calls", type=int, default=5, help="Örnek chat yanıtındaki araç çağrısı sayısı")
+    parser.add_argument("--requests", type=int, default=5000, help="Uçtan uca ölçümde endpoint başına istek")
+    parser.add_argument("--e2e-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.e2e_child:
+        print(json.dumps(asyncio.run(uctan_uca(args))))
+        return
+
+    logging.disable(logging.INFO)
+    serilestirme_olc(args)
+
+    print(f"\n{'endpoint':>20} {'FAST_JSON':>9} {'istek/s':>9} {'p50(ms)':>8} {'p99(ms)':>8}")
+    for fast in ("false", "true"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--e2e-child", "--requests", str(args.requests)],
+            env={**os.environ, "FAST_JSON": fast}, capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        for ad, r in json.loads(output).items():
+            print(f"{ad:>20} {fast:>9} {r['rps']:>9.0f} {r['p50']:>8.2f} {r['p99']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Model sunucusu (çok worker) ölçümü
+==================================
+K adet API worker sürecini iki dağıtım biçiminde karşılaştırır:
+  - local : her worker modeli kendisi yükler (INFERENCE_MODE=local)
+  - remote: tek model sunucusu, worker'lar Unix soketiyle bağlanır (INFERENCE_MODE=remote)
+Toplam istek/s, token/s ve süreçlerin toplam PSS belleği (paylaşılan mmap
+sayfaları süreçler arasında bölüştürülerek) raporlanır. Model ayarları
+ortam değişkenlerinden okunur (LLAMA_N_CTX, INFERENCE_BATCH_SLOTS ...).
+
+Örnek:
+    python backend/benchmarks/bench_model_server.py --model model.gguf --workers 4 --requests 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+MESSAGES = [
+    "bu ayki faturam ne kadar",
+    "kalan kotamı göster",
+    "konya yolundayım telefonum çekmiyor",
+    "hangi paketlere geçebilirim",
+    "internet hızımı test et",
+]
+
+
+def pss_mb(pid: int) -> float:
+    """Sürecin PSS belleği (MB); paylaşılan sayfalar paylaşan süreç sayısına bölünür"""
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+async def worker_async(args) -> dict:
+    from app.services.prompt_templates import gguf_prompt_olustur
+
+    if args.role == "worker-remote":
+        from app.services.model_server import RemoteInferenceClient
+
+        engine = RemoteInferenceClient(args.socket, connect_timeout=60)
+    else:
+        from app.services.inference_factory import cikarim_motoru_olustur
+
+        engine = cikarim_motoru_olustur(args.model)
+    engine.load_models()
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    tokens = 0
+
+    async def one(i: int):
+        nonlocal tokens
+        async with semaphore:
+            result = await engine.generate(gguf_prompt_olustur(MESSAGES[i % len(MESSAGES)]),
+                                           max_tokens=args.max_tokens, temperature=0.0)
+            tokens += result["completion_tokens"]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    report = {"seconds": elapsed, "tokens": tokens, "requests": args.requests, "pss_mb": pss_mb(os.getpid())}
+    await engine.shutdown()
+    return report
+
+
+def wait_for_socket(path: str, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(path)
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Model sunucusu açılmadı: {path}")
+
+
+def run_mode(args, mode: str) -> dict:
+    socket_path = os.path.join(tempfile.mkdtemp(), "model.sock")
+    server = None
+    if mode == "remote":
+        server = subprocess.Popen(
+            [sys.executable, "-m", "app.services.model_server", "--socket", socket_path, "--model", args.model],
+            cwd=BACKEND_ROOT, stderr=subprocess.DEVNULL,
+        )
+        wait_for_socket(socket_path, 300)
+
+    started = time.perf_counter()
+    workers = [
+        subprocess.Popen(
+            [sys.executable, __file__, "--role", f"worker-{mode}", "--model", args.model, "--socket", socket_path,
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+             "--max-tokens", str(args.max_tokens)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        for _ in range(args.workers)
+    ]
+    reports = []
+    for proc in workers:
+        out, _ = proc.communicate()
+        reports.append(json.loads(out.strip().splitlines()[-1]))
+    wall = time.perf_counter() - started
+
+    total_pss = sum(r["pss_mb"] for r in reports)
+    if server is not None:
+        total_pss += pss_mb(server.pid)
+        server.terminate()
+        server.wait(timeout=30)
+    requests = sum(r["requests"] for r in reports)
+    tokens = sum(r["tokens"] for r in reports)
+    return {"wall": wall, "rps": requests / wall, "tps": tokens / wall, "pss": total_pss}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model sunucusu çok worker ölçümü")
+    parser.add_argument("--model", required=True, help="GGUF model dosyası")
+    parser.add_argument("--workers", type=int, default=4, help="API worker süreci sayısı")
+    parser.add_argument("--requests", type=int, default=16, help="Worker başına istek")
+    parser.add_argument("--concurrency", type=int, default=4, help="Worker başına eşzamanlı istek")
+    parser.add_argument("--max-tokens", type=int, default=32)
+    parser.add_argument("--modes", nargs="+", default=["local", "remote"], choices=["local", "remote"])
+    parser.add_argument("--role", default="main", choices=["main", "worker-local", "worker-remote"])
+    parser.add_argument("--socket", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.role != "main":
+        print(json.dumps(asyncio.run(worker_async(args))))
+        return
+
+    print(f"{'mod':>7} {'süre(s)':>8} {'istek/s':>8} {'token/s':>8} {'toplam PSS(MB)':>15}")
+    for mode in args.modes:
+        r = run_mode(args, mode)
+        print(f"{mode:>7} {r['wall']:>8.2f} {r['rps']:>8.2f} {r['tps']:>8.1f} {r['pss']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
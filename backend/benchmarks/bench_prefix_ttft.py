@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Prompt öneki KV önbelleği - ilk token süresi (TTFT) ölçümü
+==========================================================
+Orkestratörün gerçek prompt'u ile önbellek kapalı/açık TTFT'yi karşılaştırır.
+Önbellek kapalıyken her istek tüm öneki yeniden prefill eder; worker havuzunda
+bunu sağlamak için istekler arasında model sıfırlanır (llama-cpp'nin örtük
+önek eşleşmesi farklı prompt'lar araya girdiğinde de kaybolur).
+
+Örnek:
+    python backend/benchmarks/bench_prefix_ttft.py --model model.gguf --requests 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.batch_scheduler import BatchScheduler
+from app.services.inference_executor import InferenceExecutor
+from app.services.prompt_cache import PromptPrefixCache
+from app.services.prompt_templates import GGUF_PROMPT_PREFIX, gguf_prompt_olustur
+
+MESSAGES = [
+    "bu ayki faturam ne kadar",
+    "kalan kotamı göster",
+    "konya yolundayım telefonum çekmiyor",
+    "hangi paketlere geçebilirim",
+    "internet hızımı test et",
+]
+
+
+def build_engine(args, backend: str, cached: bool):
+    from llama_cpp import Llama
+
+    def factory():
+        return Llama(
+            model_path=args.model,
+            n_ctx=args.n_ctx,
+            n_threads=args.threads,
+            n_batch=args.n_batch,
+            n_ubatch=args.n_batch,
+            verbose=False,
+        )
+
+    prefix_cache = PromptPrefixCache(GGUF_PROMPT_PREFIX) if cached else None
+    if backend == "batch":
+        return BatchScheduler(factory(), n_seq_max=4, n_ctx_per_seq=args.n_ctx, n_batch=args.n_batch,
+                              n_ubatch=args.n_batch, n_threads=args.threads, prefix_cache=prefix_cache)
+    return InferenceExecutor(factory, concurrency=1, prefix_cache=prefix_cache)
+
+
+async def measure(engine, backend: str, cached: bool, requests: int):
+    ttfts = []
+    for i in range(requests):
+        if backend == "pool" and not cached:
+            engine.models[0].reset()
+        result = await engine.generate(gguf_prompt_olustur(MESSAGES[i % len(MESSAGES)]), max_tokens=8, temperature=0.0)
+        ttfts.append(result["ttft_s"] * 1000)
+    ttfts.sort()
+    return statistics.median(ttfts), ttfts[min(len(ttfts) - 1, int(len(ttfts) * 0.95))]
+
+
+async def main_async(args):
+    print(f"{'backend':>8} {'önbellek':>9} {'p50 TTFT(ms)':>13} {'p95 TTFT(ms)':>13}")
+    for backend in args.backends:
+        for cached in (False, True):
+            engine = build_engine(args, backend, cached)
+            engine.load_models()
+            p50, p95 = await measure(engine, backend, cached, args.requests)
+            print(f"{backend:>8} {'açık' if cached else 'kapalı':>9} {p50:>13.1f} {p95:>13.1f}")
+            await engine.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prompt öneki TTFT ölçümü")
+    parser.add_argument("--model", required=True, help="GGUF model dosyası")
+    parser.add_argument("--backends", nargs="+", default=["pool", "batch"], choices=["pool", "batch"])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--n-ctx", type=int, default=2048)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--n-batch", type=int, default=512)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
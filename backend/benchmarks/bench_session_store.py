@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Oturum deposu ölçümü
+====================
+Her depo için üç aşama çalıştırılır:
+  1. dolum : N canlı oturum oluşturulur (create/s, RSS artışı)
+  2. doğrulama: rastgele token'larla get (get/s)
+  3. churn : kısa ömürlü girişlerle sahte saat ilerletilir; süpürücünün canlı
+     oturum sayısını sınırlı tuttuğu gösterilir (eski sözlük sınırsız büyürdü)
+
+Örnek:
+    python backend/benchmarks/bench_session_store.py --sessions 1000000 --backends memory sqlite
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.session_store import InMemorySessionStore, SQLiteSessionStore
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def depo_olustur(backend: str, args, clock):
+    if backend == "memory":
+        return InMemorySessionStore(ttl=7 * 24 * 3600, max_sessions=args.max_sessions, clock=clock)
+    path = str(Path(args.db_dir or tempfile.mkdtemp()) / f"sessions_{time.time_ns()}.db")
+    return SQLiteSessionStore(path, ttl=7 * 24 * 3600, max_sessions=args.max_sessions,
+                              sweep_interval=args.sweep_interval, clock=clock)
+
+
+def calistir(backend: str, args) -> dict:
+    clock = FakeClock()
+    store = depo_olustur(backend, args, clock)
+    rss_before = rss_mb()
+
+    started = time.perf_counter()
+    tokens = [store.create(i % 1000) for i in range(args.sessions)]
+    create_rate = args.sessions / (time.perf_counter() - started)
+    rss_delta = rss_mb() - rss_before
+
+    rng = random.Random(42)
+    sample = [rng.choice(tokens) for _ in range(args.lookups)]
+    started = time.perf_counter()
+    for token in sample:
+        store.get(token)
+    get_rate = args.lookups / (time.perf_counter() - started)
+    del tokens, sample
+
+    # Churn: her giriş 1 saatlik, saat her girişte 1 sn ilerler; kısa ömürlülerin tepe sayısı
+    peak = 0
+    for i in range(args.churn):
+        clock.now += 1.0
+        store.create(1, ttl=3600)
+        if i % 10000 == 9999:
+            peak = max(peak, len(store) - args.sessions)
+    clock.now += 8 * 24 * 3600
+    store.sweep()
+    return {
+        "create": create_rate,
+        "get": get_rate,
+        "rss": rss_delta,
+        "churn_peak": peak,
+        "live_after": len(store),
+        "expired": store.expired,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oturum deposu ölçümü")
+    parser.add_argument("--sessions", type=int, default=1000000, help="Canlı oturum sayısı")
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--churn", type=int, default=200000, help="Kısa ömürlü giriş sayısı")
+    parser.add_argument("--max-sessions", type=int, default=2000000)
+    parser.add_argument("--sweep-interval", type=float, default=60.0)
+    parser.add_argument("--backends", nargs="+", default=["memory", "sqlite"], choices=["memory", "sqlite"])
+    parser.add_argument("--db-dir", help="SQLite dosya dizini (ör. /dev/shm)")
+    args = parser.parse_args()
+
+    print(f"{'depo':>7} {'create/s':>10} {'get/s':>10} {'RSS artışı(MB)':>15} {'churn tepe':>11} {'süpürülen':>10} {'kalan':>7}")
+    for backend in args.backends:
+        r = calistir(backend, args)
+        print(f"{backend:>7} {r['create']:>10.0f} {r['get']:>10.0f} {r['rss']:>15.1f} {r['churn_peak']:>11} "
+              f"{r['expired']:>10} {r['live_after']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telekom veri deposu ölçekleme ölçümü
+====================================
+TelekomStore'a telekom_fixtures ile sentetik müşteri (hesap, paket, ödeme,
+destek talebi, servis profili) toplu yükler; yükleme süresini, bellek
+artışını, indeks okuma hızını ve yükleme sonrası tekil yazma
+(register_account) gecikmesini raporlar.
+`--sqlite` verilirse aynı veri geçici bir SQLite dosyasına yazılıp yeniden
+açılış süresi de ölçülür.
+
+Örnek:
+    python backend/benchmarks/bench_telekom_store.py --customers 100000 --sqlite
+"""
+
+import argparse
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.telekom_fixtures import fixture_email, fixture_records, fixture_user_ids
+from app.services.telekom_store import TelekomStore
+
+BOLGELER = ("İstanbul", "Ankara", "İzmir", "Bursa", "Antalya")
+TALEP_DURUMLARI = ("open", "in_progress", "resolved")
+
+
+def rss_mb() -> float:
+    """Anlık RSS (Linux'ta /proc, yoksa en yüksek RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def okuma_olc(store: TelekomStore, user_ids, ops: int) -> dict:
+    rng = random.Random(11)
+    ids = [rng.choice(user_ids) for _ in range(ops)]
+    emails = [fixture_email(uid) for uid in ids]
+    sonuc = {}
+
+    def olc(ad, func, args):
+        started = time.perf_counter()
+        for arg in args:
+            func(arg)
+        sonuc[ad] = len(args) / (time.perf_counter() - started)
+
+    olc("customer(user_id)", lambda uid: store.customer(uid).as_dict(), ids)
+    olc("account(email)", store.account, emails)
+    olc("payments(user_id)", store.payments, ids)
+    olc("tickets(user_id)", store.tickets, ids)
+    olc("customers_in_region", store.customers_in_region, [BOLGELER[i % 5] for i in range(ops // 100)])
+    olc("tickets_with_status", store.tickets_with_status, [TALEP_DURUMLARI[i % 3] for i in range(ops // 100)])
+    return sonuc
+
+
+def yazma_olc(store: TelekomStore, writes: int) -> list:
+    latencies = []
+    for i in range(writes):
+        started = time.perf_counter()
+        store.register_account(f"yeni{i}@example.com", "sifre123", f"Yeni {i}")
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Telekom veri deposu ölçekleme ölçümü")
+    parser.add_argument("--customers", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=200_000, help="Okuma ölçümü başına işlem")
+    parser.add_argument("--writes", type=int, default=50, help="Yükleme sonrası register_account sayısı")
+    parser.add_argument("--sqlite", action="store_true", help="SQLite kalıcılığını da ölç")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    store = TelekomStore()
+    rss_once = rss_mb()
+    started = time.perf_counter()
+    count = store.bulk_load(fixture_records(args.customers))
+    elapsed = time.perf_counter() - started
+    print(f"Yükleme: {count} kayıt ({args.customers} müşteri) {elapsed:.2f} s, "
+          f"{count / elapsed:,.0f} kayıt/s, RSS +{rss_mb() - rss_once:.0f} MB")
+    print(f"Depo: {store.durum()}")
+
+    print(f"\n{'okuma':>22} {'işlem/s':>12}")
+    for ad, hiz in okuma_olc(store, fixture_user_ids(args.customers), args.ops).items():
+        print(f"{ad:>22} {hiz:>12,.0f}")
+
+    latencies = yazma_olc(store, args.writes)
+    print(f"\nregister_account ({args.customers} müşteri varken): "
+          f"p50 {latencies[len(latencies) // 2]:.2f} ms, en kötü {latencies[-1]:.2f} ms")
+
+    if args.sqlite:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "telekom.db")
+            started = time.perf_counter()
+            disk = TelekomStore(db_path=path)
+            disk.bulk_load(fixture_records(args.customers))
+            print(f"\nSQLite yazma: {time.perf_counter() - started:.2f} s")
+            disk._conn.close()
+            started = time.perf_counter()
+            reopened = TelekomStore(db_path=path)
+            print(f"SQLite'tan açılış: {time.perf_counter() - started:.2f} s, "
+                  f"{reopened.durum()['customers']} müşteri")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Araç yürütme motoru ölçümü
+==========================
+Çok niyetli bir mesajın araç çağrılarını eski sıralı döngü ile
+ToolExecutionEngine üzerinden karşılaştırır. Gerçek Telekom araçları
+kullanılır; bağımlılık zincirini göstermek için yalnızca bu ölçümde tabloya
+get_current_bill'e bağımlı bir pay_bill eklenir (AI tablosunda ödeme yoktur).
+
+Örnek:
+    python backend/benchmarks/bench_tool_engine.py --repeat 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+from app.services.ai_endpoint_functions import ai_endpoint_functions
+from app.services.tool_engine import ToolExecutionEngine, ToolSpec, telekom_arac_tablosu
+
+SENARYO = [
+    "get_current_bill",
+    "get_remaining_quotas",
+    "check_network_status",
+    "test_internet_speed",
+    "pay_bill",
+]
+
+
+def _fatura_odeme_parametreleri(sonuclar: Dict[str, Any]) -> Dict[str, Any]:
+    """get_current_bill sonucundan pay_bill parametrelerini çıkar"""
+    fatura = (sonuclar.get("get_current_bill") or {}).get("data") or {}
+    return {"bill_id": fatura.get("bill_id"), "method": "credit_card"}
+
+
+def olcum_tablosu():
+    """AI tablosu + ölçüme özel, bağımlılıklı pay_bill"""
+    return telekom_arac_tablosu() + [
+        ToolSpec(
+            "pay_bill",
+            ai_endpoint_functions.telekom_pay_bill,
+            depends_on=("get_current_bill",),
+            bind=_fatura_odeme_parametreleri,
+        )
+    ]
+
+
+@dataclass
+class Cagri:
+    arac_adi: str
+    parametreler: Dict[str, Any]
+    durum: str = "bekliyor"
+    sonuc: Optional[Dict[str, Any]] = None
+    hata_mesaji: Optional[str] = None
+
+
+async def sirali(motor: ToolExecutionEngine) -> float:
+    """Eski davranış: her araç bir öncekini bekler"""
+    started = time.perf_counter()
+    fatura = None
+    for ad in SENARYO:
+        params: Dict[str, Any] = {}
+        if ad == "pay_bill":
+            params = {"bill_id": fatura["data"]["bill_id"], "method": "credit_card"}
+        sonuc = await motor.call(ad, params)
+        if ad == "get_current_bill":
+            fatura = sonuc
+    return time.perf_counter() - started
+
+
+async def motorla(motor: ToolExecutionEngine) -> float:
+    started = time.perf_counter()
+    cagrilar = await motor.run([Cagri(ad, {}) for ad in SENARYO])
+    assert all(c.durum == "tamamlandi" for c in cagrilar), [(c.arac_adi, c.hata_mesaji) for c in cagrilar]
+    return time.perf_counter() - started
+
+
+async def main_async(repeat: int):
+    motor = ToolExecutionEngine(olcum_tablosu())
+    for ad, fn in (("sıralı", sirali), ("motor", motorla)):
+        sureler = [await fn(motor) for _ in range(repeat)]
+        print(f"{ad:>7}: ortalama {sum(sureler) / len(sureler) * 1000:8.1f} ms  ({len(SENARYO)} araç)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Araç yürütme motoru ölçümü")
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args().repeat))
+
+
+if __name__ == "__main__":
+    main()
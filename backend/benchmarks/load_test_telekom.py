@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telekom API yük testi (asyncio + httpx)
+=======================================
+Sentetik müşterilerle dolu bir depoya karşı ağırlıklı bir endpoint karışımı
+gönderir ve endpoint başına p50/p95/p99 gecikmeyi raporlar.
+
+İki kip vardır:
+  - Süreç içi (varsayılan): fixture bu süreçteki depoya yüklenir, istekler
+    httpx ASGI transport ile telekom router'ına gider (ağ/uvicorn yok).
+  - Uzak sunucu (--base-url): sunucu aynı müşteri sayısı ve seed ile
+    başlatılmış olmalıdır:
+        TELEKOM_FIXTURE_CUSTOMERS=1000000 uvicorn app.main:app
+    Sürücü kullanıcıların email/şifresini fixture'dan türetir, sunucuya sormaz.
+
+Önce `--sessions` rastgele kullanıcı /auth/login ile giriş yapar (bu istekler
+de ölçülür); ardından karışım bu token'larla gönderilir.
+
+Örnek:
+    python backend/benchmarks/load_test_telekom.py --customers 100000 --requests 20000 --concurrency 64
+    python backend/benchmarks/load_test_telekom.py --base-url http://localhost:8000 --customers 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(BACKEND_ROOT))
+
+import httpx
+
+from app.services.telekom_fixtures import FIXTURE_PASSWORD, fixture_email, fixture_user_ids
+
+PREFIX = "/api/v1/telekom"
+BOLGELER = ("İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Trabzon")
+
+# (ad, yol, ağırlık, ek gövde üreticisi)
+KARISIM = (
+    ("customers/profile", "/customers/profile", 3, None),
+    ("billing/current", "/billing/current", 3, None),
+    ("billing/history", "/billing/history", 2, lambda rng: {"limit": rng.choice((6, 12, 24))}),
+    ("billing/payments", "/billing/payments", 2, None),
+    ("packages/current", "/packages/current", 2, None),
+    ("packages/quotas", "/packages/quotas", 1, None),
+    ("support/tickets/list", "/support/tickets/list", 2, None),
+    ("diagnostics/speed-test", "/diagnostics/speed-test", 1, None),
+    ("network/status", "/network/status", 1, lambda rng: {"region": rng.choice(BOLGELER)}),
+)
+
+
+def yuzdelik(sorted_values, q: float) -> float:
+    """En yakın sıra yöntemiyle yüzdelik (sıralı liste)"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))]
+
+
+class Olcum:
+    """Endpoint başına gecikme (ms) ve hata sayacı"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def gonder(self, client: httpx.AsyncClient, ad: str, path: str, payload: dict):
+        started = time.perf_counter()
+        try:
+            response = await client.post(PREFIX + path, json=payload)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.latencies[ad].append((time.perf_counter() - started) * 1000)
+        if not ok:
+            self.errors[ad] += 1
+        return response if ok else None
+
+    def rapor(self) -> dict:
+        sonuc = {}
+        for ad in sorted(self.latencies):
+            values = sorted(self.latencies[ad])
+            sonuc[ad] = {
+                "count": len(values),
+                "errors": self.errors[ad],
+                "p50_ms": yuzdelik(values, 0.50),
+                "p95_ms": yuzdelik(values, 0.95),
+                "p99_ms": yuzdelik(values, 0.99),
+                "max_ms": values[-1],
+            }
+        return sonuc
+
+
+async def paralel(isler, concurrency: int):
+    """İş listesini `concurrency` işçiyle sırayla tüket"""
+    iterator = iter(isler)
+
+    async def isci():
+        for is_ in iterator:
+            await is_()
+
+    await asyncio.gather(*(isci() for _ in range(concurrency)))
+
+
+async def giris_yap(client, olcum: Olcum, user_ids, args) -> list:
+    rng = random.Random(args.seed)
+    secilen = rng.sample(user_ids, min(args.sessions, len(user_ids)))
+    tokens = []
+
+    def is_(user_id):
+        async def calis():
+            payload = {"email": fixture_email(user_id), "password": FIXTURE_PASSWORD}
+            response = await olcum.gonder(client, "auth/login", "/auth/login", payload)
+            if response is not None:
+                tokens.append(response.json()["session_token"])
+        return calis
+
+    await paralel([is_(uid) for uid in secilen], args.concurrency)
+    if not tokens:
+        raise SystemExit("Hiçbir kullanıcı giriş yapamadı; sunucu aynı --customers/--seed ile mi başlatıldı?")
+    return tokens
+
+
+async def karisim_gonder(client, olcum: Olcum, tokens, args):
+    rng = random.Random(args.seed + 1)
+    isler = []
+    for ad, path, _, ek in rng.choices(KARISIM, weights=[k[2] for k in KARISIM], k=args.requests):
+        payload = {"session_token": rng.choice(tokens)} if ad != "network/status" else {}
+        if ek is not None:
+            payload.update(ek(rng))
+        isler.append(lambda ad=ad, path=path, payload=payload: olcum.gonder(client, ad, path, payload))
+    started = time.perf_counter()
+    await paralel(isler, args.concurrency)
+    return time.perf_counter() - started
+
+
+def surec_ici_uygulama(args):
+    """Fixture'ı bu süreçteki depoya yükle ve telekom router'ını ASGI uygulaması olarak döndür"""
+    from fastapi import FastAPI
+
+    from app.api.v1 import telekom
+    from app.services.telekom_fixtures import load_fixture
+
+    started = time.perf_counter()
+    load_fixture(telekom.STORE, args.customers, args.seed)
+    print(f"Fixture: {args.customers} müşteri {time.perf_counter() - started:.1f} s, depo {telekom.STORE.durum()}")
+
+    app = FastAPI()
+    app.include_router(telekom.router, prefix="/api/v1")
+    return app
+
+
+async def main_async(args):
+    if args.base_url:
+        client = httpx.AsyncClient(
+            base_url=args.base_url,
+            timeout=args.timeout,
+            limits=httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency),
+        )
+    else:
+        transport = httpx.ASGITransport(app=surec_ici_uygulama(args))
+        client = httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=args.timeout)
+
+    olcum = Olcum()
+    async with client:
+        tokens = await giris_yap(client, olcum, list(fixture_user_ids(args.customers)), args)
+        elapsed = await karisim_gonder(client, olcum, tokens, args)
+
+    rapor = olcum.rapor()
+    print(f"\n{args.requests} istek, {args.concurrency} eşzamanlı, {len(tokens)} oturum: "
+          f"{args.requests / elapsed:,.0f} istek/s")
+    print(f"{'endpoint':>24} {'adet':>7} {'hata':>5} {'p50(ms)':>8} {'p95(ms)':>8} {'p99(ms)':>8} {'max(ms)':>8}")
+    for ad, r in rapor.items():
+        print(f"{ad:>24} {r['count']:>7} {r['errors']:>5} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} "
+              f"{r['p99_ms']:>8.2f} {r['max_ms']:>8.2f}")
+
+    if args.json_out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_out)), exist_ok=True)
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "rps": args.requests / elapsed, "endpoints": rapor},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar: {args.json_out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Telekom API yük testi")
+    parser.add_argument("--base-url", default=None, help="Uzak sunucu; verilmezse süreç içi ASGI")
+    parser.add_argument("--customers", type=int, default=100_000, help="Fixture müşteri sayısı")
+    parser.add_argument("--seed", type=int, default=42, help="Fixture seed'i (sunucununkiyle aynı olmalı)")
+    parser.add_argument("--sessions", type=int, default=2000, help="Giriş yapacak kullanıcı sayısı")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--json-out", default=None, help="Sonuçları JSON olarak yaz")
+    args = parser.parse_args()
+
+    # Endpoint'ler her istekte INFO logu basar; ölçümü bozmasın
+    logging.disable(logging.INFO)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
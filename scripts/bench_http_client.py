@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP adapter verimi: requests + to_thread vs. paylaşılan aiohttp havuzu
+=======================================================================
+Ayrı bir süreçte yerel bir taklit model sunucusu (asyncio, HTTP/1.1
+keep-alive, isteğe bağlı gecikme) açar ve GenericHTTPAdapter çağrılarını verilen eşzamanlılıkta
+iki yoldan geçirir:
+
+  - eski: her çağrıda requests.post, asyncio.to_thread içinde (yeni TCP
+    bağlantısı, varsayılan thread havuzu sınırı)
+  - yeni: GenericHTTPAdapter -> paylaşılan aiohttp havuzu (keep-alive,
+    host başına limit, jitter'lı yeniden deneme)
+
+İstek/s, p50/p99 gecikme ve sunucunun kabul ettiği TCP bağlantı sayısını
+raporlar.
+
+Örnek:
+    PYTHONPATH=src python scripts/bench_http_client.py --concurrency 64 --requests 5000 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT / "src"))
+
+from benchmark.adapters.http_adapter import GenericHTTPAdapter
+from benchmark.http_client import aclose_client
+
+
+class TaklitSunucu:
+    """POST /predict -> {"output": ...}; bağlantıları sayar"""
+
+    def __init__(self, latency_s: float, baglantilar):
+        self.latency_s = latency_s
+        self.baglantilar = baglantilar  # süreçler arası sayaç (multiprocessing.Value)
+
+    async def _istemci(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        with self.baglantilar.get_lock():
+            self.baglantilar.value += 1
+        try:
+            while True:
+                istek_satiri = await reader.readline()
+                if not istek_satiri:
+                    break
+                uzunluk = 0
+                kapat = False
+                while True:
+                    satir = await reader.readline()
+                    if satir in (b"\r\n", b"\n", b""):
+                        break
+                    ad, _, deger = satir.decode("latin-1").partition(":")
+                    ad = ad.strip().lower()
+                    if ad == "content-length":
+                        uzunluk = int(deger.strip())
+                    elif ad == "connection" and deger.strip().lower() == "close":
+                        kapat = True
+                govde = json.loads(await reader.readexactly(uzunluk)) if uzunluk else {}
+                if self.latency_s:
+                    await asyncio.sleep(self.latency_s)
+                yanit = json.dumps({"output": f"yanıt: {govde.get('prompt', '')}"}, ensure_ascii=False).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(yanit)}\r\n".encode()
+                    + (b"Connection: close\r\n" if kapat else b"")
+                    + b"\r\n" + yanit
+                )
+                await writer.drain()
+                if kapat:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def calis(self, port_kuyrugu):
+        server = await asyncio.start_server(self._istemci, "127.0.0.1", 0, backlog=1024)
+        port_kuyrugu.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+
+def sunucu_sureci(latency_s: float, baglantilar, port_kuyrugu):
+    asyncio.run(TaklitSunucu(latency_s, baglantilar).calis(port_kuyrugu))
+
+
+def eski_adapter(endpoint: str):
+    """Değişiklik öncesi GenericHTTPAdapter.infer (requests, to_thread, bağlantı başına istek)"""
+    import requests
+
+    async def infer(prompt: str) -> bool:
+        def _post():
+            return requests.post(endpoint, json={"prompt": prompt, "temperature": 0}, timeout=60)
+
+        resp = await asyncio.to_thread(_post)
+        return resp.status_code == 200
+
+    return infer
+
+
+def yeni_adapter(endpoint: str):
+    adapter = GenericHTTPAdapter(endpoint, {})
+
+    async def infer(prompt: str) -> bool:
+        return (await adapter.infer(prompt)).success
+
+    return infer
+
+
+async def olc(ad: str, infer, baglantilar, istek: int, eszamanlilik: int) -> dict:
+    sem = asyncio.Semaphore(eszamanlilik)
+    gecikmeler = []
+    basarisiz = 0
+
+    async def tek(i: int):
+        nonlocal basarisiz
+        async with sem:
+            t0 = time.perf_counter()
+            if not await infer(f"soru {i}"):
+                basarisiz += 1
+            gecikmeler.append((time.perf_counter() - t0) * 1000)
+
+    await asyncio.gather(*(tek(i) for i in range(min(200, istek))))  # ısınma
+    onceki_baglanti = baglantilar.value
+    gecikmeler.clear()
+    started = time.perf_counter()
+    await asyncio.gather(*(tek(i) for i in range(istek)))
+    elapsed = time.perf_counter() - started
+    gecikmeler.sort()
+    return {
+        "yol": ad,
+        "istek/s": istek / elapsed,
+        "p50": gecikmeler[len(gecikmeler) // 2],
+        "p99": gecikmeler[int(len(gecikmeler) * 0.99) - 1],
+        "bağlantı": baglantilar.value - onceki_baglanti,
+        "hata": basarisiz,
+    }
+
+
+async def main_async(args, endpoint: str, baglantilar):
+    sonuclar = []
+    if not args.skip_legacy:
+        sonuclar.append(await olc("requests+to_thread", eski_adapter(endpoint), baglantilar, args.requests, args.concurrency))
+    sonuclar.append(await olc("aiohttp havuzu", yeni_adapter(endpoint), baglantilar, args.requests, args.concurrency))
+    await aclose_client()
+
+    print(f"{args.requests} istek, eşzamanlılık {args.concurrency}, sunucu gecikmesi {args.latency_ms} ms")
+    print(f"{'yol':>20} {'istek/s':>9} {'p50(ms)':>8} {'p99(ms)':>8} {'bağlantı':>9} {'hata':>5}")
+    for r in sonuclar:
+        print(f"{r['yol']:>20} {r['istek/s']:>9.0f} {r['p50']:>8.1f} {r['p99']:>8.1f} {r['bağlantı']:>9} {r['hata']:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP adapter verimi: requests vs. paylaşılan aiohttp havuzu")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Taklit sunucunun yanıt gecikmesi")
+    parser.add_argument("--skip-legacy", action="store_true", help="requests yolunu ölçme")
+    args = parser.parse_args()
+
+    # Sunucu ayrı süreçte: istemcinin event loop'u ile CPU paylaşmasın
+    baglantilar = multiprocessing.Value("i", 0)
+    port_kuyrugu = multiprocessing.Queue()
+    sunucu = multiprocessing.Process(
+        target=sunucu_sureci, args=(args.latency_ms / 1000, baglantilar, port_kuyrugu), daemon=True
+    )
+    sunucu.start()
+    try:
+        endpoint = f"http://127.0.0.1:{port_kuyrugu.get(timeout=30)}/predict"
+        asyncio.run(main_async(args, endpoint, baglantilar))
+    finally:
+        sunucu.terminate()
+
+
+if __name__ == "__main__":
+    main()
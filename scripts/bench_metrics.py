@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrik hesaplama süresi: örnek başına vs. toplu
+===============================================
+Örnek veri setini (data/telekom_test_set.sample.jsonl) --examples kadar
+çoğaltır; her örneğe beklenen çıktıdan türetilmiş bir model çıktısı üretir ve
+
+  - eski yol: compute_all_metrics (her örnek için ayrı BLEU/ROUGE/BERTScore,
+    BERTScore batch=1) — --baseline-limit örnekte ölçülüp ekstrapole edilir
+  - toplu yol: compute_metrics_batch (BLEU/ROUGE tek çağrı, BERTScore
+    --batch-size'lık batch'lerle, skorlayıcı bir kez yüklenir)
+
+sürelerini ve iki yolun örnek bazında aynı skorları verdiğini raporlar.
+
+Örnek:
+    PYTHONPATH=src python scripts/bench_metrics.py --examples 10000 --batch-size 64
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT / "src"))
+
+from benchmark.metrics import METRIC_NAMES, compute_all_metrics, compute_metrics_batch
+
+
+def veri_seti(path: Path, n: int, seed: int):
+    """Örnek seti n örneğe çoğalt; çıktı beklenen metnin bozulmuş bir kopyası"""
+    with path.open(encoding="utf-8") as f:
+        ornekler = [json.loads(line) for line in f if line.strip()]
+    rng = random.Random(seed)
+    tahminler, referanslar = [], []
+    for i in range(n):
+        ornek = ornekler[i % len(ornekler)]
+        referans = f"{ornek['expected_output']} ({ornek['input']})"
+        kelimeler = referans.split()
+        # Kelimelerin bir kısmını düşür / yer değiştir: skorlar 0 ile 1 arasında dağılsın
+        kelimeler = [k for k in kelimeler if rng.random() > 0.2] or kelimeler[:1]
+        if len(kelimeler) > 2 and rng.random() < 0.5:
+            a, b = rng.sample(range(len(kelimeler)), 2)
+            kelimeler[a], kelimeler[b] = kelimeler[b], kelimeler[a]
+        tahminler.append(" ".join(kelimeler))
+        referanslar.append(referans)
+    return tahminler, referanslar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metrik hesaplama: örnek başına vs. toplu")
+    parser.add_argument("--dataset", default=str(ROOT / "data" / "telekom_test_set.sample.jsonl"))
+    parser.add_argument("--examples", type=int, default=10_000)
+    parser.add_argument("--baseline-limit", type=int, default=200,
+                        help="Eski yolun ölçüleceği örnek sayısı (kalanı ekstrapole edilir)")
+    parser.add_argument("--batch-size", type=int, default=32, help="BERTScore batch boyutu")
+    parser.add_argument("--metrics", default=",".join(METRIC_NAMES), help="Virgülle ayrılmış metrikler")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    metrikler = tuple(m for m in args.metrics.split(",") if m)
+    tahminler, referanslar = veri_seti(Path(args.dataset), args.examples, args.seed)
+    limit = min(args.baseline_limit, args.examples)
+
+    # Metrik modüllerini ve BERTScore modelini ölçüm dışında yükle
+    compute_metrics_batch(tahminler[:2], referanslar[:2], args.batch_size, metrikler)
+
+    started = time.perf_counter()
+    eski = [compute_all_metrics(p, r) for p, r in zip(tahminler[:limit], referanslar[:limit])]
+    eski_s = (time.perf_counter() - started) / limit * args.examples
+
+    started = time.perf_counter()
+    toplu = compute_metrics_batch(tahminler, referanslar, args.batch_size, metrikler)
+    toplu_s = time.perf_counter() - started
+
+    print(f"{args.examples} örnek, metrikler: {', '.join(metrikler)}, BERTScore batch={args.batch_size}")
+    print(f"  örnek başına : {eski_s:8.1f} s  ({limit} örnekte ölçüldü, ekstrapole)")
+    print(f"  toplu        : {toplu_s:8.1f} s  ({args.examples / toplu_s:,.0f} örnek/s)")
+    print(f"  hızlanma     : {eski_s / toplu_s:8.1f}x")
+
+    for ad in metrikler:
+        fark = max(abs(a[ad] - b[ad]) for a, b in zip(eski, toplu[:limit]))
+        ortalama = sum(r[ad] for r in toplu) / len(toplu)
+        print(f"  {ad:>9}: ortalama {ortalama:.4f}, örnek bazında en büyük fark {fark:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,132 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
 
+from .gguf_runner import GGUFBatchRunner
 from .types import InferenceResult
 
 
+def _resolve_model_file(model_path: str) -> Optional[str]:
+    """A .gguf file, or the first .gguf in a directory; None if not on disk"""
+    p = Path(model_path).expanduser()
+    if p.is_file():
+        return str(p)
+    if p.is_dir():
+        files = sorted(p.glob("*.gguf"))
+        if files:
+            return str(files[0])
+    return None
+
+
 class LocalGGUFAdapter:
-    """Yerel gguf çalıştırma için kanca. Burada sadece arayüz sağlıyoruz.
+    """In-process llama.cpp backend (llama-cpp-python), no model server needed.
+
+    model_path: a local .gguf file / directory, or a Hugging Face repo id
+    (e.g. Choyrens/ChoyrensAI-Telekom-Agent-v6-gguf) together with a
+    `filename` param (glob allowed, e.g. "*Q5_K_M.gguf").
 
-    Not: Kullanıcı kendi sunucusunu/CLI'sini burada entegre edebilir.
-    Örn: llama.cpp server'a HTTP ile çağrı veya subprocess ile binary çağrısı.
+    The model is loaded once, on the first call, and served by a
+    GGUFBatchRunner: a dedicated thread that decodes every in-flight prompt
+    (up to `n_parallel` KV slots) in shared llama_decode steps, so the
+    runner's concurrent tasks are batched together. Call aclose() when done
+    to free the model.
+
+    Params: n_parallel (default BENCH_CONCURRENCY), n_ctx (per sequence),
+    n_batch, n_threads, n_gpu_layers, max_tokens, temperature, top_p, stop,
+    prompt_template (text with a "{prompt}" placeholder).
     """
 
-    def __init__(self, params: Dict[str, Any]):
+    def __init__(self, model_path: str, params: Dict[str, Any]):
+        self.model_path = model_path
         self.params = {"temperature": 0, **(params or {})}
+        self.prompt_template = self.params.get("prompt_template", "{prompt}")
+        self._engine = None
+        self._load_lock = asyncio.Lock()
+        self._load_error: Optional[str] = None
+
+    def _load(self) -> GGUFBatchRunner:
+        """Blocking: load the weights and start the batch runner"""
+        from llama_cpp import Llama
+
+        p = self.params
+        n_ctx = int(p.get("n_ctx", 4096))
+        n_batch = int(p.get("n_batch", 512))
+        n_threads = int(p.get("n_threads", os.cpu_count() or 4))
+        llama_kwargs = {
+            "n_ctx": n_ctx,
+            "n_threads": n_threads,
+            "n_batch": n_batch,
+            "n_gpu_layers": int(p.get("n_gpu_layers", 0)),
+            "verbose": False,
+        }
+
+        model_file = _resolve_model_file(self.model_path)
+        if model_file is not None:
+            llama = Llama(model_path=model_file, **llama_kwargs)
+        elif p.get("filename"):
+            # Downloads into the Hugging Face cache on first use (needs huggingface_hub)
+            llama = Llama.from_pretrained(repo_id=self.model_path, filename=p["filename"], **llama_kwargs)
+        else:
+            raise FileNotFoundError(f"GGUF model not found: {self.model_path} (set params.filename for a HF repo)")
+
+        engine = GGUFBatchRunner(
+            llama,
+            n_parallel=int(p.get("n_parallel", os.getenv("BENCH_CONCURRENCY", "4"))),
+            n_ctx_per_seq=n_ctx,
+            n_batch=n_batch,
+            n_threads=n_threads,
+        )
+        engine.start()
+        return engine
+
+    async def _get_engine(self):
+        async with self._load_lock:
+            if self._engine is None and self._load_error is None:
+                try:
+                    self._engine = await asyncio.to_thread(self._load)
+                except Exception as e:
+                    # Fail every example fast instead of reloading per call
+                    self._load_error = f"GGUF model load failed: {e}"
+        return self._engine
 
     async def infer(self, prompt: str, timeout: int = 60, max_retries: int = 3) -> InferenceResult:
-        # Placeholder: implementer tarafından doldurulacak
-        await asyncio.sleep(0.01)
-        return InferenceResult(raw_output="", success=False, error="GGUF adapter is not implemented")
+        engine = await self._get_engine()
+        if engine is None:
+            return InferenceResult(raw_output="", success=False, error=self._load_error)
+
+        gen_params = {
+            "max_tokens": int(self.params.get("max_tokens", 512)),
+            "temperature": float(self.params["temperature"]),
+            "top_p": float(self.params.get("top_p", 0.95)),
+            "stop": self.params.get("stop") or [],
+        }
+        try:
+            # On timeout the future is cancelled and the runner frees the slot
+            result = await asyncio.wait_for(
+                engine.submit(self.prompt_template.replace("{prompt}", prompt), **gen_params), timeout
+            )
+        except asyncio.TimeoutError:
+            return InferenceResult(raw_output="", success=False, error=f"GGUF generation timed out after {timeout}s")
+        except Exception as e:
+            return InferenceResult(raw_output="", success=False, error=str(e) or type(e).__name__)
 
+        completion = result["completion_tokens"]
+        # Decode rate after the first token (prefill excluded)
+        decode_s = result["generation_s"] - result["ttft_s"]
+        return InferenceResult(
+            raw_output=result["text"],
+            success=True,
+            error=None,
+            prompt_tokens=result["prompt_tokens"],
+            completion_tokens=completion,
+            tokens_per_second=(completion - 1) / decode_s if completion > 1 and decode_s > 0 else None,
+        )
 
+    async def aclose(self):
+        """Stop the runner thread and release the model"""
+        engine, self._engine = self._engine, None
+        if engine is not None:
+            await asyncio.to_thread(engine.close)
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import ctypes
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class _Job:
+    prompt: str
+    params: Dict[str, Any]
+    future: asyncio.Future
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _Sequence:
+    job: _Job
+    seq_id: int
+    prompt_tokens: List[int]
+    max_tokens: int
+    temperature: float
+    top_p: float
+    stop: List[str]
+    started_at: float = field(default_factory=time.perf_counter)
+    first_token_at: Optional[float] = None
+    n_past: int = 0
+    prefill_pos: int = 0
+    last_token: Optional[int] = None
+    logits_index: int = -1
+    completion_tokens: int = 0
+    text: str = ""
+    decoder: Any = field(default_factory=lambda: codecs.getincrementaldecoder("utf-8")(errors="ignore"))
+
+    @property
+    def prefilling(self) -> bool:
+        return self.prefill_pos < len(self.prompt_tokens)
+
+
+class GGUFBatchRunner:
+    """Continuous batching on llama.cpp's multi-sequence batch API.
+
+    A dedicated thread owns a context with `n_parallel` KV sequences. Every
+    step decodes the next token of each generating sequence plus prompt
+    chunks of newly admitted ones (chunked prefill) in a single llama_decode
+    call; a finished sequence's slot goes straight to the next queued prompt.
+
+    submit() may be called from any event loop; the result dict (text,
+    prompt_tokens, completion_tokens, ttft_s, generation_s, finish_reason)
+    is delivered on the caller's loop.
+    """
+
+    def __init__(self, llama: Any, n_parallel: int = 4, n_ctx_per_seq: int = 4096, n_batch: int = 512,
+                 n_threads: int = 4):
+        self.llama = llama
+        self.n_parallel = max(1, n_parallel)
+        self.n_ctx_per_seq = n_ctx_per_seq
+        self.n_batch = max(n_batch, self.n_parallel)
+        self.n_threads = n_threads
+
+        self._ctx = None
+        self._batch = None
+        self._n_vocab = 0
+        self._eos = -1
+        self._pending: "queue.Queue[_Job]" = queue.Queue()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._free_slots: List[int] = []
+        self._active: Dict[int, _Sequence] = {}
+
+    def start(self):
+        """Create the multi-sequence context and start the decode thread (blocking)"""
+        import llama_cpp
+
+        params = llama_cpp.llama_context_default_params()
+        params.n_ctx = self.n_ctx_per_seq * self.n_parallel
+        params.n_batch = self.n_batch
+        params.n_ubatch = self.n_batch
+        params.n_seq_max = self.n_parallel
+        params.n_threads = self.n_threads
+        params.n_threads_batch = self.n_threads
+        if hasattr(params, "kv_unified"):
+            params.kv_unified = True
+
+        init = getattr(llama_cpp, "llama_init_from_model", None) or llama_cpp.llama_new_context_with_model
+        self._ctx = init(self.llama.model, params)
+        if not self._ctx:
+            raise RuntimeError("Could not create the llama.cpp batch context")
+        self._batch = llama_cpp.llama_batch_init(self.n_batch, 0, self.n_parallel)
+        self._n_vocab = self.llama.n_vocab()
+        self._eos = self.llama.token_eos()
+        self._free_slots = list(range(self.n_parallel))
+        self._thread = threading.Thread(target=self._loop, name="bench-gguf", daemon=True)
+        self._thread.start()
+
+    def submit(self, prompt: str, **params) -> asyncio.Future:
+        if self._stop.is_set() or self._thread is None:
+            raise RuntimeError("GGUF runner is not running")
+        job = _Job(prompt, params, asyncio.get_running_loop().create_future())
+        # A cancelled waiter (timeout) frees its slot at the next step
+        job.future.add_done_callback(lambda f: job.cancelled.set() if f.cancelled() else None)
+        self._pending.put(job)
+        self._wakeup.set()
+        return job.future
+
+    # -- decode thread -------------------------------------------------
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._admit()
+            if not self._active:
+                self._wakeup.wait(timeout=0.1)
+                self._wakeup.clear()
+                continue
+            try:
+                self._step()
+            except Exception as e:
+                for seq in list(self._active.values()):
+                    self._finish(seq, error=e)
+
+    def _admit(self):
+        while self._free_slots:
+            try:
+                job = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            if job.cancelled.is_set():
+                continue
+            params = job.params
+            max_tokens = int(params.get("max_tokens") or 128)
+            # Prompt + completion must fit in the sequence's context
+            keep = max(1, self.n_ctx_per_seq - max_tokens)
+            tokens = self.llama.tokenize(job.prompt.encode("utf-8"), add_bos=True, special=True)[-keep:]
+            seq = _Sequence(
+                job=job,
+                seq_id=self._free_slots.pop(),
+                prompt_tokens=tokens,
+                max_tokens=max_tokens,
+                temperature=float(params.get("temperature", 0.0)),
+                top_p=float(params.get("top_p", 1.0)),
+                stop=list(params.get("stop") or []),
+            )
+            self._active[seq.seq_id] = seq
+
+    def _step(self):
+        import llama_cpp
+
+        batch = self._batch
+        n = 0
+
+        def add(token: int, pos: int, seq_id: int, want_logits: bool):
+            nonlocal n
+            batch.token[n] = token
+            batch.pos[n] = pos
+            batch.n_seq_id[n] = 1
+            batch.seq_id[n][0] = seq_id
+            batch.logits[n] = 1 if want_logits else 0
+            n += 1
+
+        # Generating sequences first: one token each
+        for seq in self._active.values():
+            seq.logits_index = -1
+            if not seq.prefilling and seq.last_token is not None:
+                seq.logits_index = n
+                add(seq.last_token, seq.n_past, seq.seq_id, True)
+                seq.n_past += 1
+
+        # Remaining room goes to prompt prefill
+        for seq in self._active.values():
+            if n >= self.n_batch:
+                break
+            if not seq.prefilling:
+                continue
+            chunk = seq.prompt_tokens[seq.prefill_pos:seq.prefill_pos + (self.n_batch - n)]
+            for i, token in enumerate(chunk):
+                last = seq.prefill_pos + i == len(seq.prompt_tokens) - 1
+                if last:
+                    seq.logits_index = n
+                add(token, seq.n_past, seq.seq_id, last)
+                seq.n_past += 1
+            seq.prefill_pos += len(chunk)
+
+        batch.n_tokens = n
+        rc = llama_cpp.llama_decode(self._ctx, batch)
+        if rc != 0:
+            raise RuntimeError(f"llama_decode returned {rc}")
+
+        for seq in list(self._active.values()):
+            if seq.job.cancelled.is_set():
+                self._finish(seq, reason="cancelled")
+            elif seq.logits_index >= 0:
+                ptr = llama_cpp.llama_get_logits_ith(self._ctx, seq.logits_index)
+                self._accept(seq, self._sample(ptr, seq.temperature, seq.top_p))
+
+    def _sample(self, logits_ptr, temperature: float, top_p: float) -> int:
+        import numpy as np
+
+        logits = np.ctypeslib.as_array(ctypes.cast(logits_ptr, ctypes.POINTER(ctypes.c_float)), shape=(self._n_vocab,))
+        if temperature <= 0:
+            return int(logits.argmax())
+        scaled = logits.astype(np.float64) / temperature
+        scaled -= scaled.max()
+        probs = np.exp(scaled)
+        probs /= probs.sum()
+        if top_p < 1.0:
+            order = np.argsort(-probs)
+            keep = order[:int(np.searchsorted(np.cumsum(probs[order]), top_p)) + 1]
+            return int(np.random.choice(keep, p=probs[keep] / probs[keep].sum()))
+        return int(np.random.choice(self._n_vocab, p=probs))
+
+    def _accept(self, seq: _Sequence, token: int):
+        if token == self._eos:
+            self._finish(seq, reason="stop")
+            return
+        if seq.first_token_at is None:
+            seq.first_token_at = time.perf_counter()
+        seq.completion_tokens += 1
+        seq.last_token = token
+        seq.text += seq.decoder.decode(self.llama.detokenize([token]))
+        for stop in seq.stop:
+            idx = seq.text.find(stop)
+            if idx != -1:
+                seq.text = seq.text[:idx]
+                self._finish(seq, reason="stop")
+                return
+        if seq.completion_tokens >= seq.max_tokens or seq.n_past + 1 >= self.n_ctx_per_seq:
+            self._finish(seq, reason="length")
+
+    def _finish(self, seq: _Sequence, reason: str = "stop", error: Optional[Exception] = None):
+        self._active.pop(seq.seq_id, None)
+        self._seq_rm(seq.seq_id)
+        self._free_slots.append(seq.seq_id)
+        now = time.perf_counter()
+        result = {
+            "text": seq.text + seq.decoder.decode(b"", final=True),
+            "finish_reason": reason,
+            "prompt_tokens": len(seq.prompt_tokens),
+            "completion_tokens": seq.completion_tokens,
+            "queue_wait_s": seq.started_at - seq.job.enqueued_at,
+            "ttft_s": (seq.first_token_at or now) - seq.started_at,
+            "generation_s": now - seq.started_at,
+        }
+        self._resolve(seq.job, result, error)
+
+    @staticmethod
+    def _resolve(job: _Job, result: Optional[Dict[str, Any]], error: Optional[Exception] = None):
+        future = job.future
+
+        def resolve():
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        future.get_loop().call_soon_threadsafe(resolve)
+
+    def _seq_rm(self, seq_id: int):
+        # The KV cache API was renamed across llama.cpp versions
+        import llama_cpp
+
+        if hasattr(llama_cpp, "llama_memory_seq_rm"):
+            llama_cpp.llama_memory_seq_rm(llama_cpp.llama_get_memory(self._ctx), seq_id, -1, -1)
+        elif hasattr(llama_cpp, "llama_kv_self_seq_rm"):
+            llama_cpp.llama_kv_self_seq_rm(self._ctx, seq_id, -1, -1)
+        else:
+            llama_cpp.llama_kv_cache_seq_rm(self._ctx, seq_id, -1, -1)
+
+    def close(self):
+        """Stop the thread, fail outstanding requests and free the context (blocking)"""
+        import llama_cpp
+
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        error = RuntimeError("GGUF runner closed")
+        for seq in list(self._active.values()):
+            self._finish(seq, error=error)
+        while True:
+            try:
+                self._resolve(self._pending.get_nowait(), None, error)
+            except queue.Empty:
+                break
+        if self._batch is not None:
+            llama_cpp.llama_batch_free(self._batch)
+            self._batch = None
+        if self._ctx is not None:
+            llama_cpp.llama_free(self._ctx)
+            self._ctx = None
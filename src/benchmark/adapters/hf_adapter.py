@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import asyncio
 import os
 from typing import Any, Dict, Optional
 
-import requests
-
+from ..http_client import error_text, get_client
 from .types import InferenceResult
 
 
@@ -28,26 +26,16 @@ class HFInferenceAdapter:
             "options": {"wait_for_model": True},
         }
 
-        last_error: Optional[str] = None
-        for attempt in range(max_retries):
-            try:
-                # requests is blocking; run in thread to keep async contract
-                def _post():
-                    return requests.post(url, headers=headers, json=payload, timeout=timeout)
-
-                resp = await asyncio.to_thread(_post)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    # Model outputs vary; try to normalize to string
-                    if isinstance(data, list) and data and isinstance(data[0], dict) and "generated_text" in data[0]:
-                        text = data[0]["generated_text"]
-                    else:
-                        text = str(data)
-                    return InferenceResult(raw_output=text, success=True, error=None)
-                last_error = f"HTTP {resp.status_code}: {resp.text[:200]}"
-            except Exception as e:
-                last_error = str(e)
-            await asyncio.sleep(min(2 ** attempt, 8))
-        return InferenceResult(raw_output="", success=False, error=last_error)
-
-
+        try:
+            resp = await get_client().post_json(url, payload, headers=headers, timeout=timeout, max_retries=max_retries)
+            if resp.status_code == 200:
+                data = resp.json()
+                # Model outputs vary; try to normalize to string
+                if isinstance(data, list) and data and isinstance(data[0], dict) and "generated_text" in data[0]:
+                    text = data[0]["generated_text"]
+                else:
+                    text = str(data)
+                return InferenceResult(raw_output=text, success=True, error=None)
+            return InferenceResult(raw_output="", success=False, error=f"HTTP {resp.status_code}: {resp.text[:200]}")
+        except Exception as e:
+            return InferenceResult(raw_output="", success=False, error=error_text(e))
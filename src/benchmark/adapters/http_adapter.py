@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import asyncio
-from typing import Any, Dict, Optional
-
-import requests
+from typing import Any, Dict
 
+from ..http_client import error_text, get_client
 from .types import InferenceResult
 
 
@@ -15,21 +13,12 @@ class GenericHTTPAdapter:
 
     async def infer(self, prompt: str, timeout: int = 60, max_retries: int = 3) -> InferenceResult:
         payload = {"prompt": prompt, **self.params}
-        last_error: Optional[str] = None
-        for attempt in range(max_retries):
-            try:
-                def _post():
-                    return requests.post(self.endpoint, json=payload, timeout=timeout)
-
-                resp = await asyncio.to_thread(_post)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    text = data.get("output") or data.get("text") or str(data)
-                    return InferenceResult(raw_output=text, success=True, error=None)
-                last_error = f"HTTP {resp.status_code}: {resp.text[:200]}"
-            except Exception as e:
-                last_error = str(e)
-            await asyncio.sleep(min(2 ** attempt, 8))
-        return InferenceResult(raw_output="", success=False, error=last_error)
-
-
+        try:
+            resp = await get_client().post_json(self.endpoint, payload, timeout=timeout, max_retries=max_retries)
+            if resp.status_code == 200:
+                data = resp.json()
+                text = data.get("output") or data.get("text") or str(data)
+                return InferenceResult(raw_output=text, success=True, error=None)
+            return InferenceResult(raw_output="", success=False, error=f"HTTP {resp.status_code}: {resp.text[:200]}")
+        except Exception as e:
+            return InferenceResult(raw_output="", success=False, error=error_text(e))
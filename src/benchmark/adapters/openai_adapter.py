@@ -4,6 +4,7 @@ import asyncio
 import os
 from typing import Any, Dict, Optional
 
+from ..http_client import get_client
 from .types import InferenceResult
 
 
@@ -21,7 +22,8 @@ class OpenAIAdapter:
         # Import here to avoid global dependency if not used
         from openai import AsyncOpenAI
 
-        client = AsyncOpenAI(api_key=api_key)
+        # Reuse the shared keep-alive pool instead of a new connection pool per call
+        client = AsyncOpenAI(api_key=api_key, http_client=get_client().httpx_client)
         last_error: Optional[str] = None
 
         for attempt in range(max_retries):
@@ -9,5 +9,7 @@ class InferenceResult:
     raw_output: str
     success: bool
     error: Optional[str]
-
-
+    # Filled in by backends that see the tokenizer (currently the local GGUF adapter)
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    tokens_per_second: Optional[float] = None
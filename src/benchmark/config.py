@@ -24,6 +24,10 @@ class BenchmarkConfig:
     timeout_seconds: int = 60
     max_retries: int = 3
     concurrency: int = 4
+    metrics_batch_size: int = 32  # BERTScore batch size for the per-model metrics stage
+    # --parallel-models: budget shared by all models running in one event loop
+    global_concurrency: int = 16
+    backend_concurrency: Dict[str, int] = field(default_factory=dict)  # e.g. {"hf": 2, "openai": 8}
     do_llm_eval: bool = True
     eval_model: str = os.getenv("BENCH_EVAL_MODEL", "Qwen/Qwen2-7B-Instruct")
     eval_backend: Literal["openai", "hf", "mock"] = os.getenv("BENCH_EVAL_BACKEND", "hf")  # hf by default
@@ -48,6 +52,17 @@ def load_models_config(path: str) -> List[ModelConfig]:
     return models
 
 
+def _parse_backend_limits(raw: str) -> Dict[str, int]:
+    """"hf=2,openai=8" -> {"hf": 2, "openai": 8}"""
+    limits: Dict[str, int] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        backend, _, value = item.partition("=")
+        limits[backend.strip().lower()] = int(value)
+    return limits
+
+
 def load_benchmark_env() -> BenchmarkConfig:
     return BenchmarkConfig(
         openai_api_key=os.getenv("OPENAI_API_KEY"),
@@ -55,6 +70,9 @@ def load_benchmark_env() -> BenchmarkConfig:
         timeout_seconds=int(os.getenv("BENCH_TIMEOUT", "60")),
         max_retries=int(os.getenv("BENCH_MAX_RETRIES", "3")),
         concurrency=int(os.getenv("BENCH_CONCURRENCY", "4")),
+        metrics_batch_size=int(os.getenv("BENCH_METRICS_BATCH_SIZE", "32")),
+        global_concurrency=int(os.getenv("BENCH_GLOBAL_CONCURRENCY", "16")),
+        backend_concurrency=_parse_backend_limits(os.getenv("BENCH_BACKEND_CONCURRENCY", "")),
         do_llm_eval=os.getenv("BENCH_DO_LLM_EVAL", "true").lower() == "true",
         eval_model=os.getenv("BENCH_EVAL_MODEL", "Qwen/Qwen2-7B-Instruct"),
         eval_backend=os.getenv("BENCH_EVAL_BACKEND", "hf"),
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+# Pool sizing and retry policy (shared by every adapter in the process)
+MAX_CONNECTIONS = int(os.getenv("BENCH_HTTP_MAX_CONNECTIONS", "128"))
+PER_HOST_CONNECTIONS = int(os.getenv("BENCH_HTTP_PER_HOST", "64"))
+KEEPALIVE_EXPIRY = float(os.getenv("BENCH_HTTP_KEEPALIVE_S", "30"))
+BACKOFF_BASE = float(os.getenv("BENCH_HTTP_BACKOFF_BASE", "1.0"))
+BACKOFF_CAP = float(os.getenv("BENCH_HTTP_BACKOFF_CAP", "8.0"))
+# Only the OpenAI SDK pool (httpx) can speak HTTP/2; needs the optional h2 package
+HTTP2 = os.getenv("BENCH_HTTP2", "auto").lower() in ("auto", "true") and importlib.util.find_spec("h2") is not None
+
+# Worth retrying: timeouts, throttling and server-side errors
+RETRY_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Full-jitter exponential backoff; honours a numeric Retry-After header"""
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_CAP)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def error_text(exc: BaseException) -> str:
+    # Timeouts often carry an empty message
+    return str(exc) or type(exc).__name__
+
+
+@dataclass
+class HTTPResponse:
+    """Fully read response (the connection is already back in the pool)"""
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class SharedHTTPClient:
+    """Keep-alive connection pool with per-host limits and retrying requests.
+
+    Plain JSON endpoints (HTTP / HF adapters, HF evaluator) go through an
+    aiohttp session; the OpenAI SDK only accepts an httpx client, so that
+    one is created lazily on first use. One instance per event loop (see
+    get_client): pooled connections are tied to the loop that opened them.
+    Each library is imported on first use, so runs that never make an HTTP
+    call (GGUF, mock) need neither.
+    """
+
+    def __init__(self):
+        self._session = None
+        self._httpx: Optional["httpx.AsyncClient"] = None
+
+    def _aiohttp_session(self):
+        if self._session is None:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=MAX_CONNECTIONS,
+                    limit_per_host=PER_HOST_CONNECTIONS,
+                    keepalive_timeout=KEEPALIVE_EXPIRY,
+                )
+            )
+        return self._session
+
+    @property
+    def httpx_client(self) -> "httpx.AsyncClient":
+        """Pool for AsyncOpenAI(http_client=...), HTTP/2 when h2 is installed"""
+        if self._httpx is None:
+            import httpx
+
+            self._httpx = httpx.AsyncClient(
+                http2=HTTP2,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=PER_HOST_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._httpx
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60,
+        max_retries: int = 3,
+    ) -> HTTPResponse:
+        """POST with retries on connection errors, timeouts and RETRY_STATUS.
+
+        Returns the last response (which may be a non-200 one); raises the
+        last exception if the final attempt failed without a response.
+        """
+        import aiohttp
+
+        session = self._aiohttp_session()
+        attempts = max(1, max_retries)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        for attempt in range(attempts):
+            try:
+                async with session.post(url, json=payload, headers=headers, timeout=client_timeout) as r:
+                    resp = HTTPResponse(r.status, r.headers, await r.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            if resp.status_code not in RETRY_STATUS or attempt == attempts - 1:
+                return resp
+            await asyncio.sleep(backoff_delay(attempt, resp.headers.get("Retry-After")))
+        raise AssertionError("unreachable")
+
+    async def aclose(self):
+        if self._session is not None:
+            await self._session.close()
+        if self._httpx is not None:
+            await self._httpx.aclose()
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SharedHTTPClient]" = weakref.WeakKeyDictionary()
+
+
+def get_client() -> SharedHTTPClient:
+    """Shared client of the running event loop (created on first use)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = SharedHTTPClient()
+    return client
+
+
+async def aclose_client():
+    """Close the running loop's shared client (call before the loop ends)"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -5,6 +5,8 @@ import json
 import os
 from typing import Any, Dict, Optional
 
+from .http_client import error_text, get_client
+
 
 EVAL_PROMPT = (
     "Aşağıda telekom domain'inde bir soru, beklenen yanıt ve model yanıtı var. "
@@ -31,7 +33,7 @@ async def llm_grade_openai(
         return {"score": 0.0, "reasons": f"Missing API key env: {api_key_env}"}
 
     prompt = EVAL_PROMPT.format(input=input_text, expected=expected, prediction=prediction)
-    client = AsyncOpenAI(api_key=api_key)
+    client = AsyncOpenAI(api_key=api_key, http_client=get_client().httpx_client)
     last_error: Optional[str] = None
     for attempt in range(max_retries):
         try:
@@ -72,9 +74,6 @@ async def llm_grade_hf(
 
     Modelden {"score": float, "reasons": str} formatında JSON beklenir.
     """
-    import os
-    import requests
-
     token = os.getenv(api_key_env)
     if not token:
         return {"score": 0.0, "reasons": f"Missing API key env: {api_key_env}"}
@@ -88,32 +87,26 @@ async def llm_grade_hf(
         "options": {"wait_for_model": True},
     }
 
-    last_error: Optional[str] = None
-    for attempt in range(max_retries):
-        try:
-            def _post():
-                return requests.post(url, headers=headers, json=payload, timeout=timeout)
-
-            resp = await asyncio.to_thread(_post)
-            if resp.status_code == 200:
-                data = resp.json()
-                if isinstance(data, list) and data and isinstance(data[0], dict) and "generated_text" in data[0]:
-                    text = data[0]["generated_text"]
-                else:
-                    text = str(data)
-                try:
-                    parsed = json.loads(text)
-                    score = float(parsed.get("score", 0.0))
-                    reasons = str(parsed.get("reasons", ""))
-                    score = max(0.0, min(1.0, score))
-                    return {"score": score, "reasons": reasons}
-                except Exception:
-                    return {"score": 0.0, "reasons": f"Invalid JSON from evaluator: {text[:200]}"}
-            last_error = f"HTTP {resp.status_code}: {resp.text[:200]}"
-        except Exception as e:
-            last_error = str(e)
-        await asyncio.sleep(min(2 ** attempt, 8))
-    return {"score": 0.0, "reasons": last_error or "evaluator error"}
+    try:
+        resp = await get_client().post_json(url, payload, headers=headers, timeout=timeout, max_retries=max_retries)
+        if resp.status_code != 200:
+            return {"score": 0.0, "reasons": f"HTTP {resp.status_code}: {resp.text[:200]}"}
+        data = resp.json()
+    except Exception as e:
+        return {"score": 0.0, "reasons": error_text(e)}
+    if isinstance(data, list) and data and isinstance(data[0], dict) and "generated_text" in data[0]:
+        text = data[0]["generated_text"]
+    else:
+        text = str(data)
+    try:
+        parsed = json.loads(text)
+        score = float(parsed.get("score", 0.0))
+        reasons = str(parsed.get("reasons", ""))
+        score = max(0.0, min(1.0, score))
+        return {"score": score, "reasons": reasons}
+    except Exception:
+        return {"score": 0.0, "reasons": f"Invalid JSON from evaluator: {text[:200]}"}
+
 
 async def llm_grade_mock(
     input_text: str, expected: str, prediction: str, **_: Any
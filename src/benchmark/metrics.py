@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict
+import sys
+import threading
+from typing import Dict, List, Sequence
 
 import evaluate
 
@@ -86,3 +88,109 @@ def compute_all_metrics(prediction: str, reference: str) -> Dict[str, float]:
     }
 
 
+
+
+# ---------------------------------------------------------------------------
+# Batched metrics: one call per metric for all outputs of a model
+# ---------------------------------------------------------------------------
+
+METRIC_NAMES = ("bleu", "rouge", "bertscore")
+
+# evaluate modules keep per-instance state (Arrow cache, cached scorer) and
+# are shared process-wide; models scored from different threads take turns
+_batch_lock = threading.Lock()
+
+
+def _bleu_internals():
+    # evaluate's BLEU only reports a corpus score. Its module ships the
+    # tokenizer and the n-gram scorer it uses; calling them directly gives the
+    # exact per-example score without one evaluate.compute() call per pair.
+    module = sys.modules.get(type(_lazy_bleu()).__module__)
+    compute = getattr(module, "compute_bleu", None)
+    tokenizer_cls = getattr(module, "Tokenizer13a", None)
+    if compute is None or tokenizer_cls is None:
+        return None
+    return compute, tokenizer_cls()
+
+
+def _batch_bleu(predictions: Sequence[str], references: Sequence[str]) -> List[float]:
+    internals = _bleu_internals()
+    if internals is None:
+        return [compute_bleu(p, r) for p, r in zip(predictions, references)]
+    compute, tokenizer = internals
+    scores = []
+    for pred, ref in zip(predictions, references):
+        try:
+            scores.append(float(compute([[tokenizer(ref)]], [tokenizer(pred)], max_order=4, smooth=False)[0]))
+        except Exception:
+            scores.append(0.0)
+    return scores
+
+
+def _batch_rouge(predictions: Sequence[str], references: Sequence[str]) -> List[float]:
+    # use_aggregator=False returns one score per pair from a single call
+    result = _lazy_rouge().compute(
+        predictions=list(predictions), references=list(references), use_aggregator=False
+    )
+    scores = result["rougeLsum"] if "rougeLsum" in result else result["rougeL"]
+    return [float(s) for s in scores]
+
+
+def _batch_bertscore(
+    predictions: Sequence[str], references: Sequence[str], batch_size: int
+) -> List[float]:
+    # The evaluate module caches its BERTScorer, so the scorer model is loaded
+    # once per process and reused for every model in the run
+    result = _lazy_bertscore().compute(
+        predictions=list(predictions), references=list(references), lang="tr", batch_size=batch_size
+    )
+    return [float(f1) for f1 in result["f1"]]
+
+
+def compute_metrics_batch(
+    predictions: Sequence[str],
+    references: Sequence[str],
+    bertscore_batch_size: int = 32,
+    metrics: Sequence[str] = METRIC_NAMES,
+) -> List[Dict[str, float]]:
+    """Per-example BLEU/ROUGE/BERTScore for a whole set of outputs.
+
+    Returns one dict per pair, in input order, with the same keys and values
+    as compute_all_metrics. Empty pairs score 0.0 and are left out of the
+    batched calls; a metric that fails scores 0.0 for every pair.
+    Metrics not listed in `metrics` are reported as 0.0.
+    """
+    if len(predictions) != len(references):
+        raise ValueError("predictions and references must have the same length")
+    unknown = set(metrics) - set(METRIC_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+
+    rows = [{name: 0.0 for name in METRIC_NAMES} for _ in predictions]
+    index: List[int] = []
+    preds: List[str] = []
+    refs: List[str] = []
+    for i, (prediction, reference) in enumerate(zip(predictions, references)):
+        pred = (prediction or "").strip()
+        ref = (reference or "").strip()
+        if pred and ref:
+            index.append(i)
+            preds.append(pred)
+            refs.append(ref)
+    if not index:
+        return rows
+
+    scorers = {
+        "bleu": lambda: _batch_bleu(preds, refs),
+        "rouge": lambda: _batch_rouge(preds, refs),
+        "bertscore": lambda: _batch_bertscore(preds, refs, bertscore_batch_size),
+    }
+    with _batch_lock:
+        for name in metrics:
+            try:
+                scores = scorers[name]()
+            except Exception:
+                continue
+            for i, score in zip(index, scores):
+                rows[i][name] = score
+    return rows
@@ -3,33 +3,67 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator
 
 import click
 import pandas as pd
 
 from .config import load_models_config, load_benchmark_env
-from .runner import run_model_on_dataset, save_jsonl, save_aggregate_csv
+from .http_client import aclose_client
+from .runner import ResultWriter, iter_jsonl, run_model_on_dataset, run_models_concurrently
 from .reporters import plot_model_bars
 
 
-def _load_dataset(path: str | Path) -> List[Dict[str, Any]]:
+def _check_dataset(path: str | Path) -> Path:
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Dataset bulunamadı: {p}")
+    if p.suffix.lower() not in (".jsonl", ".json"):
+        raise ValueError("Dataset uzantısı .jsonl veya .json olmalı")
+    return p
+
+
+def _iter_dataset(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Örnekleri tek tek üret (.jsonl satır satır okunur; .json tek parça olduğu için bir kez yüklenir)"""
+    p = _check_dataset(path)
     if p.suffix.lower() == ".jsonl":
-        rows = []
         with p.open("r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
-                rows.append(json.loads(line))
-        return rows
-    elif p.suffix.lower() == ".json":
-        return json.loads(p.read_text(encoding="utf-8"))
+                yield json.loads(line)
     else:
-        raise ValueError("Dataset uzantısı .jsonl veya .json olmalı")
+        yield from json.loads(p.read_text(encoding="utf-8"))
+
+
+def _run_async(coro):
+    """Event loop çalıştır; bittiğinde paylaşılan HTTP havuzunu kapat"""
+
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await aclose_client()
+
+    return asyncio.run(_main())
+
+
+def _aggregate_frame(results: Iterable[Dict[str, Any]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "id": r.get("id"),
+                "schema_valid": r.get("schema_valid"),
+                "bleu": r.get("metrics", {}).get("bleu", 0.0),
+                "rouge": r.get("metrics", {}).get("rouge", 0.0),
+                "bertscore": r.get("metrics", {}).get("bertscore", 0.0),
+                "llm_score": r.get("llm_score", 0.0),
+                "tokens_per_second": r.get("tokens_per_second"),
+            }
+            for r in results
+        ]
+    )
 
 
 @click.command()
@@ -37,12 +71,18 @@ def _load_dataset(path: str | Path) -> List[Dict[str, Any]]:
 @click.option("--dataset", "dataset_path", required=True, help="telekom_test_set.jsonl/.json yolu")
 @click.option("--out", "out_dir", default="reports", help="Çıktı klasörü")
 @click.option("--llm-eval/--no-llm-eval", default=True, help="LLM tabanlı değerlendirme")
-def main(models_path: str, dataset_path: str, out_dir: str, llm_eval: bool):
+@click.option(
+    "--parallel-models/--serial-models",
+    default=False,
+    help="Tüm modelleri tek event loop'ta eşzamanlı çalıştır (BENCH_GLOBAL_CONCURRENCY / BENCH_BACKEND_CONCURRENCY)",
+)
+@click.option("--resume", is_flag=True, default=False, help="Önceki çalıştırmada tamamlanan örnek id'lerini atla")
+def main(models_path: str, dataset_path: str, out_dir: str, llm_eval: bool, parallel_models: bool, resume: bool):
     models = load_models_config(models_path)
     bench_cfg = load_benchmark_env()
     bench_cfg.do_llm_eval = llm_eval
 
-    dataset = _load_dataset(dataset_path)
+    _check_dataset(dataset_path)
     out = Path(out_dir)
     per_example_dir = out / "per_example"
     aggregate_dir = out / "aggregate"
@@ -51,25 +91,46 @@ def main(models_path: str, dataset_path: str, out_dir: str, llm_eval: bool):
 
     aggregate_map: Dict[str, pd.DataFrame] = {}
 
-    for m in models:
-        click.echo(f"\n▶️ Model çalıştırılıyor: {m.id} ({m.backend})")
-        results = asyncio.run(run_model_on_dataset(m, bench_cfg, dataset))
-        save_jsonl(per_example_dir / f"{m.id}.jsonl", results)
-        save_aggregate_csv(aggregate_dir / f"{m.id}.csv", results)
-        aggregate_map[m.id] = pd.DataFrame(
-            [
-                {
-                    "id": r.get("id"),
-                    "schema_valid": r.get("schema_valid"),
-                    "bleu": r.get("metrics", {}).get("bleu", 0.0),
-                    "rouge": r.get("metrics", {}).get("rouge", 0.0),
-                    "bertscore": r.get("metrics", {}).get("bertscore", 0.0),
-                    "llm_score": r.get("llm_score", 0.0),
-                }
-                for r in results
-            ]
+    def _aggregate(m) -> None:
+        # Sonuçlar örnekler tamamlandıkça JSONL'e yazıldı; özet, dosyadan (devam edilen
+        # çalıştırmalarda önceki örnekler dahil) tek geçişte çıkarılır
+        frame = _aggregate_frame(iter_jsonl(per_example_dir / f"{m.id}.jsonl"))
+        frame.to_csv(aggregate_dir / f"{m.id}.csv", index=False)
+        aggregate_map[m.id] = frame
+
+    if parallel_models:
+        click.echo(
+            f"\n▶️ {len(models)} model eşzamanlı çalıştırılıyor "
+            f"(global limit {bench_cfg.global_concurrency}, backend limitleri {bench_cfg.backend_concurrency or '-'})"
         )
 
+        def _model_done(m, outcome):
+            if isinstance(outcome, Exception):
+                click.echo(f"❌ Model başarısız: {m.id} ({m.backend}): {outcome}")
+                return
+            _aggregate(m)
+            click.echo(f"✔️ Model tamamlandı: {m.id} ({len(aggregate_map[m.id])} örnek)")
+
+        _run_async(
+            run_models_concurrently(
+                models, bench_cfg, lambda: _iter_dataset(dataset_path), per_example_dir,
+                resume=resume, on_model_done=_model_done,
+            )
+        )
+    else:
+        for m in models:
+            click.echo(f"\n▶️ Model çalıştırılıyor: {m.id} ({m.backend})")
+            with ResultWriter(per_example_dir / f"{m.id}.jsonl", resume=resume) as writer:
+                if writer.done:
+                    click.echo(f"⏭️ {len(writer.done)} örnek önceki çalıştırmada tamamlanmış, atlanıyor")
+                _run_async(
+                    run_model_on_dataset(
+                        m, bench_cfg, _iter_dataset(dataset_path), on_rows=writer.write_rows,
+                        skip_ids=writer.done, collect=False,
+                    )
+                )
+            _aggregate(m)
+
     # Basit görselleştirme
     plot_model_bars(aggregate_map, out)
 
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import json
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .config import BenchmarkConfig, ModelConfig
-from .metrics import compute_all_metrics
+from .metrics import compute_metrics_batch
 from .pydantic_validator import validate_against_schema
 from .llm_eval import llm_grade_openai, llm_grade_mock, llm_grade_hf
 from .adapters.openai_adapter import OpenAIAdapter
@@ -30,10 +31,36 @@ def _build_adapter(model_cfg: ModelConfig):
             return MockEchoAdapter(model_cfg.params)
         return GenericHTTPAdapter(model_cfg.model_name_or_endpoint, model_cfg.params)
     if backend == "gguf":
-        return LocalGGUFAdapter(model_cfg.params)
+        return LocalGGUFAdapter(model_cfg.model_name_or_endpoint, model_cfg.params)
     raise ValueError(f"Unsupported backend: {backend}")
 
 
+class ConcurrencyLimits:
+    """In-flight request caps shared by models running in the same event loop.
+
+    Every request holds one slot of its backend (if that backend is limited)
+    and one slot of the global budget. The backend slot is taken first so a
+    request waiting on a saturated backend does not hold a global slot.
+    """
+
+    def __init__(self, total: int, per_backend: Optional[Dict[str, int]] = None):
+        self._total = asyncio.Semaphore(max(1, total))
+        self._backends = {
+            backend.lower(): asyncio.Semaphore(max(1, limit)) for backend, limit in (per_backend or {}).items()
+        }
+
+    @asynccontextmanager
+    async def slot(self, backend: str) -> AsyncIterator[None]:
+        backend_sem = self._backends.get(backend.lower())
+        if backend_sem is None:
+            async with self._total:
+                yield
+            return
+        async with backend_sem:
+            async with self._total:
+                yield
+
+
 async def _run_one(
     adapter,
     example: Dict[str, Any],
@@ -49,7 +76,6 @@ async def _run_one(
     )
 
     schema = validate_against_schema(result.raw_output, function_name=fn_name)
-    metrics = compute_all_metrics(result.raw_output or "", expected or "")
 
     if bench_cfg.do_llm_eval:
         if bench_cfg.eval_backend == "hf":
@@ -68,27 +94,249 @@ async def _run_one(
         "output": result.raw_output,
         "success": result.success,
         "error": result.error,
+        "prompt_tokens": result.prompt_tokens,
+        "completion_tokens": result.completion_tokens,
+        "tokens_per_second": result.tokens_per_second,
         "schema_valid": schema["valid"],
         "schema_errors": schema["errors"],
-        "metrics": metrics,
+        # Filled in by the batched metrics stage in run_model_on_dataset
+        "metrics": {},
         "llm_score": grading.get("score", 0.0),
         "llm_reasons": grading.get("reasons", ""),
         "metadata": example.get("metadata", {}),
     }
 
 
+async def _score_rows(rows: List[Dict[str, Any]], bench_cfg: BenchmarkConfig):
+    # Metrics run once over a set of outputs (BERTScore in batches) instead of
+    # once per example; off the event loop since it is CPU bound
+    metrics = await asyncio.to_thread(
+        compute_metrics_batch,
+        [r["output"] or "" for r in rows],
+        [r["expected"] or "" for r in rows],
+        bench_cfg.metrics_batch_size,
+    )
+    for row, m in zip(rows, metrics):
+        row["metrics"] = m
+
+
+async def _gather_or_cancel(*coros) -> None:
+    """Run coroutines concurrently; the first failure cancels the rest and is raised.
+
+    Plain gather would leave the siblings running detached, e.g. the producer
+    blocked forever on a full queue once the workers have died.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def run_model_on_dataset(
-    model_cfg: ModelConfig, bench_cfg: BenchmarkConfig, dataset: List[Dict[str, Any]]
+    model_cfg: ModelConfig,
+    bench_cfg: BenchmarkConfig,
+    dataset: Iterable[Dict[str, Any]],
+    limits: Optional[ConcurrencyLimits] = None,
+    on_rows: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    skip_ids: Optional[Set[str]] = None,
+    collect: bool = True,
 ) -> List[Dict[str, Any]]:
+    """Run one model over the dataset; rows are returned in dataset order.
+
+    The dataset is consumed lazily: a producer feeds a bounded queue and
+    `concurrency` workers pull from it, so no per-example task exists before
+    a worker is free to run it.
+
+    limits: shared global/per-backend caps when several models run together.
+    on_rows: if given, scored rows are handed over in completion order, in
+    groups of metrics_batch_size, while the rest of the dataset is running.
+    skip_ids: example ids to leave out (already completed in a resumed run).
+    collect: with on_rows, False keeps no rows in memory and returns [].
+    """
     adapter = _build_adapter(model_cfg)
-    sem = asyncio.Semaphore(bench_cfg.concurrency)
+    backend = model_cfg.backend.lower()
+    workers = max(1, bench_cfg.concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+    collected: List[Tuple[int, Dict[str, Any]]] = []
+    pending: List[Dict[str, Any]] = []
+    keep_rows = collect or on_rows is None
+
+    async def _flush():
+        batch = pending[:]
+        pending.clear()
+        await _score_rows(batch, bench_cfg)
+        on_rows(batch)
+
+    async def _produce():
+        try:
+            for position, ex in enumerate(dataset):
+                if skip_ids and ex.get("id") is not None and str(ex["id"]) in skip_ids:
+                    continue
+                await queue.put((position, ex))
+        finally:
+            for _ in range(workers):
+                await queue.put(None)
+
+    async def _work():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            position, ex = item
+            if limits is None:
+                row = await _run_one(adapter, ex, bench_cfg, bench_cfg.eval_model)
+            else:
+                async with limits.slot(backend):
+                    row = await _run_one(adapter, ex, bench_cfg, bench_cfg.eval_model)
+            if keep_rows:
+                collected.append((position, row))
+            if on_rows is not None:
+                pending.append(row)
+                if len(pending) >= bench_cfg.metrics_batch_size:
+                    await _flush()
+
+    try:
+        await _gather_or_cancel(_produce(), *(_work() for _ in range(workers)))
+    finally:
+        # In-process backends (GGUF) hold the model until closed
+        aclose = getattr(adapter, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    collected.sort(key=lambda item: item[0])
+    rows = [row for _, row in collected]
+    if on_rows is None:
+        await _score_rows(rows, bench_cfg)
+    elif pending:
+        await _flush()
+    return rows
+
+
+class ResultWriter:
+    """Appends per-example rows to a JSONL file with a checkpoint index.
+
+    Each batch is written and flushed to <name>.jsonl first; then one
+    "<byte offset>\\t<example id>" line per row is appended to
+    <name>.jsonl.ckpt. An id in the index is therefore always fully on disk.
+    With resume=True the JSONL is truncated to the last indexed offset
+    (dropping rows written after the last checkpoint, e.g. a torn line from
+    a crash), and `done` holds the ids to skip. Rows without an id are
+    written but not checkpointed.
+    """
+
+    def __init__(self, path: str | Path, resume: bool = False):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".ckpt")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.done: Set[str] = set()
+        self.count = 0
+        offset = 0
+        if resume and self.path.exists() and self.index_path.exists():
+            offset = self._read_index()
+        self._f = self.path.open("r+b" if offset else "wb")
+        self._f.truncate(offset)
+        self._f.seek(offset)
+        self._offset = offset
+        self._index = self.index_path.open("a" if offset else "w", encoding="utf-8")
+
+    def _read_index(self) -> int:
+        offset = 0
+        size = self.path.stat().st_size
+        kept: List[str] = []
+        with self.index_path.open(encoding="utf-8") as f:
+            for line in f:
+                end, sep, example_id = line.rstrip("\n").partition("\t")
+                # A torn last line or an offset past the data means the crash hit mid-checkpoint
+                if not sep or not line.endswith("\n") or not end.isdigit() or int(end) > size:
+                    break
+                offset = int(end)
+                self.done.add(example_id)
+                kept.append(line)
+        # Rewrite the index with the valid lines only (per-row offsets unchanged)
+        with self.index_path.open("w", encoding="utf-8") as f:
+            f.writelines(kept)
+        return offset
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        entries = []
+        for row in rows:
+            data = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+            self._f.write(data)
+            self._offset += len(data)
+            if row.get("id") is not None:
+                entries.append(f"{self._offset}\t{row['id']}\n")
+        self._f.flush()
+        self._index.writelines(entries)
+        self._index.flush()
+        self.count += len(rows)
+
+    def close(self):
+        self._f.close()
+        self._index.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_jsonl(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """Read rows back from a per-example JSONL file one at a time"""
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+async def run_models_concurrently(
+    models: List[ModelConfig],
+    bench_cfg: BenchmarkConfig,
+    dataset_factory: Callable[[], Iterable[Dict[str, Any]]],
+    per_example_dir: str | Path,
+    resume: bool = False,
+    on_model_done: Optional[Callable[[ModelConfig, Any], None]] = None,
+) -> Dict[str, Path]:
+    """Run all models in one event loop under the shared concurrency budget.
+
+    Each model reads its own pass over the dataset from dataset_factory and
+    streams its rows to <per_example_dir>/<model id>.jsonl as they complete.
+    on_model_done gets the JSONL path, or the exception for a model that
+    failed; failed models are left out of the returned {model id: path} map.
+    """
+    limits = ConcurrencyLimits(bench_cfg.global_concurrency, bench_cfg.backend_concurrency)
 
-    async def _sem_task(ex):
-        async with sem:
-            return await _run_one(adapter, ex, bench_cfg, bench_cfg.eval_model)
+    async def _one(model_cfg: ModelConfig):
+        with ResultWriter(Path(per_example_dir) / f"{model_cfg.id}.jsonl", resume=resume) as writer:
+            try:
+                await run_model_on_dataset(
+                    model_cfg, bench_cfg, dataset_factory(), limits, writer.write_rows,
+                    skip_ids=writer.done, collect=False,
+                )
+            except Exception as e:
+                error = e
+            else:
+                error = None
+        if error is not None:
+            if writer.count == 0 and not writer.done:
+                writer.path.unlink(missing_ok=True)
+                writer.index_path.unlink(missing_ok=True)
+            if on_model_done:
+                on_model_done(model_cfg, error)
+            return model_cfg.id, None
+        if on_model_done:
+            on_model_done(model_cfg, writer.path)
+        return model_cfg.id, writer.path
 
-    tasks = [_sem_task(ex) for ex in dataset]
-    return await asyncio.gather(*tasks)
+    done = await asyncio.gather(*(_one(m) for m in models))
+    return {model_id: path for model_id, path in done if path is not None}
 
 
 def save_jsonl(path: str | Path, rows: List[Dict[str, Any]]):
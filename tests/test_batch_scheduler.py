@@ -0,0 +1,69 @@
+import asyncio
+import ctypes
+import sys
+import types
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.batch_scheduler import BatchScheduler, _Sequence  # noqa: E402
+from app.services.inference_executor import create_job  # noqa: E402
+
+
+def test_shutdown_bekleyen_ve_suren_istekleri_sonuclandirir(monkeypatch):
+    # Gerçek model yok: KV temizleme çağrısı için boş bir llama_cpp
+    monkeypatch.setitem(sys.modules, "llama_cpp", types.SimpleNamespace(llama_kv_cache_seq_rm=lambda *a: None))
+
+    class SahteLlama:
+        def detokenize(self, tokens):
+            return b""
+
+    async def main():
+        zamanlayici = BatchScheduler(SahteLlama(), n_seq_max=2)
+        loop = asyncio.get_running_loop()
+        suren = create_job(loop, "a", {})
+        zamanlayici._active[0] = _Sequence(
+            job=suren, seq_id=0, prompt_tokens=[1], max_tokens=4, temperature=0, top_p=1, stop=[]
+        )
+        bekleyen = create_job(loop, "b", {})
+        zamanlayici._pending.put_nowait(bekleyen)
+
+        await zamanlayici.shutdown()
+        for future in (suren.future, bekleyen.future):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(future, 1)
+        with pytest.raises(RuntimeError):
+            zamanlayici.submit("c")
+
+    asyncio.run(main())
+
+
+def _logit_isaretcisi(degerler):
+    dizi = (ctypes.c_float * len(degerler))(*degerler)
+    return dizi, ctypes.cast(dizi, ctypes.c_void_p)
+
+
+def _sekans(**kwargs):
+    return _Sequence(job=None, seq_id=0, prompt_tokens=[], max_tokens=4, stop=[], **kwargs)
+
+
+def test_ornekleme_tekrar_cezasi_ve_top_k_uygular():
+    zamanlayici = BatchScheduler.__new__(BatchScheduler)
+    zamanlayici._n_vocab = 4
+    dizi, ptr = _logit_isaretcisi([1.0, 1.05, 0.5, -2.0])
+
+    # Son token'larda geçen 1 cezalandırılır (1.05 / 1.1 < 1.0)
+    cezali = _sekans(temperature=0, top_p=1.0, recent=deque([1, 3]))
+    assert zamanlayici._sample(ptr, cezali) == 0
+    cezasiz = _sekans(temperature=0, top_p=1.0, repeat_penalty=1.0, recent=deque([1]))
+    assert zamanlayici._sample(ptr, cezasiz) == 1
+
+    # top_k=1: sıcaklık ne olursa olsun yalnızca en olası token kalır
+    tek = _sekans(temperature=5.0, top_p=1.0, top_k=1, repeat_penalty=1.0)
+    assert {zamanlayici._sample(ptr, tek) for _ in range(50)} == {1}
+    # top_k=2 ve ceza: aday kümesi cezalı logit'lere göre seçilir
+    iki = _sekans(temperature=5.0, top_p=1.0, top_k=2, repeat_penalty=3.0, recent=deque([0, 1]))
+    assert {zamanlayici._sample(ptr, iki) for _ in range(200)} <= {1, 2}
@@ -0,0 +1,34 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.schemas.feedback import FeedbackSchema, FeedbackType  # noqa: E402
+from app.services.feedback_service import FeedbackService  # noqa: E402
+
+
+def test_hatali_olay_batchteki_digerlerini_dusurmez(tmp_path):
+    db_path = tmp_path / "feedback.db"
+    service = FeedbackService(db_url=f"sqlite:///{db_path}")
+    olaylar = []
+    for i in range(3):
+        feedback = FeedbackSchema(
+            feedback_type=FeedbackType.POSITIVE,
+            message_id=f"MSG_{i}", user_question="fatura", ai_response="Tamam",
+            user_id=None, session_id="s", context={},
+        )
+        olaylar.append({"feedback_data": service._feedback_row(f"FB_{i}", feedback)})
+    # Eksik bağlama parametresi: yalnızca bu olay yazılamaz
+    bozuk = dict(olaylar[1]["feedback_data"])
+    del bozuk["timestamp"]
+    olaylar[1] = {"feedback_data": bozuk}
+
+    service._flush_batch(olaylar)
+
+    with sqlite3.connect(db_path) as conn:
+        yazilan = [r[0] for r in conn.execute("SELECT feedback_id FROM feedback_data ORDER BY feedback_id")]
+        dead = conn.execute("SELECT payload FROM feedback_dead_letter").fetchall()
+    assert yazilan == ["FB_0", "FB_2"]
+    assert len(dead) == 1 and "FB_1" in dead[0][0]
+    assert service.stats()["flushed"] == 2 and service.stats()["dead_lettered"] == 1
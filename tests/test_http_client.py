@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from benchmark.adapters.http_adapter import GenericHTTPAdapter
+from benchmark.http_client import aclose_client, backoff_delay
+
+
+def test_backoff_delay_is_jittered_and_honours_retry_after():
+    for attempt in range(6):
+        assert 0 <= backoff_delay(attempt) <= 8.0
+    assert backoff_delay(0, "0.25") == 0.25
+    assert backoff_delay(0, "600") == 8.0
+
+
+def test_http_adapter_retries_on_503_over_shared_pool():
+    web = pytest.importorskip("aiohttp.web")
+    calls = []
+
+    async def predict(request):
+        calls.append(await request.json())
+        if len(calls) == 1:
+            return web.json_response({"error": "busy"}, status=503, headers={"Retry-After": "0"})
+        return web.json_response({"output": "tamam"})
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/predict", predict)
+        app_runner = web.AppRunner(app)
+        await app_runner.setup()
+        site = web.TCPSite(app_runner, "127.0.0.1", 0)
+        await site.start()
+        port = app_runner.addresses[0][1]
+        try:
+            adapter = GenericHTTPAdapter(f"http://127.0.0.1:{port}/predict", {"temperature": 0})
+            return await adapter.infer("merhaba")
+        finally:
+            await aclose_client()
+            await app_runner.cleanup()
+
+    result = asyncio.run(main())
+    assert result.success and result.raw_output == "tamam"
+    assert calls == [{"prompt": "merhaba", "temperature": 0}] * 2
@@ -0,0 +1,66 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.inference_executor import InferenceExecutor  # noqa: E402
+
+
+class YavasModel:
+    """İptal edilene kadar token üreten sahte Llama"""
+
+    def __init__(self):
+        self.basladi = threading.Event()
+        self.bitti = threading.Event()
+
+    def __call__(self, prompt, stream=True, **params):
+        self.basladi.set()
+        try:
+            for _ in range(10_000):
+                time.sleep(0.01)
+                yield {"choices": [{"text": "x", "finish_reason": None}]}
+        finally:
+            self.bitti.set()
+
+
+def test_shutdown_bekleyen_ve_suren_istekleri_sonlandirir():
+    model = YavasModel()
+    executor = InferenceExecutor(lambda: model, concurrency=1, max_queue=4)
+
+    async def senaryo():
+        suren = executor.submit("a", max_tokens=10_000)
+        bekleyen = executor.submit("b", max_tokens=10_000)
+        await asyncio.get_running_loop().run_in_executor(None, model.basladi.wait, 5)
+
+        await asyncio.wait_for(executor.shutdown(), 5)
+        for future in (suren, bekleyen):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(future, 1)
+        with pytest.raises(RuntimeError):
+            executor.submit("c")
+
+    asyncio.run(senaryo())
+    # Üretim thread'i max_tokens'ı beklemeden durdu
+    assert model.bitti.wait(5)
+
+
+def test_orkestrator_kapatilinca_cikarim_motoru_kapanir():
+    from app.services.ai_orchestrator_v4 import YapayZekaOrkestratoriV4
+
+    orkestrator = YapayZekaOrkestratoriV4.__new__(YapayZekaOrkestratoriV4)
+    orkestrator._model_loaded = True
+    orkestrator.inference = executor = InferenceExecutor(YavasModel, concurrency=1)
+
+    async def senaryo():
+        executor.submit("a")  # Worker'ları başlat
+        await orkestrator.kapat()
+
+    asyncio.run(senaryo())
+    assert orkestrator.inference is None and not orkestrator._model_loaded
+    with pytest.raises(RuntimeError):
+        executor.submit("b")
@@ -1,4 +1,4 @@
-from benchmark.metrics import compute_all_metrics
+from benchmark.metrics import compute_all_metrics, compute_metrics_batch
 
 
 def test_metrics_compute():
@@ -6,3 +6,9 @@ def test_metrics_compute():
     assert set(m.keys()) == {"bleu", "rouge", "bertscore"}
 
 
+def test_metrics_batch_keeps_order_and_empty_pairs():
+    rows = compute_metrics_batch(["merhaba dünya", "", "selam"], ["merhaba dunya", "selam", ""])
+    assert len(rows) == 3
+    assert all(set(r.keys()) == {"bleu", "rouge", "bertscore"} for r in rows)
+    assert rows[1] == {"bleu": 0.0, "rouge": 0.0, "bertscore": 0.0}
+    assert rows[2] == {"bleu": 0.0, "rouge": 0.0, "bertscore": 0.0}
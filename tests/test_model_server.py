@@ -0,0 +1,118 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.inference_executor import InferenceQueueFullError  # noqa: E402
+from app.services.model_server import ModelServer, RemoteInferenceClient  # noqa: E402
+
+
+class EchoEngine:
+    """Prompt'u kelime kelime akıtan, kuyruk limiti olan basit motor"""
+
+    def __init__(self, max_queue: int = 8, delay: float = 0.01):
+        self.max_queue = max_queue
+        self.delay = delay
+        self.active = 0
+        self.cancelled = 0
+
+    def submit(self, prompt, on_token=None, **params):
+        if self.active >= self.max_queue:
+            raise InferenceQueueFullError("dolu")
+        self.active += 1
+        task = asyncio.ensure_future(self._run(prompt, on_token, params))
+        future = asyncio.get_running_loop().create_future()
+
+        def done(t):
+            self.active -= 1
+            if not future.done():
+                future.set_result(t.result())
+
+        task.add_done_callback(done)
+        future.add_done_callback(lambda f: f.cancelled() and task.cancel())
+        return future
+
+    async def _run(self, prompt, on_token, params):
+        words = prompt.split()[: params.get("max_tokens", 100)]
+        try:
+            for word in words:
+                await asyncio.sleep(self.delay)
+                if on_token:
+                    on_token(word + " ")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"text": " ".join(words), "finish_reason": "stop", "completion_tokens": len(words)}
+
+    def durum(self):
+        return {"backend": "echo", "active": self.active}
+
+    async def shutdown(self):
+        pass
+
+
+def test_remote_client_end_to_end(tmp_path):
+    socket_path = str(tmp_path / "model.sock")
+
+    async def scenario():
+        engine = EchoEngine(max_queue=2)
+        server = ModelServer(engine, socket_path)
+        await server.start()
+        client = RemoteInferenceClient(socket_path, connect_timeout=2)
+        await asyncio.get_running_loop().run_in_executor(None, client.load_models)
+        try:
+            tokens = []
+            result = await client.generate("merhaba dünya nasılsın", on_token=tokens.append, max_tokens=2)
+            assert result["text"] == "merhaba dünya"
+            assert tokens == ["merhaba ", "dünya "]
+
+            # Tek bağlantı üzerinde eşzamanlı istekler
+            results = await asyncio.gather(client.generate("a b"), client.generate("c d"))
+            assert [r["text"] for r in results] == ["a b", "c d"]
+
+            # Sunucu kuyruğu doluysa istemci aynı hatayı alır
+            slow = [client.submit("x " * 50) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            with pytest.raises(InferenceQueueFullError):
+                await client.generate("taşma")
+
+            # İstemcideki iptal sunucudaki üretimi durdurur
+            for future in slow:
+                future.cancel()
+            await asyncio.sleep(0.1)
+            assert engine.cancelled == 2 and engine.active == 0
+
+            assert (await client.server_status())["backend"] == "echo"
+            assert client.durum()["completed"] == 3
+        finally:
+            await client.shutdown()
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_bad_request_does_not_drop_connection(tmp_path):
+    socket_path = str(tmp_path / "model.sock")
+
+    async def scenario():
+        engine = EchoEngine(max_queue=4)
+        server = ModelServer(engine, socket_path)
+        await server.start()
+        client = RemoteInferenceClient(socket_path, connect_timeout=2)
+        await asyncio.get_running_loop().run_in_executor(None, client.load_models)
+        try:
+            surmekte = client.submit("a b c d")
+            # Bilinmeyen parametre yalnızca kendi isteğini düşürür
+            with pytest.raises(RuntimeError, match="Bilinmeyen parametre"):
+                await client.generate("x", logit_bias={"1": 5})
+            assert (await surmekte)["text"] == "a b c d"
+            assert (await client.generate("yine çalışıyor"))["text"] == "yine çalışıyor"
+            assert server.connections == 1
+        finally:
+            await client.shutdown()
+            await server.close()
+
+    asyncio.run(scenario())
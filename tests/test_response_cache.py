@@ -0,0 +1,43 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.response_cache import TTLCache, cached  # noqa: E402
+from app.services.telekom_store import Package, TelekomStore  # noqa: E402
+
+
+def _paket(user_id, name):
+    return Package(
+        user_id=user_id, package_name=name, monthly_fee=100.0, package_type="postpaid", features=[],
+        internet_speed="100 Mbps", voice_minutes="1000", sms_count="500", contract_duration="12 ay",
+    )
+
+
+def test_depo_yazmasi_yalnizca_ilgili_kullanicinin_girdilerini_dusurur():
+    store = TelekomStore(seed=False)
+    store.upsert(_paket(1, "Mega"), _paket(2, "Mini"))
+    cache = TTLCache(maxsize=16, default_ttl=60)
+    store.add_listener(cache.invalidate_users)
+
+    class Okuyucu:
+        @cached(cache)
+        async def paket(self, user_id: int = None, session_token: str = None):
+            return {"success": True, "data": store.package(user_id).package_name}
+
+    okuyucu = Okuyucu()
+
+    async def oku(user_id):
+        return (await okuyucu.paket(user_id=user_id))["data"]
+
+    async def senaryo():
+        assert await oku(1) == "Mega"
+        assert await oku(2) == "Mini"
+        # Önbellek dışından (ör. REST router'ı) yapılan yazma
+        store.upsert(_paket(1, "Premium"))
+        assert await oku(1) == "Premium"
+        assert await oku(2) == "Mini"
+
+    asyncio.run(senaryo())
+    assert cache.invalidations == 1
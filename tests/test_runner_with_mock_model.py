@@ -30,3 +30,202 @@ def test_runner_with_dummy(monkeypatch):
     assert all(r.get("success") for r in results)
 
 
+
+
+class SlowAdapter:
+    def __init__(self, delay: float, in_flight: dict = None, model_id: str = ""):
+        self.delay = delay
+        # Shared across adapters: calls currently running per model and the peaks seen
+        self.in_flight = in_flight if in_flight is not None else {}
+        self.model_id = model_id
+
+    async def infer(self, prompt: str, timeout: int = 60, max_retries: int = 3):
+        from benchmark.adapters.types import InferenceResult
+
+        running = self.in_flight.setdefault("running", {})
+        running[self.model_id] = running.get(self.model_id, 0) + 1
+        self.in_flight["peak"] = max(self.in_flight.get("peak", 0), sum(running.values()))
+        if all(running.get(mid) for mid in ("fast", "slow")):
+            self.in_flight["overlapped"] = True
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            running[self.model_id] -= 1
+        return InferenceResult(raw_output=prompt, success=True, error=None)
+
+
+def test_models_run_concurrently_and_stream(monkeypatch, tmp_path):
+    import json
+
+    from benchmark import runner as runner_mod
+
+    delays = {"fast": 0.01, "slow": 0.02}
+    in_flight = {}
+
+    def build(cfg):
+        if cfg.id == "broken":
+            raise ValueError("Unsupported backend: nope")
+        return SlowAdapter(delays[cfg.id], in_flight, cfg.id)
+
+    monkeypatch.setattr(runner_mod, "_build_adapter", build)
+    monkeypatch.setattr(
+        runner_mod, "compute_metrics_batch", lambda preds, refs, bs: [{"bleu": 1.0} for _ in preds]
+    )
+
+    models = [
+        ModelConfig(id=mid, name=mid, backend="http", model_name_or_endpoint="") for mid in ("fast", "slow", "broken")
+    ]
+    bench = load_benchmark_env()
+    bench.do_llm_eval = False
+    bench.concurrency = 2
+    bench.metrics_batch_size = 3
+    bench.backend_concurrency = {"http": 4}
+    dataset = [{"id": str(i), "input": f"soru {i}", "expected_output": f"soru {i}", "metadata": {}} for i in range(10)]
+
+    results = asyncio.run(runner_mod.run_models_concurrently(models, bench, lambda: iter(dataset), tmp_path))
+
+    assert set(results) == {"fast", "slow"}
+    assert not (tmp_path / "broken.jsonl").exists()
+    # Both models had calls in flight at the same time, within the shared http limit
+    assert in_flight["overlapped"]
+    assert bench.concurrency < in_flight["peak"] <= 4
+    for mid in ("fast", "slow"):
+        lines = (tmp_path / f"{mid}.jsonl").read_text(encoding="utf-8").splitlines()
+        assert sorted(json.loads(line)["id"] for line in lines) == sorted(str(i) for i in range(10))
+        assert all(json.loads(line)["metrics"] == {"bleu": 1.0} for line in lines)
+
+
+def test_run_returns_dataset_order_from_lazy_queue(monkeypatch):
+    from benchmark import runner as runner_mod
+
+    class ReverseDelayAdapter:
+        async def infer(self, prompt: str, timeout: int = 60, max_retries: int = 3):
+            from benchmark.adapters.types import InferenceResult
+
+            # Earlier examples finish later
+            await asyncio.sleep(0.01 * (5 - int(prompt)))
+            return InferenceResult(raw_output=prompt, success=True, error=None)
+
+    consumed = []
+
+    def dataset():
+        for i in range(5):
+            consumed.append(i)
+            yield {"id": str(i), "input": str(i), "expected_output": str(i), "metadata": {}}
+
+    monkeypatch.setattr(runner_mod, "_build_adapter", lambda cfg: ReverseDelayAdapter())
+    monkeypatch.setattr(runner_mod, "compute_metrics_batch", lambda preds, refs, bs: [{} for _ in preds])
+    bench = load_benchmark_env()
+    bench.do_llm_eval = False
+    bench.concurrency = 5
+    model = ModelConfig(id="m", name="m", backend="http", model_name_or_endpoint="")
+
+    rows = asyncio.run(runner_mod.run_model_on_dataset(model, bench, dataset(), skip_ids={"3"}))
+    assert [r["id"] for r in rows] == ["0", "1", "2", "4"]
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+def test_result_writer_resume_drops_unindexed_tail(tmp_path):
+    import json
+
+    from benchmark.runner import ResultWriter, iter_jsonl
+
+    path = tmp_path / "m.jsonl"
+    with ResultWriter(path) as writer:
+        writer.write_rows([{"id": "1", "output": "a"}, {"id": "2", "output": "b"}])
+    # Crash mid-batch: a row reached the JSONL but not the checkpoint index
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "3", "output": "c"}) + "\n" + '{"id": "4", "out')
+
+    with ResultWriter(path, resume=True) as writer:
+        assert writer.done == {"1", "2"}
+        writer.write_rows([{"id": "3", "output": "c"}])
+
+    assert [r["id"] for r in iter_jsonl(path)] == ["1", "2", "3"]
+    with ResultWriter(path, resume=True) as writer:
+        assert writer.done == {"1", "2", "3"}
+    with ResultWriter(path) as writer:
+        assert writer.done == set()
+    assert list(iter_jsonl(path)) == []
+
+
+def test_gguf_adapter_reports_token_stats_and_is_closed(monkeypatch):
+    from benchmark import runner as runner_mod
+    from benchmark.adapters.gguf_adapter import LocalGGUFAdapter
+
+    class FakeScheduler:
+        loads = 0
+        closed = False
+
+        async def _result(self, prompt):
+            return {
+                "text": prompt.upper(), "completion_tokens": 11, "prompt_tokens": 5,
+                "ttft_s": 0.5, "generation_s": 1.5, "finish_reason": "stop",
+            }
+
+        def submit(self, prompt, **params):
+            assert params["temperature"] == 0 and params["max_tokens"] == 64
+            return self._result(prompt)
+
+        def close(self):
+            FakeScheduler.closed = True
+
+    def fake_load(self):
+        FakeScheduler.loads += 1
+        return FakeScheduler()
+
+    monkeypatch.setattr(LocalGGUFAdapter, "_load", fake_load)
+    monkeypatch.setattr(runner_mod, "compute_metrics_batch", lambda preds, refs, bs: [{} for _ in preds])
+    bench = load_benchmark_env()
+    bench.do_llm_eval = False
+    model = ModelConfig(
+        id="g", name="g", backend="gguf", model_name_or_endpoint="model.gguf",
+        params={"max_tokens": 64, "prompt_template": 'Soru: {prompt} {"json": 1}'},
+    )
+    dataset = [{"id": str(i), "input": f"q{i}", "expected_output": "", "metadata": {}} for i in range(4)]
+
+    rows = asyncio.run(runner_mod.run_model_on_dataset(model, bench, dataset))
+    assert [r["output"] for r in rows] == [f'SORU: Q{i} {{"JSON": 1}}' for i in range(4)]
+    assert all(r["prompt_tokens"] == 5 and r["completion_tokens"] == 11 for r in rows)
+    assert rows[0]["tokens_per_second"] == 10.0
+    assert FakeScheduler.loads == 1 and FakeScheduler.closed
+
+
+def test_failing_batch_handler_cancels_producer_and_workers(monkeypatch):
+    import pytest
+
+    from benchmark import runner as runner_mod
+
+    monkeypatch.setattr(runner_mod, "_build_adapter", lambda cfg: DummyAdapter())
+    monkeypatch.setattr(runner_mod, "compute_metrics_batch", lambda preds, refs, bs: [{} for _ in preds])
+    bench = load_benchmark_env()
+    bench.do_llm_eval = False
+    bench.concurrency = 2
+    bench.metrics_batch_size = 1
+    model = ModelConfig(id="m", name="m", backend="http", model_name_or_endpoint="")
+    dataset = ({"id": str(i), "input": str(i), "expected_output": "", "metadata": {}} for i in range(1000))
+
+    def on_rows(rows):
+        raise OSError("disk full")
+
+    async def main():
+        run = runner_mod.run_model_on_dataset(model, bench, dataset, on_rows=on_rows, collect=False)
+        with pytest.raises(OSError):
+            await asyncio.wait_for(run, 5)
+        # Nothing left running in the background (e.g. the producer on a full queue)
+        assert [t for t in asyncio.all_tasks() if t is not asyncio.current_task()] == []
+
+    asyncio.run(main())
+
+
+def test_result_writer_resume_keeps_per_row_offsets(tmp_path):
+    from benchmark.runner import ResultWriter
+
+    path = tmp_path / "m.jsonl"
+    with ResultWriter(path) as writer:
+        writer.write_rows([{"id": "1"}, {"id": "2"}])
+    before = (tmp_path / "m.jsonl.ckpt").read_text(encoding="utf-8")
+    with ResultWriter(path, resume=True):
+        pass
+    assert (tmp_path / "m.jsonl.ckpt").read_text(encoding="utf-8") == before
+    assert len({line.split("\t")[0] for line in before.splitlines()}) == 2
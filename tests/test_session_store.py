@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.session_store import SessionStore, SQLiteSessionStore  # noqa: E402
+
+
+def test_arayuz_dogrudan_orneklenemez():
+    with pytest.raises(TypeError):
+        SessionStore(ttl=60, max_sessions=10)
+
+
+def test_sqlite_sayim_onbellekte_tutulur_ve_sweep_ile_tazelenir(tmp_path):
+    now = [1000.0]
+    path = str(tmp_path / "sessions.db")
+    store = SQLiteSessionStore(path, ttl=60, max_sessions=10, clock=lambda: now[0])
+
+    tokens = [store.create(i) for i in range(3)]
+    assert len(store) == 3
+    assert store.delete(tokens[0])
+    assert not store.delete(tokens[0])
+    assert len(store) == 2
+
+    # Başka bir worker'ın yazması bir sonraki sweep()'e kadar sayıma yansımaz
+    diger = SQLiteSessionStore(path, ttl=60, max_sessions=10, clock=lambda: now[0])
+    diger.create(99)
+    assert len(store) == 2
+
+    now[0] += 120
+    assert store.sweep() == 3
+    assert len(store) == 0
+
+
+def _resolver(store, maxsize):
+    from app.services.session_resolver import SessionResolver
+
+    return SessionResolver(store, maxsize=maxsize, ttl=30)
+
+
+def test_paylasilan_depoda_kapatilan_oturum_diger_workerda_hemen_gecersiz(tmp_path):
+    from app.services.session_resolver import SessionError
+
+    path = str(tmp_path / "sessions.db")
+    worker_a = SQLiteSessionStore(path, ttl=60, max_sessions=10)
+    worker_b = SQLiteSessionStore(path, ttl=60, max_sessions=10)
+    resolver_b = _resolver(worker_b, maxsize=0)
+
+    token = worker_a.create(7)
+    assert resolver_b.resolve(token) == 7
+    _resolver(worker_a, maxsize=0).revoke(token)
+    with pytest.raises(SessionError):
+        resolver_b.resolve(token)
+
+
+def test_revoke_lru_girdisini_de_dusurur():
+    from app.services.session_resolver import SessionError
+    from app.services.session_store import InMemorySessionStore
+
+    resolver = _resolver(InMemorySessionStore(ttl=60, max_sessions=10), maxsize=16)
+    token = resolver.store.create(7)
+    assert resolver.resolve(token) == 7
+    assert resolver.resolve(token) == 7
+    assert resolver.hits == 1
+
+    assert resolver.revoke(token)
+    with pytest.raises(SessionError):
+        resolver.resolve(token)
+
+
+def test_create_varsayilan_olarak_satir_ici_supurmez(tmp_path):
+    now = [1000.0]
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"), ttl=60, max_sessions=10, clock=lambda: now[0])
+    store.create(1)
+    now[0] += 120
+    store.create(2)
+    assert store.expired == 0 and len(store) == 2
+
+    acik = SQLiteSessionStore(str(tmp_path / "acik.db"), ttl=60, max_sessions=10, sweep_interval=30,
+                              clock=lambda: now[0])
+    acik.create(1)
+    now[0] += 120
+    acik.create(2)
+    assert acik.expired == 1 and len(acik) == 1
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.telekom_store import ShardedMap, TelekomStore  # noqa: E402
+
+
+def test_sharded_map_yazmasi_yalnizca_degisen_parcayi_kopyalar():
+    editor = ShardedMap().edit()
+    for i in range(10_000):
+        editor[i] = str(i)
+    eski = editor.finish()
+
+    editor = eski.edit()
+    editor[42] = "yeni"
+    editor.pop(7)
+    editor.pop("yok")
+    yeni = editor.finish()
+
+    assert len(eski) == 10_000 and eski[42] == "42" and 7 in eski
+    assert len(yeni) == 9_999 and yeni[42] == "yeni" and 7 not in yeni
+    degisen = [i for i, (a, b) in enumerate(zip(eski._shards, yeni._shards)) if a is not b]
+    assert len(degisen) <= 2
+
+
+def test_tekil_yazma_indeksleri_gunceller_eski_goruntu_degismez():
+    store = TelekomStore()
+    eski = store.snapshot
+    account = store.register_account("yeni@example.com", "sifre123", "Yeni")
+
+    assert store.account("yeni@example.com") == account
+    assert "yeni@example.com" not in eski.accounts
+    assert len(store.snapshot.accounts) == len(eski.accounts) + 1
+    # Dokunulmayan indeksler paylaşılır
+    assert store.snapshot.customers is eski.customers
+
+    durumlar = {t.status for uid in store.snapshot.tickets for t in store.tickets(uid)}
+    for durum in durumlar:
+        assert all(store.ticket(tid).status == durum for tid in store.tickets_with_status(durum))
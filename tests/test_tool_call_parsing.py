@@ -0,0 +1,37 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.ai_orchestrator_v4 import YapayZekaOrkestratoriV4  # noqa: E402
+from app.services.intent_router import IntentRouter  # noqa: E402
+
+
+def _orkestrator():
+    # Model yüklemeden yalnızca ayrıştırıcıyı test et
+    orkestrator = YapayZekaOrkestratoriV4.__new__(YapayZekaOrkestratoriV4)
+    orkestrator.niyet_yonlendirici = IntentRouter()
+    return orkestrator
+
+
+def test_model_ciktisindaki_odeme_araci_cagrilmaz():
+    cagrilar = asyncio.run(_orkestrator()._parse_tool_calls("Faturanızı ödüyorum. [pay_bill]", "tok"))
+    assert cagrilar == []
+
+
+def test_salt_okunur_araclar_degistirenler_atlanarak_ayiklanir():
+    metin = "[get_current_bill] ardından [pay_bill], sonra [suspend_line] ve [get_remaining_quotas]"
+    cagrilar = asyncio.run(_orkestrator()._parse_tool_calls(metin, "tok"))
+    assert [c.arac_adi for c in cagrilar] == ["get_current_bill", "get_remaining_quotas"]
+    assert cagrilar[0].parametreler["session_token"] == "tok"
+
+
+def test_yalnizca_degistiren_araclar_onbellekten_dislanir():
+    router = IntentRouter()
+    # "faturamı göster" gibi salt okunur hesap niyetleri kullanıcı kapsamında saklanabilir
+    assert not router.degistiren_var(router.route("faturamı göster"))
+    assert not router.degistiren_var(["get_current_bill", "get_remaining_quotas", "get_available_packages"])
+    assert not router.degistiren_var([])
+    assert router.degistiren_var(["get_current_bill", "pay_bill"])
+    assert router.degistiren_var(["bilinmeyen_arac"])
@@ -0,0 +1,52 @@
+import asyncio
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from app.services.tool_engine import ToolExecutionEngine, ToolSpec, telekom_arac_tablosu  # noqa: E402
+
+
+@dataclass
+class Cagri:
+    arac_adi: str
+    parametreler: Dict[str, Any]
+    durum: str = "bekliyor"
+    sonuc: Optional[Any] = None
+    hata_mesaji: Optional[str] = None
+
+
+def test_ai_tablosunda_degisiklik_yapan_arac_yok():
+    adlar = {spec.name for spec in telekom_arac_tablosu()}
+    assert "pay_bill" not in adlar
+    assert all(ad.startswith(("get_", "check_", "test_")) for ad in adlar)
+
+
+def test_bagimli_arac_bagimliligin_sonucunu_bekler():
+    odemeler = []
+
+    async def get_current_bill(session_token: str):
+        await asyncio.sleep(0.01)
+        return {"success": True, "data": {"bill_id": "F-1"}}
+
+    async def pay_bill(bill_id: str, method: str):
+        odemeler.append((bill_id, method))
+        return {"success": True}
+
+    # Yalnızca test tablosu: ödeme AI dispatch tablosunda bulunmaz
+    motor = ToolExecutionEngine([
+        ToolSpec("get_current_bill", get_current_bill),
+        ToolSpec(
+            "pay_bill",
+            pay_bill,
+            depends_on=("get_current_bill",),
+            bind=lambda sonuclar: {"bill_id": sonuclar["get_current_bill"]["data"]["bill_id"], "method": "test"},
+        ),
+    ])
+
+    cagrilar = asyncio.run(motor.run([Cagri("pay_bill", {"session_token": "tok"})]))
+    assert [c.arac_adi for c in cagrilar] == ["get_current_bill", "pay_bill"]
+    assert all(c.durum == "tamamlandi" for c in cagrilar)
+    assert odemeler == [("F-1", "test")]